@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Loaves and Fishes - Batch Battle Runner
+
+Plays many real battles (every fish vs every enemy by default) across
+several processes and prints a summary per matchup. Same --seed, same
+results, whatever --workers is.
+
+Usage:
+    python batch_battles.py --levels 5 10 20 -n 200 --workers 4
+    python batch_battles.py --fish carp_diem holy_mackerel --enemies wild_bandit -n 1000
+    python batch_battles.py --levels 10 -n 100 --csv results.csv
+"""
+
+import sys
+import os
+import csv
+import time
+import argparse
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from engine.batch_runner import RANDOM_MOVE, run_batch, sweep_specs
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Run fish vs enemy battle sweeps")
+    parser.add_argument("--levels", type=int, nargs="+", default=[5, 10, 20],
+                        help="levels to test (both sides use the same level)")
+    parser.add_argument("--fish", nargs="+", help="fish ids (default: all)")
+    parser.add_argument("--enemies", nargs="+", help="enemy ids (default: all of enemies.json)")
+    parser.add_argument("-n", "--battles", type=int, default=100, help="battles per matchup")
+    parser.add_argument("--workers", type=int, default=None, help="processes (default: all cores)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--move", type=int, default=RANDOM_MOVE,
+                        help="move index the fish always uses (default: random)")
+    parser.add_argument("--max-turns", type=int, default=100)
+    parser.add_argument("--csv", help="write the per-matchup summary to this file")
+    args = parser.parse_args(argv)
+
+    try:
+        specs = sweep_specs(args.levels, args.fish, args.enemies)
+    except ValueError as e:
+        parser.error(str(e))  # Exits with usage and status 2
+    start = time.perf_counter()
+    results = run_batch(specs, args.battles, seed=args.seed, workers=args.workers,
+                        move=args.move, max_turns=args.max_turns)
+    elapsed = time.perf_counter() - start
+    rows = results.summary()
+
+    print(f"{len(results):,} battles ({len(specs)} matchups) in {elapsed:.1f}s "
+          f"({len(results) / elapsed:,.0f}/s)")
+    print(f"{'fish':<22} {'enemy':<22} {'lvl':>4} {'win':>7} {'turns':>6} {'dealt':>7} {'taken':>7}")
+    for row in rows:
+        print(f"{row['fish_id']:<22} {row['enemy_id']:<22} {row['fish_level']:>4} "
+              f"{row['win_rate']:>7.1%} {row['avg_turns_to_win']:>6.2f} "
+              f"{row['avg_damage_dealt']:>7.1f} {row['avg_damage_taken']:>7.1f}")
+
+    if args.csv:
+        with open(args.csv, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=list(rows[0]) if rows else [])
+            writer.writeheader()
+            writer.writerows(rows)
+        print(f"Summary written to {args.csv}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Batch Runner Benchmark - battles per second vs. number of worker processes
+
+Plays the same sweep (every fish vs every enemy at level 10) with 1, 2,
+4, ... workers up to os.cpu_count(), prints the throughput and scaling
+of each, and checks every run produced identical results.
+
+Usage:
+    python benchmarks/bench_batch_runner.py [battles_per_matchup]
+"""
+
+import sys
+import os
+import time
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from engine.batch_runner import run_batch, sweep_specs
+
+
+def run(battles_per_spec: int = 20):
+    print("=" * 70)
+    print(" BATCH RUNNER BENCHMARK ".center(70, "="))
+    print("=" * 70)
+
+    specs = sweep_specs([10])
+    cores = os.cpu_count() or 1
+    counts = sorted({1, cores} | {2 ** i for i in range(1, cores.bit_length()) if 2 ** i <= cores})
+    print(f"{len(specs)} matchups × {battles_per_spec} battles, {cores} core(s)")
+    print(f"{'workers':>8} {'seconds':>9} {'battles/s':>11} {'scaling':>8}")
+
+    baseline, reference = None, None
+    for workers in counts:
+        start = time.perf_counter()
+        results = run_batch(specs, battles_per_spec, seed=1, workers=workers)
+        elapsed = time.perf_counter() - start
+        rate = len(results) / elapsed
+        baseline = baseline or rate
+        reference = reference or results
+        assert results == reference, "results changed with the worker count"
+        print(f"{workers:>8} {elapsed:>9.2f} {rate:>11,.0f} {rate / baseline:>7.2f}x")
+
+    print("Results identical for every worker count ✓")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Battle Log Benchmark - cost of logging in headless battles
+
+Plays the same seeded battles with:
+- eager:    formats every event from its template as it happens and
+            keeps them all (like the old unbounded list of strings)
+- BattleLog: records compact events, formats only when read
+- CountingBattleLog / NullBattleLog: simulation modes
+
+and measures the memory a very long fight's log holds.
+
+Usage:
+    python benchmarks/bench_battle_log.py [battles]
+"""
+
+import sys
+import os
+import time
+import tracemalloc
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils.data_loader import get_data_loader
+from engine.fish import Fish
+from engine.player import Player
+from engine.enemy import create_enemy
+from engine.battle import Battle, BattleAction, BattleResult
+from engine.battle_log import BattleLog, CountingBattleLog, NullBattleLog, LogEvent
+from engine.rng import PythonRNG
+
+
+class EagerLog(BattleLog):
+    """Formats every event as it is recorded and keeps all of them"""
+
+    def __init__(self):
+        super().__init__()
+        self.lines = []
+
+    def record(self, event, actor="", target="", amount=0, flags=0, detail=""):
+        self.lines.append(self.render((event, actor, target, amount, flags, detail)))
+
+
+def play(make_log, seed):
+    player = Player("Jesus")
+    player.add_fish_to_party(Fish("carp_diem", get_data_loader().get_fish_by_id("carp_diem"), 10))
+    battle = Battle(player, [create_enemy("wild_bandit", 8)], rng=PythonRNG(seed=seed), log=make_log())
+    while battle.result == BattleResult.ONGOING and battle.turn_count < 100:
+        battle.execute_turn(BattleAction.ATTACK, 0)
+
+
+def long_fight_kb(log, events=10_000):
+    """Memory held by a log after a very long fight"""
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    for i in range(events):
+        log.record(LogEvent.ATTACK, "Carp Diem", "Wild Bandit", i % 50, 0, "Seize Strike")
+    used = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    return used / 1024
+
+
+def run(count: int = 20_000):
+    print("=" * 70)
+    print(" BATTLE LOG BENCHMARK ".center(70, "="))
+    print("=" * 70)
+
+    modes = (("eager", EagerLog), ("BattleLog", BattleLog),
+             ("CountingBattleLog", CountingBattleLog), ("NullBattleLog", NullBattleLog))
+    play(BattleLog, 0)  # Warm up caches and templates
+    print(f"{'log':<20} {'battles/s':>10} {'10k-event fight (KB)':>22}")
+    for label, make_log in modes:
+        start = time.perf_counter()
+        for seed in range(count):
+            play(make_log, seed)
+        rate = count / (time.perf_counter() - start)
+        print(f"{label:<20} {rate:>10,.0f} {long_fight_kb(make_log()):>22.1f}")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000)
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Damage Odds Benchmark - exact distribution vs. rolling hits to estimate it
+
+For several attacker/move/defender matchups, compares:
+- sampling `count` hits (calculate_damage() + damage_after_defense())
+  to estimate the expected damage and KO chance
+- damage_distribution() with an empty cache (first time a matchup is seen)
+- damage_distribution() from the LRU cache
+
+Usage:
+    python benchmarks/bench_damage.py [count]
+"""
+
+import sys
+import os
+import time
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils.data_loader import get_data_loader
+from engine.fish import Fish
+from engine.player import Player
+from engine.enemy import create_enemy
+from engine.battle import Battle
+from engine.battle_log import NullBattleLog
+from engine.rng import PythonRNG
+from engine.damage import damage_distribution, clear_cache
+
+# (fish, enemy, level)
+MATCHUPS = (("holy_mackerel", "wild_bandit", 10), ("carp_diem", "temple_guard", 40),
+            ("sole_survivor", "wrath_embodied", 90))
+
+
+def run(count: int = 10_000):
+    print("=" * 70)
+    print(" DAMAGE ODDS BENCHMARK ".center(70, "="))
+    print("=" * 70)
+    print(f"{'matchup':<32}{'sampled':>12}{'cold':>12}{'cached':>12}")
+
+    loader = get_data_loader()
+    for fish_id, enemy_id, level in MATCHUPS:
+        player = Player("Jesus")
+        fish = Fish(fish_id, loader.get_fish_by_id(fish_id), level)
+        player.add_fish_to_party(fish)
+        enemy = create_enemy(enemy_id, level)
+        battle = Battle(player, [enemy], rng=PythonRNG(seed=1), log=NullBattleLog())
+        atk = fish.get_effective_stat("atk")
+        move = fish.known_moves[0]
+
+        clear_cache()
+        start = time.perf_counter()
+        odds = damage_distribution(atk, move, enemy, fish.type)
+        cold = time.perf_counter() - start
+        threshold = round(odds.expected)  # "KO" an enemy with this much HP left
+
+        start = time.perf_counter()
+        total = kos = 0
+        for _ in range(count):
+            damage = enemy.damage_after_defense(battle.calculate_damage(atk, move, enemy, fish.type)[0])
+            total += damage
+            kos += damage >= threshold
+        sampled = time.perf_counter() - start
+
+        repeats = 10_000
+        start = time.perf_counter()
+        for _ in range(repeats):
+            damage_distribution(atk, move, enemy, fish.type)
+        cached = (time.perf_counter() - start) / repeats
+
+        print(f"{fish_id + ' L' + str(level):<32}{sampled * 1e3:>10.2f}ms"
+              f"{cold * 1e3:>10.3f}ms{cached * 1e6:>10.2f}µs")
+        print(f"  EV sampled {total / count:8.2f}  exact {odds.expected:8.2f}   "
+              f"KO {threshold} HP sampled {kos / count:.4f}  exact "
+              f"{odds.ko_chance(threshold):.4f}")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Data Lookup Benchmark - ID index vs. linear scan
+
+Builds synthetic fish.json files with 20, 2,000 and 200,000 records and
+times get_fish_by_id() against the old list-scan lookup.
+
+The scan cost grows with the collection size; the index stays flat.
+
+Usage:
+    python benchmarks/bench_data_lookup.py
+"""
+
+import sys
+import os
+import json
+import random
+import tempfile
+import timeit
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils.data_loader import DataLoader
+
+
+SIZES = [20, 2_000, 200_000]
+LOOKUPS = 1_000
+
+
+def make_fish_file(data_dir: str, count: int):
+    """Write a synthetic fish.json with `count` records"""
+    fish = [
+        {
+            "id": f"fish_{i}",
+            "name": f"Fish {i}",
+            "tier": i % 4,
+            "type": "Water",
+            "base_stats": {"hp": 20, "atk": 8, "def": 6, "spd": 12},
+        }
+        for i in range(count)
+    ]
+    with open(os.path.join(data_dir, "fish.json"), "w", encoding="utf-8") as f:
+        json.dump({"fish": fish}, f)
+
+
+def linear_scan(loader: DataLoader, fish_id: str):
+    """The pre-index lookup: walk the list until the ID matches"""
+    for fish in loader.get_fish_data().get("fish", []):
+        if fish["id"] == fish_id:
+            return fish
+    return None
+
+
+def run():
+    print("=" * 70)
+    print(" DATA LOOKUP BENCHMARK ".center(70, "="))
+    print("=" * 70)
+    print(f"{'records':>10} {'scan (us/lookup)':>18} {'index (us/lookup)':>18} {'speedup':>10}")
+
+    rng = random.Random(1234)
+
+    for count in SIZES:
+        with tempfile.TemporaryDirectory() as data_dir:
+            make_fish_file(data_dir, count)
+            loader = DataLoader(data_dir)
+            loader.get_fish_data()  # Warm the cache (and build the index)
+
+            ids = [f"fish_{rng.randrange(count)}" for _ in range(LOOKUPS)]
+
+            # Fewer scan repeats on the big file so the run stays short
+            scan_repeats = 1 if count > 10_000 else 10
+            scan_time = timeit.timeit(
+                lambda: [linear_scan(loader, i) for i in ids], number=scan_repeats)
+            index_time = timeit.timeit(
+                lambda: [loader.get_fish_by_id(i) for i in ids], number=10)
+
+            scan_us = scan_time / (scan_repeats * LOOKUPS) * 1e6
+            index_us = index_time / (10 * LOOKUPS) * 1e6
+            print(f"{count:>10,} {scan_us:>18.3f} {index_us:>18.3f} {scan_us / index_us:>9.0f}x")
+
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Edition Benchmark - memory held by the text-heavy data files, per edition
+
+Uses tracemalloc to measure the Python heap kept alive by the files with
+the most dual-text content, loaded with both editions (the normal
+DataLoader) vs. resolved to a single edition.
+
+Usage:
+    python benchmarks/bench_editions.py
+"""
+
+import sys
+import os
+import gc
+import tracemalloc
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils.data_loader import DataLoader
+
+DATA_PATH = os.path.join(os.path.dirname(__file__), '..', 'src', 'data')
+FILES = ("parables.json", "quests.json", "fish.json", "items.json",
+         "messages.json", "ui_strings.json")
+
+
+def measure(edition):
+    """Return KB of heap held after loading FILES with the given edition"""
+    loader = DataLoader(DATA_PATH, use_snapshot=False, edition=edition)
+    loader.clear_cache()
+    gc.collect()
+
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    for filename in FILES:
+        loader.load_json(filename)
+    gc.collect()
+    held = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+
+    loader.clear_cache()
+    return held / 1024
+
+
+def run():
+    print("=" * 70)
+    print(" EDITION BENCHMARK (tracemalloc) ".center(70, "="))
+    print("=" * 70)
+    print(f"Files: {', '.join(FILES)}")
+
+    both = measure(None)
+    print(f"{'both editions':<20} {both:>10.1f} KB")
+    for edition in ("default", "christian_edition"):
+        held = measure(edition)
+        print(f"{edition:<20} {held:>10.1f} KB  ({1 - held / both:.0%} less)")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    run()
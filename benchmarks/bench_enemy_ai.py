@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Enemy AI Benchmark - how well and how fast the "expectimax" bosses play
+
+For a few bosses, plays the same seeded battles with the boss using
+"random", "strongest_first" and "expectimax" (fixed depth, reproducible)
+and reports the boss's win rate, then measures per-decision latency of
+the default time-budgeted planner.
+
+Usage:
+    python benchmarks/bench_enemy_ai.py [battles]
+"""
+
+import sys
+import os
+import time
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils.data_loader import get_data_loader
+from engine.fish import Fish
+from engine.player import Player
+from engine.enemy import create_boss
+from engine.battle import Battle, BattleAction, BattleResult
+from engine.battle_log import NullBattleLog
+from engine.rng import PythonRNG
+from engine.enemy_ai import ExpectimaxAI, make_reproducible
+
+PARTY = ("holy_mackerel", "carp_diem", "sole_survivor", "starter_sardine")
+
+# (boss, boss level, party level) - roughly even fights
+MATCHUPS = (("final_trial", 30, 80), ("captain_guard", 30, 80), ("rahabs_pursuers", 30, 85))
+
+
+def play(boss_id, boss_level, party_level, pattern, seed, planner=None):
+    loader = get_data_loader()
+    player = Player("Jesus")
+    for fish_id in PARTY:
+        player.add_fish_to_party(Fish(fish_id, loader.get_fish_by_id(fish_id), party_level))
+    boss = create_boss(boss_id, boss_level)
+    boss.ai_pattern = pattern
+    make_reproducible([boss])
+    if planner is not None:
+        boss.planner = planner
+    battle = Battle(player, [boss], is_boss=True, rng=PythonRNG(seed=seed), log=NullBattleLog())
+    searches = []
+    while battle.result == BattleResult.ONGOING and battle.turn_count < 100:
+        battle.execute_turn(BattleAction.ATTACK, 0)
+        if boss.planner is not None and boss.planner.last_search is not None:
+            searches.append(boss.planner.last_search)
+    return battle.result == BattleResult.DEFEAT, searches
+
+
+def run(count: int = 200):
+    print("=" * 70)
+    print(" ENEMY AI BENCHMARK ".center(70, "="))
+    print("=" * 70)
+
+    patterns = ("random", "strongest_first", "expectimax")
+    print(f"{'boss win rate':<20}" + "".join(f"{p:>17}" for p in patterns))
+    for boss_id, boss_level, party_level in MATCHUPS:
+        rates = []
+        for pattern in patterns:
+            wins = sum(play(boss_id, boss_level, party_level, pattern, seed)[0]
+                       for seed in range(count))
+            rates.append(wins / count)
+        print(f"{boss_id:<20}" + "".join(f"{rate:>17.3f}" for rate in rates))
+
+    searches = []
+    start = time.perf_counter()
+    for seed in range(max(1, count // 4)):
+        searches += play("final_trial", 30, 80, "expectimax", seed, planner=ExpectimaxAI())[1]
+    total = time.perf_counter() - start
+    elapsed = sorted(search.elapsed * 1e3 for search in searches)
+    depths = [search.depth for search in searches]
+    print(f"\nDefault planner (5 ms budget), {len(searches)} decisions in {total:.1f}s:")
+    print(f"  latency ms   p50 {elapsed[len(elapsed) // 2]:.2f}   "
+          f"p99 {elapsed[int(len(elapsed) * 0.99)]:.2f}   max {elapsed[-1]:.2f}")
+    print(f"  depth        avg {sum(depths) / len(depths):.2f}   "
+          f"max {max(depths)}   positions/decision "
+          f"{sum(s.nodes + s.table_hits for s in searches) / len(searches):.0f}")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Execute Turn Benchmark - raw speed of Battle.execute_turn()
+
+Plays `count` attack turns (REPEATS times) (fish attacks, enemy answers) on one battle
+that can't end - both sides have a billion HP - and reports turns per
+second, so only execute_turn() itself is measured.
+
+Usage:
+    python benchmarks/bench_execute_turn.py [count]
+"""
+
+import sys
+import os
+import time
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils.data_loader import get_data_loader
+from engine.fish import Fish
+from engine.player import Player
+from engine.enemy import create_enemy
+from engine.battle import Battle, BattleAction, BattleResult
+from engine.battle_log import NullBattleLog
+from engine.rng import PythonRNG
+
+
+# Timed runs; the fastest counts (the others were slowed by something else)
+REPEATS = 7
+
+
+def make_battle(seed):
+    """A level-50 fish against a level-50 enemy, both with HP to spare"""
+    loader = get_data_loader()
+    player = Player("Jesus")
+    fish = Fish("carp_diem", loader.get_fish_by_id("carp_diem"), 50)  # Max level: no level-ups
+    fish.max_hp = fish.current_hp = 10 ** 9
+    player.add_fish_to_party(fish)
+    enemy = create_enemy("wall_sentinel", 50)
+    enemy.max_hp = enemy.current_hp = 10 ** 9
+    return Battle(player, [enemy], rng=PythonRNG(seed=seed), log=NullBattleLog())
+
+
+def run(count: int = 30_000):
+    print("=" * 70)
+    print(" EXECUTE TURN BENCHMARK ".center(70, "="))
+    print("=" * 70)
+
+    battle = make_battle(seed=1)
+    moves = len(battle.active_fish.known_moves)
+    attack = BattleAction.ATTACK
+    execute = battle.execute_turn
+
+    best = 0.0
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        for turn in range(count):
+            execute(attack, turn % moves)
+        elapsed = time.perf_counter() - start
+        assert battle.result == BattleResult.ONGOING
+        best = max(best, count / elapsed)
+    print(f"{'execute_turn(ATTACK)':<36} {best:>12,.0f} turns/s   "
+          f"({1e6 / best:.2f} µs/turn, best of {REPEATS})")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 30_000)
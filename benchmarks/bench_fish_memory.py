@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Fish Memory Benchmark - bytes per Fish instance
+
+Creates a full fish storage box (MAX_FISH_STORAGE fish, cycling through
+every species and a range of levels) and uses tracemalloc to measure
+the memory the instances hold, excluding the shared fish.json data.
+
+Usage:
+    python benchmarks/bench_fish_memory.py [count]
+"""
+
+import sys
+import os
+import gc
+import time
+import tracemalloc
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils.constants import MAX_FISH_STORAGE
+from utils.data_loader import DataLoader
+from engine.fish import Fish
+
+DATA_PATH = os.path.join(os.path.dirname(__file__), '..', 'src', 'data')
+
+
+def run(count: int = MAX_FISH_STORAGE):
+    print("=" * 70)
+    print(" FISH MEMORY BENCHMARK (tracemalloc) ".center(70, "="))
+    print("=" * 70)
+
+    loader = DataLoader(DATA_PATH)
+    species = loader.get_all_fish()
+    plan = [(species[i % len(species)], 1 + i % 50) for i in range(count)]
+    for data in species:
+        Fish(data["id"], data, 1)  # Warm the per-species caches (species, stat tables)
+    gc.collect()
+
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    box = [Fish(data["id"], data, level) for data, level in plan]
+    create_ms = (time.perf_counter() - start) * 1000
+    gc.collect()
+    held = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+
+    print(f"Fish created:        {len(box):,} ({len(species)} species, levels 1-50)")
+    print(f"Memory held:         {held / 1024:,.1f} KB")
+    print(f"Per instance:        {held / len(box):,.0f} bytes")
+    print(f"Create time:         {create_ms:.2f} ms (with tracemalloc)")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else MAX_FISH_STORAGE)
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Horde Benchmark - per-turn cost of a battle against many enemies
+
+Each turn is one execute_turn(ATTACK) plus one area attack on every
+enemy, with every enemy poisoned (so end-of-turn status damage hits the
+whole horde). Enemies are healed between turns (untimed), so nobody is
+defeated and the battle never ends. Compares, at each horde size:
+- battle: a normal Battle over a list of Enemy objects
+- horde:  a HordeBattle over the same enemies in columns (NumPy if
+          installed, otherwise plain loops)
+The horde does more per turn - a normal Battle only poisons the active
+enemy - so the columns are what keep it in the same range.
+
+Usage:
+    python benchmarks/bench_horde.py [turns]
+"""
+
+import sys
+import os
+import time
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils.data_loader import get_data_loader
+from engine.fish import Fish
+from engine.player import Player
+from engine.enemy import create_enemy
+from engine.battle import Battle, BattleAction, BattleResult
+from engine.battle_log import NullBattleLog
+from engine.rng import PythonRNG
+from engine import horde as horde_module
+from engine.horde import Horde, HordeBattle
+
+ENEMY_COUNTS = (50, 200, 500)
+
+
+def make_enemies(count):
+    enemies = []
+    for _ in range(count):
+        enemy = create_enemy("wild_bandit", 10)
+        enemy.max_hp = enemy.current_hp = 10 ** 6
+        enemy.apply_status_effect("poisoned")
+        enemies.append(enemy)
+    return enemies
+
+
+def make_player():
+    loader = get_data_loader()
+    player = Player("Jesus")
+    fish = Fish("carp_diem", loader.get_fish_by_id("carp_diem"), 50)
+    fish.max_hp = fish.current_hp = 10 ** 9
+    player.add_fish_to_party(fish)
+    return player
+
+
+def make_battle(count):
+    return Battle(make_player(), make_enemies(count), rng=PythonRNG(seed=1), log=NullBattleLog())
+
+
+def make_horde_battle(count):
+    horde = Horde()
+    for enemy in make_enemies(count):
+        horde.adopt(enemy)
+    return HordeBattle(make_player(), horde, rng=PythonRNG(seed=1), log=NullBattleLog())
+
+
+def time_turns(battle, turns):
+    """Mean and worst ms per turn"""
+    moves = len(battle.active_fish.known_moves)
+    worst = total = 0.0
+    for turn in range(turns):
+        for enemy in battle.enemies:
+            enemy.current_hp = enemy.max_hp
+        start = time.perf_counter()
+        battle._damage_all_enemies(30)
+        battle.execute_turn(BattleAction.ATTACK, turn % moves)
+        elapsed = time.perf_counter() - start
+        total += elapsed
+        worst = max(worst, elapsed)
+    assert battle.result == BattleResult.ONGOING
+    return total / turns * 1e3, worst * 1e3
+
+
+def run(turns: int = 300):
+    print("=" * 70)
+    print(" HORDE BENCHMARK ".center(70, "="))
+    print("=" * 70)
+    backend = "numpy" if horde_module.np is not None else "loops"
+    print(f"{'enemies':>8}{'battle ms/turn':>18}{f'horde ({backend}) ms/turn':>26}{'horde worst':>14}")
+
+    for count in ENEMY_COUNTS:
+        battle_mean, _ = time_turns(make_battle(count), turns)
+        horde_mean, horde_worst = time_turns(make_horde_battle(count), turns)
+        print(f"{count:>8}{battle_mean:>18.3f}{horde_mean:>26.3f}{horde_worst:>14.3f}")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 300)
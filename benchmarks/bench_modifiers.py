@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Stat Modifier Benchmark - per-turn ticking and float drift
+
+Two kinds of long fight, with `active` timed modifiers running at once:
+- steady: they're applied on turn 1 and last the whole fight
+- churn:  new ones are applied and old ones expire every turn
+
+Compares the old bookkeeping (multiply in, tick every entry, divide back
+out - reproduced here as a reference) with ModifierStack (min-heap by
+expiry, multiplier recomputed on change), and how far each multiplier
+has drifted from 1.0 once everything expired.
+
+Usage:
+    python benchmarks/bench_modifiers.py [turns]
+"""
+
+import sys
+import os
+import time
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from engine.modifiers import ModifierStack
+
+STATS = ("atk", "def", "spd")
+ACTIVE = (0, 4, 32)    # Timed modifiers running at once
+DURATION_SPREAD = 8
+
+
+def steady(turns: int, active: int):
+    """Everything applied on the first turn, expiring near the end"""
+    plan = [[] for _ in range(turns)]
+    plan[0] = [(STATS[i % 3], 1.0 + (i % 9) / 10 + 0.03, turns - i % DURATION_SPREAD)
+               for i in range(active)]
+    return plan
+
+
+def churn(turns: int, active: int):
+    """(stat, multiplier, duration) to apply each turn (same for both versions)"""
+    per_turn = max(1, active // DURATION_SPREAD) if active else 0
+    plan = []
+    for turn in range(turns):
+        plan.append([(STATS[(turn + i) % 3], 1.0 + ((turn * 7 + i) % 9) / 10 + 0.03,
+                      1 + (turn + i) % DURATION_SPREAD) for i in range(per_turn)])
+    return plan
+
+
+def old_style(plan, drain: int):
+    """The previous dict + per-entry list bookkeeping"""
+    modifiers = {stat: 1.0 for stat in STATS}
+    timed = {stat: [] for stat in STATS}
+    for applied in plan + [[]] * drain:
+        for stat, multiplier, turns in applied:
+            modifiers[stat] *= multiplier
+            timed[stat].append({"multiplier": multiplier, "turns": turns})
+        for stat, entries in timed.items():
+            if not entries:
+                continue
+            remaining = []
+            for entry in entries:
+                entry["turns"] -= 1
+                if entry["turns"] <= 0:
+                    modifiers[stat] /= entry["multiplier"]
+                else:
+                    remaining.append(entry)
+            timed[stat] = remaining
+    return modifiers
+
+
+def stack_style(plan, drain: int):
+    stack = ModifierStack({stat: 1.0 for stat in STATS})
+    for applied in plan + [[]] * drain:
+        for stat, multiplier, turns in applied:
+            stack.apply(stat, multiplier, turns)
+        stack.tick()
+    return stack
+
+
+def run(turns: int = 100_000):
+    print("=" * 70)
+    print(" STAT MODIFIER BENCHMARK ".center(70, "="))
+    print("=" * 70)
+    print(f"{'fight':<8}{'active':>6}{'old µs/turn':>14}{'stack µs/turn':>16}"
+          f"{'old drift':>12}{'stack drift':>13}")
+
+    for schedule in (steady, churn):
+        for active in ACTIVE:
+            plan = schedule(turns, active)
+            results = []
+            for version in (old_style, stack_style):
+                start = time.perf_counter()
+                final = version(plan, DURATION_SPREAD)
+                elapsed = time.perf_counter() - start
+                drift = max(abs(final[stat] - 1.0) for stat in STATS)
+                results.append((elapsed / turns * 1e6, drift))
+            (old_time, old_drift), (new_time, new_drift) = results
+            print(f"{schedule.__name__:<8}{active:>6}{old_time:>14.2f}{new_time:>16.2f}"
+                  f"{old_drift:>12.1e}{new_drift:>13.1e}")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Replay Benchmark - replay size, recording overhead and seek speed
+
+Records long seeded boss fights and measures:
+- bytes per replay (and per turn)
+- battles/s with and without recording
+- seek time to random turns of a long (~150 turn) replay: keyframes
+  every N turns vs. re-simulating from turn 0
+
+Usage:
+    python benchmarks/bench_replay.py [battles]
+"""
+
+import sys
+import os
+import time
+import random
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils.data_loader import get_data_loader
+from engine.fish import Fish
+from engine.player import Player
+from engine.enemy import create_enemy
+from engine.battle import Battle, BattleAction, BattleResult
+from engine.battle_log import NullBattleLog
+from engine.replay import Replay, ReplayPlayer
+from engine.rng import PythonRNG
+
+MAX_TURNS = 200
+
+
+def play(seed, record):
+    """A long fight: a three-fish party against three sturdy enemies"""
+    loader = get_data_loader()
+    player = Player("Jesus")
+    for fish_id in ("sole_survivor", "holy_mackerel", "starter_sardine"):
+        player.add_fish_to_party(Fish(fish_id, loader.get_fish_by_id(fish_id), 30))
+    enemies = [create_enemy("herodian_guard", 30) for _ in range(3)]
+    if record:
+        battle = Battle(player, enemies, log=NullBattleLog(), record_replay=True, replay_seed=seed)
+    else:
+        battle = Battle(player, enemies, log=NullBattleLog(), rng=PythonRNG(seed=seed))
+    while battle.result == BattleResult.ONGOING and battle.turn_count < MAX_TURNS:
+        battle.execute_turn(BattleAction.ATTACK, battle.turn_count % 2)
+    return battle
+
+
+def long_replay():
+    """A long replay: two fish keep switching in front of a weak enemy"""
+    loader = get_data_loader()
+    player = Player("Jesus")
+    for fish_id in ("ichthys_divine", "sole_survivor"):
+        player.add_fish_to_party(Fish(fish_id, loader.get_fish_by_id(fish_id), 100))
+    battle = Battle(player, [create_enemy("wild_bandit", 1)], log=NullBattleLog(),
+                    record_replay=True, replay_seed=1)
+    while battle.result == BattleResult.ONGOING:
+        battle.execute_turn(BattleAction.SWITCH, (battle.turn_count + 1) % 2)
+    return battle.get_replay()
+
+
+def run(count: int = 500):
+    print("=" * 70)
+    print(" REPLAY BENCHMARK ".center(70, "="))
+    print("=" * 70)
+
+    play(0, True)  # Warm up caches
+    for record in (False, True):
+        start = time.perf_counter()
+        for seed in range(count):
+            play(seed, record)
+        rate = count / (time.perf_counter() - start)
+        print(f"{'recording' if record else 'plain':<12} {rate:>10,.0f} battles/s")
+
+    replays = [play(seed, True).get_replay().to_bytes() for seed in range(50)]
+    turns = sum(Replay.from_bytes(data).turns for data in replays)
+    size = sum(len(data) for data in replays)
+    print(f"Replay size: {size / len(replays):,.0f} bytes avg "
+          f"({turns / len(replays):.1f} turns avg)")
+
+    replay = long_replay()
+    print(f"Long replay: {len(replay.to_bytes()):,} bytes for {replay.turns} turns")
+    rng = random.Random(0)
+    targets = [rng.randrange(replay.turns + 1) for _ in range(100)]
+    for label, interval in (("from turn 0", replay.turns + 1), ("keyframes/50", 50),
+                            ("keyframes/10", 10)):
+        player = ReplayPlayer(replay, keyframe_interval=interval)
+        player.run_to_end()  # Builds the keyframes once
+        start = time.perf_counter()
+        for turn in targets:
+            player.seek(turn)
+        per_seek = (time.perf_counter() - start) / len(targets) * 1e3
+        print(f"Seek {label:<14} {per_seek:>8.2f} ms")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
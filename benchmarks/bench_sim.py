@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Battle Simulator Benchmark - battles per second, engine.sim vs. Battle
+
+Runs the same fish-vs-enemy matchups through the vectorized simulator
+(engine.sim) and through Battle.execute_turn() one battle at a time,
+and prints the throughput of each on one core.
+
+Usage:
+    python benchmarks/bench_sim.py [count]
+"""
+
+import sys
+import os
+import io
+import time
+import random
+import contextlib
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils.data_loader import get_data_loader
+from engine.fish import Fish
+from engine.player import Player
+from engine.enemy import create_enemy
+from engine.battle import Battle, BattleAction, BattleResult
+from engine.sim import BattleBatch, simulate
+
+MATCHUPS = (
+    ("carp_diem", 5, "wild_bandit", 5),
+    ("holy_mackerel", 8, "wild_bandit", 9),
+    ("carp_diem", 6, "wild_bandit", 4),
+)
+SCALAR_COUNT = 3_000  # The scalar engine is far slower - keep it short
+
+
+def make_fish(fish_id, level):
+    fish = Fish(fish_id, get_data_loader().get_fish_by_id(fish_id), level)
+    fish.xp_to_next_level = 10 ** 9
+    return fish
+
+
+def scalar_rate(count: int) -> float:
+    """Battles per second through Battle.execute_turn()"""
+    random.seed(1)
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for i in range(count):
+            fish_id, fish_level, enemy_id, enemy_level = MATCHUPS[i % len(MATCHUPS)]
+            player = Player("Jesus")
+            player.add_fish_to_party(make_fish(fish_id, fish_level))
+            battle = Battle(player, [create_enemy(enemy_id, enemy_level)])
+            while battle.result == BattleResult.ONGOING and battle.turn_count < 100:
+                battle.execute_turn(BattleAction.ATTACK, 0)
+    return count / (time.perf_counter() - start)
+
+
+def run(count: int = 1_000_000):
+    print("=" * 70)
+    print(" BATTLE SIMULATOR BENCHMARK ".center(70, "="))
+    print("=" * 70)
+
+    per_matchup = count // len(MATCHUPS)
+    batch = BattleBatch.from_matchups([
+        (make_fish(fish_id, fish_level), create_enemy(enemy_id, enemy_level), per_matchup)
+        for fish_id, fish_level, enemy_id, enemy_level in MATCHUPS
+    ], move="random")
+
+    start = time.perf_counter()
+    result = simulate(batch, seed=1)
+    elapsed = time.perf_counter() - start
+    sim_per_second = len(batch) / elapsed
+
+    scalar_per_second = scalar_rate(SCALAR_COUNT)
+
+    print(f"engine.sim: {len(batch):,} battles in {elapsed:.2f}s → {sim_per_second:,.0f}/s")
+    print(f"Battle:     {SCALAR_COUNT:,} battles → {scalar_per_second:,.0f}/s")
+    print(f"Speedup:    {sim_per_second / scalar_per_second:.0f}x")
+
+    summary = result.summary()
+    print(f"Win rate {summary['win_rate']:.1%}, mean turns to kill "
+          f"{summary['turns_to_kill']['mean']:.2f}")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
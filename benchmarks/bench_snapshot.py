@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Snapshot Benchmark - how fast a battle can be saved, rewound and cloned
+
+Compares, on a mid-boss-fight battle with a three-fish party:
+- snapshot() + restore()        (search on one battle)
+- clone() (own RNG given)       (independent what-if copies)
+- clone() (RNG cloned too)
+- copy.deepcopy(battle)         (the naive way)
+
+Usage:
+    python benchmarks/bench_snapshot.py [count]
+"""
+
+import sys
+import os
+import copy
+import time
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils.data_loader import get_data_loader
+from engine.fish import Fish
+from engine.player import Player
+from engine.enemy import create_enemy, create_boss
+from engine.battle import Battle, BattleAction
+from engine.battle_log import NullBattleLog
+from engine.rng import PythonRNG
+
+
+def make_battle():
+    loader = get_data_loader()
+    player = Player("Jesus")
+    for fish_id in ("holy_mackerel", "carp_diem", "sole_survivor"):
+        player.add_fish_to_party(Fish(fish_id, loader.get_fish_by_id(fish_id), 20))
+    battle = Battle(player, [create_enemy("wild_bandit", 18), create_boss("herod_antipas", 18)],
+                    is_boss=True, rng=PythonRNG(seed=1))
+    battle.execute_turn(BattleAction.ATTACK, 0)
+    battle.active_fish.apply_stat_modifier("atk", 1.5, turns=3)  # Something to copy
+    return battle
+
+
+def timed(label, func, count):
+    start = time.perf_counter()
+    for _ in range(count):
+        func()
+    rate = count / (time.perf_counter() - start)
+    print(f"{label:<36} {rate:>12,.0f} /s")
+
+
+def run(count: int = 20_000):
+    print("=" * 70)
+    print(" SNAPSHOT BENCHMARK ".center(70, "="))
+    print("=" * 70)
+
+    battle = make_battle()
+    rng = PythonRNG(seed=2)
+    log = NullBattleLog()
+    timed("snapshot() + restore()", lambda: battle.restore(battle.snapshot()), count)
+    timed("snapshot(include_rng=True) + restore()",
+          lambda: battle.restore(battle.snapshot(include_rng=True)), count)
+    timed("clone(rng, log)", lambda: battle.clone(rng=rng, log=log), count)
+    timed("clone()", battle.clone, count)
+    timed("copy.deepcopy(battle)", lambda: copy.deepcopy(battle), max(1, count // 50))
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000)
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Startup Benchmark - time to title screen, with and without the data snapshot
+
+Copies src/data/ into two temp folders (one plain, one with a freshly
+built data.snapshot) and starts the game in a fresh Python process for
+each, timing from process start until LoavesAndFishesGame() is ready to
+show the title screen.
+
+Each run is a new process, so every run is a true cold start.
+
+Usage:
+    python benchmarks/bench_startup.py [runs]
+"""
+
+import sys
+import os
+import shutil
+import statistics
+import subprocess
+import tempfile
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+SRC = os.path.join(ROOT, 'src')
+
+# Add src directory to path
+sys.path.insert(0, SRC)
+
+from utils.data_snapshot import build_snapshot
+
+# Runs inside the child process. The game reads "src/data/" relative to
+# the working directory, so cwd decides which data folder is used.
+CHILD = r"""
+import time
+start = time.perf_counter()
+import sys, io, contextlib
+sys.path.insert(0, {root!r})
+sys.path.insert(0, {src!r})
+with contextlib.redirect_stdout(io.StringIO()):
+    import main
+    imported = time.perf_counter()
+    game = main.LoavesAndFishesGame()
+end = time.perf_counter()
+print(end - start, end - imported, game.data_loader.disk_reads, game.data_loader.snapshot_loaded)
+"""
+
+
+def time_startup(workdir: str, runs: int):
+    """
+    Start the game `runs` times from workdir.
+
+    Returns:
+        (total_ms list, init_ms list, disk_reads, snapshot_used)
+        total = process start → title screen, init = LoavesAndFishesGame()
+    """
+    code = CHILD.format(root=ROOT, src=SRC)
+    totals, inits = [], []
+    reads = snapshot = None
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, "-c", code], cwd=workdir,
+                             capture_output=True, text=True, check=True).stdout.split()
+        totals.append(float(out[0]) * 1000)
+        inits.append(float(out[1]) * 1000)
+        reads, snapshot = int(out[2]), out[3] == "True"
+    return totals, inits, reads, snapshot
+
+
+def run(runs: int = 15):
+    print("=" * 70)
+    print(" STARTUP BENCHMARK (time to title screen) ".center(70, "="))
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as json_dir, tempfile.TemporaryDirectory() as snap_dir:
+        for workdir in (json_dir, snap_dir):
+            shutil.copytree(os.path.join(SRC, "data"), os.path.join(workdir, "src", "data"))
+        build_snapshot(os.path.join(snap_dir, "src", "data"))
+
+        print(f"{'mode':<10} {'to title (ms)':>14} {'game init (ms)':>15} {'disk reads':>11}")
+        totals, inits = {}, {}
+        for label, workdir in (("json", json_dir), ("snapshot", snap_dir)):
+            total_ms, init_ms, reads, snapshot = time_startup(workdir, runs)
+            totals[label] = statistics.median(total_ms)
+            inits[label] = statistics.median(init_ms)
+            if label == "snapshot" and not snapshot:
+                print("⚠️  Snapshot was not used - results are not meaningful")
+            print(f"{label:<10} {totals[label]:>14.2f} {inits[label]:>15.2f} {reads:>11}")
+
+    print(f"Medians of {runs} runs. Game init speedup: "
+          f"{inits['json'] / inits['snapshot']:.2f}x, "
+          f"time to title saved: {totals['json'] - totals['snapshot']:.2f} ms")
+    print("(Time to title also includes interpreter start-up and module imports.)")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 15)
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+State Feed Benchmark - what a UI frame costs, polling vs. deltas
+
+A UI polls the battle every frame and a turn happens every 60 frames
+(about one a second). Compares the cost per frame of:
+- get_battle_state(): a fresh dict and the last 5 log lines, every frame
+- get_state_changes(seen): None on idle frames, a delta after a turn
+
+Usage:
+    python benchmarks/bench_state_feed.py [frames]
+"""
+
+import sys
+import os
+import time
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils.data_loader import get_data_loader
+from engine.fish import Fish
+from engine.player import Player
+from engine.enemy import create_enemy
+from engine.battle import Battle, BattleAction
+from engine.rng import PythonRNG
+
+FRAMES_PER_TURN = 60
+
+
+def make_battle():
+    loader = get_data_loader()
+    player = Player("Jesus")
+    fish = Fish("carp_diem", loader.get_fish_by_id("carp_diem"), 50)
+    fish.max_hp = fish.current_hp = 10 ** 9
+    player.add_fish_to_party(fish)
+    enemy = create_enemy("wall_sentinel", 50)
+    enemy.max_hp = enemy.current_hp = 10 ** 9
+    return Battle(player, [enemy], rng=PythonRNG(seed=1))
+
+
+def poll_full_state(battle, frames):
+    for frame in range(frames):
+        if frame % FRAMES_PER_TURN == 0:
+            battle.execute_turn(BattleAction.ATTACK, 0)
+        battle.get_battle_state()
+
+
+def poll_changes(battle, frames):
+    seen = 0
+    for frame in range(frames):
+        if frame % FRAMES_PER_TURN == 0:
+            battle.execute_turn(BattleAction.ATTACK, 0)
+        delta = battle.get_state_changes(seen)
+        if delta is not None:
+            seen = delta["revision"]
+
+
+def run(frames: int = 60_000):
+    print("=" * 70)
+    print(" STATE FEED BENCHMARK ".center(70, "="))
+    print("=" * 70)
+    for name, version in (("get_battle_state() every frame", poll_full_state),
+                          ("get_state_changes() every frame", poll_changes)):
+        battle = make_battle()
+        start = time.perf_counter()
+        version(battle, frames)
+        elapsed = time.perf_counter() - start
+        print(f"{name:<36} {elapsed / frames * 1e6:>8.2f} µs/frame (incl. a turn every "
+              f"{FRAMES_PER_TURN} frames)")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 60_000)
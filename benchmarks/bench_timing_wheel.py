@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Timing Wheel Benchmark - end-of-turn expiry cost vs. battle size
+
+A battle with `enemies` enemies, where only the active fish and the
+first enemy have timed effects (re-applied as they run out). Compares:
+- visit: every fish and enemy checked every turn (the old loop's shape,
+         reproduced with each unit's expire_due())
+- wheel: battle.wheel.advance(), which only wakes the units that are due
+
+Usage:
+    python benchmarks/bench_timing_wheel.py [turns]
+"""
+
+import sys
+import os
+import time
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils.data_loader import get_data_loader
+from engine.fish import Fish
+from engine.player import Player
+from engine.enemy import create_enemy
+from engine.battle import Battle
+from engine.battle_log import NullBattleLog
+from engine.rng import PythonRNG
+
+ENEMY_COUNTS = (1, 50, 500)
+
+
+def make_battle(enemy_count: int) -> Battle:
+    loader = get_data_loader()
+    player = Player("Jesus")
+    for fish_id in ("holy_mackerel", "carp_diem", "sole_survivor"):
+        player.add_fish_to_party(Fish(fish_id, loader.get_fish_by_id(fish_id), 20))
+    enemies = [create_enemy("wild_bandit", 10) for _ in range(enemy_count)]
+    return Battle(player, enemies, rng=PythonRNG(seed=1), log=NullBattleLog())
+
+
+def keep_effects_running(battle: Battle, turn: int):
+    """A few timed effects on two units, renewed as they expire"""
+    if turn % 3 == 0:
+        battle.active_fish.apply_stat_modifier("atk", 1.2, 3)
+        battle.active_enemy.apply_status_effect("burned", 3)
+
+
+def visit_every_unit(battle: Battle, turns: int):
+    wheel = battle.wheel
+    units = [*battle.player.active_party, *battle.enemies]
+    for turn in range(turns):
+        keep_effects_running(battle, turn)
+        wheel.now += 1
+        for unit in units:
+            unit.stat_modifiers.expire_due(wheel)
+            unit.expire_due(wheel)
+
+
+def advance_wheel(battle: Battle, turns: int):
+    for turn in range(turns):
+        keep_effects_running(battle, turn)
+        battle._tick_temporary_effects()
+
+
+def run(turns: int = 20_000):
+    print("=" * 70)
+    print(" TIMING WHEEL BENCHMARK ".center(70, "="))
+    print("=" * 70)
+    print(f"{'enemies':>8}{'visit µs/turn':>16}{'wheel µs/turn':>16}")
+
+    for enemy_count in ENEMY_COUNTS:
+        times = []
+        for version in (visit_every_unit, advance_wheel):
+            battle = make_battle(enemy_count)
+            start = time.perf_counter()
+            version(battle, turns)
+            times.append((time.perf_counter() - start) / turns * 1e6)
+        print(f"{enemy_count:>8}{times[0]:>16.2f}{times[1]:>16.2f}")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000)
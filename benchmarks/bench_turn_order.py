@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Turn Order Benchmark - ordering big rosters with SPD changes mid-round
+
+Each round every actor acts once, fastest first; after every tenth turn
+one actor still waiting gets a SPD buff and has to move. Compares, per
+round, at each roster size:
+- sort:      sort the waiting actors again after every SPD change
+- scheduler: TurnScheduler (one heapify per round, rekey() per change)
+
+Usage:
+    python benchmarks/bench_turn_order.py [rounds]
+"""
+
+import sys
+import os
+import time
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from engine.enemy import create_enemy
+from engine.turn_order import ENEMY_SIDE, TurnScheduler
+
+ROSTER_SIZES = (8, 100, 1000)
+
+
+def make_roster(size):
+    roster = []
+    for i in range(size):
+        enemy = create_enemy("wild_bandit", 10)
+        enemy.spd = 5 + (i * 37) % 50
+        roster.append(enemy)
+    return roster
+
+
+def speed_key(unit):
+    return -unit.get_effective_stat("spd")
+
+
+def buff(unit):
+    unit.stat_modifiers["spd"] = unit.stat_modifiers["spd"] * 1.01
+
+
+def sort_rounds(roster, rounds):
+    for _ in range(rounds):
+        waiting = sorted(roster, key=speed_key)
+        turn = 0
+        while waiting:
+            waiting.pop(0)
+            turn += 1
+            if turn % 10 == 0 and waiting:
+                buff(waiting[-1])
+                waiting.sort(key=speed_key)
+
+
+def scheduler_rounds(roster, rounds):
+    order = TurnScheduler()
+    for _ in range(rounds):
+        order.clear()
+        order.extend([(unit, None, 0, ENEMY_SIDE) for unit in roster])
+        waiting = list(reversed(roster))   # Any actor still to act will do
+        turn = 0
+        while order.pop() is not None:
+            turn += 1
+            if turn % 10 == 0:
+                while waiting and waiting[-1] not in order:
+                    waiting.pop()
+                if waiting:
+                    buff(waiting[-1])
+                    order.rekey(waiting[-1])
+
+
+def run(rounds: int = 20):
+    print("=" * 70)
+    print(" TURN ORDER BENCHMARK ".center(70, "="))
+    print("=" * 70)
+    print(f"{'actors':>8}{'sort ms/round':>18}{'scheduler ms/round':>22}")
+
+    for size in ROSTER_SIZES:
+        times = []
+        for version in (sort_rounds, scheduler_rounds):
+            roster = make_roster(size)
+            start = time.perf_counter()
+            version(roster, rounds)
+            times.append((time.perf_counter() - start) / rounds * 1e3)
+        print(f"{size:>8}{times[0]:>18.3f}{times[1]:>22.3f}")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
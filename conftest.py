@@ -0,0 +1,63 @@
+"""
+Shared test setup - the players, enemies and battles the test_*.py scripts build
+
+pytest loads this file by itself; the scripts import it too when run
+directly (python test_horde.py), so everything here is a plain function:
+
+    from conftest import make_battle, make_enemies
+    battle = make_battle(make_enemies(count=2, hp=10 ** 6), fish_ids=("carp_diem",))
+"""
+
+import sys
+import os
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from utils.data_loader import get_data_loader
+from engine.fish import Fish
+from engine.player import Player
+from engine.enemy import create_enemy
+from engine.battle import Battle
+from engine.rng import PythonRNG
+
+
+def make_fish(fish_id="holy_mackerel", level=10, hp=None):
+    """A fish of this species (hp: max and current HP, e.g. 10 ** 6 for fights that can't end)"""
+    fish = Fish(fish_id, get_data_loader().get_fish_by_id(fish_id), level)
+    if hp is not None:
+        fish.max_hp = fish.current_hp = hp
+    return fish
+
+
+def make_player(fish_ids=("holy_mackerel",), level=10, hp=None):
+    """A player with these fish in the party, in order"""
+    player = Player("Jesus")
+    for fish_id in fish_ids:
+        player.add_fish_to_party(make_fish(fish_id, level, hp))
+    return player
+
+
+def make_enemies(enemy_id="wild_bandit", count=1, level=10, hp=None):
+    """count enemies of one kind"""
+    enemies = [create_enemy(enemy_id, level) for _ in range(count)]
+    if hp is not None:
+        for enemy in enemies:
+            enemy.max_hp = enemy.current_hp = hp
+    return enemies
+
+
+def make_battle(enemies=None, fish_ids=("holy_mackerel",), level=10, seed=5, hp=None,
+                **kwargs):
+    """
+    A seeded battle.
+
+    Args:
+        enemies: The enemies (default: one wild_bandit at `level`)
+        fish_ids, level, hp: The player's party (see make_player())
+        seed: PythonRNG seed
+        **kwargs: Passed on to Battle (log, is_boss, ...)
+    """
+    if enemies is None:
+        enemies = make_enemies(level=level)
+    return Battle(make_player(fish_ids, level, hp), enemies, rng=PythonRNG(seed=seed), **kwargs)
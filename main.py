@@ -24,7 +24,7 @@ from engine.fishing import FISHING_SPOTS
 from ui.menu import MainMenu, MenuManager, MenuResult, ShopMenu
 from ui.shops import get_shop
 from utils.save_system import get_save_system
-from utils.data_loader import DataLoader
+from utils.data_loader import get_data_loader
 
 
 class LoavesAndFishesGame:
@@ -39,9 +39,10 @@ class LoavesAndFishesGame:
         print()
 
         # Initialize core systems
+        # One shared data context - every system gets the same loader
+        self.data_loader = get_data_loader()
         self.player = Player("Jesus")
-        self.game_state = GameState(self.player)
-        self.data_loader = DataLoader()
+        self.game_state = GameState(self.player, self.data_loader)
 
         # Initialize managers
         self.town_manager = TownManager()
@@ -55,7 +56,7 @@ class LoavesAndFishesGame:
         self.miracle_meter = MiracleMeter()
 
         # Save system
-        self.save_system = get_save_system()
+        self.save_system = get_save_system(data_loader=self.data_loader)
 
         # Game running flag
         self.running = True
@@ -67,6 +68,9 @@ class LoavesAndFishesGame:
         """Load all game data from JSON files"""
         print("Loading game data...")
 
+        # Warm the shared cache (one read when data.snapshot is fresh)
+        self.data_loader.preload_all()
+
         # Load towns
         towns_data = self.data_loader.get_all_towns()
         for town_data in towns_data:
@@ -323,7 +327,7 @@ class LoavesAndFishesGame:
         if shop:
             print(f"\n{shop.greeting}")
             shop_manager = MenuManager()
-            shop_manager.push_menu(ShopMenu(self.player, shop))
+            shop_manager.push_menu(ShopMenu(self.player, shop, self.data_loader))
 
             while shop_manager.current_menu():
                 menu = shop_manager.current_menu()
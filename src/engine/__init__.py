@@ -2,19 +2,27 @@
 Game engine modules for Loaves and Fishes
 """
 
-from .fish import Fish
+from .fish import Fish, FishSpecies
 from .player import Player
-from .enemy import Enemy, Boss, create_enemy, create_boss
+from .enemy import Enemy, Boss, EnemyFactory, get_enemy_factory, create_enemy, create_boss
 from .battle import Battle, BattleAction, BattleResult
+from .rng import RNG, PythonRNG, BufferedRNG, get_default_rng
 
 __all__ = [
     'Fish',
+    'FishSpecies',
     'Player',
     'Enemy',
     'Boss',
     'Battle',
     'BattleAction',
     'BattleResult',
+    'EnemyFactory',
+    'get_enemy_factory',
     'create_enemy',
-    'create_boss'
+    'create_boss',
+    'RNG',
+    'PythonRNG',
+    'BufferedRNG',
+    'get_default_rng'
 ]
@@ -1,10 +1,16 @@
 """
 Apostle Abilities System - Special battle abilities for each apostle
+
+Cooldowns are stored as the turn the ability is ready again, on the
+ApostleManager's TimingWheel (see timing_wheel.py), so passing a turn
+is one counter increment however many apostles are recruited.
 """
 
 from typing import Dict, Any, Optional, List
 from enum import Enum
 
+from .timing_wheel import TimingWheel
+
 
 class AbilityType(Enum):
     """Types of apostle abilities"""
@@ -49,11 +55,28 @@ class ApostleAbility:
         self.power = power
         self.targets = targets
         self.cooldown = cooldown
-        self.current_cooldown = 0
+        self.ready_turn = 0      # Turn it can be used again
+        self.wheel: Optional[TimingWheel] = None  # Turn counter (set by ApostleManager)
 
         # Special effects
         self.effects: Dict[str, Any] = {}
 
+    @property
+    def current_cooldown(self) -> int:
+        """Turns until the ability is ready (0 = ready)"""
+        now = self.wheel.now if self.wheel is not None else 0
+        return max(0, self.ready_turn - now)
+
+    @current_cooldown.setter
+    def current_cooldown(self, turns: int):
+        self.ready_turn = (self.wheel.now if self.wheel is not None else 0) + turns
+
+    def attach_wheel(self, wheel: TimingWheel):
+        """Count the cooldown on `wheel` (turns left stay the same)"""
+        turns = self.current_cooldown
+        self.wheel = wheel
+        self.current_cooldown = turns
+
     def use(self) -> bool:
         """
         Use the ability
@@ -71,9 +94,9 @@ class ApostleAbility:
         return self.current_cooldown == 0
 
     def tick_cooldown(self):
-        """Reduce cooldown by 1"""
+        """Reduce cooldown by 1 (for this ability alone - ApostleManager ticks its wheel)"""
         if self.current_cooldown > 0:
-            self.current_cooldown -= 1
+            self.ready_turn -= 1
 
     def reset_cooldown(self):
         """Reset cooldown to 0"""
@@ -220,6 +243,7 @@ class ApostleManager:
         """Initialize apostle manager"""
         self.recruited_apostles: List[str] = []
         self.abilities: Dict[str, ApostleAbility] = {}
+        self.wheel = TimingWheel(owner=self)  # Turns that cooldowns count
 
     def recruit_apostle(self, apostle_id: str):
         """
@@ -233,7 +257,8 @@ class ApostleManager:
 
             # Add their ability
             if apostle_id in APOSTLE_ABILITIES:
-                self.abilities[apostle_id] = APOSTLE_ABILITIES[apostle_id]
+                ability = self.abilities[apostle_id] = APOSTLE_ABILITIES[apostle_id]
+                ability.attach_wheel(self.wheel)
 
     def has_apostle(self, apostle_id: str) -> bool:
         """Check if apostle is recruited"""
@@ -248,9 +273,8 @@ class ApostleManager:
         return [ability for ability in self.abilities.values() if ability.is_ready()]
 
     def tick_all_cooldowns(self):
-        """Reduce all ability cooldowns"""
-        for ability in self.abilities.values():
-            ability.tick_cooldown()
+        """Reduce all ability cooldowns (one turn on the wheel - no per-ability work)"""
+        self.wheel.advance()
 
     def reset_all_cooldowns(self):
         """Reset all ability cooldowns (for new battle)"""
@@ -0,0 +1,307 @@
+"""
+Batch runner - many full Battle runs spread over worker processes
+
+engine.sim is the fast, simplified simulator. This module plays REAL
+battles (Battle.execute_turn(), every rule included) for balance sweeps
+like "every fish at levels 5/10/20 against every enemy", and spreads
+them over a ProcessPoolExecutor.
+
+REPRODUCIBLE:
+Every battle gets its own seed, derived from the run seed and the
+battle's spec + replicate number (derive_seed()), and the battle draws
+from its own PythonRNG seeded with it, so a battle's result only
+depends on what it is - not on which worker ran it, or how many workers
+there were. Same seed → bit-for-bit the same results.
+
+COMPACT RESULTS:
+Workers send back small chunks of integer columns (array('i')), and
+BatchResults keeps them that way: one column per field, one entry per
+battle, instead of a dict per battle.
+
+Usage:
+    from engine.batch_runner import BattleSpec, run_batch
+
+    specs = [BattleSpec("holy_mackerel", 10, "wild_bandit", 10)]
+    results = run_batch(specs, battles_per_spec=1000, seed=42, workers=4)
+    for row in results.summary():
+        print(row["fish_id"], row["enemy_id"], row["win_rate"])
+
+    # Or from the command line:
+    python batch_battles.py --levels 5 10 20 -n 200 --workers 4
+"""
+
+import os
+import hashlib
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+# Import data loader - handle both direct and relative imports
+try:
+    from utils.data_loader import get_data_loader
+except ImportError:
+    from ..utils.data_loader import get_data_loader
+
+from .fish import Fish
+from .player import Player
+from .enemy import create_enemy, create_boss
+from .battle import Battle, BattleAction, BattleResult
+from .rng import PythonRNG
+from .battle_log import NullBattleLog
+from .enemy_ai import make_reproducible
+
+# Outcome codes stored in the "outcome" column
+OUTCOME_CODES = {
+    BattleResult.VICTORY: 1,
+    BattleResult.DEFEAT: -1,
+    BattleResult.ONGOING: 0,   # Hit max_turns
+    BattleResult.FLED: 2,
+}
+
+# Per-battle columns, in the order workers send them
+COLUMNS = ("spec", "outcome", "turns", "damage_dealt", "damage_taken")
+
+# Player move choice: always a known_moves index, or this for a random one
+RANDOM_MOVE = -1
+
+
+class BattleSpec(NamedTuple):
+    """
+    One matchup: a fish at a level vs. an enemy (or boss) at a level.
+
+    Example:
+        BattleSpec("carp_diem", 5, "wild_bandit", 5)
+        BattleSpec("holy_mackerel", 30, "herod_antipas", 30, is_boss=True)
+    """
+    fish_id: str
+    fish_level: int
+    enemy_id: str
+    enemy_level: int
+    is_boss: bool = False
+
+
+def derive_seed(seed: int, spec: BattleSpec, replicate: int) -> int:
+    """
+    Seed for one battle.
+
+    Hashes the run seed, the spec and the replicate number, so every
+    battle has its own well-mixed seed that doesn't depend on run order.
+
+    Args:
+        seed: Seed of the whole run
+        spec: The battle's matchup
+        replicate: Which repetition of the matchup (0, 1, 2, ...)
+
+    Returns:
+        64-bit integer seed
+    """
+    key = f"{seed}|{'|'.join(map(str, spec))}|{replicate}".encode()
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "little")
+
+
+def run_battle(spec: BattleSpec, seed: int, move: int = RANDOM_MOVE,
+               max_turns: int = 100) -> Tuple[int, int, int, int]:
+    """
+    Play one battle to the end with a fixed seed.
+
+    The fish attacks every turn (with move `move`, or a random known
+    move); nothing else happens - no items, switches or apostles.
+
+    Args:
+        spec: Matchup to play
+        seed: Battle seed (see derive_seed())
+        move: known_moves index to use every turn, or RANDOM_MOVE
+        max_turns: Turn limit (the battle counts as unfinished after it)
+
+    Returns:
+        (outcome code, turns, damage dealt, damage taken)
+    """
+    rng = PythonRNG(seed=seed)
+    loader = get_data_loader()
+
+    player = Player("Jesus")
+    fish = Fish(spec.fish_id, loader.get_fish_by_id(spec.fish_id), spec.fish_level)
+    player.add_fish_to_party(fish)
+    if spec.is_boss:
+        enemy = create_boss(spec.enemy_id, spec.enemy_level)
+    else:
+        enemy = create_enemy(spec.enemy_id, spec.enemy_level)
+    if enemy is None:
+        raise ValueError(f"Unknown {'boss' if spec.is_boss else 'enemy'}: {spec.enemy_id}")
+    make_reproducible([enemy])  # Search AI mustn't depend on timing
+
+    battle = Battle(player, [enemy], is_boss=spec.is_boss, data_loader=loader, rng=rng,
+                    log=NullBattleLog())
+    move_count = len(fish.known_moves)
+    while battle.result == BattleResult.ONGOING and battle.turn_count < max_turns:
+        index = rng.randrange(move_count) if move == RANDOM_MOVE else move
+        battle.execute_turn(BattleAction.ATTACK, index)
+
+    return (OUTCOME_CODES[battle.result], battle.turn_count,
+            enemy.max_hp - enemy.current_hp, fish.max_hp - fish.current_hp)
+
+
+def _run_chunk(specs: Sequence[BattleSpec], tasks: Sequence[Tuple[int, int]], seed: int,
+               move: int, max_turns: int) -> List[array]:
+    """Play (spec index, replicate) tasks → one array per column"""
+    columns = [array("i") for _ in COLUMNS]
+    spec_col, outcome_col, turns_col, dealt_col, taken_col = columns
+    for spec_index, replicate in tasks:
+        spec = specs[spec_index]
+        outcome, turns, dealt, taken = run_battle(
+            spec, derive_seed(seed, spec, replicate), move, max_turns)
+        spec_col.append(spec_index)
+        outcome_col.append(outcome)
+        turns_col.append(turns)
+        dealt_col.append(dealt)
+        taken_col.append(taken)
+    return columns
+
+
+# A worker process's run settings, set once by _init_worker() so chunks
+# don't each carry the whole spec list
+_worker_job: Optional[Tuple[Sequence[BattleSpec], int, int, int]] = None
+
+
+def _init_worker(specs: Sequence[BattleSpec], seed: int, move: int, max_turns: int):
+    """Pool initializer: keep the run settings in this worker"""
+    global _worker_job
+    _worker_job = (specs, seed, move, max_turns)
+
+
+def _run_worker_chunk(tasks: Sequence[Tuple[int, int]]) -> List[array]:
+    """Worker entry point: _run_chunk() with the settings from _init_worker()"""
+    specs, seed, move, max_turns = _worker_job
+    return _run_chunk(specs, tasks, seed, move, max_turns)
+
+
+class BatchResults:
+    """
+    Every battle's result, stored column by column.
+
+    Attributes:
+        specs: The matchups (the "spec" column indexes into this)
+        columns: {column name: array('i')}, one entry per battle,
+                 ordered by spec, then replicate
+    """
+
+    def __init__(self, specs: Sequence[BattleSpec], columns: Dict[str, array]):
+        self.specs = list(specs)
+        self.columns = columns
+
+    def __len__(self) -> int:
+        return len(self.columns["spec"])
+
+    def __getitem__(self, column: str) -> array:
+        return self.columns[column]
+
+    def __eq__(self, other: Any) -> bool:
+        return (isinstance(other, BatchResults) and self.specs == other.specs
+                and self.columns == other.columns)
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """
+        One row of headline numbers per spec.
+
+        Returns:
+            List of dicts with the spec fields plus battles, win_rate,
+            loss_rate, avg_turns_to_win, avg_damage_dealt, avg_damage_taken
+        """
+        totals = [[0, 0, 0, 0, 0, 0] for _ in self.specs]  # battles, wins, losses, win turns, dealt, taken
+        for spec, outcome, turns, dealt, taken in zip(*(self.columns[c] for c in COLUMNS)):
+            row = totals[spec]
+            row[0] += 1
+            if outcome == 1:
+                row[1] += 1
+                row[3] += turns
+            elif outcome == -1:
+                row[2] += 1
+            row[4] += dealt
+            row[5] += taken
+
+        rows = []
+        for spec, (battles, wins, losses, win_turns, dealt, taken) in zip(self.specs, totals):
+            battles_or_1 = battles or 1
+            rows.append({
+                **spec._asdict(),
+                "battles": battles,
+                "win_rate": wins / battles_or_1,
+                "loss_rate": losses / battles_or_1,
+                "avg_turns_to_win": win_turns / wins if wins else 0.0,
+                "avg_damage_dealt": dealt / battles_or_1,
+                "avg_damage_taken": taken / battles_or_1,
+            })
+        return rows
+
+
+def sweep_specs(levels: Iterable[int], fish_ids: Optional[Iterable[str]] = None,
+                enemy_ids: Optional[Iterable[str]] = None) -> List[BattleSpec]:
+    """
+    Every fish against every enemy, at each level (both sides the same level).
+
+    Args:
+        levels: Levels to test, e.g. (5, 10, 20)
+        fish_ids: Fish species (default: all of fish.json)
+        enemy_ids: Regular enemies (default: all of enemies.json)
+
+    Returns:
+        List of BattleSpec
+
+    Raises:
+        ValueError: If a fish or enemy id isn't in the data
+    """
+    loader = get_data_loader()
+    all_fish = [fish["id"] for fish in loader.get_all_fish()]
+    all_enemies = [enemy["id"] for enemy in loader.load_json("enemies.json").get("enemies", [])]
+    fish_ids = list(fish_ids) if fish_ids else all_fish
+    enemy_ids = list(enemy_ids) if enemy_ids else all_enemies
+    for kind, ids, known in (("fish", fish_ids, all_fish), ("enemy", enemy_ids, all_enemies)):
+        unknown = [item for item in ids if item not in known]
+        if unknown:
+            raise ValueError(f"Unknown {kind} id(s): {', '.join(unknown)}")
+    return [BattleSpec(fish_id, level, enemy_id, level)
+            for level in levels for fish_id in fish_ids for enemy_id in enemy_ids]
+
+
+def run_batch(specs: Sequence[BattleSpec], battles_per_spec: int = 100, seed: int = 0,
+              workers: Optional[int] = None, move: int = RANDOM_MOVE, max_turns: int = 100,
+              chunk_size: int = 250) -> BatchResults:
+    """
+    Play every spec battles_per_spec times, spread over worker processes.
+
+    Results are identical for any number of workers: each battle has its
+    own derived seed, and chunks are put back together in order.
+
+    Args:
+        specs: Matchups to play
+        battles_per_spec: Battles per matchup
+        seed: Seed of the whole run
+        workers: Worker processes (default: os.cpu_count()); 1 runs
+                 everything in this process
+        move: known_moves index the fish always uses, or RANDOM_MOVE
+        max_turns: Turn limit per battle
+        chunk_size: Battles sent to a worker at a time (bigger = less
+                    overhead, smaller = better load balancing)
+
+    Returns:
+        BatchResults
+    """
+    specs = list(specs)
+    tasks = [(spec_index, replicate) for spec_index in range(len(specs))
+             for replicate in range(battles_per_spec)]
+    chunks = [tasks[i:i + chunk_size] for i in range(0, len(tasks), chunk_size)]
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1 or len(chunks) <= 1:
+        parts = [_run_chunk(specs, chunk, seed, move, max_turns) for chunk in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(specs, seed, move, max_turns)) as pool:
+            futures = [pool.submit(_run_worker_chunk, chunk) for chunk in chunks]
+            parts = [future.result() for future in futures]
+
+    columns = {name: array("i") for name in COLUMNS}
+    for part in parts:
+        for name, values in zip(COLUMNS, part):
+            columns[name].extend(values)
+    return BatchResults(specs, columns)
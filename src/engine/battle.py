@@ -26,26 +26,36 @@ KEY FORMULAS:
 See constants.py for all balance values.
 """
 
-from typing import Dict, List, Optional, Any, Tuple
-import random
+from typing import Callable, Dict, List, NamedTuple, Optional, Any, Tuple
 from enum import Enum
+from functools import wraps
 
 from .fish import Fish
 from .player import Player
 from .enemy import Enemy, Boss
+from .rng import RNG, PythonRNG, get_default_rng
+from .battle_log import (BattleLog, NullBattleLog, LogEvent,
+                         FLAG_CRITICAL, FLAG_SUPER_EFFECTIVE, FLAG_NOT_EFFECTIVE)
+from .damage import apply_damage_formula, VARIANCE_MIN, VARIANCE_MAX
+from .elements import defender_type_id, effectiveness_by_id, type_effectiveness
+from .statuses import (ACCURACY_MASK, ACTION_MASK, DAMAGE_MASK, INVINCIBLE,
+                       accuracy_multiplier, handlers_for)
+from .moves import Move, as_move
 from .apostle_abilities import APOSTLE_ABILITIES
 from .miracles import MIRACLES
+from .timing_wheel import TimingWheel
+from .turn_order import ENEMY_SIDE, INTERJECTION_SPEED, PARTY_SIDE, TurnScheduler
 
 # Import constants - handle both direct and relative imports
 try:
-    from utils.constants import TYPE_CHART, BASE_CRIT_CHANCE, CRIT_MULTIPLIER
+    from utils.constants import BASE_CRIT_CHANCE
 except ImportError:
-    from ..utils.constants import TYPE_CHART, BASE_CRIT_CHANCE, CRIT_MULTIPLIER
+    from ..utils.constants import BASE_CRIT_CHANCE
 
 try:
-    from utils.data_loader import DataLoader
+    from utils.data_loader import DataLoader, get_data_loader
 except ImportError:
-    from ..utils.data_loader import DataLoader
+    from ..utils.data_loader import DataLoader, get_data_loader
 
 
 class BattleAction(Enum):
@@ -83,59 +93,46 @@ class BattleResult(Enum):
     ONGOING = "ongoing"  # Battle continues
 
 
-class BattleLog:
-    """
-    Stores battle events for UI display.
-
-    The battle log keeps a running list of all events that happen
-    during combat (attacks, damage, faints, etc.).
+# get_battle_state() fields the state feed tracks (see get_state_changes();
+# the log is sent as new events instead of recent_log)
+STATE_FIELDS = ("turn", "result", "active_fish", "active_enemy", "all_enemies",
+                "miracle_meter", "can_flee", "apostle_used")
 
-    The UI typically shows the most recent 5-10 messages.
-
-    Usage:
-        log = BattleLog()
-        log.add("Fish used Splash!")
-        log.add("Enemy took 50 damage!")
-        recent = log.get_recent(5)  # Get last 5 messages
-    """
 
-    def __init__(self):
-        """Initialize an empty battle log"""
-        self.events: List[str] = []  # List of event messages in order
+# Revisions whose log position the feed remembers: a caller further
+# behind than this gets everything again, as on its first call
+STATE_MARKS_KEPT = 256
 
-    def add(self, message: str):
-        """
-        Add a message to the battle log.
 
-        Messages are appended in chronological order.
-        Each message represents one event (attack, damage, etc.)
+def _changes_state(action: Callable) -> Callable:
+    """Public Battle actions: the state feed rechecks before its next answer"""
+    @wraps(action)
+    def run(self, *args, **kwargs):
+        self._state_stale = True
+        return action(self, *args, **kwargs)
+    return run
 
-        Args:
-            message: Text description of what happened
-        """
-        self.events.append(message)
 
-    def get_recent(self, count: int = 5) -> List[str]:
-        """
-        Get the most recent N messages from the log.
+def _unit_state_key(unit: Any) -> Any:
+    """What the UI shows of a fish or enemy, as a comparable tuple (None if none)"""
+    if unit is None:
+        return None
+    return (id(unit), unit.current_hp, unit.max_hp, unit.status_mask, unit.level,
+            getattr(unit, "xp", 0), tuple(unit.stat_modifiers.values()))
 
-        Uses Python's negative slicing: events[-5:] gets last 5 items.
 
-        Args:
-            count: Number of recent messages to get (default 5)
-
-        Returns:
-            List of most recent messages (may be fewer than count if log is short)
-        """
-        return self.events[-count:]
-
-    def clear(self):
-        """
-        Clear the entire battle log.
+class BattleSnapshot(NamedTuple):
+    """
+    A battle's mutable state at one moment (see Battle.snapshot()).
 
-        Used when starting a new battle to reset the event history.
-        """
-        self.events.clear()
+    Each object is kept by reference together with a tuple of its
+    state, so restoring writes the values back into the same objects.
+    """
+    battle: Tuple      # Battle fields (turn, result, active combatants, ...)
+    player: Tuple      # Player.snapshot_state()
+    fish: Tuple        # ((fish, Fish.snapshot_state()), ...) for the party
+    enemies: Tuple     # ((enemy, Enemy.snapshot_state()), ...) still in battle
+    rng: Any = None    # rng.getstate() if requested
 
 
 class Battle:
@@ -144,7 +141,10 @@ class Battle:
     Manages turn-based combat between player's fish and enemies.
     """
 
-    def __init__(self, player: Player, enemies: List[Enemy], is_boss: bool = False):
+    def __init__(self, player: Player, enemies: List[Enemy], is_boss: bool = False,
+                 data_loader: Optional[DataLoader] = None, rng: Optional[RNG] = None,
+                 log: Optional[BattleLog] = None, record_replay: bool = False,
+                 replay_seed: Optional[int] = None):
         """
         Initialize a new battle instance.
 
@@ -156,6 +156,15 @@ class Battle:
             enemies: List of enemies to fight (1-3 enemies typically)
             is_boss: Whether this is a boss battle (default False)
                     Boss battles: Can't flee, may have dialogue/cutscenes
+            data_loader: Shared data context (default: get_data_loader())
+            rng: Random number stream for every roll in this battle
+                 (default: get_default_rng(), the global random stream)
+            log: Event log (default: a new BattleLog; simulations can pass
+                 CountingBattleLog() or NullBattleLog())
+            record_replay: Record a replay (see replay.py): the battle gets
+                           its own seeded RNG, every turn's action is kept and
+                           search-AI enemies plan at a fixed depth
+            replay_seed: Seed for the recorded battle (default: random)
 
         Example:
             # Random encounter with 2 enemies
@@ -185,19 +194,47 @@ class Battle:
         self.result = BattleResult.ONGOING       # Battle not finished yet
         self.can_flee = not is_boss              # Can flee unless boss
 
-        # BATTLE LOG: Stores all battle events for UI display
-        self.log = BattleLog()  # Empty log, populated during battle
-
         # ABILITY TRACKING: One-time use abilities
         self.apostle_used = False  # Can only use apostle once per battle
         self.miracle_used = False  # Can only use miracle once per battle
 
         # ITEM/MIRACLE STATE
         self.bread_multiplier = 1.0
-        self._queued_enemy_attack: Optional[Dict[str, Any]] = None
-
-        # DATA LOADER
-        self.data_loader = DataLoader()
+        self._queued_enemy_attack: Optional[Move] = None
+
+        # TURN ORDER: Who still acts this turn (see turn_order.py)
+        self.turn_order = TurnScheduler()
+
+        # TIMED EFFECTS: Every fish and enemy counts turns on the battle's
+        # wheel, which only wakes the ones with something running out
+        self.wheel = TimingWheel(owner=self)
+        for unit in (*player.active_party, *enemies):
+            unit.attach_wheel(self.wheel)
+
+        # DATA LOADER: Shared process-wide cache (no per-battle disk reads)
+        self.data_loader = data_loader or get_data_loader()
+
+        # RNG: Every roll (damage, accuracy, crits, enemy AI, fleeing)
+        self.rng = rng or get_default_rng()
+
+        # REPLAY: Starting state + seed + actions (None when not recording)
+        self.replay = None
+        if record_replay:
+            if rng is not None:
+                raise ValueError("A recorded battle uses its own seeded RNG; don't pass rng")
+            from .replay import Replay, capture_start, new_replay_seed
+            from .enemy_ai import make_reproducible
+            make_reproducible(enemies)  # Search AI mustn't depend on timing
+            seed = replay_seed if replay_seed is not None else new_replay_seed()
+            self.rng = PythonRNG(seed=seed)
+            self.replay = Replay(seed, capture_start(player, enemies, is_boss))
+            self._replay_enemies = list(enemies)  # self.enemies drops defeated ones
+
+        # BATTLE LOG: Stores battle events for UI display (text built on demand)
+        self.log = log if log is not None else BattleLog(data_loader=self.data_loader)
+
+        # STATE FEED: Revision number and what changed when (see get_state_changes())
+        self._reset_state_feed()
 
         # INITIALIZE: Set up starting combatants and show intro
         self._initialize_battle()
@@ -233,7 +270,7 @@ class Battle:
             # NO FISH AVAILABLE: Instant defeat
             # This shouldn't happen in normal gameplay
             # (player should always have at least one fish)
-            self.log.add("No fish available to battle!")
+            self.log.record(LogEvent.NO_FISH)
             self.result = BattleResult.DEFEAT
             return  # Exit early, battle over immediately
 
@@ -244,7 +281,7 @@ class Battle:
         else:
             # NO ENEMIES: Instant victory
             # This is a bug if it happens (shouldn't create battle with no enemies)
-            self.log.add("No enemies to fight!")
+            self.log.record(LogEvent.NO_ENEMIES)
             self.result = BattleResult.VICTORY
             return  # Exit early, battle over immediately
 
@@ -252,7 +289,7 @@ class Battle:
         # Build comma-separated list of enemy names
         # Example: "Pharisee, Sadducee, Tax Collector"
         enemy_names = ", ".join([e.name for e in self.enemies])
-        self.log.add(f"Battle started against {enemy_names}!")
+        self.log.record(LogEvent.BATTLE_START, detail=enemy_names)
 
         # STEP 4: BOSS INTRO DIALOGUE (if boss battle)
         if self.is_boss:
@@ -260,9 +297,10 @@ class Battle:
             # Shows flavor text before battle starts
             # Example: "Herod: You dare challenge me?"
             if hasattr(self.active_enemy, 'intro_dialogue'):
-                self.log.add(f"{self.active_enemy.name}: {self.active_enemy.intro_dialogue}")
+                self.log.record(LogEvent.DIALOGUE, self.active_enemy.name,
+                                detail=self.active_enemy.intro_dialogue)
 
-    def calculate_damage(self, attacker_stat: int, move: Dict[str, Any],
+    def calculate_damage(self, attacker_stat: int, move: Move,
                         defender: Any, attacker_type: str = None) -> Tuple[int, bool, float]:
         """
         Calculate damage for an attack using the battle damage formula.
@@ -303,7 +341,7 @@ class Battle:
 
         Args:
             attacker_stat: Attacker's effective ATK stat (after buffs/debuffs)
-            move: Move dictionary with power, type, accuracy
+            move: The Move (power, type, accuracy); a move dict also works
             defender: Defender (Fish or Enemy instance)
             attacker_type: Type of attacker for STAB bonus (optional)
 
@@ -313,53 +351,45 @@ class Battle:
         Note:
             Defense is applied AFTER this calculation in the defender's take_damage() method.
             See fish.py:take_damage() for defense formula.
+
+            For the exact odds of a hit instead of one roll, see
+            damage.damage_distribution().
         """
+        # Moves are compiled (see moves.py); a raw dict still works
+        if not isinstance(move, Move):
+            move = as_move(move)
+
         # STEP 1: Get base power (random from range or fixed value)
-        power = move.get("power", [0, 0])
-        if isinstance(power, list):
+        if move.rolls_power:
             # Power is a range [min, max] - pick random value
-            base_damage = random.randint(power[0], power[1])
+            base_damage = self.rng.randint(move.power_min, move.power_max)
         else:
             # Power is a fixed value
-            base_damage = power
-
-        # STEP 2: Apply attacker's ATK stat
-        # Formula: base_power + (ATK / 2)
-        # This makes ATK meaningful but not overpowering
-        damage = base_damage + (attacker_stat // 2)  # // is integer division (rounds down)
+            base_damage = move.power_min
 
-        # STEP 3: Check for critical hit (5% base chance)
-        # Critical hits deal 1.5x damage (see constants.py)
-        is_critical = random.random() < BASE_CRIT_CHANCE  # random.random() returns 0.0-1.0
-        if is_critical:
-            damage = int(damage * CRIT_MULTIPLIER)  # Default 1.5x
+        # STEP 2-3: Roll for a critical hit (5% base chance)
+        # random() returns 0.0-1.0
+        is_critical = self.rng.random() < BASE_CRIT_CHANCE
 
         # STEP 4: Type effectiveness
         # Get move type (Holy, Water, Earth, Spirit, Dark)
-        move_type = move.get("type", "Normal")
+        move_type = move.type
 
-        # Get defender type (fish use 'type', enemies use 'enemy_type')
-        defender_type = getattr(defender, 'type', None)
-        if not defender_type:
-            defender_type = getattr(defender, 'enemy_type', 'Normal')
-
-        # Look up effectiveness multiplier from TYPE_CHART
-        effectiveness = self._get_type_effectiveness(move_type, defender_type)
-        damage = int(damage * effectiveness)
+        # Look up effectiveness multiplier in the compiled TYPE_CHART
+        # (integer type ids, one flat table - see elements.py)
+        effectiveness = effectiveness_by_id(move.type_id, defender_type_id(defender))
 
         # STEP 5: STAB (Same Type Attack Bonus)
-        # If attacker's type matches move type, +20% damage
         # Example: Holy Mackerel using Holy Splash gets STAB
-        if attacker_type and move_type == attacker_type:
-            damage = int(damage * 1.2)  # 20% bonus
+        stab = bool(attacker_type and move_type == attacker_type)
 
         # STEP 6: Random variance (85-100%)
         # Prevents damage from being too predictable
-        # Makes each attack feel slightly different
-        damage = int(damage * random.uniform(0.85, 1.0))
+        variance = self.rng.uniform(VARIANCE_MIN, VARIANCE_MAX)
 
-        # STEP 7: Minimum 1 damage (prevents 0 damage stalling)
-        damage = max(1, damage)
+        # Put it together (see apply_damage_formula())
+        damage = apply_damage_formula(base_damage, attacker_stat, is_critical,
+                                      effectiveness, stab, variance)
 
         # Return damage (before defense), crit flag, and type effectiveness
         return damage, is_critical, effectiveness
@@ -390,14 +420,10 @@ class Battle:
             If types aren't in chart, defaults to 1.0 (neutral).
             This handles "Normal" type or missing types gracefully.
         """
-        # Look up in TYPE_CHART (imported from constants.py)
-        # Chart format: TYPE_CHART[attacker][defender] = multiplier
-        if attack_type in TYPE_CHART and defend_type in TYPE_CHART[attack_type]:
-            return TYPE_CHART[attack_type][defend_type]
-
-        # Default to neutral if type combo not found
-        return 1.0
+        # Same compiled table calculate_damage() reads by type id (see elements.py)
+        return type_effectiveness(attack_type, defend_type)
 
+    @_changes_state
     def player_attack(self, move_index: int) -> bool:
         """
         Player's fish uses an attack against the active enemy.
@@ -437,20 +463,25 @@ class Battle:
         # VALIDATION: Check if fish can use this move
         # can_use_move() checks status effects (frozen, asleep, etc.)
         if not self.active_fish.can_use_move(move_index):
-            self.log.add(f"{self.active_fish.name} cannot use that move!")
+            self.log.record(LogEvent.CANNOT_USE_MOVE, self.active_fish.name)
             return False
 
+        # Statuses that cost a turn by chance (paralyzed) - the turn is used
+        if self.active_fish.status_mask & ACTION_MASK and self._status_stops_action(self.active_fish):
+            return True
+
         # STEP 1: Get the move data
-        # known_moves is a list of move dictionaries from fish data
+        # known_moves is a list of compiled Moves (see moves.py)
         move = self.active_fish.known_moves[move_index]
 
         # STEP 2: Accuracy check
         # Most moves have 100% accuracy, but some may miss
         # Roll random 1-100, if higher than accuracy, attack misses
-        accuracy = move.get("accuracy", 100)  # Default 100% if not specified
-        if random.randint(1, 100) > accuracy:
+        # (Default 100% if not specified - filled in when the move was compiled)
+        if self.rng.randint(1, 100) > self._hit_chance(self.active_fish, move):
             # Move missed - still uses turn, but no damage
-            self.log.add(f"{self.active_fish.name} used {move['name']}, but it missed!")
+            self.log.record(LogEvent.MISS, self.active_fish.name, self.active_enemy.name,
+                            detail=move.name)
             return True  # Action succeeded but missed
 
         # STEP 3: Calculate damage
@@ -468,22 +499,21 @@ class Battle:
         # Returns actual damage dealt after defense
         actual_damage = self.active_enemy.take_damage(damage)
 
-        # STEP 5: Build battle message with flavor text
-        message = f"{self.active_fish.name} used {move['name']}!"
+        # STEP 5: Log the attack (text is only built when the UI shows it)
+        flags = 0
 
-        # Add critical hit notification
+        # Critical hit notification
         if is_crit:
-            message += " Critical hit!"
+            flags |= FLAG_CRITICAL
 
-        # Add type effectiveness flavor text
+        # Type effectiveness flavor text
         if effectiveness > 1.0:
-            message += " It's super effective!"  # 1.5x or 2.0x damage
+            flags |= FLAG_SUPER_EFFECTIVE  # 1.5x or 2.0x damage
         elif effectiveness < 1.0:
-            message += " It's not very effective..."  # 0.5x damage
+            flags |= FLAG_NOT_EFFECTIVE    # 0.5x damage
 
-        # Show actual damage dealt
-        message += f" ({actual_damage} damage)"
-        self.log.add(message)
+        self.log.record(LogEvent.ATTACK, self.active_fish.name, self.active_enemy.name,
+                        actual_damage, flags, move.name)
 
         # STEP 6: Award XP to fish
         # Fish gains XP equal to damage dealt (see constants.py)
@@ -497,7 +527,7 @@ class Battle:
 
         # STEP 8: Check if enemy was defeated
         if self.active_enemy.is_defeated():
-            self.log.add(f"{self.active_enemy.name} was defeated!")
+            self.log.record(LogEvent.ENEMY_DEFEATED, self.active_enemy.name)
             self._handle_enemy_defeat()  # Awards XP/money, checks for victory
 
         # STEP 9: Check for boss phase transition
@@ -507,11 +537,12 @@ class Battle:
                 # Boss entered new phase - show special dialogue
                 phase_dialogue = self.active_enemy.get_phase_dialogue()
                 if phase_dialogue:
-                    self.log.add(f"{self.active_enemy.name}: {phase_dialogue}")
+                    self.log.record(LogEvent.DIALOGUE, self.active_enemy.name, detail=phase_dialogue)
 
         return True  # Attack succeeded
 
-    def enemy_attack(self, attack: Optional[Dict[str, Any]] = None) -> bool:
+    @_changes_state
+    def enemy_attack(self, attack: Optional[Move] = None) -> bool:
         """
         Enemy performs an attack against the player's active fish.
 
@@ -541,16 +572,21 @@ class Battle:
         if not self.active_enemy or not self.active_fish:
             return False  # Invalid state - no combatants
 
+        # Frozen, asleep, paralyzed, ... enemies can lose their turn
+        if self.active_enemy.status_mask & ACTION_MASK and self._status_stops_action(self.active_enemy):
+            self._queued_enemy_attack = None
+            return True
+
         # STEP 1: Enemy AI chooses attack (or use pre-queued attack)
-        attack = self._queued_enemy_attack if self._queued_enemy_attack else self.active_enemy.choose_attack()
+        attack = self._queued_enemy_attack if self._queued_enemy_attack else self.active_enemy.choose_attack(self.rng, self)
         self._queued_enemy_attack = None
 
         # STEP 2: Accuracy check
         # Same as player attacks - some moves may miss
-        accuracy = attack.get("accuracy", 100)  # Default 100%
-        if random.randint(1, 100) > accuracy:
+        if self.rng.randint(1, 100) > self._hit_chance(self.active_enemy, attack):  # Default 100%
             # Attack missed - still uses turn
-            self.log.add(f"{self.active_enemy.name} used {attack['name']}, but it missed!")
+            self.log.record(LogEvent.MISS, self.active_enemy.name, self.active_fish.name,
+                            detail=attack.name)
             return True  # Action succeeded but missed
 
         # STEP 3: Calculate damage
@@ -567,16 +603,10 @@ class Battle:
         # Fish's take_damage() applies defense reduction
         actual_damage = self.active_fish.take_damage(damage)
 
-        # STEP 5: Build battle message
-        message = f"{self.active_enemy.name} used {attack['name']}!"
-
-        # Add critical hit notification
-        if is_crit:
-            message += " Critical hit!"
-
-        # Show damage dealt (no type effectiveness message for enemies)
-        message += f" ({actual_damage} damage)"
-        self.log.add(message)
+        # STEP 5: Log the attack
+        # (critical hits only - no type effectiveness message for enemies)
+        self.log.record(LogEvent.ATTACK, self.active_enemy.name, self.active_fish.name,
+                        actual_damage, FLAG_CRITICAL if is_crit else 0, attack.name)
 
         # STEP 6: Increase miracle meter (DESPERATION MECHANIC)
         # Taking damage charges meter at 0.2% per point
@@ -587,7 +617,7 @@ class Battle:
 
         # STEP 7: Check if fish fainted (reached 0 HP)
         if self.active_fish.is_fainted():
-            self.log.add(f"{self.active_fish.name} fainted!")
+            self.log.record(LogEvent.FISH_FAINTED, self.active_fish.name)
 
             # BONUS: Fish fainting gives +10% miracle meter
             # This is a huge boost for comebacks in tough battles
@@ -598,6 +628,7 @@ class Battle:
 
         return True  # Attack succeeded
 
+    @_changes_state
     def switch_fish(self, fish_index: int) -> bool:
         """
         Switch the active fish to a different one from the party.
@@ -637,18 +668,18 @@ class Battle:
 
         # VALIDATION: Can't switch to fainted fish
         if target_fish.is_fainted():
-            self.log.add(f"{target_fish.name} has fainted and cannot battle!")
+            self.log.record(LogEvent.SWITCH_FAINTED, target_fish.name)
             return False
 
         # VALIDATION: Can't switch to fish already in battle
         if target_fish == self.active_fish:
-            self.log.add(f"{target_fish.name} is already in battle!")
+            self.log.record(LogEvent.ALREADY_IN_BATTLE, target_fish.name)
             return False
 
         # PERFORM SWITCH
         previous_fish = self.active_fish
         self.active_fish = target_fish
-        self.log.add(f"Go, {self.active_fish.name}!")
+        self.log.record(LogEvent.SEND_OUT, self.active_fish.name)
 
         # Reset modifiers on the switched-out fish to avoid buff stacking
         if previous_fish:
@@ -656,6 +687,7 @@ class Battle:
 
         return True  # Switch succeeded
 
+    @_changes_state
     def use_item(self, item_id: str, target_index: int = 0) -> bool:
         """
         Use a bread item on a fish during battle.
@@ -693,12 +725,12 @@ class Battle:
         """
         # VALIDATION: Check player has the item
         if not self.player.has_item(item_id):
-            self.log.add("You don't have that item!")
+            self.log.record(LogEvent.NO_ITEM)
             return False
 
         item_data = self.data_loader.get_item_by_id(item_id)
         if not item_data:
-            self.log.add("That item has no effect.")
+            self.log.record(LogEvent.ITEM_NO_EFFECT)
             return False
 
         # CONSUME ITEM: Remove from inventory
@@ -714,61 +746,63 @@ class Battle:
 
         if effect == "heal_hp":
             healed = target_fish.heal(int(item_data.get("power", 0) * multiplier))
-            self.log.add(f"{target_fish.name} restored {healed} HP!")
+            self.log.record(LogEvent.HEALED, target_fish.name, amount=healed)
         elif effect == "heal_and_cure_poison":
             healed = target_fish.heal(int(item_data.get("power", 0) * multiplier))
             target_fish.remove_status_effect("poisoned")
-            self.log.add(f"{target_fish.name} restored {healed} HP and was cured!")
+            self.log.record(LogEvent.HEALED_CURED, target_fish.name, amount=healed)
         elif effect == "heal_and_atk_boost":
             healed = target_fish.heal(int(item_data.get("heal_power", 0) * multiplier))
             boost = float(item_data.get("atk_boost", 0)) / 100.0
             if boost > 0:
                 target_fish.apply_stat_modifier("atk", 1.0 + boost, duration)
-            self.log.add(f"{target_fish.name} restored {healed} HP and felt stronger!")
+            self.log.record(LogEvent.HEALED_STRONGER, target_fish.name, amount=healed)
         elif effect == "full_heal_all":
             for fish in self.player.active_party:
                 fish.heal(fish.max_hp)
                 fish.clear_status_effects()
-            self.log.add("All fish were fully healed!")
+            self.log.record(LogEvent.ALL_FULLY_HEALED)
         elif effect == "atk_boost":
             boost = float(item_data.get("boost_percent", 0)) / 100.0
             if boost > 0:
                 target_fish.apply_stat_modifier("atk", 1.0 + boost, duration)
-            self.log.add(f"{target_fish.name}'s attack rose!")
+            self.log.record(LogEvent.ATK_ROSE, target_fish.name)
         elif effect == "spd_boost":
             boost = float(item_data.get("boost_percent", 0)) / 100.0
             if boost > 0:
                 target_fish.apply_stat_modifier("spd", 1.0 + boost, duration)
-            self.log.add(f"{target_fish.name}'s speed rose!")
+                self.turn_order.rekey(target_fish)
+            self.log.record(LogEvent.SPD_ROSE, target_fish.name)
         elif effect == "def_boost":
             boost = float(item_data.get("boost_percent", 0)) / 100.0
             if boost > 0:
                 target_fish.apply_stat_modifier("def", 1.0 + boost, duration)
-            self.log.add(f"{target_fish.name}'s defense rose!")
+            self.log.record(LogEvent.DEF_ROSE, target_fish.name)
         elif effect == "enemy_atk_down" and self.active_enemy:
             debuff = float(item_data.get("debuff_percent", 0)) / 100.0
             if debuff > 0:
                 self.active_enemy.apply_stat_modifier("atk", 1.0 - debuff, duration)
-            self.log.add(f"{self.active_enemy.name}'s attack fell!")
+            self.log.record(LogEvent.ATK_FELL, self.active_enemy.name)
         elif effect == "remove_all_debuffs":
             target_fish.clear_status_effects()
             target_fish.reset_stat_modifiers()
-            self.log.add(f"{target_fish.name} was purified!")
+            self.log.record(LogEvent.PURIFIED, target_fish.name)
         elif effect == "auto_revive":
             if target_fish.is_fainted():
                 revive_hp = int(item_data.get("revive_hp", 1))
                 target_fish.current_hp = max(1, revive_hp)
-                self.log.add(f"{target_fish.name} was revived!")
+                self.log.record(LogEvent.REVIVED, target_fish.name)
             else:
-                self.log.add("Nothing happened.")
+                self.log.record(LogEvent.NOTHING_HAPPENED)
         elif effect == "invincible":
             target_fish.apply_status_effect("invincible", duration)
-            self.log.add(f"{target_fish.name} became invincible!")
+            self.log.record(LogEvent.BECAME_INVINCIBLE, target_fish.name)
         else:
-            self.log.add("That item has no effect.")
+            self.log.record(LogEvent.ITEM_NO_EFFECT)
 
         return True  # Item used successfully
 
+    @_changes_state
     def try_flee(self) -> bool:
         """
         Attempt to flee from battle and escape to safety.
@@ -801,7 +835,7 @@ class Battle:
         # VALIDATION: Check if fleeing is allowed
         # Boss battles don't allow fleeing (is_boss = True)
         if not self.can_flee:
-            self.log.add("Can't escape from a boss battle!")
+            self.log.record(LogEvent.CANT_FLEE)
             return False
 
         # CALCULATE FLEE CHANCE
@@ -822,17 +856,18 @@ class Battle:
             flee_chance += (speed_ratio - 1) * 0.2
 
         # ROLL FOR SUCCESS
-        # random.random() returns 0.0-1.0
-        if random.random() < flee_chance:
+        # rng.random() returns 0.0-1.0
+        if self.rng.random() < flee_chance:
             # SUCCESS: Escaped safely
-            self.log.add("Got away safely!")
+            self.log.record(LogEvent.FLED)
             self.result = BattleResult.FLED  # Ends battle
             return True
         else:
             # FAILURE: Couldn't escape, enemy gets free turn
-            self.log.add("Couldn't escape!")
+            self.log.record(LogEvent.FLEE_FAILED)
             return False  # Battle continues, enemy attacks
 
+    @_changes_state
     def execute_turn(self, player_action: BattleAction, player_data: Any = None) -> BattleResult:
         """
         Execute a full turn of battle (both player and enemy actions).
@@ -845,10 +880,12 @@ class Battle:
         5. If battle still ongoing, execute slower action
         6. Return current battle result
 
-        TURN ORDER RULES:
-        - Higher speed goes first
-        - Tie goes to player (SPD >= enemy SPD)
+        TURN ORDER RULES (see turn_order.py):
         - Priority moves always go first
+        - Higher effective speed goes first (SPD buffs/debuffs count)
+        - Tie goes to player (SPD >= enemy SPD)
+        - An apostle call interjects before the enemy (unless its move has priority)
+        - A SPD change mid-turn moves the actor that hasn't acted yet
         - If one side's action ends battle, other doesn't act
 
         This creates strategic depth:
@@ -879,51 +916,47 @@ class Battle:
         if self.result != BattleResult.ONGOING:
             return self.result
 
+        if self.replay is not None:
+            self.replay.record(player_action, player_data)
+
         # INCREMENT TURN COUNTER
         # Used for effects that trigger after N turns, tracking battle length, etc.
         self.turn_count += 1
 
         # DETERMINE TURN ORDER
-        # Compare speed stats to see who goes first
-        player_goes_first = True  # Default to player (ties favor player)
-
-        if self.active_fish and self.active_enemy:
-            # Compare speeds: >= means player wins ties
-            player_goes_first = self.active_fish.spd >= self.active_enemy.spd
-
-        # PRIORITY MOVES
+        # Each side's action goes in the scheduler, keyed on move priority,
+        # then effective SPD, then side (ties favor the player)
+        order = self.turn_order
+        order.clear()
         player_priority = 0
-        enemy_priority = 0
         if player_action == BattleAction.ATTACK and self.active_fish:
-            move = self.active_fish.known_moves[player_data]
-            player_priority = move.get("priority", 0)
+            player_priority = self.active_fish.known_moves[player_data].priority
+        if player_action == BattleAction.APOSTLE or not self.active_fish:
+            # Apostles have no SPD of their own (and without a fish there's
+            # no speed to take): the player's action interjects first
+            order.push(self.player, PARTY_SIDE, player_priority, PARTY_SIDE,
+                       speed=INTERJECTION_SPEED)
+        else:
+            order.push(self.active_fish, PARTY_SIDE, player_priority, PARTY_SIDE)
 
         if self.active_enemy:
-            self._queued_enemy_attack = self.active_enemy.choose_attack()
-            enemy_priority = self._queued_enemy_attack.get("priority", 0)
-
-        if player_priority != enemy_priority:
-            player_goes_first = player_priority > enemy_priority
+            self._queued_enemy_attack = self.active_enemy.choose_attack(self.rng, self)
+            order.push(self.active_enemy, ENEMY_SIDE, self._queued_enemy_attack.priority,
+                       ENEMY_SIDE)
 
         # EXECUTE ACTIONS IN ORDER
-        if player_goes_first:
-            # PLAYER ACTS FIRST
-            # Execute player's chosen action (attack, switch, item, etc.)
-            self._execute_player_action(player_action, player_data)
-
-            # Check if battle ended (enemy defeated, fled, etc.)
-            if self.result == BattleResult.ONGOING:
-                # Battle still ongoing - enemy acts
-                self._execute_enemy_action()
-        else:
-            # ENEMY ACTS FIRST
-            # Enemy attacks automatically
-            self._execute_enemy_action()
-
-            # Check if battle ended (all fish fainted)
-            if self.result == BattleResult.ONGOING:
-                # Battle still ongoing - player acts
+        # Stop as soon as one action ends the battle (enemy defeated, fled,
+        # all fish fainted)
+        while self.result == BattleResult.ONGOING:
+            turn = order.pop()
+            if turn is None:
+                break
+            if turn.action == PARTY_SIDE:
+                # Player's chosen action (attack, switch, item, etc.)
                 self._execute_player_action(player_action, player_data)
+            else:
+                # Enemy attacks automatically
+                self._execute_enemy_action()
 
         # END-OF-TURN EFFECTS
         if self.result == BattleResult.ONGOING:
@@ -1000,7 +1033,7 @@ class Battle:
 
         if not available:
             # NO FISH LEFT: Player loses battle
-            self.log.add("All your fish have fainted!")
+            self.log.record(LogEvent.PARTY_WIPED)
             self.result = BattleResult.DEFEAT  # Ends battle
             self.player.battles_lost += 1      # Track loss stat
 
@@ -1010,12 +1043,12 @@ class Battle:
             for fish in self.player.active_party:
                 fish.revive(0.1)
                 fish.clear_status_effects()
-            self.log.add(f"You lost {lost_money} denarii and retreated to safety.")
+            self.log.record(LogEvent.MONEY_LOST, amount=lost_money)
         else:
             # FISH AVAILABLE: Auto-switch to next fish
             # Takes first available fish from list
             self.active_fish = available[0]
-            self.log.add(f"Go, {self.active_fish.name}!")
+            self.log.record(LogEvent.SEND_OUT, self.active_fish.name)
 
             # Battle continues with new fish
             # Note: This doesn't use a turn, happens instantly
@@ -1040,32 +1073,41 @@ class Battle:
         """
         # AWARD REWARDS for defeating this enemy
         if self.active_enemy:
-            # Get reward amounts from enemy data
-            xp = self.active_enemy.xp_reward      # Experience points
-            money = self.active_enemy.money_reward  # Denarii (game currency)
-
-            # Grant rewards to player
-            # player.gain_xp() distributes XP among party fish
-            # player.add_money() adds to player's wallet
-            self.player.gain_xp(xp)
-            self.player.add_money(money)
-
-            self.log.add(f"Gained {xp} XP and {money} denarii!")
+            self._award_enemy_rewards(self.active_enemy)
 
         # REMOVE DEFEATED ENEMY from enemy list
         # List comprehension: keep only enemies that are NOT defeated
         self.enemies = [e for e in self.enemies if not e.is_defeated()]
 
+        self._next_enemy_or_victory()
+
+    def _award_enemy_rewards(self, enemy: Enemy):
+        """XP and money for one defeated enemy"""
+        # Get reward amounts from enemy data
+        xp = enemy.xp_reward      # Experience points
+        money = enemy.money_reward  # Denarii (game currency)
+
+        # Grant rewards to player
+        # player.gain_xp() distributes XP among party fish
+        # player.add_money() adds to player's wallet
+        self.player.gain_xp(xp)
+        self.player.add_money(money)
+
+        self.log.record(LogEvent.REWARDS, amount=xp, detail=money)
+
+    def _next_enemy_or_victory(self):
+        """After defeated enemies are removed: victory, or the next enemy steps up"""
         # CHECK FOR VICTORY: Are all enemies defeated?
         if not self.enemies:
             # ALL ENEMIES DEFEATED: Victory!
-            self.log.add("Victory!")
+            self.log.record(LogEvent.VICTORY)
 
             # BOSS DEFEAT DIALOGUE
             # Bosses have special defeat messages
             if self.is_boss and isinstance(self.active_enemy, Boss):
                 # Show boss's defeat dialogue (story moment)
-                self.log.add(f"{self.active_enemy.name}: {self.active_enemy.defeat_dialogue}")
+                self.log.record(LogEvent.DIALOGUE, self.active_enemy.name,
+                                detail=self.active_enemy.defeat_dialogue)
 
             # End battle with victory
             self.result = BattleResult.VICTORY
@@ -1078,15 +1120,15 @@ class Battle:
                 bonus_xp = int(props.get("bonus_xp", 0))
                 if bonus_money > 0:
                     self.player.add_money(bonus_money)
-                    self.log.add(f"Bonus reward: {bonus_money} denarii!")
+                    self.log.record(LogEvent.BONUS_MONEY, amount=bonus_money)
                 if bonus_xp > 0:
                     self.player.gain_xp(bonus_xp)
-                    self.log.add(f"Bonus reward: {bonus_xp} XP!")
+                    self.log.record(LogEvent.BONUS_XP, amount=bonus_xp)
         else:
             # ENEMIES REMAIN: Next enemy appears
             # Switch to next enemy in list
             self.active_enemy = self.enemies[0]
-            self.log.add(f"{self.active_enemy.name} appears!")
+            self.log.record(LogEvent.ENEMY_APPEARS, self.active_enemy.name)
 
             # Battle continues against new enemy
             # Player's fish stays in battle (doesn't auto-heal)
@@ -1115,7 +1157,7 @@ class Battle:
             none is specified.
         """
         if self.miracle_used:
-            self.log.add("Miracle already used this battle!")
+            self.log.record(LogEvent.MIRACLE_ALREADY_USED)
             return
 
         selected = MIRACLES.get(miracle_id) if miracle_id else None
@@ -1126,37 +1168,39 @@ class Battle:
                     break
 
         if selected is None:
-            self.log.add("Miracle meter is not high enough!")
+            self.log.record(LogEvent.MIRACLE_METER_LOW)
             return
 
         if self.player.miracle_meter < selected.meter_cost:
-            self.log.add("Miracle meter is not high enough!")
+            self.log.record(LogEvent.MIRACLE_METER_LOW)
             return
 
         self.player.miracle_meter = max(0.0, self.player.miracle_meter - selected.meter_cost)
-        self.log.add(f"Jesus used {selected.name} miracle!")
+        self.log.record(LogEvent.MIRACLE, detail=selected.name)
 
         if selected.miracle_id == "healing_miracle":
             for fish in self.player.active_party:
                 fish.heal(fish.max_hp)
                 fish.clear_status_effects()
-            self.log.add("All fish were healed!")
+            self.log.record(LogEvent.ALL_HEALED)
         elif selected.miracle_id == "loaves_and_fishes":
             self.bread_multiplier = 3.0
-            self.log.add("Bread effects were multiplied!")
+            self.log.record(LogEvent.BREAD_MULTIPLIED)
         elif selected.miracle_id == "divine_judgment":
+            self._enemies_stale = True  # Every enemy changes (see _commit_state())
+            self._damage_all_enemies(300)
             for enemy in self.enemies:
-                enemy.take_damage(300)
                 enemy.apply_stat_modifier("atk", 0.5, 3)
                 enemy.apply_stat_modifier("def", 0.5, 3)
                 enemy.apply_stat_modifier("spd", 0.5, 3)
-            self.log.add("Divine judgment struck all enemies!")
+                self.turn_order.rekey(enemy)
+            self.log.record(LogEvent.DIVINE_JUDGMENT)
         elif selected.miracle_id == "resurrection_power":
             for fish in self.player.active_party:
                 if fish.is_fainted():
                     fish.revive(1.0)
                     fish.apply_status_effect("immunity", 2)
-            self.log.add("The fallen rose again!")
+            self.log.record(LogEvent.FALLEN_ROSE)
 
         self.miracle_used = True
 
@@ -1186,67 +1230,71 @@ class Battle:
         """
         # VALIDATION: Can only use once per battle
         if self.apostle_used:
-            self.log.add("Already used apostle ability this battle!")
+            self.log.record(LogEvent.APOSTLE_ALREADY_USED)
             return
 
         # VALIDATION: Must have recruited apostle
         if not self.player.has_apostle(apostle_id):
-            self.log.add("That apostle has not been recruited!")
+            self.log.record(LogEvent.APOSTLE_NOT_RECRUITED)
             return
 
         ability = APOSTLE_ABILITIES.get(apostle_id)
         if not ability:
-            self.log.add("That apostle has no ability yet!")
+            self.log.record(LogEvent.APOSTLE_NO_ABILITY)
             return
 
-        self.log.add(f"Called upon {ability.name}!")
+        self.log.record(LogEvent.APOSTLE_CALLED, detail=ability.name)
 
         if ability.ability_id == "rock_foundation":
             for fish in self.player.active_party:
                 fish.apply_stat_modifier("def", 1.5)
-            self.log.add("Party defense rose!")
+            self.log.record(LogEvent.PARTY_DEF_ROSE)
         elif ability.ability_id == "fishers_net":
-            self.log.add("Enemy escape was prevented!")
+            self.log.record(LogEvent.ESCAPE_PREVENTED)
         elif ability.ability_id == "sons_of_thunder":
-            for enemy in self.enemies:
-                enemy.take_damage(ability.power)
-            self.log.add("Thunder struck all enemies!")
+            self._enemies_stale = True
+            self._damage_all_enemies(ability.power)
+            self.log.record(LogEvent.THUNDER)
         elif ability.ability_id == "beloved_healing":
             for fish in self.player.active_party:
                 fish.heal(ability.power)
-            self.log.add("All fish were healed!")
+            self.log.record(LogEvent.ALL_HEALED)
         elif ability.ability_id == "multiplication":
             self.bread_multiplier = 3.0
-            self.log.add("Bread effects were multiplied!")
+            self.log.record(LogEvent.BREAD_MULTIPLIED)
         elif ability.ability_id == "true_sight":
             if self.active_enemy:
-                self.log.add(f"Enemy HP: {self.active_enemy.current_hp}/{self.active_enemy.max_hp}")
+                self.log.record(LogEvent.ENEMY_HP, self.active_enemy.name,
+                                amount=self.active_enemy.current_hp,
+                                detail=self.active_enemy.max_hp)
         elif ability.ability_id == "tax_audit":
             self.player.add_money(100)
+            self._enemies_stale = True
             for enemy in self.enemies:
                 enemy.apply_stat_modifier("atk", 0.7)
-            self.log.add("Enemy attack fell and money was gained!")
+            self.log.record(LogEvent.TAX_AUDIT)
         elif ability.ability_id == "doubting_strike":
             if self.active_enemy and self.active_enemy.current_hp <= self.active_enemy.max_hp * 0.5:
                 self.active_enemy.take_damage(ability.power)
-                self.log.add("A devastating strike landed!")
+                self.log.record(LogEvent.DEVASTATING_STRIKE)
             else:
-                self.log.add("The enemy must be below 50% HP!")
+                self.log.record(LogEvent.ENEMY_HP_TOO_HIGH)
                 return
         elif ability.ability_id == "lesser_miracle":
             for fish in self.player.active_party:
                 fish.heal(ability.power)
                 fish.clear_status_effects()
-            self.log.add("All fish were healed and cured!")
+            self.log.record(LogEvent.ALL_HEALED_CURED)
         elif ability.ability_id == "righteous_zeal" and self.active_fish:
             self.active_fish.apply_stat_modifier("atk", 1.4)
             self.active_fish.apply_stat_modifier("spd", 1.4)
-            self.log.add("Your fish is filled with zeal!")
+            self.turn_order.rekey(self.active_fish)
+            self.log.record(LogEvent.ZEAL)
         elif ability.ability_id == "revolutionary_fervor" and self.active_fish:
             damage = int(self.active_fish.current_hp * 0.5)
-            for enemy in self.enemies:
-                enemy.take_damage(damage)
-            self.log.add("Zealous damage struck all enemies!")
+            self._enemies_stale = True
+            self._damage_all_enemies(damage)
+            self.log.record(LogEvent.ZEALOUS_DAMAGE)
         elif ability.ability_id == "thirty_silver":
             sacrificed = next((f for f in self.player.active_party if not f.is_fainted()), None)
             if sacrificed:
@@ -1254,7 +1302,7 @@ class Battle:
             self.player.add_money(300)
             for fish in self.player.active_party:
                 fish.apply_stat_modifier("atk", 1.5)
-            self.log.add("A sacrifice was made for power and silver!")
+            self.log.record(LogEvent.SACRIFICE)
 
         # MARK AS USED
         self.apostle_used = True
@@ -1262,40 +1310,69 @@ class Battle:
         # GRANT MIRACLE METER: Using apostle gives +5%
         self.player.add_miracle_meter(5)
 
-    def _apply_end_of_turn_effects(self):
-        if self.active_fish:
-            self._apply_status_damage(self.active_fish, "poisoned", 0.05, "poison")
-            self._apply_status_damage(self.active_fish, "burned", 0.03, "burn")
+    def _damage_all_enemies(self, damage: int):
+        """Area attack: every enemy still in battle takes the hit (after its DEF)"""
+        for enemy in self.enemies:
+            enemy.take_damage(damage)
 
-        if self.active_enemy:
-            self._apply_status_damage(self.active_enemy, "poisoned", 0.05, "poison")
-            self._apply_status_damage(self.active_enemy, "burned", 0.03, "burn")
+    def _apply_end_of_turn_effects(self):
+        # Only the handlers of status bits that are set (see statuses.py)
+        if self.active_fish and self.active_fish.status_mask & DAMAGE_MASK:
+            self._apply_status_damage(self.active_fish)
+        self._apply_enemy_status_damage()
 
         self._tick_temporary_effects()
 
+    def _apply_enemy_status_damage(self):
+        """End-of-turn status damage on the enemy side (the active enemy)"""
+        if self.active_enemy and self.active_enemy.status_mask & DAMAGE_MASK:
+            self._apply_status_damage(self.active_enemy)
+
     def _tick_temporary_effects(self):
-        for fish in self.player.active_party:
-            fish.tick_temporary_effects()
-        for enemy in self.enemies:
-            enemy.tick_temporary_effects()
+        # Wakes only the fish/enemies whose modifiers or statuses end this turn
+        if self.wheel.advance():
+            self._enemies_stale = True  # Any of them may have been an enemy
 
-    def _apply_status_damage(self, target: Any, status: str,
-                             max_hp_ratio: float, label: str):
-        if "invincible" in target.status_effects:
+    def _apply_status_damage(self, target: Any):
+        """Damage-over-time statuses (poisoned, burned, ...) hurt the target"""
+        if target.status_mask & INVINCIBLE:
             return
-        if status not in target.status_effects:
-            return
-        damage = max(1, int(target.max_hp * max_hp_ratio))
-        target.current_hp = max(0, target.current_hp - damage)
-        self.log.add(f"{target.name} took {damage} {label} damage!")
+        for handler in handlers_for(target.status_mask & DAMAGE_MASK):
+            damage = max(1, int(target.max_hp * handler.damage_per_turn))
+            target.current_hp = max(0, target.current_hp - damage)
+            self.log.record(LogEvent.STATUS_DAMAGE, target.name, amount=damage,
+                            detail=handler.label)
+
+    def _status_stops_action(self, unit: Any) -> bool:
+        """
+        Check the statuses that can cost a turn (see statuses.py).
+
+        cannot_act statuses (frozen, asleep, stunned) always do; act_chance
+        statuses (paralyzed) roll for it. Costs nothing - no roll - when
+        none of them is set.
+
+        Returns:
+            True if the unit loses its turn (logged)
+        """
+        for handler in handlers_for(unit.status_mask & ACTION_MASK):
+            if handler.cannot_act or self.rng.random() >= handler.act_chance:
+                self.log.record(LogEvent.STATUS_BLOCKED, unit.name, detail=handler.name)
+                return True
+        return False
+
+    def _hit_chance(self, attacker: Any, move: Move) -> float:
+        """Move accuracy after the attacker's accuracy penalties (blinded, ...)"""
+        if attacker.status_mask & ACCURACY_MASK:
+            return move.accuracy * accuracy_multiplier(attacker.status_mask)
+        return move.accuracy
 
     def get_battle_state(self) -> Dict[str, Any]:
         """
         Get current battle state for UI display.
 
         This method packages all battle info needed by the UI into
-        one dictionary. The UI calls this every frame to render
-        the battle screen.
+        one dictionary. A UI that redraws every frame should poll
+        get_state_changes() instead, which only returns what changed.
 
         Returns:
             Dictionary containing all battle state:
@@ -1318,14 +1395,255 @@ class Battle:
             Returns object references, not copies.
             UI should NOT modify returned objects (read-only).
         """
+        state = self._state_values()
+        state["recent_log"] = self.log.get_recent(5)  # Last 5 messages
+        return state
+
+    def _state_values(self) -> Dict[str, Any]:
+        """The STATE_FIELDS values (what get_battle_state() returns, minus the log)"""
         return {
             "turn": self.turn_count,              # Turn number (1, 2, 3, ...)
             "result": self.result,                # BattleResult enum
             "active_fish": self.active_fish,      # Current player fish
             "active_enemy": self.active_enemy,    # Current enemy
             "all_enemies": self.enemies,          # All remaining enemies
-            "recent_log": self.log.get_recent(5), # Last 5 messages
             "miracle_meter": self.player.miracle_meter,  # 0-100
             "can_flee": self.can_flee,            # Can player flee?
             "apostle_used": self.apostle_used     # Apostle used yet?
         }
+
+    # ========================================================================
+    # STATE FEED (what changed since the UI last looked)
+    # ========================================================================
+
+    def get_state_changes(self, since: int = 0) -> Optional[Dict[str, Any]]:
+        """
+        What changed since revision `since` - for UIs that poll every frame.
+
+        The battle keeps a revision number that goes up whenever its
+        state changes, and the revision each STATE_FIELDS field last
+        changed on. A frame where nothing happened costs one comparison:
+
+            delta = battle.get_state_changes()         # Everything (since 0)
+            seen = delta["revision"]
+            ...every frame...
+            delta = battle.get_state_changes(seen)
+            if delta is not None:
+                seen = delta["revision"]
+                ui.apply(delta["changes"], delta["log"])
+
+        A fish or enemy field counts as changed when the unit is swapped
+        or its HP, level/XP, statuses or stat multipliers change. Changes
+        made through execute_turn() (or the other public actions, or
+        restore()) are picked up automatically; code that edits battle
+        state some other way calls mark_state_changed().
+
+        Args:
+            since: Revision the caller last saw (0 = nothing yet; more
+                   than STATE_MARKS_KEPT revisions ago counts as 0 too)
+
+        Returns:
+            None if nothing changed since then, else:
+            - revision: The current revision (pass it next time)
+            - changes: {field: value} for the fields that changed (values
+              as in get_battle_state())
+            - log: LogEntry events recorded since then (the ones still in
+              the log's ring buffer; battle.log.render() turns one into text)
+        """
+        if self._state_stale:
+            self._commit_state()
+        if since >= self.revision:
+            return None
+        if since < self._first_mark:
+            since = 0  # Too far behind (or first call): everything
+        values = self._state_values()
+        changes = {field: values[field] for field, revision in self._field_revisions.items()
+                   if revision > since}
+        return {
+            "revision": self.revision,
+            "changes": changes,
+            "log": self.log.since(self._log_marks[since - self._first_mark] if since else 0),
+        }
+
+    def mark_state_changed(self):
+        """Battle state was changed outside the battle's own methods: recheck all of it"""
+        self._state_stale = True
+        self._enemies_stale = True
+
+    def _reset_state_feed(self):
+        """Start the feed over at revision 0 (new battle or clone)"""
+        self.revision = 0
+        self._state_stale = True                    # Recheck before the next answer
+        self._enemies_stale = True                  # ...including every enemy
+        self._enemies_seen: Optional[List] = None   # self.enemies list last checked
+        self._state_keys: Dict[str, Any] = {}       # Field → what it looked like
+        self._field_revisions: Dict[str, int] = {}  # Field → revision it last changed on
+        self._log_marks: List[int] = [0]            # log.total at each revision...
+        self._first_mark = 0                        # ...from this one on
+
+    def _commit_state(self):
+        """
+        Compare the fields with last time; any change (or new log event) is a new revision.
+
+        all_enemies is only rebuilt when an enemy may have changed: the
+        active one did, the list was replaced (defeats, restore()), or
+        something hit enemies besides the active one (_enemies_stale) -
+        a frame where only the fish or the meter changed stays O(1).
+        """
+        self._state_stale = False
+        old = self._state_keys
+        keys = {
+            "turn": self.turn_count,
+            "result": self.result,
+            "active_fish": _unit_state_key(self.active_fish),
+            "active_enemy": _unit_state_key(self.active_enemy),
+            "miracle_meter": self.player.miracle_meter,
+            "can_flee": self.can_flee,
+            "apostle_used": self.apostle_used,
+        }
+        changed = [field for field, key in keys.items() if old.get(field) != key]
+        if (self._enemies_stale or self.enemies is not self._enemies_seen
+                or "active_enemy" in changed):
+            self._enemies_stale = False
+            self._enemies_seen = self.enemies
+            keys["all_enemies"] = self._enemies_state_key()
+            if old.get("all_enemies") != keys["all_enemies"]:
+                changed.append("all_enemies")
+        else:
+            keys["all_enemies"] = old["all_enemies"]
+
+        log_total = self.log.total
+        marks = self._log_marks
+        if not changed and log_total == marks[-1]:
+            return
+        self.revision += 1
+        marks.append(log_total)
+        if len(marks) > 2 * STATE_MARKS_KEPT:
+            del marks[:-STATE_MARKS_KEPT]
+            self._first_mark = self.revision - STATE_MARKS_KEPT + 1
+        for field in changed:
+            self._field_revisions[field] = self.revision
+        self._state_keys = keys
+
+    def _enemies_state_key(self) -> Any:
+        """State key of every enemy still in battle (HordeBattle reads its columns)"""
+        return tuple(_unit_state_key(enemy) for enemy in self.enemies)
+
+    # ========================================================================
+    # SNAPSHOTS AND CLONES (AI lookahead, "what if" previews)
+    # ========================================================================
+
+    def snapshot(self, include_rng: bool = False) -> BattleSnapshot:
+        """
+        Capture the battle's mutable state so it can be restored later.
+
+        Only what a turn can change is copied: HP, stats, modifiers
+        (including timed ones), statuses, the miracle meter, items,
+        one-time ability flags and the queued enemy attack. Species,
+        templates and moves are shared, not copied.
+
+        The battle log isn't part of the snapshot (it only ever grows).
+
+        Args:
+            include_rng: Also save the RNG position, so the same rolls
+                         come out again after restore()
+
+        Returns:
+            BattleSnapshot for restore()
+
+        Example:
+            saved = battle.snapshot()
+            battle.execute_turn(BattleAction.ATTACK, 2)  # Try a move
+            damage = saved.enemies[0][1][0] - battle.active_enemy.current_hp
+            battle.restore(saved)                        # Undo it
+        """
+        return BattleSnapshot(
+            (tuple(self.enemies), self.active_fish, self.active_enemy, self.turn_count,
+             self.result, self.can_flee, self.apostle_used, self.miracle_used,
+             self.bread_multiplier, self._queued_enemy_attack, self.wheel.now),
+            self.player.snapshot_state(),
+            tuple((fish, fish.snapshot_state()) for fish in self.player.active_party),
+            tuple((enemy, enemy.snapshot_state()) for enemy in self.enemies),
+            self.rng.getstate() if include_rng else None,
+        )
+
+    def restore(self, snapshot: BattleSnapshot):
+        """
+        Return the battle to a snapshot() (any number of times).
+
+        Args:
+            snapshot: Snapshot taken from THIS battle
+        """
+        self.mark_state_changed()
+        (enemies, self.active_fish, self.active_enemy, self.turn_count, self.result,
+         self.can_flee, self.apostle_used, self.miracle_used, self.bread_multiplier,
+         self._queued_enemy_attack, now) = snapshot.battle
+        self.enemies = list(enemies)
+        self.wheel.reset(now)  # Every unit below schedules its end turns again
+        self.player.restore_state(snapshot.player)
+        for fish, state in snapshot.fish:
+            fish.restore_state(state)
+        for enemy, state in snapshot.enemies:
+            enemy.restore_state(state)
+        if snapshot.rng is not None:
+            self.rng.setstate(snapshot.rng)
+
+    def clone(self, rng: Optional[RNG] = None, log: Optional[BattleLog] = None) -> "Battle":
+        """
+        Independent copy of the battle to play ahead without touching this one.
+
+        The player, party fish and enemies are copied (their static data
+        stays shared). Clones don't record replays.
+
+        Args:
+            rng: Random stream for the clone (default: rng.clone(), which
+                 continues exactly like this battle's stream would)
+            log: Log for the clone (default: NullBattleLog())
+
+        Returns:
+            New Battle
+
+        Example:
+            preview = battle.clone()
+            preview.execute_turn(BattleAction.ATTACK, 0)
+            ui.show_preview(preview.active_enemy.current_hp)
+        """
+        other = type(self).__new__(type(self))
+        other.__dict__.update(self.__dict__)
+        other.player = self.player.clone()
+        twins: Dict[int, Any] = {id(old): new for old, new
+                                 in zip(self.player.active_party, other.player.active_party)}
+        for enemy in self.enemies:
+            twins[id(enemy)] = enemy.clone()
+        other.enemies = [twins[id(enemy)] for enemy in self.enemies]
+        other.active_fish = twins.get(id(self.active_fish), self.active_fish)
+        other.active_enemy = twins.get(id(self.active_enemy), self.active_enemy)
+        other.wheel = TimingWheel(self.wheel.now, owner=other)
+        other.turn_order = TurnScheduler()
+        other._reset_state_feed()
+        for unit in (*other.player.active_party, *other.enemies):
+            unit.attach_wheel(other.wheel)
+        other.rng = rng if rng is not None else self.rng.clone()
+        other.log = log if log is not None else NullBattleLog()
+        other.replay = None
+        return other
+
+    def get_replay(self):
+        """
+        The battle's replay so far, stamped with the current state.
+
+        Only for battles created with record_replay=True. Call it when the
+        battle ends; ReplayPlayer.verify() then checks a re-simulation
+        ends in exactly this state.
+
+        Returns:
+            replay.Replay
+
+        Raises:
+            ValueError: If the battle isn't recording a replay
+        """
+        if self.replay is None:
+            raise ValueError("Battle was not created with record_replay=True")
+        from .replay import state_digest
+        self.replay.final_digest = state_digest(self, self._replay_enemies)
+        return self.replay
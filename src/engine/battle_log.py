@@ -0,0 +1,323 @@
+"""
+Battle log - compact battle events, turned into text only when shown
+
+Every attack, faint, heal, etc. is recorded as a small tuple:
+
+    (event, actor, target, amount, flags, detail)
+
+    event:  LogEvent code (ATTACK, MISS, FISH_FAINTED, ...)
+    actor:  Who did it (fish/enemy name)
+    target: Who it was done to (if anyone)
+    amount: The number involved (damage, HP healed, XP, ...)
+    flags:  FLAG_CRITICAL / FLAG_SUPER_EFFECTIVE / FLAG_NOT_EFFECTIVE
+    detail: Extra text (move name, dialogue line, ...)
+
+Nothing is formatted while the battle runs. get_recent() (what the UI
+shows) fills in the event's template from the "battle_log" section of
+messages.json, in the loader's edition:
+
+    "attack": {"default": "{actor} used {detail}!{flags} ({amount} damage)", ...}
+
+The log is a ring buffer: it keeps the last `capacity` events, so a long
+boss fight can't grow it forever.
+
+FOR SIMULATIONS:
+- CountingBattleLog: only counts events per code (no storage)
+- NullBattleLog: throws everything away
+
+    battle = Battle(player, enemies, log=NullBattleLog())
+"""
+
+from collections import Counter, deque
+from enum import IntEnum
+from typing import Any, Dict, List, NamedTuple, Optional
+
+# Import data loader - handle both direct and relative imports
+try:
+    from utils.data_loader import DataLoader, get_data_loader
+except ImportError:
+    from ..utils.data_loader import DataLoader, get_data_loader
+
+# Events kept by default (the UI shows the last 5)
+DEFAULT_LOG_CAPACITY = 100
+
+# Attack flags (bits of an event's flags)
+FLAG_CRITICAL = 1
+FLAG_SUPER_EFFECTIVE = 2
+FLAG_NOT_EFFECTIVE = 4
+
+# Flag → template key, in the order they're shown
+_FLAG_TEMPLATES = (
+    (FLAG_CRITICAL, "flag_critical"),
+    (FLAG_SUPER_EFFECTIVE, "flag_super_effective"),
+    (FLAG_NOT_EFFECTIVE, "flag_not_effective"),
+)
+
+
+class LogEvent(IntEnum):
+    """
+    Battle event codes.
+
+    Each code's lowercase name is its template key in messages.json
+    (e.g. LogEvent.ATTACK → battle_log.attack).
+    """
+    TEXT = 0                  # Free text (BattleLog.add)
+    NO_FISH = 1
+    NO_ENEMIES = 2
+    BATTLE_START = 3
+    DIALOGUE = 4
+    CANNOT_USE_MOVE = 5
+    MISS = 6
+    ATTACK = 7
+    ENEMY_DEFEATED = 8
+    FISH_FAINTED = 9
+    SWITCH_FAINTED = 10
+    ALREADY_IN_BATTLE = 11
+    SEND_OUT = 12
+    NO_ITEM = 13
+    ITEM_NO_EFFECT = 14
+    HEALED = 15
+    HEALED_CURED = 16
+    HEALED_STRONGER = 17
+    ALL_FULLY_HEALED = 18
+    ATK_ROSE = 19
+    SPD_ROSE = 20
+    DEF_ROSE = 21
+    ATK_FELL = 22
+    PURIFIED = 23
+    REVIVED = 24
+    NOTHING_HAPPENED = 25
+    BECAME_INVINCIBLE = 26
+    CANT_FLEE = 27
+    FLED = 28
+    FLEE_FAILED = 29
+    PARTY_WIPED = 30
+    MONEY_LOST = 31
+    REWARDS = 32
+    VICTORY = 33
+    BONUS_MONEY = 34
+    BONUS_XP = 35
+    ENEMY_APPEARS = 36
+    MIRACLE_ALREADY_USED = 37
+    MIRACLE_METER_LOW = 38
+    MIRACLE = 39
+    ALL_HEALED = 40
+    BREAD_MULTIPLIED = 41
+    DIVINE_JUDGMENT = 42
+    FALLEN_ROSE = 43
+    APOSTLE_ALREADY_USED = 44
+    APOSTLE_NOT_RECRUITED = 45
+    APOSTLE_NO_ABILITY = 46
+    APOSTLE_CALLED = 47
+    PARTY_DEF_ROSE = 48
+    ESCAPE_PREVENTED = 49
+    THUNDER = 50
+    ENEMY_HP = 51
+    TAX_AUDIT = 52
+    DEVASTATING_STRIKE = 53
+    ENEMY_HP_TOO_HIGH = 54
+    ALL_HEALED_CURED = 55
+    ZEAL = 56
+    ZEALOUS_DAMAGE = 57
+    SACRIFICE = 58
+    STATUS_DAMAGE = 59
+    STATUS_BLOCKED = 60
+
+
+class LogEntry(NamedTuple):
+    """One recorded event (see the module docstring)"""
+    event: LogEvent
+    actor: str = ""
+    target: str = ""
+    amount: int = 0
+    flags: int = 0
+    detail: Any = ""
+
+
+def load_templates(data_loader: DataLoader) -> Dict[str, str]:
+    """
+    The battle_log templates from messages.json, in the loader's edition.
+
+    Args:
+        data_loader: Loader to read messages.json from
+
+    Returns:
+        {template key: format string}
+    """
+    section = data_loader.load_json("messages.json").get("battle_log", {})
+    return {key: data_loader.text(value) for key, value in section.items()}
+
+
+class BattleLog:
+    """
+    Stores battle events for UI display.
+
+    Events are recorded as compact tuples in a ring buffer (the last
+    `capacity` events) and only turned into text when read.
+
+    Usage:
+        log = BattleLog()
+        log.record(LogEvent.ATTACK, "Carp Diem", "Wild Bandit", 12, FLAG_CRITICAL, "Splash")
+        log.add("Something unusual happened!")  # Free text still works
+        recent = log.get_recent(5)  # ["Carp Diem used Splash! Critical hit! (12 damage)", ...]
+    """
+
+    def __init__(self, capacity: int = DEFAULT_LOG_CAPACITY,
+                 data_loader: Optional[DataLoader] = None):
+        """
+        Initialize an empty battle log
+
+        Args:
+            capacity: Events kept (older ones are dropped)
+            data_loader: Where the message templates come from
+                         (default: get_data_loader())
+        """
+        self.capacity = capacity
+        self.data_loader = data_loader
+        self.total = 0  # Events recorded, including dropped ones
+        self._entries: deque = deque(maxlen=capacity)
+        self._templates: Optional[Dict[str, str]] = None
+
+    def record(self, event: LogEvent, actor: str = "", target: str = "",
+               amount: int = 0, flags: int = 0, detail: Any = ""):
+        """
+        Record one event (no formatting happens here).
+
+        Args:
+            event: What happened
+            actor: Who did it
+            target: Who it was done to
+            amount: Damage, HP, XP, ...
+            flags: FLAG_* bits
+            detail: Move name, dialogue, ...
+        """
+        self._entries.append((event, actor, target, amount, flags, detail))
+        self.total += 1
+
+    def add(self, message: str):
+        """
+        Add a ready-made text message to the battle log.
+
+        Args:
+            message: Text description of what happened
+        """
+        self.record(LogEvent.TEXT, detail=message)
+
+    def entries(self, count: Optional[int] = None) -> List[LogEntry]:
+        """
+        The kept events as LogEntry tuples, oldest first.
+
+        Args:
+            count: Only the last `count` events (default: all kept)
+        """
+        entries = list(self._entries)
+        if count is not None:
+            entries = entries[-count:] if count > 0 else []
+        return [LogEntry._make(entry) for entry in entries]
+
+    def since(self, total: int) -> List[LogEntry]:
+        """
+        The events recorded after the log's total was `total`, oldest first.
+
+        Args:
+            total: A past value of self.total
+
+        Returns:
+            The new events still kept (older ones may have left the ring buffer)
+        """
+        new = self.total - total
+        return self.entries(new) if new > 0 else []
+
+    def render(self, entry: LogEntry) -> str:
+        """
+        Turn one event into text using its messages.json template.
+
+        Args:
+            entry: The event
+
+        Returns:
+            The message
+        """
+        if self._templates is None:
+            self._templates = load_templates(self.data_loader or get_data_loader())
+        templates = self._templates
+
+        event, actor, target, amount, flags, detail = entry
+        key = LogEvent(event).name.lower()
+        template = templates.get(key)
+        if template is None:
+            return str(detail) if event == LogEvent.TEXT else key  # No template available
+        flag_text = "".join(templates.get(flag_key, "")
+                            for flag, flag_key in _FLAG_TEMPLATES if flags & flag)
+        return template.format(actor=actor, target=target, amount=amount,
+                               flags=flag_text, detail=detail)
+
+    def get_recent(self, count: int = 5) -> List[str]:
+        """
+        Get the most recent N messages from the log.
+
+        Args:
+            count: Number of recent messages to get (default 5)
+
+        Returns:
+            List of most recent messages (may be fewer than count if log is short)
+        """
+        return [self.render(entry) for entry in self.entries(count)]
+
+    @property
+    def events(self) -> List[str]:
+        """Every kept event as text, oldest first"""
+        return [self.render(entry) for entry in self._entries]
+
+    def clear(self):
+        """
+        Clear the entire battle log.
+
+        Used when starting a new battle to reset the event history.
+        """
+        self._entries.clear()
+        self.total = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class CountingBattleLog(BattleLog):
+    """
+    Battle log for simulations: counts events per code, keeps nothing.
+
+    Example:
+        log = CountingBattleLog()
+        battle = Battle(player, enemies, log=log)
+        ...
+        log.counts[LogEvent.MISS]  # How many attacks missed
+    """
+
+    def __init__(self, capacity: int = 0, data_loader: Optional[DataLoader] = None):
+        super().__init__(0, data_loader)
+        self.counts: Counter = Counter()
+
+    def record(self, event: LogEvent, actor: str = "", target: str = "",
+               amount: int = 0, flags: int = 0, detail: Any = ""):
+        """Count the event"""
+        self.counts[event] += 1
+        self.total += 1
+
+    def clear(self):
+        """Reset the counts"""
+        super().clear()
+        self.counts.clear()
+
+
+class NullBattleLog(BattleLog):
+    """Battle log that discards every event (fastest, for headless runs)"""
+
+    def __init__(self, capacity: int = 0, data_loader: Optional[DataLoader] = None):
+        super().__init__(0, data_loader)
+
+    def record(self, event: LogEvent, actor: str = "", target: str = "",
+               amount: int = 0, flags: int = 0, detail: Any = ""):
+        """Do nothing"""
+
+    def add(self, message: str):
+        """Do nothing"""
@@ -0,0 +1,295 @@
+"""
+Damage math - the battle damage formula, and its exact odds
+
+Battle.calculate_damage() rolls dice for every hit:
+
+    power     randint(low, high)          (every value equally likely)
+    critical  random() < BASE_CRIT_CHANCE (×CRIT_MULTIPLIER)
+    variance  uniform(0.85, 1.0)          (×variance, rounded down)
+
+and the defender's take_damage() then applies its defense. Balance
+tools and smart enemies want to know what a hit will do ON AVERAGE, or
+how likely it is to knock the defender out - without rolling thousands
+of hits to find out.
+
+damage_distribution() works it out exactly: every damage the hit can
+do (after defense) with its probability, the expected damage, and the
+chance to deal at least some amount:
+
+    odds = damage_distribution(fish.get_effective_stat("atk"), move, enemy, fish.type)
+    odds.expected                        # Average damage, misses included
+    odds.ko_chance(enemy.current_hp)     # Chance this hit knocks it out
+    for damage, chance in odds.outcomes(): ...
+
+The variance is a continuous roll, so for each (power, crit) pair the
+chance of every rounded-down result is the length of the variance range
+that produces it. Results are memoized (LRU) on the numbers that decide
+them - ATK, power range, accuracy, type multiplier, STAB and the
+defender's effective DEF - so asking again for the same matchup is a
+dictionary lookup.
+
+The formula itself (apply_damage_formula(), apply_defense()) lives here
+too, so the battle and the odds can never disagree. Type lookups are in
+elements.py.
+"""
+
+import math
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+# Import constants - handle both direct and relative imports
+try:
+    from utils.constants import BASE_CRIT_CHANCE, CRIT_MULTIPLIER
+except ImportError:
+    from ..utils.constants import BASE_CRIT_CHANCE, CRIT_MULTIPLIER
+
+from .elements import defender_type_of, type_effectiveness
+from .moves import as_move
+
+# Random variance range of every hit
+VARIANCE_MIN = 0.85
+VARIANCE_MAX = 1.0
+
+STAB_MULTIPLIER = 1.2   # Same-type attack bonus
+
+# Distinct matchups kept by the LRU cache
+DISTRIBUTION_CACHE_SIZE = 4096
+
+
+# ============================================================================
+# THE FORMULA
+# ============================================================================
+
+def apply_damage_formula(base_damage: int, attacker_stat: int, is_critical: bool,
+                         effectiveness: float, stab: bool, variance: float) -> int:
+    """
+    The battle damage formula once the dice are rolled (see Battle.calculate_damage()).
+
+    Kept separate so AI lookahead can price an attack with chosen rolls
+    using exactly the same arithmetic as a real hit.
+
+    Args:
+        base_damage: Rolled move power
+        attacker_stat: Attacker's effective ATK
+        is_critical: Critical hit (×CRIT_MULTIPLIER)
+        effectiveness: Type multiplier
+        stab: Same-type attack bonus (×1.2)
+        variance: Random factor, 0.85-1.0
+
+    Returns:
+        Damage before the defender's defense (at least 1)
+    """
+    # Formula: base_power + (ATK / 2) - ATK matters but doesn't overpower
+    damage = base_damage + (attacker_stat // 2)  # // is integer division (rounds down)
+    if is_critical:
+        damage = int(damage * CRIT_MULTIPLIER)  # Default 1.5x
+    damage = int(damage * effectiveness)
+    if stab:
+        damage = int(damage * STAB_MULTIPLIER)  # 20% bonus
+    damage = int(damage * variance)
+
+    # Minimum 1 damage (prevents 0 damage stalling)
+    return max(1, damage)
+
+
+def _damage_before_variance(base_damage: int, attacker_stat: int, is_critical: bool,
+                            effectiveness: float, stab: bool) -> int:
+    """apply_damage_formula() up to the variance roll (same steps, for _hit_odds())"""
+    damage = base_damage + (attacker_stat // 2)
+    if is_critical:
+        damage = int(damage * CRIT_MULTIPLIER)  # Default 1.5x
+    damage = int(damage * effectiveness)
+    if stab:
+        damage = int(damage * STAB_MULTIPLIER)  # 20% bonus
+    return damage
+
+
+def apply_defense(damage: int, effective_defense: float, halved: bool = False) -> int:
+    """
+    Damage left after the defender's DEF (see Fish.take_damage()).
+
+    Formula: damage × (100 / (100 + DEF)), rounded down, at least 1.
+
+    Args:
+        damage: Raw damage
+        effective_defense: Defender's DEF after buffs/debuffs
+        halved: Halve it again (Fish property "damage_reduction_alone")
+
+    Returns:
+        HP the hit takes off
+    """
+    actual_damage = max(1, int(damage * (100 / (100 + effective_defense))))
+    if halved:
+        actual_damage = max(1, int(actual_damage * 0.5))
+    return actual_damage
+
+
+# ============================================================================
+# EXACT ODDS
+# ============================================================================
+
+class DamageDistribution(NamedTuple):
+    """
+    Every damage one attack can do, with its probability.
+
+    Attributes:
+        damages: Possible damages (after defense), smallest first;
+                 0 is a miss
+        chances: Probability of each damage (they add up to 1)
+        at_least: at_least[i] = chance of dealing damages[i] or more
+        expected: Average damage, misses included
+        hit_chance: Chance the attack doesn't miss
+    """
+    damages: Tuple[int, ...]
+    chances: Tuple[float, ...]
+    at_least: Tuple[float, ...]
+    expected: float
+    hit_chance: float
+
+    def outcomes(self) -> List[Tuple[int, float]]:
+        """[(damage, probability), ...], smallest damage first"""
+        return list(zip(self.damages, self.chances))
+
+    def ko_chance(self, hp: int) -> float:
+        """
+        Chance of dealing at least `hp` damage (knocking out a defender
+        with that much HP left).
+        """
+        index = bisect_left(self.damages, hp)
+        return self.at_least[index] if index < len(self.damages) else 0.0
+
+
+@lru_cache(maxsize=DISTRIBUTION_CACHE_SIZE)
+def _hit_odds(attacker_stat: int, low: int, high: int, effectiveness: float,
+              stab: bool) -> Tuple[Tuple[int, float], ...]:
+    """
+    Raw damage odds of a hit that lands (before defense).
+
+    For each (power, crit) roll the damage before variance is some D, and
+    int(D × variance) = k for variance in [k / D, (k + 1) / D). Only the
+    two end slices are cut off by the variance range; every slice in
+    between has the same width 1 / D. So each roll adds a constant to a
+    run of results - done with a difference array, one pass at the end.
+    """
+    width = VARIANCE_MAX - VARIANCE_MIN
+    rolls = []  # (damage before variance, chance)
+    power_chance = 1 / (high - low + 1)
+    for is_critical, crit_chance in ((False, 1 - BASE_CRIT_CHANCE), (True, BASE_CRIT_CHANCE)):
+        if crit_chance > 0:
+            rolls.extend((_damage_before_variance(base_damage, attacker_stat, is_critical,
+                                                  effectiveness, stab),
+                          power_chance * crit_chance)
+                         for base_damage in range(low, high + 1))
+
+    size = max(0, max(damage for damage, _ in rolls)) + 2
+    edges = [0.0] * size   # Chance added to one result
+    steps = [0.0] * size   # Difference array: constant chance over a run
+    for damage, chance in rolls:
+        if damage <= 0:
+            edges[0] += chance
+            continue
+        first = int(damage * VARIANCE_MIN)
+        last = math.ceil(damage * VARIANCE_MAX) - 1   # Last k with k / damage < VARIANCE_MAX
+        if first >= last:
+            edges[first] += chance
+            continue
+        edges[first] += chance * ((first + 1) / damage - VARIANCE_MIN) / width
+        edges[last] += chance * (VARIANCE_MAX - last / damage) / width
+        per_slice = chance / (damage * width)
+        steps[first + 1] += per_slice
+        steps[last] -= per_slice
+
+    odds = []
+    run = 0.0
+    for rolled in range(size):
+        run += steps[rolled]
+        chance = edges[rolled] + run
+        if chance > 1e-15:
+            odds.append((rolled, chance))
+    if odds and odds[0][0] == 0:  # Minimum 1 damage
+        zero = odds.pop(0)[1]
+        if odds and odds[0][0] == 1:
+            odds[0] = (1, odds[0][1] + zero)
+        else:
+            odds.insert(0, (1, zero))
+    return tuple(odds)
+
+
+@lru_cache(maxsize=DISTRIBUTION_CACHE_SIZE)
+def cached_distribution(attacker_stat: int, low: int, high: int, accuracy: int,
+                        effectiveness: float, stab: bool,
+                        defense: Optional[Tuple[float, bool]]) -> DamageDistribution:
+    """
+    damage_distribution() for plain numbers (this is what's memoized).
+
+    Args:
+        attacker_stat: Attacker's effective ATK
+        low, high: Move power range
+        accuracy: Move accuracy (1-100)
+        effectiveness: Type multiplier
+        stab: Same-type attack bonus applies
+        defense: Defender's defense_profile() - (effective DEF, halved),
+                 or None if it takes no damage
+
+    Returns:
+        DamageDistribution
+    """
+    hit_chance = min(100, max(0, accuracy)) / 100
+    odds: Dict[int, float] = {}
+    if hit_chance > 0:
+        for raw, chance in _hit_odds(attacker_stat, low, high, effectiveness, stab):
+            damage = apply_defense(raw, *defense) if defense is not None else 0
+            odds[damage] = odds.get(damage, 0.0) + chance * hit_chance
+    if hit_chance < 1:
+        odds[0] = odds.get(0, 0.0) + (1 - hit_chance)
+
+    damages = tuple(sorted(damage for damage, chance in odds.items() if chance > 0))
+    chances = tuple(odds[damage] for damage in damages)
+    # Summed from the top, so small KO chances (e.g. crits only) stay precise
+    at_least = []
+    remaining = 0.0
+    for chance in reversed(chances):
+        remaining += chance
+        at_least.append(min(1.0, remaining))
+    at_least[-1] = 1.0  # The weakest outcome or more: always
+    return DamageDistribution(damages, chances, tuple(reversed(at_least)),
+                              sum(d * c for d, c in zip(damages, chances)), hit_chance)
+
+
+def damage_distribution(attacker_stat: int, move: Any, defender: Any,
+                        attacker_type: Optional[str] = None,
+                        effectiveness: Optional[float] = None) -> DamageDistribution:
+    """
+    Exact odds of one attack, after the defender's defense.
+
+    Takes the same arguments as Battle.calculate_damage() and covers
+    everything it and take_damage() do: power range, accuracy, crits,
+    type effectiveness, STAB, variance, defense and its special cases.
+
+    Args:
+        attacker_stat: Attacker's effective ATK (after buffs/debuffs)
+        move: Move (or move/attack dict)
+        defender: Fish or Enemy (uses its defense_profile())
+        attacker_type: Attacker's type, for STAB (optional)
+        effectiveness: Type multiplier (default: looked up from TYPE_CHART)
+
+    Returns:
+        DamageDistribution
+
+    Example:
+        odds = damage_distribution(30, boss.attacks[0], fish, boss.enemy_type)
+        print(f"{odds.expected:.1f} average, {odds.ko_chance(fish.current_hp):.0%} to KO")
+    """
+    move = as_move(move)
+    if effectiveness is None:
+        effectiveness = type_effectiveness(move.type, defender_type_of(defender))
+    stab = bool(attacker_type and move.type == attacker_type)
+    return cached_distribution(attacker_stat, move.power_min, move.power_max, move.accuracy,
+                               effectiveness, stab, defender.defense_profile())
+
+
+def clear_cache():
+    """Forget every memoized distribution (e.g. after editing BASE_CRIT_CHANCE)"""
+    _hit_odds.cache_clear()
+    cached_distribution.cache_clear()
@@ -0,0 +1,193 @@
+"""
+Element types - integer type ids and the compiled type chart
+
+Moves, fish and enemies name their type with a string ("Holy", "Water",
+...). Hot code compares small integers instead: type_id("Holy") is the
+type's position in TYPE_NAMES - the TYPE_CHART types first, then any
+other type the first time it's seen ("Normal", "Physical", ...).
+
+TYPE_CHART is compiled ONCE into a flat table of multipliers, one row
+per attack type:
+
+    table[attack_id * size + defend_id]
+
+so the battle engine (effectiveness_by_id()) and the batch simulator
+(sim.type_matrix(), a NumPy view of the same numbers) read the same
+table, and neither walks nested dicts. Types outside the chart are
+neutral (1.0) against everything.
+
+    type_id("Holy")                         → 0
+    TYPE_NAMES[0]                           → "Holy"
+    effectiveness_by_id(0, type_id("Dark")) → 2.0
+    type_effectiveness("Holy", "Dark")      → 2.0
+
+fish.json carries its own copy of the chart ("type_chart").
+check_type_chart() compares it with TYPE_CHART and raises
+TypeChartMismatch listing every pair that differs.
+check_data_type_chart() runs it on a data directory's fish.json once
+(GameState does at startup), and test_elements.py runs it against the
+shipped data.
+"""
+
+import os
+from array import array
+from typing import Any, Dict, List, Mapping, Set, Tuple
+
+# Import constants - handle both direct and relative imports
+try:
+    from utils.constants import TYPE_CHART
+except ImportError:
+    from ..utils.constants import TYPE_CHART
+
+# Type ids: the TYPE_CHART types first, then any other type seen
+TYPE_NAMES: List[str] = list(TYPE_CHART)
+TYPE_IDS: Dict[str, int] = {name: index for index, name in enumerate(TYPE_NAMES)}
+
+# Data directories whose fish.json type_chart already passed the check
+_checked_data_paths: Set[str] = set()
+
+
+class TypeChartMismatch(ValueError):
+    """A type chart (e.g. fish.json's) disagrees with constants.TYPE_CHART"""
+
+
+# ============================================================================
+# THE COMPILED TABLE
+# ============================================================================
+
+def _compile_table(size: int) -> array:
+    """TYPE_CHART as a flat size × size table (missing pairs are 1.0)"""
+    table = array("d", [1.0]) * (size * size)
+    for attack, row in TYPE_CHART.items():
+        for defend, multiplier in row.items():
+            table[TYPE_IDS[attack] * size + TYPE_IDS[defend]] = multiplier
+    return table
+
+
+_size = len(TYPE_NAMES)
+_table = _compile_table(_size)
+
+
+def type_id(type_name: str) -> int:
+    """Get (or assign) the integer id for a type name"""
+    global _size, _table
+    index = TYPE_IDS.get(type_name)
+    if index is None:
+        # New type (only at load time): existing ids keep their place
+        index = TYPE_IDS[type_name] = len(TYPE_NAMES)
+        TYPE_NAMES.append(type_name)
+        _size = len(TYPE_NAMES)
+        _table = _compile_table(_size)
+    return index
+
+
+def effectiveness_by_id(attack_id: int, defend_id: int) -> float:
+    """Type multiplier for two type ids (see type_id())"""
+    return _table[attack_id * _size + defend_id]
+
+
+def effectiveness_table() -> Tuple[array, int]:
+    """
+    The compiled table and its row length.
+
+    Returns:
+        (table, size): table[attack_id * size + defend_id] is the
+        multiplier. The table is rebuilt (not changed) when a new type
+        is seen, so a copy you hold stays consistent with its size.
+    """
+    return _table, _size
+
+
+# ============================================================================
+# STRING LOOKUPS
+# ============================================================================
+
+def defender_type_of(defender: Any) -> str:
+    """Element type of a fish ('type') or enemy ('enemy_type')"""
+    defender_type = getattr(defender, 'type', None)
+    if not defender_type:
+        defender_type = getattr(defender, 'enemy_type', 'Normal')
+    return defender_type
+
+
+def defender_type_id(defender: Any) -> int:
+    """Type id of a fish or enemy (compiled on both; looked up for anything else)"""
+    defend_id = getattr(defender, 'type_id', None)
+    if defend_id is None:
+        defend_id = type_id(defender_type_of(defender))
+    return defend_id
+
+
+def type_effectiveness(attack_type: str, defend_type: str) -> float:
+    """
+    Type multiplier of an attack type against a defender type.
+
+    Args:
+        attack_type: Type of the move (Holy, Water, Earth, Spirit, Dark)
+        defend_type: Type of the defender
+
+    Returns:
+        Multiplier from the compiled TYPE_CHART (1.0 if the pair isn't in it)
+    """
+    attack_id = TYPE_IDS.get(attack_type)
+    defend_id = TYPE_IDS.get(defend_type)
+    if attack_id is None or defend_id is None:
+        return 1.0
+    return _table[attack_id * _size + defend_id]
+
+
+# ============================================================================
+# CONSISTENCY CHECK
+# ============================================================================
+
+def check_type_chart(chart: Mapping[str, Mapping[str, float]], source: str = "fish.json"):
+    """
+    Make sure another copy of the type chart matches constants.TYPE_CHART.
+
+    Pairs missing from a chart count as neutral (1.0), like in the
+    lookups, so only differences that change a multiplier are reported.
+
+    Args:
+        chart: {attack_type: {defend_type: multiplier}}
+        source: Where the chart came from (for the error message)
+
+    Raises:
+        TypeChartMismatch: Listing every pair that differs
+    """
+    def multiplier(table: Mapping[str, Mapping[str, float]], attack: str, defend: str) -> float:
+        return table.get(attack, {}).get(defend, 1.0)
+
+    types = list(TYPE_CHART)
+    for row in (chart, *chart.values()):
+        types.extend(name for name in row if name not in types)
+
+    differences = [
+        f"{attack} → {defend}: TYPE_CHART {multiplier(TYPE_CHART, attack, defend)}, "
+        f"{source} {multiplier(chart, attack, defend)}"
+        for attack in types for defend in types
+        if multiplier(TYPE_CHART, attack, defend) != multiplier(chart, attack, defend)
+    ]
+    if differences:
+        raise TypeChartMismatch(
+            f"{source} type_chart disagrees with constants.TYPE_CHART "
+            f"({len(differences)} pairs):\n  " + "\n  ".join(differences))
+
+
+def check_data_type_chart(data_loader: Any):
+    """
+    Check a data directory's fish.json "type_chart" against TYPE_CHART
+    (once per directory; data without a type_chart has nothing to check).
+
+    Args:
+        data_loader: DataLoader of the data directory
+
+    Raises:
+        TypeChartMismatch: Listing every pair that differs
+    """
+    data_path = os.path.abspath(data_loader.data_path)
+    if data_path in _checked_data_paths:
+        return
+    type_chart = data_loader.get_fish_data().get("type_chart")
+    if type_chart is not None:
+        check_type_chart(type_chart, os.path.join(data_loader.data_path, "fish.json"))
+    _checked_data_paths.add(data_path)
@@ -1,12 +1,174 @@
 """
 Enemy classes - represents enemies and bosses
+
+Enemies and bosses come from src/data/enemies.json and bosses.json.
+EnemyFactory compiles each record ONCE into an immutable EnemyTemplate
+and memoizes the level-scaled stats per (template, level), so spawning
+an enemy only creates its per-battle state (HP, statuses, modifiers).
+
+Usage:
+    enemy = create_enemy("wild_bandit", level=4)
+    boss = create_boss("steward_feast")  # Boss's own level from bosses.json
 """
 
-from typing import Dict, List, Optional, Any
-import random
+import copy
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Any, NamedTuple, Tuple
+
+# Import data loader - handle both direct and relative imports
+try:
+    from utils.data_loader import DataLoader, get_data_loader
+except ImportError:
+    from ..utils.data_loader import DataLoader, get_data_loader
+
+from .damage import apply_defense
+from .elements import type_id
+from .modifiers import ModifierStack
+from .moves import Move
+from .statuses import StatusHolder
+from .stat_tables import ENEMY_GROWTH_RATE, StatTable, get_stat_table, scale_stat
+from .rng import RNG, get_default_rng
+from .timing_wheel import TimingWheel
+
+# Kept for compatibility - the rate lives in stat_tables.py
+GROWTH_RATE = ENEMY_GROWTH_RATE
+
+# Neutral stat modifiers - each enemy gets its own ModifierStack of them
+_NEUTRAL_STAT_MODIFIERS = {"atk": 1.0, "def": 1.0, "spd": 1.0}
+
+
+def _scale_stat(base_stat: int, level: int) -> int:
+    """Scale a base stat to a level"""
+    return scale_stat(base_stat, level, ENEMY_GROWTH_RATE)
+
+
+def _compile_attack(attack: Dict[str, Any]) -> Move:
+    """
+    Compile one attack into a Move.
+
+    Enemy attacks always roll their power: a fixed power (e.g. 0)
+    becomes a [min, max] range first.
+    """
+    power = attack.get("power", [0, 0])
+    if not isinstance(power, list):
+        attack = dict(attack)
+        attack["power"] = [power, power]
+    return Move(attack)
+
+
+@dataclass(frozen=True, eq=False)
+class EnemyTemplate:
+    """
+    Immutable, compiled enemy or boss data.
 
+    Built once per record by EnemyFactory (or once per Enemy(dict) call).
+    Every enemy spawned from a template shares it - do not modify the
+    attacks, drops or properties it points to.
 
-class Enemy:
+    eq=False keeps templates hashable by identity, so (template, level)
+    can key the scaled-stat memo.
+    """
+    enemy_id: str
+    name: str
+    enemy_type: str
+    type_id: int                                # Integer id of enemy_type (elements.py)
+    base_stats: Tuple[int, int, int, int]       # (hp, atk, def, spd)
+    stats: StatTable                            # base_stats at every level
+    attacks: Tuple[Move, ...]
+    xp_reward: Optional[int]                    # None = scale with level
+    money_reward: Optional[int]                 # None = scale with level
+    item_drops: Tuple[Dict[str, Any], ...]
+    ai_pattern: str
+    properties: Dict[str, Any]
+    default_level: int = 1
+
+    # Boss-only data
+    is_boss: bool = False
+    title: str = ""
+    phases: int = 1
+    gimmick: Optional[str] = None
+    special_conditions: Tuple[Any, ...] = ()
+    intro_dialogue: Any = "..."
+    defeat_dialogue: Any = "..."
+    phase_transitions: Dict[str, Any] = field(default_factory=dict)
+    biblical_reference: str = ""
+
+    @classmethod
+    def from_data(cls, data: Dict[str, Any], is_boss: bool = False,
+                  text=None) -> "EnemyTemplate":
+        """
+        Compile an enemy or boss record from JSON.
+
+        Args:
+            data: Record from enemies.json / bosses.json (or a template dict)
+            is_boss: True for bosses
+            text: Optional function that turns dual-text fields into
+                  display strings (e.g. DataLoader.text)
+
+        Returns:
+            New EnemyTemplate
+        """
+        if text is None:
+            text = lambda value: value  # Keep fields as they are
+        base_stats = data["base_stats"]
+        base_vector = (base_stats["hp"], base_stats["atk"], base_stats["def"],
+                       base_stats.get("spd", 10))
+        level_range = data.get("level_range")
+        return cls(
+            enemy_id=data["id"],
+            name=data["name"],
+            enemy_type=data["type"],
+            type_id=type_id(data["type"]),
+            base_stats=base_vector,
+            stats=get_stat_table(base_vector, ENEMY_GROWTH_RATE),
+            attacks=tuple(_compile_attack(a) for a in data.get("attacks", [])),
+            xp_reward=data.get("xp_reward"),
+            money_reward=data.get("money_reward"),
+            item_drops=tuple(data.get("item_drops", [])),
+            ai_pattern=data.get("ai_pattern", "random"),
+            properties=data.get("properties", {}),
+            default_level=data.get("level", level_range[0] if level_range else 1),
+            is_boss=is_boss,
+            title=data.get("title", ""),
+            phases=data.get("phases", 1),
+            gimmick=data.get("gimmick", None),
+            special_conditions=tuple(data.get("special_conditions", [])),
+            intro_dialogue=text(data.get("intro_dialogue", "...")),
+            defeat_dialogue=text(data.get("defeat_dialogue", "...")),
+            phase_transitions={phase: text(line) for phase, line
+                               in data.get("phase_transitions", {}).items()},
+            biblical_reference=data.get("biblical_reference", ""),
+        )
+
+
+class ScaledStats(NamedTuple):
+    """A template's stats at one level"""
+    max_hp: int
+    atk: int
+    defense: int
+    spd: int
+    xp_reward: int
+    money_reward: int
+
+
+def scale_template(template: EnemyTemplate, level: int) -> ScaledStats:
+    """
+    Compute a template's stats at a level.
+
+    Stats come from the template's stat table;
+    EnemyFactory.scaled_stats() memoizes the result per (template, level).
+    """
+    hp, atk, defense, spd = template.stats.at(level)
+    xp_reward = template.xp_reward
+    money_reward = template.money_reward
+    return ScaledStats(
+        hp, atk, defense, spd,
+        level * 10 + 20 if xp_reward is None else xp_reward,
+        level * 5 + 10 if money_reward is None else money_reward,
+    )
+
+
+class Enemy(StatusHolder):
     """
     Represents an enemy in battle.
     Similar to Fish but simpler - no leveling system, fixed stats.
@@ -16,97 +178,132 @@ class Enemy:
         """
         Initialize an enemy
 
+        Prefer create_enemy() / EnemyFactory, which reuse compiled
+        templates and memoized stats instead of compiling every time.
+
         Args:
-            enemy_data: Dictionary containing enemy data
+            enemy_data: Dictionary containing enemy data (or an EnemyTemplate)
             level: Enemy level (for scaling)
         """
-        self.enemy_id = enemy_data["id"]
-        self.name = enemy_data["name"]
-        self.enemy_type = enemy_data["type"]
-        self.level = level
+        if isinstance(enemy_data, EnemyTemplate):
+            template = enemy_data
+        else:
+            template = EnemyTemplate.from_data(enemy_data, is_boss=isinstance(self, Boss))
+        self._setup(template, level, scale_template(template, level))
 
-        # Base stats
-        base_stats = enemy_data["base_stats"]
-        self.max_hp = self._scale_stat(base_stats["hp"], level)
-        self.current_hp = self.max_hp
-        self.atk = self._scale_stat(base_stats["atk"], level)
-        self.defense = self._scale_stat(base_stats["def"], level)
-        self.spd = self._scale_stat(base_stats.get("spd", 10), level)
+    @classmethod
+    def spawn(cls, template: EnemyTemplate, level: int, stats: ScaledStats) -> "Enemy":
+        """
+        Create an enemy from a compiled template and precomputed stats.
 
-        # Attacks
-        self.attacks = enemy_data.get("attacks", [])
+        Skips __init__ (no compiling, no scaling) - used by EnemyFactory.
 
-        # Rewards
-        self.xp_reward = enemy_data.get("xp_reward", level * 10 + 20)
-        self.money_reward = enemy_data.get("money_reward", level * 5 + 10)
-        self.item_drops = enemy_data.get("item_drops", [])
+        Args:
+            template: Compiled template
+            level: Enemy level
+            stats: scale_template(template, level), usually memoized
 
-        # AI behavior
-        self.ai_pattern = enemy_data.get("ai_pattern", "random")
+        Returns:
+            New enemy (or boss, when called on Boss)
+        """
+        enemy = cls.__new__(cls)
+        enemy._setup(template, level, stats)
+        return enemy
+
+    def _setup(self, template: EnemyTemplate, level: int, stats: ScaledStats):
+        """Set shared fields from the template and fresh per-battle state"""
+        self.template = template
+        self.enemy_id = template.enemy_id
+        self.name = template.name
+        self.enemy_type = template.enemy_type
+        self.type_id = template.type_id
+        self.level = level
 
-        # Special properties
-        self.properties = enemy_data.get("properties", {})
+        # Stats and rewards (already scaled to this level)
+        self.max_hp, self.atk, self.defense, self.spd, \
+            self.xp_reward, self.money_reward = stats
+        self.current_hp = self.max_hp
+
+        # Shared with the template - never modified per enemy
+        self.attacks = template.attacks
+        self.item_drops = template.item_drops
+        self.ai_pattern = template.ai_pattern  # AI behavior
+        self.properties = template.properties  # Special properties
 
-        # Status effects
-        self.status_effects: List[str] = []
+        # Status effects: one bit each, end turn per bit (see statuses.py)
+        self.status_mask = 0
+        self._status_ends: Optional[List[int]] = None
+        self._wheel: Optional[TimingWheel] = None  # What timed effects count turns on
 
-        # Stat modifiers
-        self.stat_modifiers = {
-            "atk": 1.0,
-            "def": 1.0,
-            "spd": 1.0
-        }
-        self.timed_stat_modifiers = {stat: [] for stat in self.stat_modifiers}
-        self.status_durations: Dict[str, int] = {}
+        # Stat modifiers (cached multipliers over a timed stack - see modifiers.py)
+        self.stat_modifiers = ModifierStack(_NEUTRAL_STAT_MODIFIERS)
 
         # Track last used attack for cycle pattern
         self._last_attack_index = -1
 
+        # Search planner for "expectimax" enemies (see enemy_ai.py), made on first use
+        self.planner = None
+
     def _scale_stat(self, base_stat: int, level: int) -> int:
         """Scale stat based on level"""
-        # Enemies grow about 5% per level
-        growth_rate = 0.05
-        return int(base_stat * (1 + growth_rate * (level - 1)))
+        return _scale_stat(base_stat, level)
 
-    def choose_attack(self) -> Dict[str, Any]:
+    def choose_attack(self, rng: Optional[RNG] = None, battle: Any = None) -> Move:
         """
         Choose which attack to use based on AI pattern.
-        Returns the chosen attack dictionary.
+        Returns the chosen attack (a compiled Move).
+
+        Args:
+            rng: Random number stream (default: get_default_rng());
+                 Battle passes its own
+            battle: The battle in progress (Battle passes itself); the
+                    "expectimax" pattern searches its future states
         """
+        rng = rng or get_default_rng()
         if not self.attacks:
             # Default attack if none defined
-            return {
+            return Move({
                 "name": "Strike",
                 "type": "Physical",
                 "power": [self.atk // 2, self.atk],
                 "accuracy": 100
-            }
+            })
 
         if self.ai_pattern == "random":
-            return random.choice(self.attacks)
-        elif self.ai_pattern == "strongest_first":
+            return rng.choice(self.attacks)
+        elif self.ai_pattern == "expectimax" and battle is not None:
+            # Plan a few turns ahead (see enemy_ai.py)
+            from .enemy_ai import plan_attack
+            return plan_attack(self, battle)
+        elif self.ai_pattern in ("strongest_first", "expectimax"):
             # Use strongest attack if available, otherwise random
-            strongest = max(self.attacks, key=lambda a: max(a.get("power", [0])))
+            strongest = max(self.attacks, key=lambda a: a.power_max)
             return strongest
         elif self.ai_pattern == "cycle":
             # Cycle through attacks in order
             if not self.attacks:
-                return random.choice(self.attacks)
+                return rng.choice(self.attacks)
             self._last_attack_index = (self._last_attack_index + 1) % len(self.attacks)
             return self.attacks[self._last_attack_index]
         else:
-            return random.choice(self.attacks)
+            return rng.choice(self.attacks)
 
     def take_damage(self, damage: int) -> int:
         """
         Apply damage to the enemy. Returns actual damage dealt.
         """
-        defense_mult = self.stat_modifiers["def"]
-        actual_damage = max(1, int(damage * (100 / (100 + self.defense * defense_mult))))
-
+        actual_damage = self.damage_after_defense(damage)
         self.current_hp = max(0, self.current_hp - actual_damage)
         return actual_damage
 
+    def damage_after_defense(self, damage: int) -> int:
+        """HP a raw hit would take off this enemy, without applying it"""
+        return apply_defense(damage, self.defense * self.stat_modifiers["def"])
+
+    def defense_profile(self) -> Tuple[float, bool]:
+        """(effective DEF, halved) that damage_after_defense() applies"""
+        return self.defense * self.stat_modifiers["def"], False
+
     def heal(self, amount: int) -> int:
         """Heal the enemy. Returns actual HP restored."""
         old_hp = self.current_hp
@@ -117,68 +314,27 @@ class Enemy:
         """Check if enemy is defeated"""
         return self.current_hp <= 0
 
-    def apply_status_effect(self, status: str, turns: Optional[int] = None):
-        """Apply a status effect"""
-        if status != "immunity" and "immunity" in self.status_effects:
-            return
-        if status not in self.status_effects:
-            self.status_effects.append(status)
-        if turns and turns > 0:
-            current = self.status_durations.get(status, 0)
-            self.status_durations[status] = max(current, turns)
-
-    def remove_status_effect(self, status: str):
-        """Remove a status effect"""
-        if status in self.status_effects:
-            self.status_effects.remove(status)
-        if status in self.status_durations:
-            del self.status_durations[status]
-
     def apply_stat_modifier(self, stat: str, multiplier: float,
                             turns: Optional[int] = None):
         """Apply a temporary stat modifier"""
         if stat in self.stat_modifiers:
-            self.stat_modifiers[stat] *= multiplier
             if turns and turns > 0:
-                self.timed_stat_modifiers[stat].append({
-                    "multiplier": multiplier,
-                    "turns": turns
-                })
+                self.timing_wheel()  # Make sure it expires on this enemy's wheel
+            self.stat_modifiers.apply(stat, multiplier, turns)
 
     def reset_stat_modifiers(self):
         """Reset all stat modifiers"""
-        for stat in self.stat_modifiers:
-            self.stat_modifiers[stat] = 1.0
-        for stat in self.timed_stat_modifiers:
-            self.timed_stat_modifiers[stat] = []
-
-    def tick_temporary_effects(self):
-        """Tick down temporary stat modifiers and timed status effects"""
-        for stat, entries in self.timed_stat_modifiers.items():
-            if not entries:
-                continue
-            remaining_entries = []
-            for entry in entries:
-                entry["turns"] -= 1
-                if entry["turns"] <= 0:
-                    multiplier = entry["multiplier"]
-                    if multiplier:
-                        self.stat_modifiers[stat] /= multiplier
-                else:
-                    remaining_entries.append(entry)
-            self.timed_stat_modifiers[stat] = remaining_entries
-
-        if not self.status_durations:
-            return
-        expired = []
-        for status, turns in self.status_durations.items():
-            turns -= 1
-            if turns <= 0:
-                expired.append(status)
-            else:
-                self.status_durations[status] = turns
-        for status in expired:
-            self.remove_status_effect(status)
+        self.stat_modifiers.reset()
+
+    def attach_wheel(self, wheel: TimingWheel):
+        """Count this enemy's timed modifiers and statuses on `wheel` (Battle does this)"""
+        self.stat_modifiers.attach(wheel)
+        self._attach_statuses(wheel)
+
+    @property
+    def timed_stat_modifiers(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Modifiers that expire: {stat: [{"multiplier": m, "turns": t}, ...]} (a copy)"""
+        return self.stat_modifiers.timed_entries
 
     def get_effective_stat(self, stat: str) -> int:
         """Get effective stat value after modifiers"""
@@ -186,6 +342,27 @@ class Enemy:
         modifier = self.stat_modifiers.get(stat, 1.0)
         return int(base_value * modifier)
 
+    def snapshot_state(self) -> Tuple:
+        """Everything a battle can change on this enemy, as a tuple (see Battle.snapshot())"""
+        return (self.current_hp, self._status_state(), self.stat_modifiers.copy(),
+                self._last_attack_index)
+
+    def restore_state(self, state: Tuple):
+        """Put back a snapshot_state() (it can be restored any number of times)"""
+        self.current_hp = state[0]
+        self._restore_status_state(state[1])
+        self.stat_modifiers = state[2].copy()
+        if self._wheel is not None:
+            self.stat_modifiers.attach(self._wheel)
+        self._last_attack_index = state[3]
+
+    def clone(self) -> "Enemy":
+        """Independent copy for battle what-ifs (template data stays shared)"""
+        other = copy.copy(self)
+        other._wheel = TimingWheel(self._wheel.now, owner=other) if self._wheel else None
+        other.restore_state(self.snapshot_state())
+        return other
+
     def __str__(self) -> str:
         """String representation"""
         return f"{self.name} (Lv.{self.level}) - {self.current_hp}/{self.max_hp} HP"
@@ -201,27 +378,27 @@ class Boss(Enemy):
     Bosses can have multiple phases, special gimmicks, and unique behaviors.
     """
 
-    def __init__(self, boss_data: Dict[str, Any], level: int = 1):
-        """Initialize a boss"""
-        super().__init__(boss_data, level)
+    def _setup(self, template: EnemyTemplate, level: int, stats: ScaledStats):
+        """Set up the enemy fields, then the boss-specific ones"""
+        super()._setup(template, level, stats)
 
         # Boss-specific data
-        self.boss_id = boss_data["id"]
-        self.title = boss_data.get("title", "")
-        self.phases = boss_data.get("phases", 1)
+        self.boss_id = template.enemy_id
+        self.title = template.title
+        self.phases = template.phases
         self.current_phase = 1
 
         # Gimmicks and special mechanics
-        self.gimmick = boss_data.get("gimmick", None)
-        self.special_conditions = boss_data.get("special_conditions", [])
+        self.gimmick = template.gimmick
+        self.special_conditions = template.special_conditions
 
         # Dialogue
-        self.intro_dialogue = boss_data.get("intro_dialogue", "...")
-        self.defeat_dialogue = boss_data.get("defeat_dialogue", "...")
-        self.phase_transitions = boss_data.get("phase_transitions", {})
+        self.intro_dialogue = template.intro_dialogue
+        self.defeat_dialogue = template.defeat_dialogue
+        self.phase_transitions = template.phase_transitions
 
         # Biblical reference
-        self.biblical_reference = boss_data.get("biblical_reference", "")
+        self.biblical_reference = template.biblical_reference
 
     def check_phase_transition(self) -> bool:
         """
@@ -260,9 +437,18 @@ class Boss(Enemy):
         # Reset stat modifiers
         self.reset_stat_modifiers()
 
-        # Boost stats for new phase
-        self.stat_modifiers["atk"] *= 1.2
-        self.stat_modifiers["def"] *= 1.1
+        # Boost stats for new phase (permanent)
+        self.apply_stat_modifier("atk", 1.2)
+        self.apply_stat_modifier("def", 1.1)
+
+    def snapshot_state(self) -> Tuple:
+        """Enemy state plus the current phase"""
+        return super().snapshot_state() + (self.current_phase,)
+
+    def restore_state(self, state: Tuple):
+        """Put back a snapshot_state()"""
+        super().restore_state(state)
+        self.current_phase = state[-1]
 
     def get_phase_dialogue(self) -> Optional[str]:
         """Get dialogue for current phase"""
@@ -274,7 +460,8 @@ class Boss(Enemy):
         return f"{self.name}{phase_str} (Lv.{self.level}) - {self.current_hp}/{self.max_hp} HP"
 
 
-# Enemy data templates (will be loaded from JSON in the future)
+# Built-in fallback templates, used when an ID isn't in the JSON data
+# (e.g. the game was started from a folder without src/data/)
 ENEMY_TEMPLATES = {
     "skeptical_scholar": {
         "id": "skeptical_scholar",
@@ -382,33 +569,168 @@ BOSS_TEMPLATES = {
 }
 
 
-def create_enemy(enemy_id: str, level: int = 1) -> Optional[Enemy]:
+# ============================================================================
+# ENEMY FACTORY
+# ============================================================================
+
+class EnemyFactory:
+    """
+    Creates enemies and bosses from enemies.json and bosses.json.
+
+    On first use, every record is compiled into an immutable EnemyTemplate
+    (dual-text dialogue resolved through the data loader). Level-scaled
+    stats are computed once per (template, level) and reused, so spawning
+    only builds the new enemy's per-battle state.
+
+    IDs not found in the JSON data fall back to ENEMY_TEMPLATES and
+    BOSS_TEMPLATES.
+
+    The templates are compiled again (and the stats cache dropped) when
+    the loader hands out new enemies.json/bosses.json data, e.g. after
+    DataLoader.clear_cache() or reload_data().
+    """
+
+    def __init__(self, data_loader: Optional[DataLoader] = None):
+        """
+        Initialize the factory.
+
+        Args:
+            data_loader: Shared data context (default: get_data_loader())
+        """
+        self.data_loader = data_loader or get_data_loader()
+        self._enemy_templates: Optional[Dict[str, EnemyTemplate]] = None
+        self._boss_templates: Optional[Dict[str, EnemyTemplate]] = None
+        self._sources: Optional[Tuple[Any, Any]] = None  # JSON the templates came from
+        self._stats: Dict[Tuple[EnemyTemplate, int], ScaledStats] = {}
+
+    def reset(self):
+        """Forget the compiled templates and stats (compiled again on next use)"""
+        self._enemy_templates = None
+        self._boss_templates = None
+        self._sources = None
+        self._stats.clear()
+
+    def _check_templates(self):
+        """Compile the templates if there are none yet or the JSON data changed"""
+        enemies_json = self.data_loader.load_json("enemies.json")
+        bosses_json = self.data_loader.load_json("bosses.json")
+        sources = self._sources
+        # A missing file is a new {} every time - only new data counts
+        if (sources is None or not (sources[0] is enemies_json or not sources[0] and not enemies_json)
+                or not (sources[1] is bosses_json or not sources[1] and not bosses_json)):
+            self._compile_templates(enemies_json, bosses_json)
+
+    def _compile_templates(self, enemies_json: Dict[str, Any], bosses_json: Dict[str, Any]):
+        """Compile every enemy and boss record (internal helper)"""
+        text = self.data_loader.text
+        enemies: Dict[str, EnemyTemplate] = {}
+        for data in enemies_json.get("enemies", []):
+            enemies.setdefault(data["id"], EnemyTemplate.from_data(data, text=text))
+        for enemy_id, data in ENEMY_TEMPLATES.items():
+            enemies.setdefault(enemy_id, EnemyTemplate.from_data(data, text=text))
+
+        bosses: Dict[str, EnemyTemplate] = {}
+        for data in bosses_json.get("bosses", []):
+            bosses.setdefault(data["id"], EnemyTemplate.from_data(data, is_boss=True, text=text))
+        for boss_id, data in BOSS_TEMPLATES.items():
+            bosses.setdefault(boss_id, EnemyTemplate.from_data(data, is_boss=True, text=text))
+
+        self._enemy_templates = enemies
+        self._boss_templates = bosses
+        self._sources = (enemies_json, bosses_json)
+        self._stats.clear()  # Keyed on the old templates
+
+    def get_enemy_template(self, enemy_id: str) -> Optional[EnemyTemplate]:
+        """Get the compiled template for a regular enemy (None if unknown)"""
+        self._check_templates()
+        return self._enemy_templates.get(enemy_id)
+
+    def get_boss_template(self, boss_id: str) -> Optional[EnemyTemplate]:
+        """Get the compiled template for a boss (None if unknown)"""
+        self._check_templates()
+        return self._boss_templates.get(boss_id)
+
+    def scaled_stats(self, template: EnemyTemplate, level: int) -> ScaledStats:
+        """Get a template's stats at a level (computed once, then memoized)"""
+        key = (template, level)
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = scale_template(template, level)
+            self._stats[key] = stats
+        return stats
+
+    def create_enemy(self, enemy_id: str, level: Optional[int] = None) -> Optional[Enemy]:
+        """
+        Spawn a regular enemy.
+
+        Args:
+            enemy_id: Enemy ID (e.g., "wild_bandit")
+            level: Enemy level (default: bottom of its level_range)
+
+        Returns:
+            Enemy instance or None if not found
+        """
+        template = self.get_enemy_template(enemy_id)
+        if template is None:
+            return None
+        if level is None:
+            level = template.default_level
+        return Enemy.spawn(template, level, self.scaled_stats(template, level))
+
+    def create_boss(self, boss_id: str, level: Optional[int] = None) -> Optional[Boss]:
+        """
+        Spawn a boss.
+
+        Args:
+            boss_id: Boss ID (e.g., "steward_feast")
+            level: Boss level (default: its level in bosses.json)
+
+        Returns:
+            Boss instance or None if not found
+        """
+        template = self.get_boss_template(boss_id)
+        if template is None:
+            return None
+        if level is None:
+            level = template.default_level
+        return Boss.spawn(template, level, self.scaled_stats(template, level))
+
+
+_enemy_factory = None  # Shared factory over get_data_loader()
+
+
+def get_enemy_factory() -> EnemyFactory:
+    """Get the shared EnemyFactory (built on the shared DataLoader)"""
+    global _enemy_factory
+    if _enemy_factory is None:
+        _enemy_factory = EnemyFactory()
+        _enemy_factory.data_loader.on_clear_cache(_enemy_factory.reset)
+    return _enemy_factory
+
+
+def create_enemy(enemy_id: str, level: Optional[int] = None) -> Optional[Enemy]:
     """
     Factory function to create an enemy by ID.
 
     Args:
         enemy_id: Enemy template ID
-        level: Enemy level
+        level: Enemy level (default: bottom of its level_range)
 
     Returns:
         Enemy instance or None if not found
     """
-    if enemy_id in ENEMY_TEMPLATES:
-        return Enemy(ENEMY_TEMPLATES[enemy_id], level)
-    return None
+    return get_enemy_factory().create_enemy(enemy_id, level)
 
 
-def create_boss(boss_id: str, level: int = 1) -> Optional[Boss]:
+def create_boss(boss_id: str, level: Optional[int] = None) -> Optional[Boss]:
     """
     Factory function to create a boss by ID.
 
     Args:
         boss_id: Boss template ID
-        level: Boss level
+        level: Boss level (default: its level in bosses.json)
 
     Returns:
         Boss instance or None if not found
     """
-    if boss_id in BOSS_TEMPLATES:
-        return Boss(BOSS_TEMPLATES[boss_id], level)
-    return None
+    return get_enemy_factory().create_boss(boss_id, level)
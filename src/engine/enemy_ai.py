@@ -0,0 +1,416 @@
+"""
+Search-based enemy AI - bosses that think a few turns ahead
+
+Enemies with ai_pattern "expectimax" don't pick attacks by a fixed rule.
+Each turn they search the possible futures of the fight and pick the
+attack that leaves them best off:
+
+    boss picks an attack              (max: best for the boss)
+      dice for both sides             (chance: miss / low hit / high hit /
+                                       crit, weighted by probability)
+        ... next turn ...
+
+The player is expected to attack with each fish's best move (highest
+expected damage on the boss), and speed and move priority decide who
+hits first, as in Battle.execute_turn().
+
+The search works on a compact model of the battle - boss HP, which fish
+is out and every party fish's HP - not on full Battle objects, so it
+can look at thousands of positions per decision. Damage comes from the
+exact odds of each hit (damage.damage_distribution()), squeezed into a
+few equally likely buckets so the search doesn't branch too much, and
+type effectiveness from the compiled type table (elements.py).
+
+RESPONSIVE:
+- Iterative deepening: search 1 turn ahead, then 2, then 3, ... and use
+  the deepest search that finished.
+- A time budget per decision (DEFAULT_TIME_BUDGET = 5 ms), counted from
+  the start of the decision (building the model included). The search
+  itself stops BUDGET_HEADROOM short of it, so unwinding a dropped search
+  still finishes inside the budget, and a deeper search isn't started if
+  the last one took longer than the time left. It's a soft limit: a
+  garbage collection or a busy machine can still push a decision past it.
+- A transposition table: positions reached by different move orders
+  (e.g. "miss, then hit" vs "hit, then miss") are only evaluated once,
+  and the table is kept between turns while stats stay the same.
+
+DETERMINISM:
+The search never rolls dice, so with the same state it always picks the
+same attack - unless the time budget cuts a search short on a slow or
+busy machine. For replays and batch simulations that must be
+bit-for-bit reproducible, use a planner without a time budget:
+
+    ExpectimaxAI(time_budget=None, max_depth=2)
+    make_reproducible(enemies)    # Does that for every "expectimax" enemy
+
+Recorded battles (replays) and the batch runner do this automatically.
+
+Not modelled (the real battle still applies them): switching, items,
+miracles, apostles, statuses, boss phase changes and other enemies in
+the battle.
+"""
+
+import time
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+
+from .damage import damage_distribution
+from .elements import defender_type_id, effectiveness_by_id
+from .moves import Move
+
+# The ai_pattern value that uses this module
+SEARCH_AI_PATTERN = "expectimax"
+
+DEFAULT_TIME_BUDGET = 0.005   # Seconds per decision
+BUDGET_HEADROOM = 0.2         # Share of the budget kept for dropping a cut-off search
+DEFAULT_MAX_DEPTH = 3         # Turns to look ahead
+REPRODUCIBLE_DEPTH = 2        # Fixed depth without a time budget (~1-3 ms per decision)
+MAX_TABLE_ENTRIES = 200_000   # Transposition table is cleared when it gets bigger
+
+# Score of a won/lost fight (the heuristic is always between -1 and 1)
+WIN_SCORE = 1000.0
+
+# Outcomes per landed hit in the search (equally likely slices of the
+# exact damage odds, each at its average damage)
+HIT_BUCKETS = 3
+
+Outcomes = Tuple[Tuple[float, int], ...]   # ((probability, damage), ...)
+
+
+class SearchInfo(NamedTuple):
+    """What the last decision's search did (for tuning and benchmarks)"""
+    depth: int          # Deepest finished search (0 = fell back to greedy)
+    nodes: int          # Positions evaluated
+    table_hits: int     # Positions found in the transposition table
+    elapsed: float      # Seconds
+
+
+class _OutOfTime(Exception):
+    """Time budget used up - abandon the current search depth"""
+
+
+def hit_outcomes(attacker_stat: int, move: Any, defender: Any,
+                 attacker_type: Optional[str], effectiveness: float,
+                 buckets: int = HIT_BUCKETS) -> Outcomes:
+    """
+    Possible results of one attack, with their probabilities.
+
+    Args:
+        attacker_stat: Attacker's effective ATK
+        move: The Move (or a move dict)
+        defender: Fish or Enemy (its defense is applied)
+        attacker_type: Attacker's type (for STAB)
+        effectiveness: Type multiplier of the move against the defender
+        buckets: Slices the landed hits are grouped into
+
+    Returns:
+        ((probability, damage after defense), ...): a miss (0 damage) and
+        `buckets` equally likely slices of the hits, weakest to strongest,
+        each at its average damage (equal damages merged)
+    """
+    odds = damage_distribution(attacker_stat, move, defender, attacker_type, effectiveness)
+    hit_mass = sum(chance for damage, chance in odds.outcomes() if damage > 0)
+    outcomes: Dict[int, float] = {}
+    if odds.damages[0] == 0:
+        outcomes[0] = 1.0 - hit_mass
+    if hit_mass > 0:
+        size = hit_mass / buckets
+        mass = total = 0.0
+        for damage, chance in odds.outcomes():
+            while damage > 0 and chance > 1e-12:
+                part = min(chance, size - mass)
+                mass += part
+                total += part * damage
+                chance -= part
+                if mass >= size * (1 - 1e-9):  # Slice full - emit it
+                    average = max(1, int(round(total / mass)))
+                    outcomes[average] = outcomes.get(average, 0.0) + mass
+                    mass = total = 0.0
+        if mass > 1e-12:  # Float leftovers
+            average = max(1, int(round(total / mass)))
+            outcomes[average] = outcomes.get(average, 0.0) + mass
+    return tuple((chance, damage) for damage, chance in outcomes.items() if chance > 0)
+
+
+class _Model(NamedTuple):
+    """Everything about the fight that doesn't change during a search"""
+    boss_max_hp: int
+    party_max_hp: int
+    max_hps: Tuple[int, ...]
+    boss_attacks: Tuple[int, ...]                   # Indexes into enemy.attacks
+    boss_priority: Tuple[int, ...]
+    boss_hits: Tuple[Tuple[Outcomes, ...], ...]     # [attack][fish]
+    # Per fish: (priority, outcomes on the boss) of its best move (None = can't attack)
+    fish_replies: Tuple[Optional[Tuple[int, Outcomes]], ...]
+    fish_faster: Tuple[bool, ...]                   # Fish SPD >= boss SPD
+
+
+class ExpectimaxAI:
+    """
+    Plans enemy attacks with a depth-limited expectimax search.
+
+    Usage:
+        ai = ExpectimaxAI()                       # 5 ms, 3 turns
+        attack = ai.choose_attack(enemy, battle)
+        ai.last_search.depth                      # How far it got
+
+    Enemies with ai_pattern "expectimax" get one automatically
+    (see Enemy.choose_attack()).
+    """
+
+    def __init__(self, time_budget: Optional[float] = DEFAULT_TIME_BUDGET,
+                 max_depth: int = DEFAULT_MAX_DEPTH,
+                 max_table_entries: int = MAX_TABLE_ENTRIES):
+        """
+        Args:
+            time_budget: Seconds per decision (None = no limit: always
+                         searches max_depth turns, fully reproducible)
+            max_depth: Turns to look ahead at most
+            max_table_entries: Transposition table size limit
+        """
+        self.time_budget = time_budget
+        self.max_depth = max(1, max_depth)
+        self.max_table_entries = max_table_entries
+        self.table: Dict[Tuple, float] = {}
+        self.last_search: Optional[SearchInfo] = None
+        self._model: Optional[_Model] = None
+        self._deadline = float("inf")
+        self._nodes = 0
+        self._hits = 0
+
+    # ------------------------------------------------------------------
+    # Decision
+    # ------------------------------------------------------------------
+
+    def choose_attack(self, enemy: Any, battle: Any) -> Move:
+        """
+        Pick the enemy's attack for this turn.
+
+        Args:
+            enemy: The attacking enemy (battle.active_enemy)
+            battle: The Battle in progress
+
+        Returns:
+            One of enemy.attacks
+        """
+        start = time.perf_counter()
+        if self.time_budget is None:
+            self._deadline = float("inf")
+        else:
+            self._deadline = start + self.time_budget * (1.0 - BUDGET_HEADROOM)
+        self._nodes = self._hits = 0
+
+        model = self._build_model(enemy, battle)
+        if model != self._model:  # Stats changed - old positions are worthless
+            self.table.clear()
+            self._model = model
+        elif len(self.table) > self.max_table_entries:
+            self.table.clear()
+
+        party = battle.player.active_party
+        state = (enemy.current_hp, party.index(battle.active_fish),
+                 tuple(fish.current_hp for fish in party))
+
+        # Without a finished search: the best expected hit right now
+        choice = max(range(len(model.boss_attacks)),
+                     key=lambda attack: sum(p * d for p, d in model.boss_hits[attack][state[1]]))
+        finished = 0
+        for depth in range(1, self.max_depth + 1):
+            begun = time.perf_counter()
+            try:
+                choice = self._best_attack(state, depth)
+            except _OutOfTime:
+                break
+            finished = depth
+            # The next depth costs at least as much as this one did
+            done = time.perf_counter()
+            if done + (done - begun) > self._deadline:
+                break
+
+        self.last_search = SearchInfo(finished, self._nodes, self._hits,
+                                      time.perf_counter() - start)
+        return enemy.attacks[model.boss_attacks[choice]]
+
+    def _build_model(self, enemy: Any, battle: Any) -> _Model:
+        party = battle.player.active_party
+        boss_atk = enemy.get_effective_stat("atk")
+
+        boss_attacks = tuple(range(len(enemy.attacks)))
+        boss_hits = tuple(
+            tuple(hit_outcomes(boss_atk, attack, fish, enemy.enemy_type,
+                               effectiveness_by_id(attack.type_id, defender_type_id(fish)))
+                  for fish in party)
+            for attack in enemy.attacks)
+
+        # The player is expected to use each fish's best move against the boss
+        enemy_type_id = defender_type_id(enemy)
+        fish_replies = []
+        for fish in party:
+            atk = fish.get_effective_stat("atk")
+            moves = [(move.priority,
+                      hit_outcomes(atk, move, enemy, fish.type,
+                                   effectiveness_by_id(move.type_id, enemy_type_id)))
+                     for index, move in enumerate(fish.known_moves) if fish.can_use_move(index)]
+            fish_replies.append(max(moves, key=lambda m: sum(p * d for p, d in m[1]))
+                                if moves else None)
+
+        return _Model(
+            boss_max_hp=enemy.max_hp,
+            party_max_hp=sum(fish.max_hp for fish in party) or 1,
+            max_hps=tuple(fish.max_hp for fish in party),
+            boss_attacks=boss_attacks,
+            boss_priority=tuple(attack.priority for attack in enemy.attacks),
+            boss_hits=boss_hits,
+            fish_replies=tuple(fish_replies),
+            fish_faster=tuple(fish.get_effective_stat("spd") >= enemy.get_effective_stat("spd")
+                              for fish in party),
+        )
+
+    # ------------------------------------------------------------------
+    # Search
+    # ------------------------------------------------------------------
+
+    def _best_attack(self, state: Tuple, depth: int) -> int:
+        # Ties (e.g. every attack wins; rounded so float noise doesn't
+        # decide) go to the biggest expected hit
+        active = state[1]
+        hits = self._model.boss_hits
+        return max(range(len(self._model.boss_attacks)),
+                   key=lambda attack: (round(self._turn_value(state, attack, depth), 9),
+                                       sum(p * d for p, d in hits[attack][active])))
+
+    def _value(self, state: Tuple, depth: int) -> float:
+        """Max node: the boss's best attack from this position"""
+        boss_hp, active, hps = state
+        if depth == 0:
+            return boss_hp / self._model.boss_max_hp - sum(hps) / self._model.party_max_hp
+
+        key = (boss_hp, active, hps, depth)
+        value = self.table.get(key)
+        if value is not None:
+            self._hits += 1
+            return value
+
+        self._nodes += 1
+        if time.perf_counter() > self._deadline:
+            raise _OutOfTime
+
+        value = max(self._turn_value(state, attack, depth)
+                    for attack in range(len(self._model.boss_attacks)))
+        self.table[key] = value
+        return value
+
+    def _turn_value(self, state: Tuple, attack: int, depth: int) -> float:
+        """Chance node: one turn with this attack, averaged over every roll"""
+        boss_hp, active, hps = state
+        model = self._model
+        reply = model.fish_replies[active]
+        if reply is None:
+            priority, reply_hits = 0, ((1.0, 0),)  # Can't attack - just takes the hit
+        else:
+            priority, reply_hits = reply
+        boss_priority = model.boss_priority[attack]
+        if priority != boss_priority:
+            boss_first = boss_priority > priority
+        else:
+            boss_first = not model.fish_faster[active]
+
+        # The boss's possible hits: (chance, party HP after, next fish or None)
+        hits = [(chance,) + _hit_fish(hps, active, damage)
+                for chance, damage in model.boss_hits[attack][active]]
+        win, loss = WIN_SCORE + depth, -WIN_SCORE - depth
+        if depth == 1:
+            return self._last_turn_value(boss_hp, active, hits, reply_hits, boss_first, win, loss)
+
+        value = self._value
+        total = 0.0
+        if boss_first:
+            for chance, after, new_active in hits:
+                if new_active is None:
+                    total += chance * win
+                elif new_active != active:
+                    # The fish fainted - its action is lost, the next fish comes out
+                    total += chance * value((boss_hp, new_active, after), depth - 1)
+                else:
+                    for reply_chance, dealt in reply_hits:
+                        if dealt >= boss_hp:
+                            total += chance * reply_chance * loss
+                        else:
+                            total += chance * reply_chance * value(
+                                (boss_hp - dealt, active, after), depth - 1)
+        else:
+            for reply_chance, dealt in reply_hits:
+                if dealt >= boss_hp:
+                    total += reply_chance * loss  # Boss falls before it can attack
+                    continue
+                for chance, after, new_active in hits:
+                    if new_active is None:
+                        total += reply_chance * chance * win
+                    else:
+                        total += reply_chance * chance * value(
+                            (boss_hp - dealt, new_active, after), depth - 1)
+        return total
+
+    def _last_turn_value(self, boss_hp, active, hits, reply_hits, boss_first, win, loss) -> float:
+        """
+        _turn_value() for the last turn of the search.
+
+        The positions after it are scored by the heuristic, which is linear
+        in the damage dealt - so the player's rolls can be averaged once
+        instead of once per boss roll.
+        """
+        boss_max, party_max = self._model.boss_max_hp, self._model.party_max_hp
+        survive = 0.0      # Chance the boss survives the player's hit
+        boss_score = 0.0   # Expected boss HP share when it survives
+        for chance, dealt in reply_hits:
+            if dealt < boss_hp:
+                survive += chance
+                boss_score += chance * (boss_hp - dealt) / boss_max
+        falls = (1 - survive) * loss
+
+        total = 0.0
+        for chance, after, new_active in hits:
+            if new_active is None:
+                # Party wiped - unless the player got the boss first
+                total += chance * (win if boss_first else falls + survive * win)
+            elif boss_first and new_active != active:
+                total += chance * (boss_hp / boss_max - sum(after) / party_max)
+            else:
+                total += chance * (falls + boss_score - survive * sum(after) / party_max)
+        return total
+
+
+def _hit_fish(hps: Tuple[int, ...], active: int, damage: int) -> Tuple[Tuple[int, ...], Optional[int]]:
+    """Party HP after a hit, and who's out next (None = every fish fainted)"""
+    if damage <= 0:
+        return hps, active
+    hp = max(0, hps[active] - damage)
+    after = hps[:active] + (hp,) + hps[active + 1:]
+    if hp > 0:
+        return after, active
+    for index, left in enumerate(after):  # Battle sends out the first healthy fish
+        if left > 0:
+            return after, index
+    return after, None
+
+
+def plan_attack(enemy: Any, battle: Any) -> Move:
+    """
+    Attack for an "expectimax" enemy (each enemy keeps its own planner
+    and transposition table).
+    """
+    if enemy.planner is None:
+        enemy.planner = ExpectimaxAI()
+    return enemy.planner.choose_attack(enemy, battle)
+
+
+def make_reproducible(enemies: Any):
+    """
+    Give every "expectimax" enemy a fixed-depth planner with no time
+    budget, so its choices never depend on how fast the machine is.
+
+    Args:
+        enemies: Enemies about to battle
+    """
+    for enemy in enemies:
+        if enemy.ai_pattern == SEARCH_AI_PATTERN:
+            enemy.planner = ExpectimaxAI(time_budget=None, max_depth=REPRODUCIBLE_DEPTH)
@@ -1,17 +1,151 @@
 """
 Fish class - represents a battle fish (weapon) in Loaves and Fishes
+
+FLYWEIGHT:
+A player can own up to MAX_FISH_STORAGE fish, and many of them are the
+same species. Everything that's the same for every fish of a species
+(name, type, base stats, moves, flavor text) lives in ONE immutable
+FishSpecies object. Each Fish only stores what's different about it
+(level, XP, HP, status) in __slots__, and points at its species.
+
+Fish.name, fish.base_atk, fish.all_moves etc. still work - they're
+read-only properties that forward to the species.
 """
 
-from typing import Dict, List, Optional, Any
+from dataclasses import dataclass
+from operator import attrgetter
+from typing import Dict, List, Optional, Any, Tuple
 import random
 
+from .damage import apply_defense
+from .elements import type_id
+from .modifiers import ModifierStack
+from .moves import Move
+from .statuses import CANNOT_ACT_MASK, INVINCIBLE, SILENCED, StatusHolder
+from .stat_tables import FISH_GROWTH_RATE, StatTable, get_stat_table
+from .timing_wheel import TimingWheel
+
+# Neutral stat modifiers - each fish gets its own copy on first use
+_DEFAULT_STAT_MODIFIERS = {
+    "atk": 1.0,
+    "def": 1.0,
+    "spd": 1.0,
+    "accuracy": 1.0,
+    "evasion": 1.0
+}
+
+
+@dataclass(frozen=True, eq=False)
+class FishSpecies:
+    """
+    Immutable data shared by every fish of one species.
+
+    Get one with FishSpecies.get() - it returns the same object for the
+    same fish.json record, so 999 Carp Diems share one species.
+    """
+    fish_id: str
+    name: str
+    tier: Any
+    type: str
+    type_id: int            # Integer id of `type` (see elements.py)
+    base_hp: int
+    base_atk: int
+    base_def: int
+    base_spd: int
+    property: Dict[str, Any]
+    all_moves: Tuple[Move, ...]     # Compiled once per species
+    combo_attack: Optional[Dict[str, Any]]
+    flavor_text: Any
+    stats: StatTable        # (hp, atk, def, spd) at every level
+    source: Dict[str, Any]  # The fish.json record this was built from
+
+    @classmethod
+    def from_data(cls, fish_id: str, fish_data: Dict[str, Any]) -> "FishSpecies":
+        """Build a species from a fish.json record"""
+        base_stats = fish_data["base_stats"]
+        return cls(
+            fish_id=fish_id,
+            name=fish_data["name"],
+            tier=fish_data["tier"],
+            type=fish_data["type"],
+            type_id=type_id(fish_data["type"]),
+            base_hp=base_stats["hp"],
+            base_atk=base_stats["atk"],
+            base_def=base_stats["def"],
+            base_spd=base_stats["spd"],
+            property=fish_data["property"],
+            all_moves=tuple(Move(move) for move in fish_data["moves"]),
+            combo_attack=fish_data.get("combo_attack", None),
+            flavor_text=fish_data["flavor_text"],
+            stats=get_stat_table((base_stats["hp"], base_stats["atk"], base_stats["def"],
+                                  base_stats["spd"]), FISH_GROWTH_RATE),
+            source=fish_data,
+        )
+
+    @classmethod
+    def get(cls, fish_id: str, fish_data: Dict[str, Any]) -> "FishSpecies":
+        """
+        Get the shared species for a fish.json record.
+
+        Built once per record; a different record for the same fish_id
+        (reloaded data, another edition) replaces the cached species.
+
+        Args:
+            fish_id: Fish identifier (e.g., "holy_mackerel")
+            fish_data: The fish's record from fish.json
+
+        Returns:
+            The shared FishSpecies
+        """
+        species = _SPECIES.get(fish_id)
+        if species is None or species.source is not fish_data:
+            species = cls.from_data(fish_id, fish_data)
+            _SPECIES[fish_id] = species
+        return species
+
+
+# Flyweight cache: {fish_id: FishSpecies}
+_SPECIES: Dict[str, FishSpecies] = {}
 
-class Fish:
+
+def _species_field(name: str, doc: str) -> property:
+    """Read-only Fish property that forwards to the species"""
+    return property(attrgetter(f"species.{name}"), doc=doc)  # attrgetter: no Python-level call
+
+
+class Fish(StatusHolder):
     """
     Represents a fish that can be used in battle.
     Fish are like Pokémon - they have stats, moves, types, and can level up.
+
+    Static data is shared through self.species (see FishSpecies);
+    the slots below are the only per-fish state. Species fields (tier,
+    type, base stats, ...) are read-only and a fish takes no attributes
+    beyond its slots; only the name can be set per fish (a nickname).
     """
 
+    __slots__ = (
+        "species", "level", "xp", "xp_to_next_level",
+        "max_hp", "current_hp", "atk", "defense", "spd",
+        "known_moves", "held_item", "status_mask", "_status_ends",
+        "_stat_modifiers", "_wheel",
+        "nickname",  # Player-given name (None = the species name)
+        "owner",  # Player who owns this fish (set by Player)
+    )
+
+    # Static data - read-only, shared by every fish of the species
+    fish_id = _species_field("fish_id", "Unique identifier for the fish type")
+    tier = _species_field("tier", "Rarity tier (0-3 or special)")
+    type = _species_field("type", "Element type (Water, Holy, ...)")
+    type_id = _species_field("type_id", "Integer id of the element type")
+    base_hp = _species_field("base_hp", "Level 1 HP")
+    base_atk = _species_field("base_atk", "Level 1 ATK")
+    base_def = _species_field("base_def", "Level 1 DEF")
+    base_spd = _species_field("base_spd", "Level 1 SPD")
+    all_moves = _species_field("all_moves", "Every move the species can learn")
+    combo_attack = _species_field("combo_attack", "Combo attack data (or None)")
+    flavor_text = _species_field("flavor_text", "Dual-text description")
+
     def __init__(self, fish_id: str, fish_data: Dict[str, Any], level: int = 1):
         """
         Initialize a fish instance
@@ -21,89 +155,56 @@ class Fish:
             fish_data: Dictionary containing fish data from JSON
             level: Starting level (default 1)
         """
-        self.fish_id = fish_id
-        self.name = fish_data["name"]
-        self.tier = fish_data["tier"]
-        self.type = fish_data["type"]
+        self.species = FishSpecies.get(fish_id, fish_data)
         self.level = level
         self.xp = 0
         self.xp_to_next_level = 100  # Flat 100 XP per level
+        self.nickname: Optional[str] = None
 
-        # Base stats
-        base_stats = fish_data["base_stats"]
-        self.base_hp = base_stats["hp"]
-        self.base_atk = base_stats["atk"]
-        self.base_def = base_stats["def"]
-        self.base_spd = base_stats["spd"]
-
-        # Current stats (calculated from base + level)
-        self.max_hp = self._calculate_stat(self.base_hp, level)
+        # Current stats (looked up from the species' stat table)
+        self.max_hp, self.atk, self.defense, self.spd = self.species.stats.at(level)
         self.current_hp = self.max_hp
-        self.atk = self._calculate_stat(self.base_atk, level)
-        self.defense = self._calculate_stat(self.base_def, level)
-        self.spd = self._calculate_stat(self.base_spd, level)
-
-        # Property (special ability)
-        self.property = fish_data["property"]
 
         # Moves
-        self.all_moves = fish_data["moves"]
         self.known_moves = self._get_available_moves()
 
         # Held item
         self.held_item: Optional[Dict[str, Any]] = None
 
-        # Status effects
-        self.status_effects: List[str] = []
+        # Status effects: one bit each, end turn per bit (see statuses.py)
+        self.status_mask = 0
+        self._status_ends: Optional[List[int]] = None
 
-        # Combo attack data
-        self.combo_attack = fish_data.get("combo_attack", None)
+        # Battle state - created on first use (most stored fish never battle)
+        self._stat_modifiers: Optional[ModifierStack] = None
+        self._wheel: Optional[TimingWheel] = None  # What timed effects count turns on
 
-        # Flavor text
-        self.flavor_text = fish_data["flavor_text"]
+    @property
+    def name(self) -> str:
+        """Display name: the nickname if the player gave one, else the species name"""
+        return self.nickname or self.species.name
 
-        # Battle state
-        self.stat_modifiers = {
-            "atk": 1.0,
-            "def": 1.0,
-            "spd": 1.0,
-            "accuracy": 1.0,
-            "evasion": 1.0
-        }
-        self.timed_stat_modifiers = {stat: [] for stat in self.stat_modifiers}
-        self.status_durations: Dict[str, int] = {}
+    @name.setter
+    def name(self, value: Optional[str]):
+        self.nickname = value
 
-    def _calculate_stat(self, base_stat: int, level: int) -> int:
-        """
-        Calculate stat based on level using a linear growth formula.
+    @property
+    def stat_modifiers(self) -> ModifierStack:
+        """Current stat multipliers (atk, def, spd, accuracy, evasion) - see modifiers.py"""
+        if self._stat_modifiers is None:
+            self._stat_modifiers = ModifierStack(_DEFAULT_STAT_MODIFIERS, self._wheel)
+        return self._stat_modifiers
 
-        Stats grow 7% per level, meaning a Level 10 fish will have stats
-        that are about 63% higher than at Level 1.
+    @property
+    def timed_stat_modifiers(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Modifiers that expire: {stat: [{"multiplier": m, "turns": t}, ...]} (a copy)"""
+        return self.stat_modifiers.timed_entries
 
-        Formula: stat = base_stat × (1 + 0.07 × (level - 1))
-        Example: Base ATK of 20 at Level 10 = 20 × (1 + 0.07 × 9) = 32.6 → 32
-
-        Args:
-            base_stat: The stat value at level 1 (from JSON data)
-            level: Current level of the fish (1-50)
-
-        Returns:
-            The calculated stat value as an integer
-
-        Note:
-            You can adjust growth_rate (0.07) to make fish stronger/weaker:
-            - 0.05 = slower growth (5% per level)
-            - 0.10 = faster growth (10% per level)
-        """
-        growth_rate = 0.07  # 7% growth per level - balanced for JRPG progression
-        stat_value = base_stat * (1 + growth_rate * (level - 1))
-        return int(stat_value)  # Convert to integer (rounds down)
-
-    def _get_available_moves(self) -> List[Dict[str, Any]]:
+    def _get_available_moves(self) -> List[Move]:
         """Get moves available at current level"""
         available = []
         for move in self.all_moves:
-            if move["level"] <= self.level:
+            if move.level <= self.level:
                 available.append(move)
         return available
 
@@ -139,19 +240,15 @@ class Fish:
         self.level += 1
         self.xp -= self.xp_to_next_level
 
-        # Recalculate stats
+        # Look up the new stats
         old_max_hp = self.max_hp
-        self.max_hp = self._calculate_stat(self.base_hp, self.level)
+        self.max_hp, self.atk, self.defense, self.spd = self.species.stats.at(self.level)
         self.current_hp += (self.max_hp - old_max_hp)  # Heal for the HP increase
 
-        self.atk = self._calculate_stat(self.base_atk, self.level)
-        self.defense = self._calculate_stat(self.base_def, self.level)
-        self.spd = self._calculate_stat(self.base_spd, self.level)
-
         # Check for new moves
         new_moves = []
         for move in self.all_moves:
-            if move["level"] == self.level:
+            if move.level == self.level:
                 new_moves.append(move)
                 if move not in self.known_moves:
                     self.known_moves.append(move)
@@ -183,33 +280,56 @@ class Fish:
             Defense is MULTIPLICATIVE with stat modifiers (buffs/debuffs).
             Always deals at least 1 damage to prevent stalling.
         """
-        if "invincible" in self.status_effects:
+        actual_damage = self.damage_after_defense(damage)
+
+        # Reduce HP, but never go below 0
+        self.current_hp = max(0, self.current_hp - actual_damage)
+
+        return actual_damage
+
+    def damage_after_defense(self, damage: int) -> int:
+        """
+        HP a raw hit would take off this fish, without applying it.
+
+        take_damage() uses this; AI lookahead calls it directly.
+
+        Args:
+            damage: Raw damage amount before defense reduction
+
+        Returns:
+            Damage after defense and abilities (0 while invincible)
+        """
+        profile = self.defense_profile()
+        if profile is None:
             return 0
+        return apply_defense(damage, *profile)
 
-        # Get current defense modifier (affected by buffs/debuffs)
-        defense_mult = self.stat_modifiers["def"]
+    def defense_profile(self) -> Optional[Tuple[float, bool]]:
+        """
+        What damage_after_defense() does to a hit right now.
+
+        Returns:
+            (effective DEF, halved) for damage.apply_defense(), or None
+            while the fish is invincible (takes no damage)
+        """
+        if self.status_mask & INVINCIBLE:
+            return None
 
-        # Calculate damage reduction based on defense
-        # Formula: damage × (100 / (100 + effective_defense))
+        # Get current defense modifier (affected by buffs/debuffs)
+        # Formula: damage × (100 / (100 + effective_defense)), at least 1
         # Higher defense = lower damage multiplier
+        modifiers = self._stat_modifiers
+        defense_mult = modifiers["def"] if modifiers else 1.0
         effective_defense = self.defense * defense_mult
-        damage_multiplier = 100 / (100 + effective_defense)
-        actual_damage = int(damage * damage_multiplier)
-
-        # Ensure at least 1 damage is dealt (prevents immortality)
-        actual_damage = max(1, actual_damage)
 
-        # Apply special property effects (e.g., damage reduction abilities)
+        # Special property effects (e.g., damage reduction abilities)
+        halved = False
         if self.property.get("effect") == "damage_reduction_alone":
             owner = getattr(self, "owner", None)
             if owner and hasattr(owner, "get_active_fish"):
-                if len(owner.get_active_fish()) == 1:
-                    actual_damage = max(1, int(actual_damage * 0.5))
-
-        # Reduce HP, but never go below 0
-        self.current_hp = max(0, self.current_hp - actual_damage)
+                halved = len(owner.get_active_fish()) == 1
 
-        return actual_damage
+        return effective_defense, halved
 
     def heal(self, amount: int) -> int:
         """
@@ -239,28 +359,6 @@ class Fish:
         if self.is_fainted():
             self.current_hp = int(self.max_hp * hp_percent)
 
-    def apply_status_effect(self, status: str, turns: Optional[int] = None):
-        """Apply a status effect to the fish"""
-        if status != "immunity" and "immunity" in self.status_effects:
-            return
-        if status not in self.status_effects:
-            self.status_effects.append(status)
-        if turns and turns > 0:
-            current = self.status_durations.get(status, 0)
-            self.status_durations[status] = max(current, turns)
-
-    def remove_status_effect(self, status: str):
-        """Remove a status effect from the fish"""
-        if status in self.status_effects:
-            self.status_effects.remove(status)
-        if status in self.status_durations:
-            del self.status_durations[status]
-
-    def clear_status_effects(self):
-        """Remove all status effects"""
-        self.status_effects.clear()
-        self.status_durations.clear()
-
     def apply_stat_modifier(self, stat: str, multiplier: float,
                             turns: Optional[int] = None):
         """
@@ -272,60 +370,36 @@ class Fish:
             turns: Number of turns the modifier lasts (None or 0 for permanent)
         """
         if stat in self.stat_modifiers:
-            self.stat_modifiers[stat] *= multiplier
             if turns and turns > 0:
-                self.timed_stat_modifiers[stat].append({
-                    "multiplier": multiplier,
-                    "turns": turns
-                })
+                self.timing_wheel()  # Make sure it expires on this fish's wheel
+            self.stat_modifiers.apply(stat, multiplier, turns)
 
     def reset_stat_modifiers(self):
         """Reset all stat modifiers to 1.0"""
-        for stat in self.stat_modifiers:
-            self.stat_modifiers[stat] = 1.0
-        for stat in self.timed_stat_modifiers:
-            self.timed_stat_modifiers[stat] = []
-
-    def tick_temporary_effects(self):
-        """Tick down temporary stat modifiers and timed status effects"""
-        for stat, entries in self.timed_stat_modifiers.items():
-            if not entries:
-                continue
-            remaining_entries = []
-            for entry in entries:
-                entry["turns"] -= 1
-                if entry["turns"] <= 0:
-                    multiplier = entry["multiplier"]
-                    if multiplier:
-                        self.stat_modifiers[stat] /= multiplier
-                else:
-                    remaining_entries.append(entry)
-            self.timed_stat_modifiers[stat] = remaining_entries
-
-        if not self.status_durations:
-            return
-        expired = []
-        for status, turns in self.status_durations.items():
-            turns -= 1
-            if turns <= 0:
-                expired.append(status)
-            else:
-                self.status_durations[status] = turns
-        for status in expired:
-            self.remove_status_effect(status)
+        # Back to the neutral state - recreated on next use
+        self._stat_modifiers = None
+
+    def attach_wheel(self, wheel: TimingWheel):
+        """
+        Count this fish's timed modifiers and statuses on `wheel`
+        (turns left stay the same). Battle does this for the party.
+        """
+        if self._stat_modifiers is not None:
+            self._stat_modifiers.attach(wheel)
+        self._attach_statuses(wheel)
 
     def can_use_move(self, move_index: int) -> bool:
         """Check if fish can use the specified move"""
         if move_index < 0 or move_index >= len(self.known_moves):
             return False
 
-        # Check status effects
-        if "frozen" in self.status_effects or "asleep" in self.status_effects:
+        # Check status effects (frozen, asleep, stunned - see STATUS_EFFECTS)
+        if self.status_mask & CANNOT_ACT_MASK:
             return False
 
         # Check if silenced (can only use physical moves)
         move = self.known_moves[move_index]
-        if "silenced" in self.status_effects and move["category"] != "Physical":
+        if self.status_mask & SILENCED and not move.is_physical:
             return False
 
         return True
@@ -351,7 +425,7 @@ class Fish:
             Effective stat value
         """
         base_value = getattr(self, stat, 0)
-        modifier = self.stat_modifiers.get(stat, 1.0)
+        modifier = self._stat_modifiers.get(stat, 1.0) if self._stat_modifiers else 1.0  # Cached
 
         # Apply held item bonuses
         if self.held_item:
@@ -361,6 +435,49 @@ class Fish:
 
         return int(base_value * modifier)
 
+    # ========================================================================
+    # SNAPSHOTS (battle lookahead - see Battle.snapshot())
+    # ========================================================================
+
+    def snapshot_state(self) -> Tuple:
+        """
+        Everything a battle can change on this fish, as a tuple.
+
+        Species data isn't copied (it's shared and read-only), and
+        untouched modifiers cost nothing.
+        """
+        return (self.level, self.xp, self.xp_to_next_level, self.max_hp, self.current_hp,
+                self.atk, self.defense, self.spd, tuple(self.known_moves),
+                self._status_state(),
+                self._stat_modifiers.copy() if self._stat_modifiers is not None else None)
+
+    def restore_state(self, state: Tuple):
+        """Put back a snapshot_state() (it can be restored any number of times)"""
+        (self.level, self.xp, self.xp_to_next_level, self.max_hp, self.current_hp,
+         self.atk, self.defense, self.spd, moves, statuses, modifiers) = state
+        self.known_moves = list(moves)
+        self._restore_status_state(statuses)
+        self._stat_modifiers = modifiers.copy() if modifiers is not None else None
+        if self._stat_modifiers is not None and self._wheel is not None:
+            self._stat_modifiers.attach(self._wheel)
+
+    def clone(self) -> "Fish":
+        """
+        Independent copy for battle what-ifs (same species, owner and item).
+
+        Example:
+            preview = fish.clone()
+            preview.take_damage(50)  # fish is unchanged
+        """
+        other = Fish.__new__(Fish)
+        other.species = self.species
+        other.held_item = self.held_item
+        other.nickname = self.nickname
+        other.owner = getattr(self, "owner", None)
+        other._wheel = TimingWheel(self._wheel.now, owner=other) if self._wheel else None
+        other.restore_state(self.snapshot_state())
+        return other
+
     def __str__(self) -> str:
         """String representation of the fish"""
         return f"{self.name} (Lv.{self.level}) - {self.current_hp}/{self.max_hp} HP"
@@ -374,8 +491,9 @@ class Fish:
         """
         Convert fish to dictionary for saving to JSON.
 
-        Only saves dynamic state that changes during gameplay.
-        Static data (name, base stats, moves) comes from fish.json.
+        Only saves dynamic state that changes during gameplay (and the
+        nickname). Static data (species name, base stats, moves) comes
+        from fish.json.
 
         Returns:
             Dictionary with all data needed to restore this fish's state
@@ -383,6 +501,7 @@ class Fish:
         Example saved data:
             {
                 "fish_id": "holy_mackerel",
+                "nickname": "Bubbles",
                 "level": 15,
                 "xp": 450,
                 "current_hp": 48,
@@ -392,11 +511,12 @@ class Fish:
         """
         return {
             "fish_id": self.fish_id,          # Which fish type (links to JSON)
+            "nickname": self.nickname,        # Player-given name (or None)
             "level": self.level,              # Current level (1-50)
             "xp": self.xp,                    # XP toward next level
             "current_hp": self.current_hp,    # Current HP (can be damaged)
             "held_item": self.held_item,      # Equipped item (or None)
-            "status_effects": self.status_effects  # Active status effects
+            "status_effects": self.status_effects  # Active status effects (names)
         }
 
     @classmethod
@@ -422,9 +542,14 @@ class Fish:
         fish = cls(data["fish_id"], fish_data, data["level"])
 
         # Restore saved state
+        fish.nickname = data.get("nickname")              # Restore nickname (older saves: none)
         fish.xp = data["xp"]                              # Restore XP progress
         fish.current_hp = data["current_hp"]              # Restore HP (might be damaged)
         fish.held_item = data.get("held_item")            # Restore equipped item
-        fish.status_effects = data.get("status_effects", [])  # Restore status effects
+        fish.status_effects = data.get("status_effects", [])  # Restore status effects (names → bits)
 
         return fish
+
+    # Defined last: inside the class body this name shadows the built-in
+    # @property decorator
+    property = _species_field("property", "Special ability")
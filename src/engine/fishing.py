@@ -2,10 +2,11 @@
 Fishing Mini-game - Catch fish through a simple rhythm/timing game
 """
 
-import random
 from typing import Optional, Dict, Any
 from enum import Enum
 
+from .rng import RNG, get_default_rng
+
 
 class FishingDifficulty(Enum):
     """Fishing difficulty levels"""
@@ -26,14 +27,16 @@ class FishingResult(Enum):
 class FishingMinigame:
     """A fishing mini-game instance"""
 
-    def __init__(self, fishing_spot_quality: int = 50):
+    def __init__(self, fishing_spot_quality: int = 50, rng: Optional[RNG] = None):
         """
         Initialize fishing mini-game
 
         Args:
             fishing_spot_quality: Quality of fishing spot (0-100)
+            rng: Random number stream (default: get_default_rng())
         """
         self.fishing_spot_quality = fishing_spot_quality
+        self.rng = rng or get_default_rng()
         self.is_active = False
         self.current_fish: Optional[Dict[str, Any]] = None
 
@@ -61,7 +64,7 @@ class FishingMinigame:
         # Determine if something bites
         bite_chance = self.fishing_spot_quality / 100
 
-        if random.random() < bite_chance:
+        if self.rng.random() < bite_chance:
             # Something bit! Determine what
             self.current_fish = self._generate_fish()
             self._set_difficulty()
@@ -83,7 +86,7 @@ class FishingMinigame:
             Dictionary with fish data
         """
         # Determine rarity
-        roll = random.random()
+        roll = self.rng.random()
 
         if roll < 0.05:  # 5% legendary
             tier = "special"
@@ -101,7 +104,7 @@ class FishingMinigame:
         return {
             "tier": tier,
             "difficulty": difficulty,
-            "size": random.randint(1, 10),  # 1-10 scale
+            "size": self.rng.randint(1, 10),  # 1-10 scale
             "caught": False
         }
 
@@ -148,12 +151,12 @@ class FishingMinigame:
             return FishingResult.NOTHING
 
         # Move fish randomly
-        if random.random() < self.fish_change_direction_chance:
+        if self.rng.random() < self.fish_change_direction_chance:
             # Fish changes direction
-            self.fish_position += random.randint(-self.fish_speed, self.fish_speed)
+            self.fish_position += self.rng.randint(-self.fish_speed, self.fish_speed)
         else:
             # Fish continues current movement
-            direction = 1 if random.random() < 0.5 else -1
+            direction = 1 if self.rng.random() < 0.5 else -1
             self.fish_position += self.fish_speed * direction
 
         # Keep fish in bounds
@@ -304,14 +307,17 @@ class FishingSpot:
         self.quality = quality
         self.available_fish = available_fish
 
-    def start_fishing(self) -> FishingMinigame:
+    def start_fishing(self, rng: Optional[RNG] = None) -> FishingMinigame:
         """
         Start fishing at this spot
 
+        Args:
+            rng: Random number stream for the mini-game (optional)
+
         Returns:
             FishingMinigame instance
         """
-        game = FishingMinigame(self.quality)
+        game = FishingMinigame(self.quality, rng)
         game.start_fishing()
         return game
 
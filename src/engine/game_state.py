@@ -4,9 +4,10 @@ Game State Management - Central state and scene management
 
 from enum import Enum
 from typing import Optional, Dict, Any
-import random
 
 from utils.data_loader import get_data_loader
+from .elements import check_data_type_chart
+from .rng import RNG, get_default_rng
 
 
 class GameScene(Enum):
@@ -36,14 +37,19 @@ class EncounterType(Enum):
 class GameState:
     """Manages overall game state and scene transitions"""
 
-    def __init__(self, player):
+    def __init__(self, player, data_loader=None, rng: Optional[RNG] = None):
         """
         Initialize game state
 
         Args:
             player: Player instance
+            data_loader: Shared data context (default: get_data_loader())
+            rng: Random number stream for encounters (default: get_default_rng())
         """
         self.player = player
+        self.data_loader = data_loader or get_data_loader()
+        check_data_type_chart(self.data_loader)  # Fail at startup, not mid-battle
+        self.rng = rng or get_default_rng()
         self.current_scene = GameScene.TITLE
         self.previous_scene = None
 
@@ -134,11 +140,11 @@ class GameState:
         self.steps_since_encounter += 1
 
         # Check for random encounter
-        if random.random() < self.encounter_rate:
+        if self.rng.random() < self.encounter_rate:
             self.steps_since_encounter = 0
 
             # Determine encounter type
-            roll = random.random()
+            roll = self.rng.random()
 
             if roll < 0.7:  # 70% wild battle
                 return EncounterType.WILD_BATTLE
@@ -224,14 +230,14 @@ class GameState:
         """
         Get available enemy encounters for current region
 
+        Uses the loader's region index, so an encounter roll never scans
+        the full enemy list.
+
         Returns:
             List of enemy IDs
         """
         region = self.get_current_region()
-
-        data_loader = get_data_loader()
-        enemies_data = data_loader.load_json("enemies.json").get("enemies", [])
-        return [e["id"] for e in enemies_data if e.get("region") == region]
+        return [e["id"] for e in self.data_loader.get_enemies_by_region(region)]
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -0,0 +1,388 @@
+"""
+Horde battles - 50 to 500 enemies at once, kept in columns
+
+A normal Battle holds a few Enemy objects and fights the active one. In
+a horde battle every enemy's HP, DEF, status bits and atk/def/spd
+multipliers live in a Horde instead: one array per field, one entry
+(row) per enemy.
+
+    horde = Horde().spawn("wild_bandit", 200, level=5)
+    battle = HordeBattle(player, horde)
+
+The enemies are still Enemy objects (HordeEnemy) - attacks, AI,
+statuses and modifiers work as usual - but their current_hp,
+status_mask and stat multipliers read and write their row, so whatever
+hits the whole horde runs on the columns at once:
+
+    area attacks      Divine Judgment, Sons of Thunder, Revolutionary
+                      Fervor (one pass over hp/defense/def multiplier)
+    status damage     Poison/burn hurt EVERY enemy at the end of the turn
+    defeat sweep      Every enemy at 0 HP is rewarded and removed in one
+                      pass (the enemy list is rebuilt once, not per KO)
+
+Turn order is unchanged: the player fights the active (front) enemy,
+which attacks back; when it falls the next one steps up.
+
+With NumPy installed the batch operations work on NumPy views of the
+columns (no copies); without it, on plain loops over the same arrays.
+Either way the numbers are the ones Enemy.take_damage() and the normal
+end-of-turn status damage give.
+"""
+
+from array import array
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+try:  # Optional: batch operations fall back to plain loops without it
+    import numpy as np
+except ImportError:
+    np = None
+
+from .battle import Battle
+from .battle_log import LogEvent
+from .damage import apply_defense
+from .enemy import Enemy, EnemyFactory, EnemyTemplate, ScaledStats, get_enemy_factory
+from .modifiers import ModifierStack
+from .statuses import DAMAGE_MASK, INVINCIBLE, StatusHandler, handlers_for
+from .timing_wheel import TimingWheel
+
+# Stat multipliers kept as columns (an enemy's whole ModifierStack)
+MODIFIER_STATS = ("atk", "def", "spd")
+
+
+# ============================================================================
+# COLUMNS
+# ============================================================================
+
+class Horde:
+    """
+    Column storage for a horde's enemies (row = order added).
+
+    Attributes:
+        hp, max_hp, defense: array('i') per row
+        status: array('Q') status bits per row (see statuses.py)
+        modifiers: {"atk"/"def"/"spd": array('d')} stat multipliers per row
+        alive: array('b') - 1 while the enemy is still in the battle
+        units: HordeEnemy per row
+    """
+
+    def __init__(self):
+        self.hp = array("i")
+        self.max_hp = array("i")
+        self.defense = array("i")
+        self.status = array("Q")
+        self.modifiers: Dict[str, array] = {stat: array("d") for stat in MODIFIER_STATS}
+        self.alive = array("b")
+        self.units: List["HordeEnemy"] = []
+
+    def __len__(self) -> int:
+        return len(self.units)
+
+    # Adding enemies ---------------------------------------------------------
+
+    def spawn(self, enemy_id: str, count: int, level: Optional[int] = None,
+              factory: Optional[EnemyFactory] = None) -> "Horde":
+        """
+        Add `count` enemies of one kind.
+
+        Args:
+            enemy_id: Enemy ID (e.g., "wild_bandit")
+            count: How many
+            level: Their level (default: bottom of its level_range)
+            factory: EnemyFactory (default: get_enemy_factory())
+
+        Returns:
+            self, so spawns can be chained
+
+        Example:
+            horde = Horde().spawn("wild_bandit", 300).spawn("lost_sheep", 20, level=8)
+        """
+        factory = factory or get_enemy_factory()
+        template = factory.get_enemy_template(enemy_id)
+        if template is None:
+            raise ValueError(f"Unknown enemy: {enemy_id!r}")
+        if level is None:
+            level = template.default_level
+        stats = factory.scaled_stats(template, level)  # One memoized copy for the whole group
+        for _ in range(count):
+            self.add(template, level, stats)
+        return self
+
+    def add(self, template: EnemyTemplate, level: int, stats: ScaledStats) -> "HordeEnemy":
+        """New enemy in a new row (see Enemy.spawn())"""
+        unit = HordeEnemy.__new__(HordeEnemy)
+        unit.horde = self
+        unit.row = len(self.units)
+        self.units.append(unit)
+        self.hp.append(0)
+        self.max_hp.append(stats.max_hp)
+        self.defense.append(stats.defense)
+        self.status.append(0)
+        for column in self.modifiers.values():
+            column.append(1.0)
+        self.alive.append(1)
+        unit._setup(template, level, stats)  # Writes HP/status/modifiers into the row
+        return unit
+
+    def adopt(self, enemy: Enemy) -> "HordeEnemy":
+        """
+        Copy an ordinary enemy (HP, statuses, modifiers) into a new row.
+
+        Returns:
+            The HordeEnemy standing for it
+        """
+        stats = ScaledStats(enemy.max_hp, enemy.atk, enemy.defense, enemy.spd,
+                            enemy.xp_reward, enemy.money_reward)
+        unit = self.add(enemy.template, enemy.level, stats)
+        if enemy._wheel is not None:
+            unit._wheel = TimingWheel(enemy._wheel.now, owner=unit)
+        unit.restore_state(enemy.snapshot_state())
+        return unit
+
+    def copy(self) -> "Horde":
+        """Copy of the columns (units still point at this horde - see HordeBattle.clone())"""
+        other = Horde.__new__(Horde)
+        other.hp = array("i", self.hp)
+        other.max_hp = array("i", self.max_hp)
+        other.defense = array("i", self.defense)
+        other.status = array("Q", self.status)
+        other.modifiers = {stat: array("d", column) for stat, column in self.modifiers.items()}
+        other.alive = array("b", self.alive)
+        other.units = list(self.units)
+        return other
+
+    def set_alive(self, units: Sequence["HordeEnemy"]):
+        """Mark exactly these units as still in the battle"""
+        self.alive = array("b", bytes(len(self.units)))
+        for unit in units:
+            self.alive[unit.row] = 1
+
+    # Batch operations -------------------------------------------------------
+
+    def damage_all(self, damage: int):
+        """
+        Every live enemy takes a hit of `damage` after its DEF.
+
+        Same result as enemy.take_damage(damage) on each of them.
+        """
+        hp, defense, def_mod, alive = self.hp, self.defense, self.modifiers["def"], self.alive
+        if np is not None:
+            hp_view = np.frombuffer(hp, dtype=hp.typecode)
+            effective = np.frombuffer(defense, dtype=defense.typecode) * \
+                np.frombuffer(def_mod, dtype=def_mod.typecode)
+            dealt = np.maximum(1, (damage * (100 / (100 + effective))).astype(np.int64))
+            live = np.frombuffer(alive, dtype=alive.typecode) != 0
+            hp_view[live] = np.maximum(0, hp_view[live] - dealt[live])
+            return
+        for row in range(len(hp)):
+            if alive[row]:
+                dealt = apply_defense(damage, defense[row] * def_mod[row])
+                hp[row] = max(0, hp[row] - dealt)
+
+    def status_damage(self) -> List[Tuple[int, int, StatusHandler]]:
+        """
+        End-of-turn damage from poison, burn, ... on every live enemy.
+
+        Invincible enemies take none. Same numbers as
+        Battle._apply_status_damage() on each enemy.
+
+        Returns:
+            [(row, damage, handler), ...] for the log, handler by handler
+        """
+        hits: List[Tuple[int, int, StatusHandler]] = []
+        hp, max_hp, status, alive = self.hp, self.max_hp, self.status, self.alive
+        if np is not None:
+            masks = np.frombuffer(status, dtype=status.typecode)
+            live = np.frombuffer(alive, dtype=alive.typecode) != 0
+            live &= (masks & np.uint64(INVINCIBLE)) == 0
+            if not (masks[live] & np.uint64(DAMAGE_MASK)).any():
+                return hits
+            hp_view = np.frombuffer(hp, dtype=hp.typecode)
+            max_view = np.frombuffer(max_hp, dtype=max_hp.typecode)
+            for handler in handlers_for(DAMAGE_MASK):
+                rows = np.flatnonzero(live & ((masks & np.uint64(handler.bit)) != 0))
+                if not rows.size:
+                    continue
+                dealt = np.maximum(1, (max_view[rows] * handler.damage_per_turn).astype(np.int64))
+                hp_view[rows] = np.maximum(0, hp_view[rows] - dealt)
+                hits.extend((row, amount, handler)
+                            for row, amount in zip(rows.tolist(), dealt.tolist()))
+            return hits
+        for handler in handlers_for(DAMAGE_MASK):
+            for row in range(len(hp)):
+                if alive[row] and status[row] & handler.bit and not status[row] & INVINCIBLE:
+                    dealt = max(1, int(max_hp[row] * handler.damage_per_turn))
+                    hp[row] = max(0, hp[row] - dealt)
+                    hits.append((row, dealt, handler))
+        return hits
+
+    def defeated_rows(self) -> List[int]:
+        """Rows still marked alive with 0 HP"""
+        hp, alive = self.hp, self.alive
+        if np is not None:
+            hp_view = np.frombuffer(hp, dtype=hp.typecode)
+            live = np.frombuffer(alive, dtype=alive.typecode) != 0
+            return np.flatnonzero(live & (hp_view <= 0)).tolist()
+        return [row for row in range(len(hp)) if alive[row] and hp[row] <= 0]
+
+
+# ============================================================================
+# ENEMIES BACKED BY A ROW
+# ============================================================================
+
+class HordeModifierStack(ModifierStack):
+    """ModifierStack that also writes atk/def/spd into its enemy's row"""
+
+    __slots__ = ("_unit",)
+
+    def _store(self, stat: str, value: float):
+        dict.__setitem__(self, stat, value)
+        unit = self._unit
+        column = unit.horde.modifiers.get(stat)
+        if column is not None:
+            column[unit.row] = value
+
+    def copy(self) -> "HordeModifierStack":
+        other = super().copy()
+        other._unit = self._unit
+        return other
+
+    def __reduce__(self):
+        cls, args, state = super().__reduce__()
+        return cls, args, state + (self._unit,)
+
+    def __setstate__(self, state):
+        super().__setstate__(state[:-1])
+        self._unit = state[-1]
+
+
+class HordeEnemy(Enemy):
+    """
+    Enemy whose HP, status bits and stat multipliers are its row in a Horde.
+
+    Attributes:
+        horde: The Horde holding its columns
+        row: Its row in them
+    """
+
+    @property
+    def current_hp(self) -> int:
+        return self.horde.hp[self.row]
+
+    @current_hp.setter
+    def current_hp(self, value: int):
+        self.horde.hp[self.row] = value
+
+    @property
+    def status_mask(self) -> int:
+        return self.horde.status[self.row]
+
+    @status_mask.setter
+    def status_mask(self, mask: int):
+        self.horde.status[self.row] = mask
+
+    @property
+    def stat_modifiers(self) -> HordeModifierStack:
+        """Stat multipliers (see modifiers.py) - also kept in the horde's columns"""
+        return self._modifiers
+
+    @stat_modifiers.setter
+    def stat_modifiers(self, stack: ModifierStack):
+        if not isinstance(stack, HordeModifierStack):
+            bound = HordeModifierStack.__new__(HordeModifierStack)
+            bound._copy_from(stack)
+            stack = bound
+        stack._unit = self
+        self._modifiers = stack
+        for stat, column in self.horde.modifiers.items():
+            column[self.row] = stack.get(stat, 1.0)
+
+    def clone(self) -> "HordeEnemy":
+        """Independent copy, in a one-row horde of its own"""
+        return Horde().adopt(self)
+
+
+# ============================================================================
+# BATTLE
+# ============================================================================
+
+class HordeBattle(Battle):
+    """
+    Battle against a Horde: area attacks, status damage and defeats run
+    on the horde's columns (see the module docstring).
+
+    Example:
+        horde = Horde().spawn("wild_bandit", 200, level=5)
+        battle = HordeBattle(player, horde, rng=PythonRNG(seed=1))
+        battle.execute_turn(BattleAction.MIRACLE)   # Divine Judgment hits all 200
+    """
+
+    def __init__(self, player: Any, horde: Union[Horde, Sequence[Enemy]], **kwargs: Any):
+        """
+        Args:
+            player: The player instance
+            horde: A Horde, or ordinary enemies (copied into a new Horde)
+            **kwargs: As for Battle (except record_replay)
+        """
+        if kwargs.get("record_replay"):
+            raise ValueError("Horde battles can't be recorded (replays respawn plain enemies)")
+        if not isinstance(horde, Horde):
+            enemies, horde = horde, Horde()
+            for enemy in enemies:
+                horde.adopt(enemy)
+        self.horde = horde
+        super().__init__(player, [unit for unit in horde.units if horde.alive[unit.row]],
+                         **kwargs)
+
+    def _damage_all_enemies(self, damage: int):
+        self.horde.damage_all(damage)
+        self._sweep_defeated()
+
+    def _apply_enemy_status_damage(self):
+        hits = self.horde.status_damage()
+        if not hits:
+            return
+        self._enemies_stale = True
+        units = self.horde.units
+        for row, damage, handler in hits:
+            self.log.record(LogEvent.STATUS_DAMAGE, units[row].name, amount=damage,
+                            detail=handler.label)
+        self._sweep_defeated()
+
+    def _enemies_state_key(self) -> Any:
+        # The columns as bytes: one compare for the whole horde
+        horde = self.horde
+        return (tuple(map(id, self.enemies)), horde.hp.tobytes(), horde.status.tobytes(),
+                *(column.tobytes() for column in horde.modifiers.values()))
+
+    def _handle_enemy_defeat(self):
+        self._sweep_defeated()
+
+    def _sweep_defeated(self):
+        """Reward and remove every enemy at 0 HP at once, then pick the next one"""
+        horde = self.horde
+        rows = horde.defeated_rows()
+        if not rows:
+            return
+        for row in rows:
+            horde.alive[row] = 0
+            self._award_enemy_rewards(horde.units[row])
+        alive = horde.alive
+        self.enemies = [enemy for enemy in self.enemies if alive[enemy.row]]
+        if not self.enemies or self.active_enemy is None or not alive[self.active_enemy.row]:
+            self._next_enemy_or_victory()
+
+    def restore(self, snapshot: Any):
+        super().restore(snapshot)
+        self.horde.set_alive(self.enemies)
+
+    def clone(self, rng: Any = None, log: Any = None) -> "HordeBattle":
+        other = super().clone(rng, log)
+        # super() cloned each enemy into a horde of its own - put them
+        # back into one copy of the columns, in their old rows
+        other.horde = horde = self.horde.copy()
+        twins = dict(zip(map(id, self.enemies), other.enemies))
+        for enemy in self.enemies:
+            twin = twins[id(enemy)]
+            twin.horde, twin.row = horde, enemy.row
+            horde.units[enemy.row] = twin
+        return other
@@ -0,0 +1,216 @@
+"""
+Stat modifiers - cached multipliers over a stack of timed buffs/debuffs
+
+A fish or enemy's stat_modifiers used to be a dict that buffs multiplied
+into and expiring buffs divided back out of. Every tick rebuilt every
+timed list, and "× 1.3 ... ÷ 1.3" doesn't always land back on the same
+float, so long fights slowly drifted.
+
+ModifierStack keeps the pieces instead:
+
+    base          Permanent multipliers per stat (never divided)
+    timed         Each stat's timed multipliers, in the order applied
+                  ({order: multiplier})
+    heap          The same timed entries, in a min-heap by expiry turn
+
+and the multiplier per stat as its own dict value, recomputed from
+base × timed only when that stat's stack changes. Reads
+(stack["atk"], get_effective_stat()) are plain dict lookups; a tick
+pops only the entries that expire (nothing to do on most turns).
+
+    stack = ModifierStack({"atk": 1.0, "def": 1.0})
+    stack.apply("atk", 1.5, turns=2)     # stack["atk"] == 1.5
+    stack.tick(); stack.tick()           # stack["atk"] == 1.0 exactly
+
+Setting a value directly (stack["def"] = 1.5) makes it the stat's new
+permanent multiplier and drops that stat's timed entries.
+
+Expiry turns are absolute, on a TimingWheel (see timing_wheel.py): the
+stack asks the wheel to wake it on its earliest expiry turn, so a
+battle never visits a stack with nothing running out. A stack on its
+own gets a wheel of its own on its first timed modifier.
+"""
+
+import heapq
+from typing import Any, Dict, List, Optional, Tuple
+
+from .timing_wheel import TimingWheel
+
+# One timed modifier in the heap: (expiry turn, order applied, stat, multiplier)
+Entry = Tuple[int, int, str, float]
+
+
+class ModifierStack(dict):
+    """
+    {stat: current multiplier}, with the stack that produces it.
+
+    Only use apply() / tick() / reset() (or plain assignment) to change
+    it - other dict methods would skip the bookkeeping.
+    """
+
+    __slots__ = ("_base", "_timed", "_heap", "_wheel", "_order")
+
+    def __init__(self, neutral: Dict[str, float], wheel: Optional[TimingWheel] = None):
+        """
+        Args:
+            neutral: {stat: 1.0} for every stat this entity has
+            wheel: Wheel expiry turns count on (default: its own, made on
+                   the first timed modifier)
+        """
+        super().__init__(neutral)
+        self._base: Dict[str, float] = dict(neutral)
+        self._timed: Dict[str, Dict[int, float]] = {}
+        self._heap: List[Entry] = []
+        self._wheel = wheel
+        self._order = 0     # Application counter (keeps products in apply order)
+
+    # Changing the stack -----------------------------------------------------
+
+    def apply(self, stat: str, multiplier: float, turns: Optional[int] = None):
+        """
+        Multiply a stat, permanently or for `turns` turns.
+
+        Args:
+            stat: Stat to modify (must already be in the stack)
+            multiplier: e.g. 1.2 for +20%
+            turns: Turns it lasts (None or 0 = until reset)
+        """
+        if turns and turns > 0:
+            wheel = self._wheel
+            if wheel is None:
+                wheel = self._wheel = TimingWheel(owner=self)
+            order = self._order = self._order + 1
+            expiry = wheel.now + turns
+            heap = self._heap
+            heapq.heappush(heap, (expiry, order, stat, multiplier))
+            if heap[0][1] == order:
+                wheel.schedule(expiry, self)  # New earliest expiry
+            timed = self._timed.get(stat)
+            if timed is None:
+                timed = self._timed[stat] = {}
+            timed[order] = multiplier
+            self._store(stat, self[stat] * multiplier)
+        else:
+            self._base[stat] *= multiplier
+            self._recompute(stat)
+
+    def tick(self):
+        """
+        One turn passes for this stack alone: drop the modifiers that run out.
+
+        A stack on a fish, enemy or battle wheel moves to a wheel of its
+        own first (a unit's stack expires when its wheel advances).
+        """
+        if not self._heap:
+            return
+        wheel = self._wheel
+        if wheel.owner is not self:
+            wheel = TimingWheel(wheel.now, owner=self)
+            self.attach(wheel)
+        wheel.advance()
+
+    def expire_due(self, wheel: TimingWheel):
+        """Wheel callback: drop the modifiers that end by wheel.now"""
+        if wheel is not self._wheel:
+            return  # Left over from a wheel this stack has moved off
+        heap = self._heap
+        now = wheel.now
+        changed = []
+        while heap and heap[0][0] <= now:
+            _, order, stat, _ = heapq.heappop(heap)
+            del self._timed[stat][order]
+            if stat not in changed:
+                changed.append(stat)
+        for stat in changed:
+            self._recompute(stat)
+        if heap:
+            wheel.schedule(heap[0][0], self)
+
+    def attach(self, wheel: TimingWheel):
+        """
+        Count expiry turns on another wheel (turns left don't change).
+
+        Args:
+            wheel: The new wheel (e.g. the battle's)
+        """
+        old = self._wheel
+        shift = wheel.now - (old.now if old is not None else 0)
+        if shift and self._heap:
+            # Same shift for every entry - still a valid heap
+            self._heap = [(expiry + shift, order, stat, multiplier)
+                          for expiry, order, stat, multiplier in self._heap]
+        self._wheel = wheel
+        if self._heap:
+            wheel.schedule(self._heap[0][0], self)
+
+    def reset(self):
+        """Every stat back to 1.0, nothing timed"""
+        for stat in self:
+            self._base[stat] = 1.0
+            self._store(stat, 1.0)
+        self._timed.clear()
+        self._heap.clear()
+
+    def __setitem__(self, stat: str, value: float):
+        # A direct value becomes the permanent multiplier
+        self._base[stat] = value
+        if self._timed.pop(stat, None):
+            self._heap = [entry for entry in self._heap if entry[2] != stat]
+            heapq.heapify(self._heap)
+        self._store(stat, value)
+
+    def _recompute(self, stat: str):
+        """Multiplier from scratch: base × timed entries, in the order applied"""
+        value = self._base[stat]
+        timed = self._timed.get(stat)
+        if timed:
+            for multiplier in timed.values():
+                value *= multiplier
+        self._store(stat, value)
+
+    # Every change to a multiplier goes through here (subclasses can
+    # mirror the values somewhere else - see horde.py)
+    _store = dict.__setitem__
+
+    # Reading and copying ----------------------------------------------------
+
+    @property
+    def timed_entries(self) -> Dict[str, List[Dict[str, Any]]]:
+        """{stat: [{"multiplier": m, "turns": turns left}, ...]} (a copy, for display)"""
+        entries: Dict[str, List[Dict[str, Any]]] = {stat: [] for stat in self}
+        now = self._wheel.now if self._wheel is not None else 0
+        for expiry, _, stat, multiplier in sorted(self._heap, key=lambda entry: entry[1]):
+            entries[stat].append({"multiplier": multiplier, "turns": expiry - now})
+        return entries
+
+    def copy(self) -> "ModifierStack":
+        """
+        Independent copy (heap entries are immutable tuples - shallow copies are enough).
+
+        The copy counts on the same wheel but isn't scheduled on it -
+        attach() it to have its modifiers expire.
+        """
+        other = type(self).__new__(type(self))
+        other._copy_from(self)
+        return other
+
+    def _copy_from(self, source: "ModifierStack"):
+        """Take over an independent copy of another stack's state"""
+        dict.update(self, source)
+        self._base = dict(source._base)
+        self._timed = {stat: dict(timed) for stat, timed in source._timed.items() if timed}
+        self._heap = list(source._heap)
+        self._wheel = source._wheel
+        self._order = source._order
+
+    # Values go in the constructor and the rest in the state, so the
+    # wheel (which refers back to this stack) is pickled after it exists
+    def __reduce__(self):
+        return (type(self), (dict(self),),
+                (self._base, self._timed, self._heap, self._wheel, self._order))
+
+    def __setstate__(self, state):
+        self._base, self._timed, self._heap, self._wheel, self._order = state
+
+    def __repr__(self) -> str:
+        return f"ModifierStack({dict.__repr__(self)}, timed={len(self._heap)})"
@@ -0,0 +1,136 @@
+"""
+Moves - fish moves and enemy attacks, compiled once from their JSON
+
+fish.json moves and enemies.json/bosses.json attacks are plain dicts:
+
+    {"name": "Splash", "type": "Water", "category": "Physical",
+     "power": [5, 8], "accuracy": 100, "level": 1, ...}
+
+Reading them in the battle loop means a dict lookup (with a default)
+for every field on every attack, and an isinstance() check to tell a
+power range from a fixed power. FishSpecies and EnemyTemplate compile
+each one ONCE into a Move instead: a small slotted, read-only object
+with everything parsed -
+
+    move.power_min, move.power_max   Power range (fixed power: both equal)
+    move.rolls_power                 Power is rolled (the data gave a range)
+    move.accuracy, move.priority     Ints, defaults filled in
+    move.type, move.type_id          Type name and its integer id (elements.py)
+    move.effect                      MoveEffect or None (effect + value/chance/duration)
+
+so battle code uses plain attribute access.
+
+A Move is also a read-only Mapping over its JSON record, so older code
+(and the UI) that does move["name"] or move.get("special") keeps
+working, and dict(move) gives the record back (e.g. for saves).
+
+Functions that take a move from outside (Battle.calculate_damage(),
+damage_distribution(), ...) accept a plain dict too - as_move()
+compiles it on the spot.
+"""
+
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, NamedTuple, Optional
+
+from .elements import type_id
+
+
+class MoveEffect(NamedTuple):
+    """
+    A move's secondary effect, parsed from its record.
+
+    Example: {"effect": "def_down", "effect_value": 0.2, "effect_chance": 0.3}
+             → MoveEffect("def_down", 0.2, 0.3, None)
+    """
+    name: str                       # "def_down", "stun", "heal_self", ...
+    value: Optional[float] = None   # effect_value (strength)
+    chance: float = 1.0             # effect_chance (1.0 = always)
+    duration: Optional[int] = None  # Turns (None = the effect's default)
+
+
+class Move(Mapping):
+    """
+    One compiled fish move or enemy attack (immutable).
+
+    Example:
+        move = Move({"name": "Splash", "type": "Water", "power": [5, 8], "accuracy": 100})
+        move.power_min, move.power_max   # 5, 8
+        move["name"]                     # "Splash" (Mapping access to the record)
+    """
+
+    __slots__ = ("name", "type", "type_id", "category", "is_physical", "level",
+                 "power_min", "power_max", "rolls_power", "accuracy", "priority",
+                 "effect", "special", "source")
+
+    def __init__(self, data: Dict[str, Any]):
+        """
+        Compile a move record.
+
+        Args:
+            data: The move/attack dict from JSON (kept as move.source -
+                  don't modify it afterwards)
+        """
+        power = data.get("power", [0, 0])
+        if isinstance(power, list):
+            power_min, power_max, rolls_power = power[0], power[1], True
+        else:
+            power_min = power_max = power
+            rolls_power = False
+
+        effect = None
+        if data.get("effect"):
+            effect = MoveEffect(data["effect"], data.get("effect_value"),
+                                data.get("effect_chance", 1.0), data.get("duration"))
+
+        move_type = data.get("type", "Normal")
+        category = data.get("category", "")
+        fields = {
+            "name": data.get("name", ""),
+            "type": move_type,
+            "type_id": type_id(move_type),
+            "category": category,
+            "is_physical": category == "Physical",
+            "level": data.get("level", 1),
+            "power_min": power_min,
+            "power_max": power_max,
+            "rolls_power": rolls_power,
+            "accuracy": data.get("accuracy", 100),
+            "priority": data.get("priority", 0),
+            "effect": effect,
+            "special": data.get("special"),
+            "source": data,
+        }
+        for slot, value in fields.items():
+            object.__setattr__(self, slot, value)
+
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError(f"Move is read-only (tried to set {name!r})")
+
+    def __delattr__(self, name: str):
+        raise AttributeError(f"Move is read-only (tried to delete {name!r})")
+
+    def __reduce__(self):
+        return (Move, (self.source,))
+
+    # Read-only Mapping over the JSON record ------------------------------
+
+    def __getitem__(self, key: str) -> Any:
+        return self.source[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.source)
+
+    def __len__(self) -> int:
+        return len(self.source)
+
+    # Mapping's __eq__ compares records; equal records → equal names
+    def __hash__(self) -> int:
+        return hash(self.name)
+
+    def __repr__(self) -> str:
+        return f"Move({self.name!r}, {self.type}, {self.power_min}-{self.power_max})"
+
+
+def as_move(move: Any) -> Move:
+    """The move itself if it's compiled, else a Move compiled from the dict"""
+    return move if isinstance(move, Move) else Move(move)
@@ -2,8 +2,10 @@
 Player class - represents Jesus and his party management
 """
 
+import copy
 from typing import List, Dict, Optional, Any
 from .fish import Fish
+from .stat_tables import PLAYER_GROWTH_RATE, PLAYER_STAT_TABLE, scale_stat
 
 
 class Player:
@@ -20,8 +22,8 @@ class Player:
         self.xp_to_next_level = 100
 
         # Base stats
-        self.base_hp = 50
-        self.max_hp = self._calculate_stat(self.base_hp, self.level)
+        self.base_hp = PLAYER_STAT_TABLE.base[0]
+        self.max_hp = self._max_hp_at(self.level)
         self.current_hp = self.max_hp
 
         # Fish party (4 active, unlimited storage)
@@ -58,8 +60,13 @@ class Player:
 
     def _calculate_stat(self, base_stat: int, level: int) -> int:
         """Calculate stat based on level"""
-        growth_rate = 0.05  # Jesus grows slower than fish
-        return int(base_stat * (1 + growth_rate * (level - 1)))
+        return scale_stat(base_stat, level, PLAYER_GROWTH_RATE)  # Jesus grows slower than fish
+
+    def _max_hp_at(self, level: int) -> int:
+        """Max HP at a level (table lookup; formula if base_hp was changed)"""
+        if self.base_hp == PLAYER_STAT_TABLE.base[0]:
+            return PLAYER_STAT_TABLE.stat(level, 0)
+        return self._calculate_stat(self.base_hp, level)
 
     def add_fish_to_party(self, fish: Fish) -> bool:
         """
@@ -211,7 +218,7 @@ class Player:
 
         # Recalculate stats
         old_max_hp = self.max_hp
-        self.max_hp = self._calculate_stat(self.base_hp, self.level)
+        self.max_hp = self._max_hp_at(self.level)
         self.current_hp += (self.max_hp - old_max_hp)
 
         return True
@@ -255,6 +262,38 @@ class Player:
             fish.current_hp = fish.max_hp
             fish.clear_status_effects()
 
+    def snapshot_state(self) -> tuple:
+        """
+        What a battle can change on the player, as a tuple (see Battle.snapshot()).
+
+        Party fish are snapshotted separately; this keeps the party order.
+        """
+        return (self.level, self.xp, self.max_hp, self.current_hp, self.money,
+                self.miracle_meter, dict(self.bread_items), self.battles_won,
+                self.battles_lost, self.total_damage_dealt, tuple(self.active_party))
+
+    def restore_state(self, state: tuple):
+        """Put back a snapshot_state()"""
+        (self.level, self.xp, self.max_hp, self.current_hp, self.money, self.miracle_meter,
+         bread_items, self.battles_won, self.battles_lost, self.total_damage_dealt,
+         party) = state
+        self.bread_items = dict(bread_items)
+        self.active_party = list(party)
+
+    def clone(self) -> "Player":
+        """
+        Copy for battle what-ifs: party fish and battle state are copied,
+        everything else (storage, quests, towns, ...) is shared.
+        """
+        other = copy.copy(self)
+        other.bread_items = dict(self.bread_items)
+        other.active_party = []
+        for fish in self.active_party:
+            twin = fish.clone()
+            twin.owner = other
+            other.active_party.append(twin)
+        return other
+
     def __str__(self) -> str:
         """String representation"""
         return f"{self.name} (Lv.{self.level}) - {self.current_hp}/{self.max_hp} HP"
@@ -288,6 +327,7 @@ class Player:
         """Create player from saved dictionary"""
         player = cls(data["name"])
         player.level = data["level"]
+        player.max_hp = player._max_hp_at(player.level)  # Stats follow the saved level
         player.xp = data["xp"]
         player.current_hp = data["current_hp"]
 
@@ -301,6 +341,8 @@ class Player:
             Fish.from_dict(f_data, fish_data_loader.get_fish_by_id(f_data["fish_id"]))
             for f_data in data["fish_storage"]
         ]
+        for fish in player.active_party + player.fish_storage:
+            fish.owner = player
 
         player.recruited_apostles = data["recruited_apostles"]
         player.bread_items = data["bread_items"]
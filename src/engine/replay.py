@@ -0,0 +1,439 @@
+"""
+Battle replays - record a battle, play it back, seek, and verify it
+
+A battle is completely determined by its starting state, its RNG seed
+and the actions the player chose each turn. A replay stores just that:
+
+    battle = Battle(player, [boss], is_boss=True, record_replay=True)
+    ... play ...
+    data = battle.get_replay().to_bytes()      # A few hundred bytes
+
+    replay = Replay.from_bytes(data)
+    playback = ReplayPlayer(replay)
+    playback.seek(12)                          # State after turn 12
+    playback.battle.get_battle_state()
+    assert playback.verify()                   # Same ending as recorded
+
+FILE FORMAT (little-endian):
+    b"LFRP"  version:u8  seed:u64  turns:u32  digest:16 bytes
+    header_len:u32  header: zlib-compressed JSON
+                    (starting state, is_boss, string table)
+    turns × 2 bytes: action code:u8, argument:u8
+        argument = move/fish index, a string table index (action code
+        has ARG_STRING set), or ARG_NONE
+
+The digest is a hash of the final state (HP, levels, XP, money, result,
+turn and RNG state), so verify() catches any divergence.
+
+SEEKING:
+ReplayPlayer saves a keyframe (an in-memory copy of the whole battle)
+every keyframe_interval turns as it plays. seek() jumps back to the
+nearest keyframe instead of re-simulating from turn 0. Keyframes are
+not stored in the file (they're rebuilt on playback), so the file stays
+small enough to keep thousands of replays around.
+
+The file is plain data (JSON + bytes), never pickle, so replays sent in
+by players are safe to load.
+"""
+
+import io
+import os
+import json
+import zlib
+import pickle
+import struct
+import hashlib
+from typing import Any, Dict, List, Optional, Tuple
+
+# Import data loader - handle both direct and relative imports
+try:
+    from utils.data_loader import DataLoader, get_data_loader
+except ImportError:
+    from ..utils.data_loader import DataLoader, get_data_loader
+
+from .fish import FishSpecies
+from .player import Player
+from .enemy import Boss, EnemyTemplate, create_enemy, create_boss
+from .moves import Move
+from .stat_tables import StatTable
+from .rng import PythonRNG
+from .battle import Battle, BattleAction, BattleResult
+from .enemy_ai import make_reproducible
+
+REPLAY_MAGIC = b"LFRP"
+REPLAY_VERSION = 1
+
+_HEADER = struct.Struct("<4sBQI16sI")
+_ACTIONS = list(BattleAction)
+
+# Action byte: low bits = BattleAction index, ARG_STRING = argument is a string
+ARG_STRING = 0x80
+ARG_NONE = 0xFF
+
+
+class ReplayError(ValueError):
+    """Raised for replay data that can't be read or played"""
+
+
+# ============================================================================
+# STATE
+# ============================================================================
+
+def _combatant_extras(unit: Any) -> Dict[str, Any]:
+    """Battle state to_dict() doesn't save (modifiers, status timers)"""
+    extras = {"status_effects": list(unit.status_effects),
+              "status_durations": dict(unit.status_durations)}
+    modifiers = unit.stat_modifiers
+    if any(value != 1.0 for value in modifiers.values()):
+        extras["stat_modifiers"] = dict(modifiers)
+    return extras
+
+
+# Keys every capture_start() dictionary has
+START_KEYS = ("player", "party_extras", "enemies", "is_boss")
+
+
+def capture_start(player: Player, enemies: List[Any], is_boss: bool) -> Dict[str, Any]:
+    """
+    The starting state of a battle as plain JSON data.
+
+    Args:
+        player: Player (party, items, money, miracle meter, ...)
+        enemies: Enemies at the start of the battle
+        is_boss: Boss battle flag
+
+    Returns:
+        JSON-compatible dictionary
+    """
+    return {
+        "player": player.to_dict(),
+        "party_extras": [_combatant_extras(fish) for fish in player.active_party],
+        "enemies": [{"id": enemy.enemy_id, "level": enemy.level,
+                     "boss": isinstance(enemy, Boss), "current_hp": enemy.current_hp,
+                     **_combatant_extras(enemy)} for enemy in enemies],
+        "is_boss": is_boss,
+    }
+
+
+def _apply_extras(unit: Any, extras: Dict[str, Any]):
+    unit.status_effects = list(extras.get("status_effects", []))
+    unit.status_durations = dict(extras.get("status_durations", {}))
+    for stat, value in extras.get("stat_modifiers", {}).items():
+        unit.stat_modifiers[stat] = value
+
+
+def restore_start(state: Dict[str, Any],
+                  data_loader: Optional[DataLoader] = None) -> Tuple[Player, List[Any]]:
+    """
+    Rebuild the player and enemies from capture_start() data.
+
+    Raises:
+        ReplayError: If a fish or enemy no longer exists in the data files,
+                     or the data isn't shaped like capture_start() output
+    """
+    try:
+        return _restore_start(state, data_loader or get_data_loader())
+    except ReplayError:
+        raise
+    except (AttributeError, KeyError, IndexError, TypeError, ValueError) as e:
+        raise ReplayError(f"Corrupt replay start state: {e!r}") from e
+
+
+def _restore_start(state: Dict[str, Any], loader: DataLoader) -> Tuple[Player, List[Any]]:
+    for fish_data in state["player"]["active_party"] + state["player"]["fish_storage"]:
+        if loader.get_fish_by_id(fish_data["fish_id"]) is None:
+            raise ReplayError(f"Unknown fish in replay: {fish_data['fish_id']}")
+    player = Player.from_dict(state["player"], loader)
+    for fish, extras in zip(player.active_party, state["party_extras"]):
+        _apply_extras(fish, extras)
+
+    enemies = []
+    for data in state["enemies"]:
+        create = create_boss if data["boss"] else create_enemy
+        enemy = create(data["id"], data["level"])
+        if enemy is None:
+            raise ReplayError(f"Unknown enemy in replay: {data['id']}")
+        enemy.current_hp = data["current_hp"]
+        _apply_extras(enemy, data)
+        enemies.append(enemy)
+    return player, enemies
+
+
+def state_digest(battle: Battle, enemies: List[Any]) -> bytes:
+    """
+    16-byte fingerprint of a battle's state.
+
+    Args:
+        battle: The battle
+        enemies: ALL the battle's enemies (battle.enemies drops defeated ones)
+    """
+    player = battle.player
+    summary = [
+        battle.result.value, battle.turn_count,
+        [(f.fish_id, f.level, f.xp, f.current_hp, sorted(f.status_effects))
+         for f in player.active_party],
+        [(e.enemy_id, e.current_hp, sorted(e.status_effects)) for e in enemies],
+        player.money, round(player.miracle_meter, 6),
+        repr(battle.rng.source.getstate()) if hasattr(battle.rng, "source") else "",
+    ]
+    return hashlib.blake2b(json.dumps(summary).encode(), digest_size=16).digest()
+
+
+# ============================================================================
+# REPLAY DATA
+# ============================================================================
+
+class Replay:
+    """
+    A recorded battle: starting state, seed and one action per turn.
+
+    Attributes:
+        seed: RNG seed the battle used
+        start: Starting state (see capture_start())
+        actions: [(BattleAction, data), ...] in turn order
+        final_digest: state_digest() when the replay was taken (or None)
+    """
+
+    def __init__(self, seed: int, start: Dict[str, Any],
+                 actions: Optional[List[Tuple[BattleAction, Any]]] = None,
+                 final_digest: Optional[bytes] = None):
+        self.seed = seed
+        self.start = start
+        self.actions = actions if actions is not None else []
+        self.final_digest = final_digest
+
+    @property
+    def turns(self) -> int:
+        """Number of recorded turns"""
+        return len(self.actions)
+
+    def record(self, action: BattleAction, data: Any):
+        """Append one turn's player action"""
+        if not (data is None or isinstance(data, str)
+                or (isinstance(data, int) and 0 <= data < ARG_NONE)):
+            raise ReplayError(f"Can't record action data {data!r}")
+        self.actions.append((action, data))
+
+    def to_bytes(self) -> bytes:
+        """Encode in the compact binary format (see module docstring)"""
+        strings: List[str] = []
+        string_index: Dict[str, int] = {}
+        body = bytearray()
+        for action, data in self.actions:
+            code = _ACTIONS.index(action)
+            if isinstance(data, str):
+                if data not in string_index:
+                    if len(strings) >= ARG_NONE:
+                        raise ReplayError("Too many distinct action strings")
+                    string_index[data] = len(strings)
+                    strings.append(data)
+                body += bytes((code | ARG_STRING, string_index[data]))
+            else:
+                body += bytes((code, ARG_NONE if data is None else data))
+
+        header = zlib.compress(json.dumps({"start": self.start, "strings": strings},
+                                          separators=(",", ":")).encode(), 9)
+        return _HEADER.pack(REPLAY_MAGIC, REPLAY_VERSION, self.seed, self.turns,
+                            self.final_digest or bytes(16), len(header)) + header + bytes(body)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Replay":
+        """
+        Decode a replay.
+
+        Raises:
+            ReplayError: If the data isn't a valid replay
+        """
+        if len(data) < _HEADER.size:
+            raise ReplayError("Replay data is truncated")
+        magic, version, seed, turns, digest, header_len = _HEADER.unpack_from(data)
+        if magic != REPLAY_MAGIC:
+            raise ReplayError("Not a replay file")
+        if version != REPLAY_VERSION:
+            raise ReplayError(f"Unsupported replay version {version}")
+        offset = _HEADER.size
+        body = data[offset + header_len:]
+        if len(body) != turns * 2:
+            raise ReplayError("Replay data is truncated")
+        try:
+            header = json.loads(zlib.decompress(data[offset:offset + header_len]))
+        except (zlib.error, ValueError) as e:
+            raise ReplayError(f"Corrupt replay header: {e}") from e
+
+        if (not isinstance(header, dict) or not isinstance(header.get("start"), dict)
+                or not isinstance(header.get("strings"), list)):
+            raise ReplayError("Corrupt replay header: missing start state or string table")
+        missing = [key for key in START_KEYS if key not in header["start"]]
+        if missing:
+            raise ReplayError(f"Corrupt replay header: start state lacks {', '.join(missing)}")
+
+        strings = header["strings"]
+        actions = []
+        try:
+            for i in range(0, len(body), 2):
+                code, arg = body[i], body[i + 1]
+                index = code & ~ARG_STRING
+                if index >= len(_ACTIONS):
+                    raise ReplayError(f"Unknown action code {code} at turn {i // 2 + 1}")
+                action = _ACTIONS[index]
+                if code & ARG_STRING:
+                    if arg >= len(strings):
+                        raise ReplayError(f"Bad string index {arg} at turn {i // 2 + 1}")
+                    actions.append((action, strings[arg]))
+                else:
+                    actions.append((action, None if arg == ARG_NONE else arg))
+        except (IndexError, KeyError, TypeError) as e:
+            raise ReplayError(f"Corrupt replay actions: {e}") from e
+        return cls(seed, header["start"], actions, digest if any(digest) else None)
+
+    def save(self, path: str):
+        """Write the replay to a file"""
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path: str) -> "Replay":
+        """Read a replay file"""
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
+
+
+def new_replay_seed() -> int:
+    """A fresh random 64-bit seed for a recorded battle"""
+    return int.from_bytes(os.urandom(8), "little")
+
+
+# ============================================================================
+# PLAYBACK
+# ============================================================================
+
+class _KeyframePickler(pickle.Pickler):
+    """Pickles a battle, keeping shared read-only objects by reference"""
+
+    SHARED_TYPES = (DataLoader, FishSpecies, EnemyTemplate, StatTable, Move)
+
+    def __init__(self, file, shared: List[Any]):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.shared = shared
+        self.shared_ids: Dict[int, int] = {id(obj): i for i, obj in enumerate(shared)}
+
+    def persistent_id(self, obj: Any) -> Optional[int]:
+        if isinstance(obj, self.SHARED_TYPES) or isinstance(obj, Replay):
+            key = id(obj)
+            if key not in self.shared_ids:
+                self.shared_ids[key] = len(self.shared)
+                self.shared.append(obj)
+            return self.shared_ids[key]
+        return None
+
+
+class _KeyframeUnpickler(pickle.Unpickler):
+    def __init__(self, file, shared: List[Any]):
+        super().__init__(file)
+        self.shared = shared
+
+    def persistent_load(self, pid: int) -> Any:
+        return self.shared[pid]
+
+
+class ReplayPlayer:
+    """
+    Re-simulates a Replay turn by turn, with keyframes for fast seeking.
+
+    Attributes:
+        replay: The replay being played
+        battle: The re-simulated battle at the current turn
+        turn: Turns played so far (0 = start of battle)
+    """
+
+    def __init__(self, replay: Replay, data_loader: Optional[DataLoader] = None,
+                 keyframe_interval: int = 10):
+        """
+        Args:
+            replay: Replay to play
+            data_loader: Data to rebuild fish/enemies from (default: shared loader)
+            keyframe_interval: Save a keyframe every N turns
+        """
+        self.replay = replay
+        self.data_loader = data_loader or get_data_loader()
+        self.keyframe_interval = max(1, keyframe_interval)
+        self._shared: List[Any] = []
+        self._keyframes: Dict[int, bytes] = {}
+        self._restart()
+
+    def _restart(self):
+        player, enemies = restore_start(self.replay.start, self.data_loader)
+        make_reproducible(enemies)  # Same planners as when it was recorded
+        self.enemies = enemies
+        self.battle = Battle(player, list(enemies), is_boss=self.replay.start["is_boss"],
+                             data_loader=self.data_loader,
+                             rng=PythonRNG(seed=self.replay.seed))
+        self.turn = 0
+        self._save_keyframe()
+
+    def _save_keyframe(self):
+        buffer = io.BytesIO()
+        _KeyframePickler(buffer, self._shared).dump((self.battle, self.enemies))
+        self._keyframes[self.turn] = buffer.getvalue()
+
+    def _load_keyframe(self, turn: int):
+        buffer = io.BytesIO(self._keyframes[turn])
+        self.battle, self.enemies = _KeyframeUnpickler(buffer, self._shared).load()
+        self.turn = turn
+
+    def step(self) -> BattleResult:
+        """
+        Play the next recorded turn.
+
+        Raises:
+            ReplayError: If there are no turns left
+        """
+        if self.turn >= self.replay.turns:
+            raise ReplayError("End of replay")
+        action, data = self.replay.actions[self.turn]
+        result = self.battle.execute_turn(action, data)
+        self.turn += 1
+        if self.turn % self.keyframe_interval == 0 and self.turn not in self._keyframes:
+            self._save_keyframe()
+        return result
+
+    def seek(self, turn: int) -> Battle:
+        """
+        Jump to the state right after `turn` turns.
+
+        Going backwards (or far ahead) restores the nearest saved keyframe
+        first, then plays the remaining turns.
+
+        Args:
+            turn: 0..replay.turns
+
+        Returns:
+            The battle at that turn
+        """
+        if not 0 <= turn <= self.replay.turns:
+            raise ReplayError(f"Turn {turn} is outside the replay (0-{self.replay.turns})")
+        nearest = max(t for t in self._keyframes if t <= turn)
+        if turn < self.turn or nearest > self.turn:
+            self._load_keyframe(nearest)
+        while self.turn < turn:
+            self.step()
+        return self.battle
+
+    def run_to_end(self) -> Battle:
+        """Play every remaining turn"""
+        return self.seek(self.replay.turns)
+
+    def verify(self) -> bool:
+        """
+        Re-simulate the whole replay and compare the final state.
+
+        Returns:
+            True if the ending matches the recorded digest
+
+        Raises:
+            ReplayError: If the replay has no recorded digest
+        """
+        if self.replay.final_digest is None:
+            raise ReplayError("Replay has no final state to verify against")
+        self.run_to_end()
+        return state_digest(self.battle, self.enemies) == self.replay.final_digest
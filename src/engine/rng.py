@@ -0,0 +1,192 @@
+"""
+Random number streams - one injectable RNG interface for the whole engine
+
+Battles, enemy AI, fishing and random encounters all roll dice. Instead
+of calling the module-level random functions, they take an RNG object:
+
+    battle = Battle(player, enemies, rng=PythonRNG(seed=42))
+    game = FishingMinigame(80, rng=PythonRNG(seed=7))
+    state = GameState(player, rng=my_rng)
+
+so every session or simulation can have its own independent, seedable
+stream.
+
+TWO IMPLEMENTATIONS:
+- PythonRNG: wraps a random.Random (the default). Without arguments
+  get_default_rng() returns one that uses the random module's global
+  stream, so random.seed() keeps working exactly as before.
+- BufferedRNG: draws floats from a NumPy Generator in big blocks
+  (one call per 4096 numbers), for high-throughput simulations.
+  Needs NumPy.
+
+THE INTERFACE (all an engine object may call):
+    rng.random()            → float in [0, 1)
+    rng.randint(a, b)       → int in [a, b] (both ends included)
+    rng.uniform(a, b)       → float between a and b
+    rng.choice(sequence)    → one element
+    rng.randrange(n)        → int in [0, n)
+
+Streams can be saved and cloned (for battle snapshots):
+    state = rng.getstate() ... rng.setstate(state)
+    twin = rng.clone()      → independent copy at the same position
+"""
+
+import copy
+import random
+from typing import Any, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional (only BufferedRNG needs it)
+    np = None
+
+
+class RNG:
+    """
+    Base class of the engine's random number streams.
+
+    Subclasses must provide random(); the others are built on it
+    (PythonRNG swaps in random.Random's own, exact versions).
+    """
+
+    def random(self) -> float:
+        """Float in [0, 1)"""
+        raise NotImplementedError
+
+    def randint(self, a: int, b: int) -> int:
+        """Integer in [a, b], both ends included"""
+        return a + int(self.random() * (b - a + 1))
+
+    def uniform(self, a: float, b: float) -> float:
+        """Float between a and b"""
+        return a + (b - a) * self.random()
+
+    def choice(self, sequence: Sequence[Any]) -> Any:
+        """Random element of a non-empty sequence"""
+        if not sequence:
+            raise IndexError("Cannot choose from an empty sequence")
+        return sequence[int(self.random() * len(sequence))]
+
+    def randrange(self, n: int) -> int:
+        """Integer in [0, n)"""
+        return int(self.random() * n)
+
+    def getstate(self) -> Any:
+        """Position in the stream (for setstate())"""
+        return copy.deepcopy(self.__dict__)
+
+    def setstate(self, state: Any):
+        """Go back to a getstate() position"""
+        self.__dict__.update(copy.deepcopy(state))
+
+    def clone(self) -> "RNG":
+        """Independent stream that continues exactly like this one"""
+        return copy.deepcopy(self)
+
+
+class PythonRNG(RNG):
+    """
+    RNG backed by Python's random module.
+
+    Example:
+        rng = PythonRNG(seed=42)          # Own stream
+        rng = PythonRNG(random.Random())  # Wrap an existing Random
+        rng = PythonRNG(random)           # The module's global stream
+    """
+
+    def __init__(self, source: Any = None, seed: Optional[int] = None):
+        """
+        Args:
+            source: A random.Random (or the random module itself) to draw
+                    from; a new random.Random(seed) if omitted
+            seed: Seed for the new random.Random
+        """
+        self.source = source if source is not None else random.Random(seed)
+
+        # Bind the source's methods directly - no extra call per roll
+        self.random = self.source.random
+        self.randint = self.source.randint
+        self.uniform = self.source.uniform
+        self.choice = self.source.choice
+        self.randrange = self.source.randrange
+
+    def seed(self, seed: Optional[int]):
+        """Restart the stream from a seed"""
+        self.source.seed(seed)
+
+    def getstate(self) -> Any:
+        """Position in the stream (random.Random state)"""
+        return self.source.getstate()
+
+    def setstate(self, state: Any):
+        """Go back to a getstate() position"""
+        self.source.setstate(state)
+
+    def clone(self) -> "PythonRNG":
+        """
+        Independent stream that continues exactly like this one.
+
+        Works for the global stream too: the clone gets its own
+        random.Random at the module's current position.
+        """
+        source = random.Random.__new__(random.Random)  # Skip seeding from os.urandom
+        source.setstate(self.source.getstate())
+        return PythonRNG(source)
+
+
+class BufferedRNG(RNG):
+    """
+    RNG that pre-draws blocks of floats from a NumPy Generator.
+
+    Generator.random(n) is very fast per number but slow per call, so
+    this draws block_size numbers at once and hands them out one by one.
+    Integers and choices are derived from those floats.
+
+    Example:
+        rng = BufferedRNG(seed=42)
+        battle = Battle(player, enemies, rng=rng)
+    """
+
+    def __init__(self, seed: Optional[int] = None, generator: Any = None,
+                 block_size: int = 4096):
+        """
+        Args:
+            seed: Seed for a new numpy.random.default_rng()
+            generator: Existing numpy.random.Generator (overrides seed)
+            block_size: Numbers drawn per refill
+
+        Raises:
+            ImportError: If NumPy isn't installed
+        """
+        if np is None:
+            raise ImportError("NumPy is required for BufferedRNG")
+        self.generator = generator if generator is not None else np.random.default_rng(seed)
+        self.block_size = block_size
+        self._block: list = []
+        self._index = 0
+
+    def random(self) -> float:
+        """Next float from the current block (refills when used up)"""
+        if self._index >= len(self._block):
+            self._block = self.generator.random(self.block_size).tolist()
+            self._index = 0
+        value = self._block[self._index]
+        self._index += 1
+        return value
+
+    def getstate(self) -> Any:
+        """Position in the stream (generator state + unread numbers)"""
+        return (self.generator.bit_generator.state, self._block, self._index)
+
+    def setstate(self, state: Any):
+        """Go back to a getstate() position"""
+        self.generator.bit_generator.state, self._block, self._index = state
+
+
+# Default stream: the random module's global one (random.seed() still works)
+_DEFAULT_RNG = PythonRNG(random)
+
+
+def get_default_rng() -> RNG:
+    """Get the RNG engine objects use when none is given"""
+    return _DEFAULT_RNG
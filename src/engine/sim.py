@@ -0,0 +1,551 @@
+"""
+Battle simulator - thousands of 1v1 battles at once for balance runs
+
+Playing battles through Battle.execute_turn() one object at a time is
+fine for the game but far too slow for tuning fish.json, enemies.json
+or the TYPE_CHART. This module runs N independent fish-vs-enemy battles
+together: every stat (HP, ATK, DEF, SPD, modifiers, status flags) is a
+NumPy array with one entry per battle, and each turn is a handful of
+array operations.
+
+SAME RULES AS THE GAME:
+- Turn order: higher effective SPD first (ties → player), move priority
+  overrides
+- Accuracy: randint(1, 100) > accuracy misses
+- Damage: Battle.calculate_damage() - power roll + ATK/2, 5% crits,
+  type chart, STAB, 85-100% variance, minimum 1
+- Defense: Fish/Enemy.take_damage() - × 100 / (100 + DEF × modifier),
+  minimum 1, invincible fish take 0, "damage_reduction_alone" halves
+- Enemy AI: random / strongest_first / cycle, chosen once per turn
+- Statuses: frozen/asleep/stunned fish and enemies lose their turns,
+  silenced fish only use physical moves
+- End of turn: poison (5% max HP) and burn (3% max HP)
+- A side loses when it takes a hit at 0 HP (as in the scalar engine)
+
+NOT SIMULATED: items, switching, apostles, miracles, in-battle level-ups,
+chance-based statuses (paralyzed, blinded) and timed modifiers/statuses (modifiers and statuses present at the start
+last the whole battle).
+
+Requires NumPy (not needed by the game itself).
+
+Usage:
+    from engine.sim import simulate_matchup
+    result = simulate_matchup(fish, enemy, n=100_000, seed=1)
+    print(result.summary())
+
+    # Or from the command line:
+    python src/engine/sim.py holy_mackerel:10 wild_bandit:10 -n 100000
+"""
+
+import sys
+import os
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError as e:  # NumPy is optional for the game, required here
+    raise ImportError("engine.sim needs NumPy: pip install numpy") from e
+
+if __name__ == "__main__":  # Allow `python src/engine/sim.py`
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+# Import constants - handle both direct and relative imports
+try:
+    from utils.constants import BASE_CRIT_CHANCE, CRIT_MULTIPLIER
+except ImportError:
+    from ..utils.constants import BASE_CRIT_CHANCE, CRIT_MULTIPLIER
+
+try:
+    from .damage import STAB_MULTIPLIER, VARIANCE_MAX, VARIANCE_MIN
+    from .elements import effectiveness_table
+    from .moves import as_move
+    from .statuses import CANNOT_ACT_MASK, INVINCIBLE, SILENCED, STATUS_BITS, STATUS_HANDLERS
+except ImportError:  # Run as a script
+    from engine.damage import STAB_MULTIPLIER, VARIANCE_MAX, VARIANCE_MIN
+    from engine.elements import effectiveness_table
+    from engine.moves import as_move
+    from engine.statuses import CANNOT_ACT_MASK, INVINCIBLE, SILENCED, STATUS_BITS, STATUS_HANDLERS
+
+
+# ============================================================================
+# ENCODING
+# ============================================================================
+
+# Status flags: the game's own status bits (statuses.py), so a fish's
+# status_mask goes straight into the status arrays
+STATUS_POISONED = STATUS_BITS["poisoned"]
+STATUS_BURNED = STATUS_BITS["burned"]
+STATUS_INVINCIBLE = INVINCIBLE
+STATUS_SILENCED = SILENCED
+STATUS_BLOCKED = CANNOT_ACT_MASK   # frozen, asleep, stunned
+
+# The statuses this simulator plays out
+SIMULATED_STATUSES = STATUS_POISONED | STATUS_BURNED | STATUS_INVINCIBLE | STATUS_SILENCED | \
+    STATUS_BLOCKED
+
+# Enemy AI patterns
+AI_RANDOM = 0
+AI_STRONGEST_FIRST = 1
+AI_CYCLE = 2
+AI_PATTERNS = {"random": AI_RANDOM, "strongest_first": AI_STRONGEST_FIRST, "cycle": AI_CYCLE}
+
+# Outcomes
+OUTCOME_TIMEOUT = 0
+OUTCOME_WIN = 1
+OUTCOME_LOSS = -1
+
+# Player move choice: a move index, or random among known moves each turn
+RANDOM_MOVE = -1
+
+def type_matrix() -> np.ndarray:
+    """
+    Effectiveness matrix [attack_type, defend_type] for every known type.
+
+    The battle engine's compiled table (elements.py), reshaped - the
+    scalar and batch damage can't disagree on a multiplier.
+    """
+    table, size = effectiveness_table()
+    return np.frombuffer(table, dtype=np.float64).reshape(size, size).copy()
+
+
+def _encode_moves(moves: Sequence[Any]) -> List[Tuple[int, int, int, int, int, bool]]:
+    """(power_min, power_max, accuracy, type_id, priority, is_physical) per move"""
+    encoded = []
+    for move in map(as_move, moves):
+        encoded.append((move.power_min, move.power_max, move.accuracy, move.type_id,
+                        move.priority, move.is_physical))
+    return encoded
+
+
+def _encode_matchup(fish: Any, enemy: Any, move: int) -> Dict[str, Any]:
+    """Snapshot one fish and one enemy as plain numbers (internal helper)"""
+    fish_mods = fish.stat_modifiers
+    enemy_mods = enemy.stat_modifiers
+
+    # Fish.take_damage() halves damage for this property when the owner
+    # has only one fish out
+    owner = getattr(fish, "owner", None)
+    halve = (fish.property.get("effect") == "damage_reduction_alone"
+             and owner is not None and hasattr(owner, "get_active_fish")
+             and len(owner.get_active_fish()) == 1)
+
+    attacks = list(enemy.attacks) or [{
+        # Enemy.choose_attack() default when no attacks are defined
+        "name": "Strike", "type": "Physical", "power": [enemy.atk // 2, enemy.atk], "accuracy": 100
+    }]
+    strongest = max(range(len(attacks)),
+                    key=lambda i: max(_encode_moves([attacks[i]])[0][:2]))
+
+    return {
+        "fish_hp": fish.current_hp,
+        "fish_max_hp": fish.max_hp,
+        "fish_atk": fish.get_effective_stat("atk"),
+        "fish_def": fish.defense,
+        "fish_def_mod": fish_mods["def"],
+        "fish_spd": fish.get_effective_stat("spd"),
+        "fish_type": fish.type_id,
+        "fish_status": fish.status_mask & SIMULATED_STATUSES,
+        "fish_halve": halve,
+        "moves": _encode_moves(fish.known_moves),
+        "move_choice": move,
+        "enemy_hp": enemy.current_hp,
+        "enemy_max_hp": enemy.max_hp,
+        "enemy_atk": enemy.get_effective_stat("atk"),
+        "enemy_def": enemy.defense,
+        "enemy_def_mod": enemy_mods["def"],
+        "enemy_spd": enemy.get_effective_stat("spd"),
+        "enemy_type": enemy.type_id,
+        "enemy_status": enemy.status_mask & SIMULATED_STATUSES,
+        "attacks": _encode_moves(attacks),
+        "ai": AI_PATTERNS.get(enemy.ai_pattern, AI_RANDOM),
+        "strongest": strongest,
+    }
+
+
+class BattleBatch:
+    """
+    N battles' starting state as NumPy arrays (one row per battle).
+
+    Build with BattleBatch.from_matchups(). Moves and enemy attacks are
+    (N, max_moves) tables padded with unused slots.
+    """
+
+    SCALARS = ("fish_hp", "fish_max_hp", "fish_atk", "fish_def", "fish_def_mod", "fish_spd",
+               "fish_type", "fish_status", "fish_halve", "move_choice",
+               "enemy_hp", "enemy_max_hp", "enemy_atk", "enemy_def", "enemy_def_mod",
+               "enemy_spd", "enemy_type", "enemy_status", "ai", "strongest")
+    MOVE_COLUMNS = ("low", "high", "accuracy", "type", "priority", "physical")
+
+    def __init__(self, arrays: Dict[str, np.ndarray]):
+        self.arrays = arrays
+        self.size = len(arrays["fish_hp"])
+
+    def __len__(self) -> int:
+        return self.size
+
+    @classmethod
+    def from_matchups(cls, matchups: Sequence[Tuple[Any, Any, int]],
+                      move: Union[int, str] = 0) -> "BattleBatch":
+        """
+        Build a batch from (fish, enemy, count) triples.
+
+        Each fish/enemy is snapshotted as it is right now (HP, modifiers,
+        statuses), then repeated count times.
+
+        Args:
+            matchups: [(fish, enemy, number_of_battles), ...]
+            move: Player's move each turn - a known_moves index, or
+                  "random" for a random known move every turn
+
+        Returns:
+            BattleBatch with sum(counts) battles
+        """
+        choice = RANDOM_MOVE if move == "random" else int(move)
+        encoded = [_encode_matchup(fish, enemy, choice) for fish, enemy, _ in matchups]
+        counts = np.array([count for _, _, count in matchups], dtype=np.int64)
+        rows = np.repeat(np.arange(len(encoded)), counts)
+
+        arrays = {}
+        for name in cls.SCALARS:
+            arrays[name] = np.array([e[name] for e in encoded])[rows]
+
+        for side in ("moves", "attacks"):
+            width = max(len(e[side]) for e in encoded)
+            table = np.zeros((len(encoded), width, len(cls.MOVE_COLUMNS)), dtype=np.int64)
+            for i, e in enumerate(encoded):
+                if e[side]:
+                    table[i, :len(e[side])] = e[side]
+            for column, name in enumerate(cls.MOVE_COLUMNS):
+                arrays[f"{side}_{name}"] = table[:, :, column][rows]
+            arrays[f"{side}_count"] = np.array([len(e[side]) for e in encoded])[rows]
+
+        return cls(arrays)
+
+
+# ============================================================================
+# RESULTS
+# ============================================================================
+
+class SimResult:
+    """
+    Outcome of a batch of battles.
+
+    Attributes (one entry per battle):
+        outcome: OUTCOME_WIN / OUTCOME_LOSS / OUTCOME_TIMEOUT
+        turns: Turns played
+        damage_dealt: Total damage the fish dealt
+        damage_taken: Total damage the fish took from attacks
+    Per-hit damage (all battles, every landed hit):
+        player_hits, enemy_hits
+    """
+
+    def __init__(self, outcome: np.ndarray, turns: np.ndarray, damage_dealt: np.ndarray,
+                 damage_taken: np.ndarray, player_hits: np.ndarray, enemy_hits: np.ndarray):
+        self.outcome = outcome
+        self.turns = turns
+        self.damage_dealt = damage_dealt
+        self.damage_taken = damage_taken
+        self.player_hits = player_hits
+        self.enemy_hits = enemy_hits
+
+    def __len__(self) -> int:
+        return len(self.outcome)
+
+    @property
+    def win_rate(self) -> float:
+        """Fraction of battles the fish won"""
+        return float(np.mean(self.outcome == OUTCOME_WIN)) if len(self) else 0.0
+
+    @property
+    def loss_rate(self) -> float:
+        """Fraction of battles the fish lost"""
+        return float(np.mean(self.outcome == OUTCOME_LOSS)) if len(self) else 0.0
+
+    def turns_to_kill(self) -> np.ndarray:
+        """Turns taken in the battles the fish won"""
+        return self.turns[self.outcome == OUTCOME_WIN]
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Headline numbers for balancing.
+
+        Returns:
+            Dictionary with win/loss/timeout rates, turns-to-kill
+            (mean, median, 90th percentile) and damage distributions
+            (mean, std and 10/50/90th percentiles per hit and per battle)
+        """
+        def spread(values: np.ndarray) -> Dict[str, float]:
+            if not len(values):
+                return {"mean": 0.0, "std": 0.0, "p10": 0.0, "p50": 0.0, "p90": 0.0}
+            p10, p50, p90 = np.percentile(values, [10, 50, 90])
+            return {"mean": float(values.mean()), "std": float(values.std()),
+                    "p10": float(p10), "p50": float(p50), "p90": float(p90)}
+
+        kills = self.turns_to_kill()
+        return {
+            "battles": len(self),
+            "win_rate": self.win_rate,
+            "loss_rate": self.loss_rate,
+            "timeout_rate": float(np.mean(self.outcome == OUTCOME_TIMEOUT)) if len(self) else 0.0,
+            "turns_to_kill": spread(kills),
+            "damage_per_hit_dealt": spread(self.player_hits),
+            "damage_per_hit_taken": spread(self.enemy_hits),
+            "damage_per_battle_dealt": spread(self.damage_dealt),
+            "damage_per_battle_taken": spread(self.damage_taken),
+        }
+
+
+# ============================================================================
+# SIMULATION
+# ============================================================================
+
+def _roll_damage(rng: np.random.Generator, atk: np.ndarray, low: np.ndarray, high: np.ndarray,
+                 effectiveness: np.ndarray, stab: np.ndarray) -> np.ndarray:
+    """Battle.calculate_damage() for many attacks at once (before defense)"""
+    n = len(atk)
+    power = low + np.floor(rng.random(n) * (high - low + 1))     # randint(low, high)
+    damage = power + atk // 2
+    crit = rng.random(n) < BASE_CRIT_CHANCE
+    damage = np.where(crit, np.floor(damage * CRIT_MULTIPLIER), damage)
+    damage = np.floor(damage * effectiveness)
+    damage = np.where(stab, np.floor(damage * STAB_MULTIPLIER), damage)
+    damage = np.floor(damage * (VARIANCE_MIN + (VARIANCE_MAX - VARIANCE_MIN) * rng.random(n)))
+    return np.maximum(1, damage)
+
+
+def _after_defense(damage: np.ndarray, defense: np.ndarray, def_mod: np.ndarray) -> np.ndarray:
+    """take_damage() defense reduction, minimum 1"""
+    return np.maximum(1, np.floor(damage * (100 / (100 + defense * def_mod))))
+
+
+def simulate(batch: BattleBatch, seed: Optional[int] = None, max_turns: int = 100,
+             rng: Optional[np.random.Generator] = None) -> SimResult:
+    """
+    Play every battle in a batch to the end (or max_turns).
+
+    Args:
+        batch: Starting state (see BattleBatch.from_matchups)
+        seed: Seed for a new NumPy Generator (ignored if rng is given)
+        max_turns: Battles still going after this many turns time out
+        rng: NumPy Generator to draw from
+
+    Returns:
+        SimResult
+    """
+    rng = rng or np.random.default_rng(seed)
+    a = batch.arrays
+    chart = type_matrix()
+    n = batch.size
+
+    fish_hp = a["fish_hp"].astype(np.float64)
+    enemy_hp = a["enemy_hp"].astype(np.float64)
+    outcome = np.zeros(n, dtype=np.int8)
+    turns = np.zeros(n, dtype=np.int32)
+    dealt = np.zeros(n)
+    taken = np.zeros(n)
+    player_hits: List[np.ndarray] = []
+    enemy_hits: List[np.ndarray] = []
+
+    poison = STATUS_HANDLERS[STATUS_POISONED.bit_length() - 1].damage_per_turn
+    burn = STATUS_HANDLERS[STATUS_BURNED.bit_length() - 1].damage_per_turn
+    fish_poison = np.maximum(1, np.floor(a["fish_max_hp"] * poison))
+    fish_burn = np.maximum(1, np.floor(a["fish_max_hp"] * burn))
+    enemy_poison = np.maximum(1, np.floor(a["enemy_max_hp"] * poison))
+    enemy_burn = np.maximum(1, np.floor(a["enemy_max_hp"] * burn))
+    fish_status = a["fish_status"]
+    enemy_status = a["enemy_status"]
+    fish_blocked = (fish_status & STATUS_BLOCKED) != 0
+    enemy_blocked = (enemy_status & STATUS_BLOCKED) != 0
+    fish_silenced = (fish_status & STATUS_SILENCED) != 0
+    fish_invincible = (fish_status & STATUS_INVINCIBLE) != 0
+
+    active = np.arange(n)
+    for turn in range(1, max_turns + 1):
+        if not len(active):
+            break
+        m = len(active)
+        turns[active] = turn
+
+        # Choose moves (player) and attacks (enemy AI) for this turn
+        move_count = a["moves_count"][active]
+        move = a["move_choice"][active]
+        random_move = move == RANDOM_MOVE
+        if random_move.any():
+            move = np.where(random_move, np.floor(rng.random(m) * move_count).astype(np.int64), move)
+        attack_count = a["attacks_count"][active]
+        ai = a["ai"][active]
+        attack = np.where(ai == AI_STRONGEST_FIRST, a["strongest"][active],
+                          np.where(ai == AI_CYCLE, (turn - 1) % attack_count,
+                                   np.floor(rng.random(m) * attack_count).astype(np.int64)))
+
+        def move_column(side: str, column: str, index: np.ndarray) -> np.ndarray:
+            return a[f"{side}_{column}"][active, index]
+
+        # Turn order: SPD (ties → player), then priority overrides
+        player_priority = move_column("moves", "priority", move)
+        enemy_priority = move_column("attacks", "priority", attack)
+        player_first = np.where(player_priority != enemy_priority,
+                                player_priority > enemy_priority,
+                                a["fish_spd"][active] >= a["enemy_spd"][active])
+
+        ongoing = np.ones(m, dtype=bool)
+
+        def player_acts(mask: np.ndarray):
+            rows = np.nonzero(mask)[0]
+            if not len(rows):
+                return
+            idx = active[rows]
+            mv = move[rows]
+            usable = ~fish_blocked[idx] & ~(fish_silenced[idx] & (a["moves_physical"][idx, mv] == 0))
+            hits = usable & (rng.integers(1, 101, len(rows)) <= a["moves_accuracy"][idx, mv])
+            rows, idx, mv = rows[hits], idx[hits], mv[hits]
+            if not len(rows):
+                return
+            move_type = a["moves_type"][idx, mv]
+            damage = _roll_damage(rng, a["fish_atk"][idx], a["moves_low"][idx, mv],
+                                  a["moves_high"][idx, mv],
+                                  chart[move_type, a["enemy_type"][idx]],
+                                  move_type == a["fish_type"][idx])
+            actual = _after_defense(damage, a["enemy_def"][idx], a["enemy_def_mod"][idx])
+            enemy_hp[idx] = np.maximum(0, enemy_hp[idx] - actual)
+            dealt[idx] += actual
+            player_hits.append(actual)
+            won = enemy_hp[idx] <= 0
+            outcome[idx[won]] = OUTCOME_WIN
+            ongoing[rows[won]] = False
+
+        def enemy_acts(mask: np.ndarray):
+            rows = np.nonzero(mask & ongoing & (enemy_hp[active] > 0))[0]
+            if not len(rows):
+                return
+            idx = active[rows]
+            at = attack[rows]
+            hits = ~enemy_blocked[idx] & (rng.integers(1, 101, len(rows)) <= a["attacks_accuracy"][idx, at])
+            rows, idx, at = rows[hits], idx[hits], at[hits]
+            if not len(rows):
+                return
+            attack_type = a["attacks_type"][idx, at]
+            damage = _roll_damage(rng, a["enemy_atk"][idx], a["attacks_low"][idx, at],
+                                  a["attacks_high"][idx, at],
+                                  chart[attack_type, a["fish_type"][idx]],
+                                  attack_type == a["enemy_type"][idx])
+            actual = _after_defense(damage, a["fish_def"][idx], a["fish_def_mod"][idx])
+            actual = np.where(a["fish_halve"][idx], np.maximum(1, np.floor(actual * 0.5)), actual)
+            actual = np.where(fish_invincible[idx], 0, actual)
+            fish_hp[idx] = np.maximum(0, fish_hp[idx] - actual)
+            taken[idx] += actual
+            enemy_hits.append(actual)
+            lost = fish_hp[idx] <= 0
+            outcome[idx[lost]] = OUTCOME_LOSS
+            ongoing[rows[lost]] = False
+
+        player_acts(player_first)
+        enemy_acts(np.ones(m, dtype=bool))
+        player_acts(~player_first & ongoing)
+
+        # End of turn: poison and burn (invincible targets are immune)
+        still = active[ongoing]
+        fs, es = fish_status[still], enemy_status[still]
+        fish_dot = np.where(fs & STATUS_POISONED, fish_poison[still], 0) + \
+            np.where(fs & STATUS_BURNED, fish_burn[still], 0)
+        fish_dot = np.where(fish_invincible[still], 0, fish_dot)
+        enemy_dot = np.where(es & STATUS_POISONED, enemy_poison[still], 0) + \
+            np.where(es & STATUS_BURNED, enemy_burn[still], 0)
+        enemy_dot = np.where(es & STATUS_INVINCIBLE, 0, enemy_dot)
+        if fish_dot.any():
+            fish_hp[still] = np.maximum(0, fish_hp[still] - fish_dot)
+        if enemy_dot.any():
+            enemy_hp[still] = np.maximum(0, enemy_hp[still] - enemy_dot)
+
+        active = still
+
+    empty = np.zeros(0)
+    return SimResult(
+        outcome=outcome,
+        turns=turns,
+        damage_dealt=dealt,
+        damage_taken=taken,
+        player_hits=np.concatenate(player_hits) if player_hits else empty,
+        enemy_hits=np.concatenate(enemy_hits) if enemy_hits else empty,
+    )
+
+
+def simulate_matchup(fish: Any, enemy: Any, n: int = 10_000, move: Union[int, str] = 0,
+                     seed: Optional[int] = None, max_turns: int = 100) -> SimResult:
+    """
+    Simulate n battles between one fish and one enemy.
+
+    Args:
+        fish: Fish instance (its current HP, modifiers and statuses are used)
+        enemy: Enemy or Boss instance
+        n: Number of battles
+        move: known_moves index the fish always uses, or "random"
+        seed: RNG seed for reproducible runs
+        max_turns: Turn limit per battle
+
+    Returns:
+        SimResult
+
+    Example:
+        result = simulate_matchup(Fish("carp_diem", data, 5),
+                                  create_enemy("wild_bandit", 5), n=100_000)
+        result.win_rate  # e.g. 0.62
+    """
+    batch = BattleBatch.from_matchups([(fish, enemy, n)], move=move)
+    return simulate(batch, seed=seed, max_turns=max_turns)
+
+
+def main(argv: List[str]) -> int:
+    """Command line: simulate one fish:level vs enemy:level matchup"""
+    import argparse
+    import time
+
+    from utils.data_loader import get_data_loader
+    from engine.fish import Fish
+    from engine.enemy import create_enemy, create_boss
+
+    parser = argparse.ArgumentParser(description="Simulate fish vs enemy battles")
+    parser.add_argument("fish", help="fish_id[:level], e.g. holy_mackerel:10")
+    parser.add_argument("enemy", help="enemy_or_boss_id[:level], e.g. wild_bandit:10")
+    parser.add_argument("-n", type=int, default=100_000, help="number of battles")
+    parser.add_argument("--move", default="0", help="move index or 'random'")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv[1:])
+
+    def split(spec: str) -> Tuple[str, Optional[int]]:
+        name, _, level = spec.partition(":")
+        return name, int(level) if level else None
+
+    loader = get_data_loader()
+    fish_id, fish_level = split(args.fish)
+    fish_data = loader.get_fish_by_id(fish_id)
+    if not fish_data:
+        print(f"Error: Unknown fish {fish_id}")
+        return 1
+    fish = Fish(fish_id, fish_data, fish_level or 1)
+    enemy_id, enemy_level = split(args.enemy)
+    enemy = create_enemy(enemy_id, enemy_level) or create_boss(enemy_id, enemy_level)
+    if enemy is None:
+        print(f"Error: Unknown enemy {enemy_id}")
+        return 1
+
+    move = args.move if args.move == "random" else int(args.move)
+    start = time.perf_counter()
+    result = simulate_matchup(fish, enemy, n=args.n, move=move, seed=args.seed)
+    elapsed = time.perf_counter() - start
+
+    summary = result.summary()
+    print(f"{fish} vs {enemy}: {args.n:,} battles in {elapsed:.2f}s "
+          f"({args.n / elapsed:,.0f}/s)")
+    print(f"Win {summary['win_rate']:.1%}  Loss {summary['loss_rate']:.1%}  "
+          f"Timeout {summary['timeout_rate']:.1%}")
+    kills = summary["turns_to_kill"]
+    print(f"Turns to kill: mean {kills['mean']:.2f}, median {kills['p50']:.0f}, p90 {kills['p90']:.0f}")
+    for key in ("damage_per_hit_dealt", "damage_per_hit_taken"):
+        d = summary[key]
+        print(f"{key}: mean {d['mean']:.1f} ± {d['std']:.1f} (p10 {d['p10']:.0f}, p90 {d['p90']:.0f})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,214 @@
+"""
+Stat tables - precomputed stats for every level
+
+Fish, enemies and Jesus all grow with a simple linear formula:
+
+    stat = int(base_stat × (1 + growth_rate × (level - 1)))
+
+Instead of working that out every time something is created or levels
+up, a StatTable computes HP/ATK/DEF/SPD for levels 1..MAX_LEVEL ONCE and
+stores them in one compact array. Creating a fish, levelling up and
+loading a save are then just a lookup.
+
+Tables are shared: every species/enemy with the same base stats and
+growth rate uses the same table.
+
+BULK ANALYTICS:
+The tables are also handy for balancing. With NumPy installed,
+fish_stat_curves() returns every species' stats at every level as one
+(species, level, stat) array; without NumPy you get nested lists.
+
+    ids, curves = fish_stat_curves()
+    curves[ids.index("holy_mackerel"), 9]   # Level 10: [hp, atk, def, spd]
+    curves[:, -1, 1].max()                  # Best ATK at max level
+
+NumPy is optional - the game itself only uses the standard library.
+"""
+
+from array import array
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional (only used for analytics views)
+    np = None
+
+# Import constants and data loader - handle both direct and relative imports
+try:
+    from utils.constants import MAX_LEVEL
+    from utils.data_loader import DataLoader, get_data_loader
+except ImportError:
+    from ..utils.constants import MAX_LEVEL
+    from ..utils.data_loader import DataLoader, get_data_loader
+
+# Growth per level (see the formula above)
+FISH_GROWTH_RATE = 0.07    # 7% per level - balanced for JRPG progression
+ENEMY_GROWTH_RATE = 0.05   # Enemies grow about 5% per level
+PLAYER_GROWTH_RATE = 0.05  # Jesus grows slower than fish
+
+# Column order of every table row
+STAT_NAMES = ("hp", "atk", "def", "spd")
+
+# Jesus's level 1 stats (HP only)
+PLAYER_BASE_STATS = (50,)
+
+
+def scale_stat(base_stat: int, level: int, growth_rate: float) -> int:
+    """
+    The growth formula for one stat at one level.
+
+    Args:
+        base_stat: Stat at level 1
+        level: Level to compute
+        growth_rate: Growth per level (e.g., FISH_GROWTH_RATE)
+
+    Returns:
+        Stat value, rounded down
+    """
+    return int(base_stat * (1 + growth_rate * (level - 1)))
+
+
+class StatTable:
+    """
+    One base-stat vector's values at every level 1..MAX_LEVEL.
+
+    Stored as a flat array('i'): row = level - 1, one column per base stat.
+    Levels outside the table fall back to the formula.
+
+    Example:
+        table = get_stat_table((30, 20, 15, 25), FISH_GROWTH_RATE)
+        hp, atk, defense, spd = table.at(10)
+    """
+
+    __slots__ = ("base", "growth_rate", "width", "max_level", "_values")
+
+    def __init__(self, base: Sequence[int], growth_rate: float, max_level: int = MAX_LEVEL):
+        """
+        Build the table.
+
+        Args:
+            base: Level 1 stats (any number of columns, usually hp/atk/def/spd)
+            growth_rate: Growth per level
+            max_level: Last precomputed level
+        """
+        self.base = tuple(base)
+        self.growth_rate = growth_rate
+        self.width = len(self.base)
+        self.max_level = max_level
+        self._values = array("i", (scale_stat(stat, level, growth_rate)
+                                   for level in range(1, max_level + 1)
+                                   for stat in self.base))
+
+    def at(self, level: int) -> Tuple[int, ...]:
+        """Get every stat at a level (a lookup for levels 1..max_level)"""
+        if 1 <= level <= self.max_level:
+            start = (level - 1) * self.width
+            return tuple(self._values[start:start + self.width])
+        return tuple(scale_stat(stat, level, self.growth_rate) for stat in self.base)
+
+    def stat(self, level: int, column: int) -> int:
+        """Get one stat (by column index) at a level"""
+        if 1 <= level <= self.max_level:
+            return self._values[(level - 1) * self.width + column]
+        return scale_stat(self.base[column], level, self.growth_rate)
+
+    def rows(self) -> List[List[int]]:
+        """All levels as nested lists: rows()[level - 1] = [hp, atk, ...]"""
+        values, width = self._values, self.width
+        return [values[i:i + width].tolist() for i in range(0, len(values), width)]
+
+    def as_array(self) -> Any:
+        """
+        The table as a read-only NumPy array of shape (max_level, width).
+
+        Shares memory with the table (no copy).
+
+        Raises:
+            ImportError: If NumPy isn't installed
+        """
+        if np is None:
+            raise ImportError("NumPy is required for StatTable.as_array()")
+        view = np.frombuffer(self._values, dtype=np.intc).reshape(self.max_level, self.width)
+        view.flags.writeable = False
+        return view
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the values"""
+        return len(self._values) * self._values.itemsize
+
+    def __repr__(self) -> str:
+        return f"StatTable(base={self.base}, growth_rate={self.growth_rate})"
+
+
+# Shared tables: {(base_stats, growth_rate): StatTable}
+_TABLES: Dict[Tuple[Tuple[int, ...], float], StatTable] = {}
+
+
+def get_stat_table(base: Sequence[int], growth_rate: float) -> StatTable:
+    """
+    Get the shared table for a base-stat vector (built on first request).
+
+    Args:
+        base: Level 1 stats, e.g. (hp, atk, def, spd)
+        growth_rate: Growth per level
+
+    Returns:
+        The StatTable
+    """
+    key = (tuple(base), growth_rate)
+    table = _TABLES.get(key)
+    if table is None:
+        table = StatTable(key[0], growth_rate)
+        _TABLES[key] = table
+    return table
+
+
+def base_stat_vector(record: Dict[str, Any]) -> Tuple[int, int, int, int]:
+    """(hp, atk, def, spd) from a JSON record's base_stats (spd defaults to 10)"""
+    base_stats = record["base_stats"]
+    return (base_stats["hp"], base_stats["atk"], base_stats["def"],
+            base_stats.get("spd", 10))
+
+
+PLAYER_STAT_TABLE = get_stat_table(PLAYER_BASE_STATS, PLAYER_GROWTH_RATE)
+
+
+# ============================================================================
+# BULK ANALYTICS
+# ============================================================================
+
+def stat_curves(records: List[Dict[str, Any]], growth_rate: float) -> Tuple[List[str], Any]:
+    """
+    Stats of many records at every level, stacked.
+
+    Args:
+        records: JSON records with "id" and "base_stats"
+        growth_rate: Growth per level
+
+    Returns:
+        (ids, curves) - curves[i][level - 1] = [hp, atk, def, spd] for ids[i].
+        curves is a NumPy int array of shape (len(ids), MAX_LEVEL, 4) when
+        NumPy is installed, nested lists otherwise.
+    """
+    ids = [record["id"] for record in records]
+    tables = [get_stat_table(base_stat_vector(record), growth_rate) for record in records]
+    if np is None:
+        return ids, [table.rows() for table in tables]
+    if not tables:
+        return ids, np.zeros((0, MAX_LEVEL, len(STAT_NAMES)), dtype=np.intc)
+    return ids, np.stack([table.as_array() for table in tables])
+
+
+def fish_stat_curves(data_loader: Optional[DataLoader] = None) -> Tuple[List[str], Any]:
+    """Every fish species' stat curve (see stat_curves())"""
+    loader = data_loader or get_data_loader()
+    return stat_curves(loader.get_all_fish(), FISH_GROWTH_RATE)
+
+
+def enemy_stat_curves(data_loader: Optional[DataLoader] = None) -> Tuple[List[str], Any]:
+    """Every enemy's and boss's stat curve (see stat_curves())"""
+    loader = data_loader or get_data_loader()
+    records = (loader.load_json("enemies.json").get("enemies", [])
+               + loader.load_json("bosses.json").get("bosses", []))
+    return stat_curves(records, ENEMY_GROWTH_RATE)
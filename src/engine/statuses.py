@@ -0,0 +1,316 @@
+"""
+Status effects - one bit per status, and a handler for each
+
+A fish or enemy's statuses are a single int, status_mask, with one bit
+per status (poisoned, frozen, ...), plus a parallel list of the turns
+the timed ones end on (absolute, on a TimingWheel - see timing_wheel.py):
+
+    fish.apply_status_effect("poisoned", 3)
+    fish.status_mask & POISONED          # Set
+    fish.status_effects                  # ["poisoned"] (names, for the UI/saves)
+    fish.status_durations                # {"poisoned": 3}
+
+"Is it frozen?" is one AND instead of a list scan, and a fish with no
+statuses costs one int.
+
+WHAT EACH STATUS DOES comes from constants.STATUS_EFFECTS, compiled once
+into a StatusHandler per bit:
+
+    damage_per_turn    Fraction of max HP lost at the end of each turn
+    cannot_act         Loses every turn
+    act_chance         Chance to act each turn (rolled)
+    accuracy_penalty   Accuracy lost (0.5 = half)
+
+and masks of the bits that have each behavior (DAMAGE_MASK,
+ACTION_MASK, ...), so Battle only looks at the handlers of bits that are
+set - usually none. Statuses the battle code uses that aren't in
+STATUS_EFFECTS (invincible, immunity, silenced) get a bit with no
+handler behavior; any other name gets the next free bit the first time
+it's seen, so old saves with unknown statuses still load and save back.
+
+Fish and Enemy share the bookkeeping through StatusHolder.
+"""
+
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+# Import constants - handle both direct and relative imports
+try:
+    from utils.constants import STATUS_EFFECTS
+except ImportError:
+    from ..utils.constants import STATUS_EFFECTS
+
+from .timing_wheel import TimingWheel
+
+# Statuses set by battle code (items, miracles) rather than STATUS_EFFECTS
+ENGINE_STATUSES = ("invincible", "immunity", "silenced")
+
+# Word used in the status damage log ("took 3 poison damage")
+_DAMAGE_LABELS = {"poisoned": "poison", "burned": "burn"}
+
+
+class StatusHandler(NamedTuple):
+    """
+    What one status does, compiled from its STATUS_EFFECTS entry.
+
+    Example: "poisoned" → StatusHandler("poisoned", 1 << 2, 5, damage_per_turn=0.05, ...)
+    """
+    name: str
+    bit: int
+    duration: Optional[int] = None      # Default turns (None = until removed)
+    damage_per_turn: float = 0.0        # Fraction of max HP, end of turn
+    cannot_act: bool = False
+    act_chance: float = 1.0
+    accuracy_penalty: float = 0.0
+    label: str = ""                     # Status damage log detail
+
+
+# Bit index → name / handler, and name → bit
+STATUS_NAMES: List[str] = []
+STATUS_HANDLERS: List[StatusHandler] = []
+STATUS_BITS: Dict[str, int] = {}
+
+
+def status_bit(name: str) -> int:
+    """Get (or assign) the bit for a status name"""
+    bit = STATUS_BITS.get(name)
+    if bit is None:
+        bit = STATUS_BITS[name] = 1 << len(STATUS_NAMES)
+        settings = STATUS_EFFECTS.get(name, {})
+        STATUS_HANDLERS.append(StatusHandler(
+            name=name,
+            bit=bit,
+            duration=settings.get("duration"),
+            damage_per_turn=settings.get("damage_per_turn", 0.0),
+            cannot_act=settings.get("cannot_act", False),
+            act_chance=settings.get("act_chance", 1.0),
+            accuracy_penalty=settings.get("accuracy_penalty", 0.0),
+            label=_DAMAGE_LABELS.get(name, name),
+        ))
+        STATUS_NAMES.append(name)
+    return bit
+
+
+for _name in (*STATUS_EFFECTS, *ENGINE_STATUSES):
+    status_bit(_name)
+
+INVINCIBLE = STATUS_BITS["invincible"]
+IMMUNITY = STATUS_BITS["immunity"]
+SILENCED = STATUS_BITS["silenced"]
+
+
+def _mask_where(test) -> int:
+    """Bits of every handler that passes test"""
+    mask = 0
+    for handler in STATUS_HANDLERS:
+        if test(handler):
+            mask |= handler.bit
+    return mask
+
+
+# Which bits do something (new names never do, so these never change)
+DAMAGE_MASK = _mask_where(lambda h: h.damage_per_turn > 0)
+CANNOT_ACT_MASK = _mask_where(lambda h: h.cannot_act)
+ACTION_MASK = _mask_where(lambda h: h.cannot_act or h.act_chance < 1)
+ACCURACY_MASK = _mask_where(lambda h: h.accuracy_penalty > 0)
+
+
+# ============================================================================
+# MASK HELPERS
+# ============================================================================
+
+def bit_indexes(mask: int) -> Iterator[int]:
+    """Index of every set bit, lowest first"""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def handlers_for(mask: int) -> Iterator[StatusHandler]:
+    """Handlers of the set bits, in bit order"""
+    for index in bit_indexes(mask):
+        yield STATUS_HANDLERS[index]
+
+
+def status_mask(names: Iterable[str]) -> int:
+    """Mask with a bit set for every status name"""
+    mask = 0
+    for name in names:
+        mask |= status_bit(name)
+    return mask
+
+
+def status_names(mask: int) -> List[str]:
+    """Names of the set bits, in bit order"""
+    return [STATUS_NAMES[index] for index in bit_indexes(mask)]
+
+
+def accuracy_multiplier(mask: int) -> float:
+    """Accuracy left after every accuracy penalty in the mask (1.0 = none)"""
+    multiplier = 1.0
+    for handler in handlers_for(mask & ACCURACY_MASK):
+        multiplier *= 1 - handler.accuracy_penalty
+    return multiplier
+
+
+# ============================================================================
+# SHARED BOOKKEEPING (Fish and Enemy)
+# ============================================================================
+
+class StatusHolder:
+    """
+    Status bookkeeping for anything with status_mask / _status_ends / _wheel.
+
+    status_mask: One bit per active status
+    _status_ends: Turn each timed status ends on, per bit index (0 =
+                  untimed), or None while no timed status has been applied
+    _wheel: TimingWheel the end turns count on (None until something
+            timed is applied - see timing_wheel.py)
+
+    status_effects / status_durations read and write the same state as
+    names, for the UI, saves and older code.
+
+    Subclasses provide attach_wheel(wheel), which moves all of the unit's
+    timed effects (statuses and modifiers) onto a wheel.
+    """
+
+    __slots__ = ()
+
+    @property
+    def status_effects(self) -> List[str]:
+        """Active status names (a copy - change statuses with the methods below)"""
+        return status_names(self.status_mask)
+
+    @status_effects.setter
+    def status_effects(self, names: Iterable[str]):
+        self.status_mask = status_mask(names)
+        ends = self._status_ends
+        if ends:
+            for index in range(len(ends)):  # Removed statuses lose their turns
+                if not self.status_mask & (1 << index):
+                    ends[index] = 0
+
+    @property
+    def status_durations(self) -> Dict[str, int]:
+        """{status: turns left} for the timed statuses (a copy)"""
+        ends = self._status_ends
+        if not ends:
+            return {}
+        now = self._wheel.now if self._wheel is not None else 0
+        return {STATUS_NAMES[index]: ends[index] - now
+                for index in bit_indexes(self.status_mask)
+                if index < len(ends) and ends[index] > now}
+
+    @status_durations.setter
+    def status_durations(self, durations: Dict[str, int]):
+        self._status_ends = None
+        for name, turns in durations.items():
+            if turns > 0:
+                self._set_end(status_bit(name), self.timing_wheel().now + turns)
+
+    def has_status(self, status: str) -> bool:
+        """True if the status is active"""
+        bit = STATUS_BITS.get(status)
+        return bit is not None and bool(self.status_mask & bit)
+
+    def timing_wheel(self) -> TimingWheel:
+        """The wheel timed effects count on (a new one of its own if there's none yet)"""
+        if self._wheel is None:
+            self.attach_wheel(TimingWheel(owner=self))
+        return self._wheel
+
+    def _set_end(self, bit: int, end: int):
+        index = bit.bit_length() - 1
+        if self._status_ends is None:
+            self._status_ends = [0] * len(STATUS_NAMES)
+        elif index >= len(self._status_ends):
+            self._status_ends.extend([0] * (len(STATUS_NAMES) - len(self._status_ends)))
+        self._status_ends[index] = end
+        self._wheel.schedule(end, self)
+
+    def apply_status_effect(self, status: str, turns: Optional[int] = None):
+        """Apply a status effect (for `turns` turns; the longer duration wins)"""
+        bit = status_bit(status)
+        if bit != IMMUNITY and self.status_mask & IMMUNITY:
+            return
+        self.status_mask |= bit
+        if turns and turns > 0:
+            end = self.timing_wheel().now + turns
+            index = bit.bit_length() - 1
+            current = self._status_ends
+            if current is None or index >= len(current) or current[index] < end:
+                self._set_end(bit, end)
+
+    def remove_status_effect(self, status: str):
+        """Remove a status effect"""
+        bit = STATUS_BITS.get(status)
+        if bit is None:
+            return
+        self.status_mask &= ~bit
+        index = bit.bit_length() - 1
+        if self._status_ends and index < len(self._status_ends):
+            self._status_ends[index] = 0
+
+    def clear_status_effects(self):
+        """Remove all status effects"""
+        self.status_mask = 0
+        self._status_ends = None
+
+    def tick_temporary_effects(self):
+        """
+        One turn passes for this unit alone: timed modifiers and statuses count down.
+
+        In a battle the battle's wheel does this for everyone at once
+        (and only wakes the units with something running out).
+        """
+        wheel = self._wheel
+        if wheel is None:
+            return  # Nothing timed was ever applied
+        if wheel.owner is not self:
+            wheel = TimingWheel(wheel.now, owner=self)
+            self.attach_wheel(wheel)
+        wheel.advance()
+
+    def expire_due(self, wheel: TimingWheel):
+        """Wheel callback: remove the timed statuses that end by wheel.now"""
+        ends = self._status_ends
+        if wheel is not self._wheel or not ends or not self.status_mask:
+            return
+        now = wheel.now
+        soonest = 0
+        for index in bit_indexes(self.status_mask):
+            if index < len(ends) and ends[index]:
+                if ends[index] <= now:
+                    ends[index] = 0
+                    self.status_mask &= ~(1 << index)
+                elif not soonest or ends[index] < soonest:
+                    soonest = ends[index]
+        if soonest:
+            wheel.schedule(soonest, self)
+
+    def _attach_statuses(self, wheel: TimingWheel):
+        """Move the timed statuses onto a wheel (turns left don't change)"""
+        ends = self._status_ends
+        old = self._wheel
+        self._wheel = wheel
+        if not ends:
+            return
+        shift = wheel.now - (old.now if old is not None else 0)
+        for index in bit_indexes(self.status_mask):
+            if index < len(ends) and ends[index]:
+                ends[index] += shift
+                wheel.schedule(ends[index], self)
+
+    def _status_state(self) -> Any:
+        """(mask, end turns copy) for snapshots"""
+        return self.status_mask, tuple(self._status_ends) if self._status_ends else None
+
+    def _restore_status_state(self, state: Any):
+        """Put back a _status_state() (end turns are on the same wheel as when saved)"""
+        mask, ends = state
+        self.status_mask = mask
+        self._status_ends = list(ends) if ends else None
+        if ends and self._wheel is not None:
+            for index in bit_indexes(mask):
+                if index < len(ends) and ends[index]:
+                    self._wheel.schedule(ends[index], self)
@@ -0,0 +1,140 @@
+"""
+Timing wheel - end-of-turn expiry that only touches what's due
+
+Timed modifiers and statuses used to count their own turns down, so
+every turn Battle called tick_temporary_effects() on every fish in the
+party and every enemy, even when nothing was about to run out.
+
+Now a timed effect remembers the absolute turn it ends on, measured
+against one TimingWheel (wheel.now), and asks the wheel to wake it then:
+
+    wheel = TimingWheel()
+    fish.attach_wheel(wheel)
+    fish.apply_status_effect("frozen", 2)   # Ends on turn wheel.now + 2
+    wheel.advance()                         # Turn 1: nobody is woken
+    wheel.advance()                         # Turn 2: fish is woken and thaws
+
+The wheel is WHEEL_SIZE slots, one per upcoming turn (slot = turn %
+WHEEL_SIZE). advance() empties just the slot for the new turn, so a turn
+costs the same however many units are waiting. Turns further ahead go
+into an overflow dict and drop into their slot when they come round.
+
+A timer is anything with expire_due(wheel). It's woken on its earliest
+end turn and schedules its next one itself; a stale wake-up (the effect
+was removed, or replaced by a longer one) just finds nothing due.
+
+Each Battle has one wheel for the whole fight. Outside a battle a unit
+gets a small wheel of its own the first time something timed is applied
+to it, so unit.tick_temporary_effects() still means "one turn passes
+for this unit".
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+# Turns the wheel covers before using the overflow dict (longer than any
+# item, miracle or status duration in the game)
+WHEEL_SIZE = 16
+
+
+class TimingWheel:
+    """
+    The battle's turn counter, plus who needs waking on which turn.
+
+    Attributes:
+        now: Turns that have passed (absolute - effects end on now + turns)
+        owner: The battle or unit the wheel belongs to
+    """
+
+    __slots__ = ("now", "owner", "_slots", "_overflow")
+
+    def __init__(self, now: int = 0, owner: Any = None):
+        """
+        Args:
+            now: Starting turn
+            owner: Battle or unit the wheel belongs to (units use this to
+                   tell their own wheel from a battle's)
+        """
+        self.now = now
+        self.owner = owner
+        self._slots: Optional[List[Dict[int, Any]]] = None  # Made on first schedule()
+        self._overflow: Dict[int, Dict[int, Any]] = {}       # {turn: {id: timer}}
+
+    def schedule(self, turn: int, timer: Any):
+        """
+        Wake timer.expire_due(self) at the end of `turn`.
+
+        Scheduling the same timer for the same turn again does nothing.
+
+        Args:
+            turn: Absolute turn (a turn already past means the next one)
+            timer: Object with an expire_due(wheel) method
+        """
+        if turn <= self.now:
+            turn = self.now + 1
+        if turn - self.now > WHEEL_SIZE:
+            bucket = self._overflow.get(turn)
+            if bucket is None:
+                bucket = self._overflow[turn] = {}
+            bucket[id(timer)] = timer
+            return
+        if self._slots is None:
+            self._slots = [{} for _ in range(WHEEL_SIZE)]
+        self._slots[turn % WHEEL_SIZE][id(timer)] = timer
+
+    def advance(self) -> int:
+        """
+        One turn passes: wake the timers due this turn.
+
+        Returns:
+            How many timers were woken
+        """
+        now = self.now = self.now + 1
+        slots = self._slots
+        if slots is None:
+            if not self._overflow:
+                return 0
+            slots = self._slots = [{} for _ in range(WHEEL_SIZE)]
+        index = now % WHEEL_SIZE
+        due = slots[index]
+        # The slot now stands for the turn WHEEL_SIZE ahead
+        later = self._overflow.pop(now + WHEEL_SIZE, None) if self._overflow else None
+        if not due:
+            if later:
+                slots[index] = later
+            return 0
+        slots[index] = later or {}
+        for timer in due.values():
+            timer.expire_due(self)
+        return len(due)
+
+    def reset(self, now: int):
+        """Forget every scheduled wake-up and set the turn (Battle.restore() reschedules)"""
+        self.now = now
+        self._slots = None
+        self._overflow = {}
+
+    def entries(self) -> List[Tuple[int, Any]]:
+        """[(turn, timer), ...] still scheduled, soonest first (for tests and debugging)"""
+        found = [(turn, timer) for turn, bucket in self._overflow.items()
+                 for timer in bucket.values()]
+        if self._slots is not None:
+            for index, bucket in enumerate(self._slots):
+                turn = self.now + ((index - self.now) % WHEEL_SIZE or WHEEL_SIZE)
+                found.extend((turn, timer) for timer in bucket.values())
+        found.sort(key=lambda entry: entry[0])
+        return found
+
+    # Buckets are keyed by id(), which doesn't survive pickling - save
+    # (turn, timer) pairs and schedule them again on load
+    def __getstate__(self):
+        return self.now, self.owner, self.entries()
+
+    def __setstate__(self, state):
+        self.now, self.owner, entries = state
+        self._slots = None
+        self._overflow = {}
+        for turn, timer in entries:
+            self.schedule(turn, timer)
+
+    def __repr__(self) -> str:
+        return f"TimingWheel(now={self.now}, scheduled={len(self.entries())})"
@@ -0,0 +1,192 @@
+"""
+Turn order - who acts next, for any number of combatants
+
+Battle used to pick the order of a turn with one comparison (active
+fish SPD >= active enemy SPD, unless the moves' priorities differ), so it
+couldn't order more than two actors and never saw SPD buffs.
+
+TurnScheduler keeps the actors still to act this round in a heap keyed
+on:
+
+    1. move priority        Higher first (Quick Attack beats Tackle)
+    2. effective SPD        get_effective_stat("spd"): SPD buffs/debuffs
+                            and held items count
+    3. side                 PARTY_SIDE before ENEMY_SIDE (ties favor the
+                            player, as they always have)
+    4. order scheduled      First pushed first - so ties never depend on
+                            object ids or dict order
+
+    order = TurnScheduler()
+    order.extend([(fish, "attack", 0, PARTY_SIDE),
+                  (enemy, "attack", 0, ENEMY_SIDE)])
+    enemy.apply_stat_modifier("spd", 2.0, 3)
+    order.rekey(enemy)                  # Its place moves with its new SPD
+    turn = order.pop()                  # Turn(actor=enemy, action="attack", ...)
+
+A round of n actors is one heapify (O(n)), each turn taken is one pop
+(O(log n)), and a SPD change mid-round re-keys just that actor (its old
+entry is left in the heap, marked dead, and skipped when popped) - the
+roster is never sorted again. For a handful of actors a plain sort is
+cheaper (bench_turn_order.py: ~3x at 8 actors); the heap pays off from
+about a hundred actors.
+
+Apostle interjections have no SPD of their own: push them with
+speed=INTERJECTION_SPEED to act before every combatant of the same
+priority.
+"""
+
+from heapq import heapify, heappop, heappush
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence
+
+# Ties on priority and SPD: the party's side acts first
+PARTY_SIDE = 0
+ENEMY_SIDE = 1
+
+# Speed for actors that should act before anyone at their priority
+INTERJECTION_SPEED = float("inf")
+
+# Marks a heap entry replaced by rekey() / remove() (skipped by pop())
+_DEAD = object()
+
+# Heap entry: [-priority, -speed, side, order, actor, action, fixed speed?]
+# (order is unique, so comparisons never reach the actor)
+_ACTOR = 4
+
+
+class Turn(NamedTuple):
+    """One actor's place in the round"""
+    actor: Any
+    action: Any
+    priority: int
+    speed: float
+
+
+# Builds a Turn without NamedTuple's argument handling (pop() is per action)
+_new_turn = tuple.__new__
+
+
+def effective_speed(unit: Any) -> float:
+    """SPD after buffs/debuffs and held items (what turn order compares)"""
+    return unit.get_effective_stat("spd")
+
+
+class TurnScheduler:
+    """
+    The actors still to act this round, fastest first.
+
+    Each actor has at most one pending turn: pushing an actor that's
+    already waiting replaces its turn.
+    """
+
+    __slots__ = ("_heap", "_pending", "_order")
+
+    def __init__(self):
+        self._heap: List[list] = []
+        self._pending: Dict[int, list] = {}  # {id(actor): live heap entry}
+        self._order = 0     # Scheduling counter (last tie-break)
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def __contains__(self, actor: Any) -> bool:
+        return id(actor) in self._pending
+
+    def _entry(self, actor: Any, action: Any = None, priority: int = 0,
+               side: int = PARTY_SIDE, speed: Optional[float] = None) -> list:
+        pending = self._pending
+        key = id(actor)
+        if key in pending:
+            pending[key][_ACTOR] = _DEAD
+        order = self._order = self._order + 1
+        if speed is None:
+            entry = [-priority, -actor.get_effective_stat("spd"), side, order, actor, action, False]
+        else:
+            entry = [-priority, -speed, side, order, actor, action, True]
+        pending[key] = entry
+        return entry
+
+    def push(self, actor: Any, action: Any = None, priority: int = 0,
+             side: int = PARTY_SIDE, speed: Optional[float] = None):
+        """
+        Schedule an actor's turn this round.
+
+        Args:
+            actor: Fish, Enemy, or anything with get_effective_stat()
+                   (or any object at all, if speed is given)
+            action: What to do when it comes up (returned by pop())
+            priority: Move priority (higher acts first)
+            side: PARTY_SIDE or ENEMY_SIDE (breaks SPD ties)
+            speed: Fixed speed (default: the actor's effective SPD, kept
+                   up to date by rekey())
+        """
+        heappush(self._heap, self._entry(actor, action, priority, side, speed))
+
+    def extend(self, turns: Iterable[Sequence[Any]]):
+        """
+        Schedule many turns at once: (actor, action[, priority[, side[, speed]]]) each.
+
+        Into an empty scheduler (the start of a round) this is one
+        heapify rather than a push per actor.
+        """
+        entries = [self._entry(*turn) for turn in turns]
+        if self._heap:
+            for entry in entries:
+                heappush(self._heap, entry)
+        else:
+            self._heap = entries
+            heapify(entries)
+
+    def rekey(self, actor: Any) -> bool:
+        """
+        Move a waiting actor to where its current SPD puts it (after a
+        SPD buff or debuff lands mid-round).
+
+        Returns:
+            True if the actor was waiting (and uses its own SPD)
+        """
+        entry = self._pending.get(id(actor))
+        if entry is None or entry[6]:
+            return False
+        speed = effective_speed(actor)
+        if -entry[1] != speed:
+            entry[_ACTOR] = _DEAD
+            # Keeps its order number: a re-keyed actor still wins ties it won before
+            new = [entry[0], -speed, entry[2], entry[3], actor, entry[5], False]
+            self._pending[id(actor)] = new
+            heappush(self._heap, new)
+        return True
+
+    def remove(self, actor: Any) -> bool:
+        """
+        Cancel a waiting actor's turn (e.g. it was defeated first).
+
+        Returns:
+            True if it was waiting
+        """
+        entry = self._pending.pop(id(actor), None)
+        if entry is None:
+            return False
+        entry[_ACTOR] = _DEAD
+        return True
+
+    def pop(self) -> Optional[Turn]:
+        """
+        The next actor to act, taken off the schedule.
+
+        Returns:
+            Turn, or None when everyone has acted
+        """
+        heap = self._heap
+        while heap:
+            entry = heappop(heap)
+            actor = entry[_ACTOR]
+            if actor is not _DEAD:
+                del self._pending[id(actor)]
+                return _new_turn(Turn, (actor, entry[5], -entry[0], -entry[1]))
+        return None
+
+    def clear(self):
+        """Drop every waiting turn (a new round)"""
+        if self._heap:
+            self._heap = []
+            self._pending = {}
@@ -123,9 +123,11 @@ class PartyMenu(Menu):
 
         Args:
             player: Player instance
+            data_loader: Shared data context (default: get_data_loader())
         """
         super().__init__("PARTY MANAGEMENT")
         self.player = player
+        self.data_loader = data_loader or get_data_loader()
         self.rebuild_menu()
 
     def rebuild_menu(self):
@@ -224,16 +226,17 @@ class PartyMenu(Menu):
 class InventoryMenu(Menu):
     """Menu for managing inventory"""
 
-    def __init__(self, player):
+    def __init__(self, player, data_loader=None):
         """
         Initialize inventory menu
 
         Args:
             player: Player instance
+            data_loader: Shared data context (default: get_data_loader())
         """
         super().__init__("INVENTORY")
         self.player = player
-        self.data_loader = get_data_loader()
+        self.data_loader = data_loader or get_data_loader()
         self.rebuild_menu()
 
     def rebuild_menu(self):
@@ -250,8 +253,7 @@ class InventoryMenu(Menu):
                 item_name = item_data.get("name", item_id) if item_data else item_id
                 description = ""
                 if item_data:
-                    flavor = item_data.get("flavor_text", {})
-                    description = flavor.get("default", "")
+                    description = self.data_loader.text(item_data.get("flavor_text", ""))
                 item_text = f"{item_name} x{count}"
                 self.add_item(MenuItem(
                     item_text,
@@ -361,19 +363,20 @@ class InventoryMenu(Menu):
 class ShopMenu(Menu):
     """Menu for shop interactions"""
 
-    def __init__(self, player, shop_data: Dict[str, Any]):
+    def __init__(self, player, shop_data: Dict[str, Any], data_loader=None):
         """
         Initialize shop menu
 
         Args:
             player: Player instance
             shop_data: Shop configuration (items, prices, etc.)
+            data_loader: Shared data context (default: get_data_loader())
         """
         super().__init__(f"SHOP - {shop_data.get('name', 'General Store')}")
         self.player = player
         self.shop_data = shop_data
         self.mode = "buy"  # buy or sell
-        self.data_loader = get_data_loader()
+        self.data_loader = data_loader or get_data_loader()
         self.rebuild_menu()
 
     def rebuild_menu(self):
@@ -491,6 +494,8 @@ class MainMenu(Menu):
 
         Args:
             player: Player instance
+            game_state: GameState instance (quests, parables)
+            data_loader: Shared data context (default: get_data_loader())
         """
         super().__init__("MAIN MENU")
         self.player = player
@@ -499,13 +504,14 @@ class MainMenu(Menu):
 
         self.add_item(MenuItem(
             "Party",
-            action=lambda: self.open_submenu(PartyMenu(self.player)),
+            action=lambda: self.open_submenu(
+                PartyMenu(self.player, self.game_state, self.data_loader)),
             description="Manage your fish party"
         ))
 
         self.add_item(MenuItem(
             "Inventory",
-            action=lambda: self.open_submenu(InventoryMenu(self.player)),
+            action=lambda: self.open_submenu(InventoryMenu(self.player, self.data_loader)),
             description="View and use items"
         ))
 
@@ -655,7 +661,7 @@ class MainMenu(Menu):
 
     def save_game(self) -> MenuResult:
         """Save the game"""
-        save_system = get_save_system()
+        save_system = get_save_system(data_loader=self.data_loader)
         choice = input("Save slot (1-5): ").strip()
         try:
             slot = int(choice) if choice else 1
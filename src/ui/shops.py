@@ -27,7 +27,8 @@ class Shop:
                  shop_id: str,
                  name: str,
                  description: str,
-                 greeting: str):
+                 greeting: str,
+                 data_loader=None):
         """
         Initialize a shop
 
@@ -36,7 +37,9 @@ class Shop:
             name: Shop display name
             description: Shop description
             greeting: Shopkeeper greeting
+            data_loader: Shared data context (default: get_data_loader())
         """
+        self.data_loader = data_loader or get_data_loader()
         self.shop_id = shop_id
         self.name = name
         self.description = description
@@ -159,18 +162,20 @@ class Shop:
 class BakerShop(Shop):
     """Baker shop - sells bread items (healing and buffs)"""
 
-    def __init__(self, town: str = "General"):
+    def __init__(self, town: str = "General", data_loader=None):
         """
         Initialize baker shop
 
         Args:
             town: Town name (affects inventory)
+            data_loader: Shared data context (default: get_data_loader())
         """
         super().__init__(
             shop_id=f"baker_{town.lower()}",
             name=f"{town} Bakery",
             description="Fresh bread and baked goods",
-            greeting="Welcome to the bakery! May I offer you the bread of life?"
+            greeting="Welcome to the bakery! May I offer you the bread of life?",
+            data_loader=data_loader
         )
 
         # Stock basic items
@@ -289,18 +294,20 @@ class BakerShop(Shop):
 class FishmongerShop(Shop):
     """Fishmonger shop - buys fish and sells fishing supplies"""
 
-    def __init__(self, town: str = "General"):
+    def __init__(self, town: str = "General", data_loader=None):
         """
         Initialize fishmonger shop
 
         Args:
             town: Town name
+            data_loader: Shared data context (default: get_data_loader())
         """
         super().__init__(
             shop_id=f"fishmonger_{town.lower()}",
             name=f"{town} Fishmonger",
             description="Fresh fish and fishing supplies",
-            greeting="Welcome! Looking to catch or sell some fish?"
+            greeting="Welcome! Looking to catch or sell some fish?",
+            data_loader=data_loader
         )
 
         # Fishing supplies
@@ -431,8 +438,7 @@ class FishmongerShop(Shop):
         base_value = 50
         level_bonus = fish_level * 10
 
-        data_loader = get_data_loader()
-        fish_data = data_loader.get_fish_by_id(fish_id)
+        fish_data = self.data_loader.get_fish_by_id(fish_id)
         tier = fish_data.get("tier") if fish_data else 1
 
         rarity_multiplier = 1.0
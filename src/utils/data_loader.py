@@ -20,16 +20,182 @@ Benefits:
 - Modding-friendly (swap JSON files)
 - Dual-text system works seamlessly
 
+Fast cold start:
+    Run `python src/utils/data_snapshot.py` to compile all JSON files into
+    one pre-parsed snapshot. DataLoader uses it automatically while it's
+    fresh, and silently falls back to the JSON files when it's stale.
+
 Usage:
     loader = DataLoader()
     fish_data = loader.get_fish_by_id("holy_mackerel")
     print(fish_data["name"])  # "Holy Mackerel"
     print(fish_data["flavor_text"]["default"])  # Irreverent version
+
+    # One edition only: dual-text pairs come back as plain strings
+    loader = DataLoader(edition="christian_edition")
+    print(loader.get_fish_by_id("holy_mackerel")["flavor_text"])
 """
 
 import json
 import os
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, Iterable, List, Any, Optional, Tuple
+
+from .constants import MAX_LEVEL
+from .data_snapshot import load_snapshot
+from .lazy_text import load_lazy_json
+from .editions import EDITIONS, edition_text, resolve_edition
+
+
+# ============================================================================
+# RECORD INDEXES
+# ============================================================================
+#
+# Which collections get a hash index, per file.
+# Format: {filename: [(collection_key, field), ...]}
+#
+# When a file is first loaded, DataLoader builds one dict per entry:
+#   {record[field]: record}
+# so get_fish_by_id() etc. are a single dict lookup instead of a list scan.
+#
+# If two records share a key, the FIRST one wins (same as the old scan).
+#
+# ============================================================================
+
+INDEXED_COLLECTIONS: Dict[str, List[Tuple[str, str]]] = {
+    "fish.json": [("fish", "id")],
+    "apostles.json": [("apostles", "id")],
+    "items.json": [("bread_items", "id")],
+    "towns.json": [("towns", "id"), ("towns", "number")],
+    "enemies.json": [("enemies", "id")],
+    "bosses.json": [("bosses", "id")],
+    "quests.json": [("quests", "id")],
+    "parables.json": [("parables", "id")],
+}
+
+# Text-heavy files whose long strings stay on disk in lazy-text mode
+# (see lazy_text.py)
+LAZY_TEXT_FILES = ("parables.json", "quests.json")
+
+
+def _index_records(records: List[Dict[str, Any]], field: str) -> Dict[Any, Dict[str, Any]]:
+    """Build {record[field]: record}, keeping the first record for duplicate keys"""
+    index = {}
+    for record in records:
+        if field in record:
+            index.setdefault(record[field], record)
+    return index
+
+
+# ============================================================================
+# SECONDARY INDEXES (GROUPS)
+# ============================================================================
+#
+# A hash index finds ONE record by a unique field (id). A group finds
+# ALL records sharing a value - "every enemy in Galilee", "every tier 2
+# fish" - without scanning the whole list.
+#
+# Format: {filename: [(collection_key, group_name), ...]}
+#
+# By default a group is keyed by the record field of the same name.
+# GROUP_KEY_FUNCTIONS overrides that for computed keys; a key function
+# returns every key a record belongs under (so one enemy with
+# level_range [1, 10] is listed under levels 1 through 10).
+#
+# Each group value is a TUPLE in file order, built once when the file
+# is loaded. Tuples can't be modified, so it's safe to hand the same one
+# to every caller.
+#
+# ============================================================================
+
+def _field_keys(field: str) -> Callable[[Dict[str, Any]], Iterable[Any]]:
+    """Key function: the record's value for one field (if it has one)"""
+    def keys(record: Dict[str, Any]) -> Iterable[Any]:
+        return (record[field],) if field in record else ()
+    return keys
+
+
+def _level_range_keys(record: Dict[str, Any]) -> Iterable[int]:
+    """Key function: every level in an enemy's level_range (inclusive)"""
+    level_range = record.get("level_range")
+    if not level_range:
+        return ()
+    return range(level_range[0], level_range[-1] + 1)
+
+
+def _unlocked_level_keys(record: Dict[str, Any]) -> Iterable[int]:
+    """Key function: every level at which a quest's level_requirement is met"""
+    return range(max(record.get("level_requirement", 1), 1), MAX_LEVEL + 1)
+
+
+def _location_region_keys(record: Dict[str, Any]) -> Iterable[str]:
+    """Key function: region part of a location (e.g., Galilee - Farm Field)"""
+    location = record.get("location")
+    return (location.split(" - ", 1)[0],) if location else ()
+
+
+GROUPED_COLLECTIONS: Dict[str, List[Tuple[str, str]]] = {
+    "enemies.json": [("enemies", "region"), ("enemies", "type"), ("enemies", "level")],
+    "fish.json": [("fish", "tier"), ("fish", "type")],
+    "quests.json": [("quests", "region"), ("quests", "level_requirement"),
+                    ("quests", "unlocked_at")],
+    "parables.json": [("parables", "location"), ("parables", "region")],
+}
+
+# Groups that aren't keyed by a plain field: {(filename, group_name): key_function}
+GROUP_KEY_FUNCTIONS: Dict[Tuple[str, str], Callable[[Dict[str, Any]], Iterable[Any]]] = {
+    ("enemies.json", "level"): _level_range_keys,
+    ("quests.json", "unlocked_at"): _unlocked_level_keys,
+    ("parables.json", "region"): _location_region_keys,
+}
+
+
+def _group_records(records: List[Dict[str, Any]],
+                   key_function: Callable[[Dict[str, Any]], Iterable[Any]]
+                   ) -> Dict[Any, Tuple[Dict[str, Any], ...]]:
+    """Build {key: (record, ...)} in file order"""
+    groups: Dict[Any, List[Dict[str, Any]]] = {}
+    for record in records:
+        for key in key_function(record):
+            groups.setdefault(key, []).append(record)
+    return {key: tuple(members) for key, members in groups.items()}
+
+
+class _DataStore:
+    """
+    Process-wide storage behind every DataLoader for one data directory.
+
+    All DataLoader instances pointing at the same folder share ONE store,
+    so each JSON file is parsed at most once per process no matter how
+    many loaders get created (until clear_cache() is called).
+    """
+
+    def __init__(self):
+        self.cache: Dict[str, Any] = {}       # {filename: json_data}
+        self.indexes: Dict[Tuple[str, str, str], Dict[Any, Any]] = {}
+        self.groups: Dict[Tuple[str, str, str], Dict[Any, Tuple]] = {}
+        self.disk_reads = 0                   # Files actually read from disk
+        self.snapshot_checked = False         # Tried the snapshot yet?
+        self.snapshot_loaded = False          # Did the snapshot fill the cache?
+        self.clear_hooks: List[Callable[[], None]] = []  # Run by clear_cache()
+
+
+# One store per data directory and mode:
+# {(absolute_path, lazy_text, edition): _DataStore}
+# edition=None holds the raw dual-text data; an edition store holds only
+# resolved copies (the raw data is dropped after resolving).
+_stores: Dict[Tuple[str, bool, Optional[str]], _DataStore] = {}
+
+
+def _get_store(data_path: str, lazy_text: bool = False,
+               edition: Optional[str] = None) -> _DataStore:
+    """Get (or create) the shared store for a data directory"""
+    key = (os.path.abspath(data_path), lazy_text, edition)
+    store = _stores.get(key)
+    if store is None:
+        store = _DataStore()
+        _stores[key] = store
+    return store
+
 
 class DataLoader:
     """
@@ -42,9 +208,14 @@ class DataLoader:
 
     The caching system means files are read once when first accessed,
     then served from memory for all subsequent requests.
+
+    The cache is shared by every DataLoader for the same data directory,
+    and disk_reads counts how many files were actually read, so tests can
+    assert that gameplay does no file I/O once data is warmed up.
     """
 
-    def __init__(self, data_path: str = "src/data/"):
+    def __init__(self, data_path: str = "src/data/", use_snapshot: bool = True,
+                 lazy_text: bool = False, edition: Optional[str] = None):
         """
         Initialize the DataLoader.
 
@@ -52,10 +223,41 @@ class DataLoader:
             data_path: Path to the directory containing JSON data files.
                       Defaults to "src/data/" which works from project root.
                       Use different path for tests or modded content.
+            use_snapshot: Load everything from data.snapshot in one read
+                      when it's fresh (see data_snapshot.py). Default True.
+            lazy_text: Keep long strings in LAZY_TEXT_FILES on disk until
+                      they're read (see lazy_text.py). Default False.
+            edition: "default" or "christian_edition" to get records with
+                      every dual-text pair collapsed to that edition's
+                      string (see editions.py). Default None keeps both.
+
+        Raises:
+            ValueError: If edition isn't one of EDITIONS
         """
+        if edition is not None and edition not in EDITIONS:
+            raise ValueError(f"Unknown edition {edition!r} (expected one of {EDITIONS})")
+
         self.data_path = data_path
-        self._cache = {}  # Dictionary to store loaded JSON data
-                         # Format: {filename: json_data}
+        self.use_snapshot = use_snapshot
+        self.lazy_text = lazy_text
+        self.edition = edition
+        self._store = _get_store(data_path, lazy_text, edition)  # Shared with other loaders on this path
+        self._cache = self._store.cache      # Dictionary to store loaded JSON data
+                                             # Format: {filename: json_data}
+        self._indexes = self._store.indexes  # Hash indexes built from cached data
+                                             # Format: {(filename, collection, field): {value: record}}
+        self._groups = self._store.groups    # Secondary indexes (see GROUPED_COLLECTIONS)
+                                             # Format: {(filename, collection, group): {key: (record, ...)}}
+
+    @property
+    def disk_reads(self) -> int:
+        """Number of files (JSON or snapshot) read from disk for this data directory"""
+        return self._store.disk_reads
+
+    @property
+    def snapshot_loaded(self) -> bool:
+        """True if the cached data came from a fresh snapshot"""
+        return self._store.snapshot_loaded
 
     def load_json(self, filename: str) -> Dict[str, Any]:
         """
@@ -87,15 +289,26 @@ class DataLoader:
         if filename in self._cache:
             return self._cache[filename]
 
+        # First miss: try to fill the whole cache from the snapshot (one read)
+        if self.use_snapshot and not self._store.snapshot_checked:
+            self._load_snapshot()
+            if filename in self._cache:
+                return self._cache[filename]
+
         # File not in cache - need to load from disk
         filepath = os.path.join(self.data_path, filename)
 
         try:
-            # Open file with UTF-8 encoding (supports dual-text with special characters)
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)  # Parse JSON into Python dictionary
-                self._cache[filename] = data  # Store in cache for future requests
-                return data
+            if self.lazy_text and filename in LAZY_TEXT_FILES:
+                # Structure now, long text from the mapped file on demand
+                data = load_lazy_json(filepath)
+                self._store.disk_reads += 1
+            else:
+                # Open file with UTF-8 encoding (supports dual-text with special characters)
+                with open(filepath, 'r', encoding='utf-8') as f:
+                    self._store.disk_reads += 1
+                    data = json.load(f)  # Parse JSON into Python dictionary
+            return self._add_to_cache(filename, data)
 
         except FileNotFoundError:
             # File doesn't exist - probably misnamed or missing
@@ -109,17 +322,165 @@ class DataLoader:
             print(f"Check for missing commas, brackets, or quotes")
             return {}  # Return empty dict so game doesn't crash
 
+    def _load_snapshot(self):
+        """
+        Fill the cache from data.snapshot if it's fresh (internal helper).
+
+        Only tried once per data directory (until clear_cache()).
+        A stale or missing snapshot is not an error - load_json() just
+        falls back to reading the JSON files one by one.
+        """
+        self._store.snapshot_checked = True
+        files = load_snapshot(self.data_path)
+        if files is None:
+            return
+
+        self._store.disk_reads += 1
+        self._store.snapshot_loaded = True
+        for filename, data in files.items():
+            if self.lazy_text and filename in LAZY_TEXT_FILES:
+                continue  # Loaded lazily from the JSON file instead
+            if filename not in self._cache:
+                self._add_to_cache(filename, data)
+
+    def _add_to_cache(self, filename: str, data: Any) -> Any:
+        """
+        Cache freshly read data and index it (internal helper).
+
+        Edition loaders resolve dual-text pairs here, once per file, and
+        keep only the resolved copy.
+
+        Returns:
+            The data as it will be served from the cache
+        """
+        if self.edition is not None:
+            data = resolve_edition(data, self.edition)
+        self._cache[filename] = data  # Store in cache for future requests
+        self._build_indexes(filename, data)  # One pass, then O(1) lookups
+        return data
+
+    def preload_all(self):
+        """
+        Load every JSON file in the data directory.
+
+        Called at startup so no scene has to wait on disk later.
+        With a fresh snapshot this is a single file read.
+        """
+        try:
+            filenames = sorted(f for f in os.listdir(self.data_path) if f.endswith(".json"))
+        except OSError as e:
+            print(f"Error: Cannot read data directory {self.data_path}: {e}")
+            return
+        for filename in filenames:
+            self.load_json(filename)
+
+    def _build_indexes(self, filename: str, data: Dict[str, Any]):
+        """
+        Build the hash indexes for a freshly loaded file (internal helper).
+
+        Called once per file by load_json(). Uses INDEXED_COLLECTIONS and
+        GROUPED_COLLECTIONS to decide which collections and fields to index.
+
+        Args:
+            filename: Name of the JSON file that was just loaded
+            data: The parsed JSON data
+        """
+        for collection, field in INDEXED_COLLECTIONS.get(filename, []):
+            self._indexes[(filename, collection, field)] = _index_records(
+                data.get(collection, []), field)
+        for collection, group in GROUPED_COLLECTIONS.get(filename, []):
+            key_function = GROUP_KEY_FUNCTIONS.get((filename, group)) or _field_keys(group)
+            self._groups[(filename, collection, group)] = _group_records(
+                data.get(collection, []), key_function)
+
+    def get_index(self, filename: str, collection: str, field: str) -> Dict[Any, Dict[str, Any]]:
+        """
+        Get the hash index for one collection field.
+
+        Loads the file if needed. Files not listed in INDEXED_COLLECTIONS
+        are indexed on first request.
+
+        Args:
+            filename: JSON file (e.g., "fish.json")
+            collection: Top-level list key (e.g., "fish")
+            field: Record field to index by (e.g., "id")
+
+        Returns:
+            Dictionary mapping field value → record (do not modify)
+
+        Example:
+            fish_by_id = loader.get_index("fish.json", "fish", "id")
+            fish_by_id["holy_mackerel"]["name"]  # "Holy Mackerel"
+        """
+        key = (filename, collection, field)
+        index = self._indexes.get(key)
+        if index is None:
+            data = self.load_json(filename)
+            index = self._indexes.get(key)
+            if index is None:
+                # Not a registered index - build it on demand
+                index = _index_records(data.get(collection, []), field)
+                self._indexes[key] = index
+        return index
+
+    def get_record(self, filename: str, collection: str, field: str,
+                   value: Any) -> Optional[Dict[str, Any]]:
+        """
+        Get one record by an indexed field (O(1) dict lookup).
+
+        Args:
+            filename: JSON file (e.g., "towns.json")
+            collection: Top-level list key (e.g., "towns")
+            field: Field to match (e.g., "number")
+            value: Value to look up (e.g., 3)
+
+        Returns:
+            The matching record, or None if not found
+        """
+        return self.get_index(filename, collection, field).get(value)
+
+    def get_group(self, filename: str, collection: str, group: str,
+                  key: Any) -> Tuple[Dict[str, Any], ...]:
+        """
+        Get every record in a collection that shares one key.
+
+        Uses the prebuilt secondary indexes (see GROUPED_COLLECTIONS).
+        A group that isn't registered is treated as a plain field and
+        built on first request.
+
+        Args:
+            filename: JSON file (e.g., "enemies.json")
+            collection: Top-level list key (e.g., "enemies")
+            group: Group name - usually a field (e.g., "region")
+            key: Value to look up (e.g., "Galilee")
+
+        Returns:
+            Tuple of matching records in file order (empty if none).
+            The same cached tuple is returned on every call.
+
+        Example:
+            galilee = loader.get_group("enemies.json", "enemies", "region", "Galilee")
+            [e["id"] for e in galilee]
+        """
+        index_key = (filename, collection, group)
+        groups = self._groups.get(index_key)
+        if groups is None:
+            data = self.load_json(filename)
+            groups = self._groups.get(index_key)
+            if groups is None:
+                # Not a registered group - build it on demand
+                key_function = GROUP_KEY_FUNCTIONS.get((filename, group)) or _field_keys(group)
+                groups = _group_records(data.get(collection, []), key_function)
+                self._groups[index_key] = groups
+        return groups.get(key, ())
+
     def get_fish_data(self) -> Dict[str, Any]:
         """Load all fish data"""
         return self.load_json("fish.json")
 
     def get_fish_by_id(self, fish_id: str) -> Optional[Dict[str, Any]]:
         """Get a specific fish by ID"""
-        fish_data = self.get_fish_data()
-        for fish in fish_data.get("fish", []):
-            if fish["id"] == fish_id:
-                return fish
-        return None
+        return self.get_record("fish.json", "fish", "id", fish_id)
 
     def get_all_fish(self) -> List[Dict[str, Any]]:
         """Get list of all fish"""
@@ -132,11 +493,7 @@ class DataLoader:
 
     def get_apostle_by_id(self, apostle_id: str) -> Optional[Dict[str, Any]]:
         """Get a specific apostle by ID"""
-        apostles_data = self.get_apostles_data()
-        for apostle in apostles_data.get("apostles", []):
-            if apostle["id"] == apostle_id:
-                return apostle
-        return None
+        return self.get_record("apostles.json", "apostles", "id", apostle_id)
 
     def get_all_apostles(self) -> List[Dict[str, Any]]:
         """Get list of all apostles"""
@@ -154,11 +511,7 @@ class DataLoader:
 
     def get_item_by_id(self, item_id: str) -> Optional[Dict[str, Any]]:
         """Get a specific bread item by ID"""
-        items = self.get_bread_items()
-        for item in items:
-            if item["id"] == item_id:
-                return item
-        return None
+        return self.get_record("items.json", "bread_items", "id", item_id)
 
     def get_equipment(self) -> Dict[str, List[Dict[str, Any]]]:
         """Get all equipment (robes, accessories, fish items)"""
@@ -171,27 +524,74 @@ class DataLoader:
 
     def get_town_by_id(self, town_id: str) -> Optional[Dict[str, Any]]:
         """Get a specific town by ID"""
-        towns_data = self.get_towns_data()
-        for town in towns_data.get("towns", []):
-            if town["id"] == town_id:
-                return town
-        return None
+        return self.get_record("towns.json", "towns", "id", town_id)
 
     def get_town_by_number(self, town_number: int) -> Optional[Dict[str, Any]]:
         """Get a town by its number (1-13)"""
-        towns_data = self.get_towns_data()
-        for town in towns_data.get("towns", []):
-            if town["number"] == town_number:
-                return town
-        return None
+        return self.get_record("towns.json", "towns", "number", town_number)
 
     def get_all_towns(self) -> List[Dict[str, Any]]:
         """Get list of all towns"""
         towns_data = self.get_towns_data()
         return towns_data.get("towns", [])
 
+    def get_enemies_by_region(self, region: str) -> Tuple[Dict[str, Any], ...]:
+        """Get every enemy that appears in a region (e.g., "Galilee")"""
+        return self.get_group("enemies.json", "enemies", "region", region)
+
+    def get_enemies_by_type(self, enemy_type: str) -> Tuple[Dict[str, Any], ...]:
+        """Get every enemy of one type (e.g., "Dark")"""
+        return self.get_group("enemies.json", "enemies", "type", enemy_type)
+
+    def get_enemies_for_level(self, level: int) -> Tuple[Dict[str, Any], ...]:
+        """Get every enemy whose level_range includes this level"""
+        return self.get_group("enemies.json", "enemies", "level", level)
+
+    def get_fish_by_tier(self, tier: Any) -> Tuple[Dict[str, Any], ...]:
+        """Get every fish of one tier (0-3, or "special" / "post_game")"""
+        return self.get_group("fish.json", "fish", "tier", tier)
+
+    def get_fish_by_type(self, fish_type: str) -> Tuple[Dict[str, Any], ...]:
+        """Get every fish of one type (e.g., "Water")"""
+        return self.get_group("fish.json", "fish", "type", fish_type)
+
+    def get_quests_by_region(self, region: str) -> Tuple[Dict[str, Any], ...]:
+        """Get every quest in a region"""
+        return self.get_group("quests.json", "quests", "region", region)
+
+    def get_quests_by_level_requirement(self, level: int) -> Tuple[Dict[str, Any], ...]:
+        """Get quests whose level_requirement is exactly this level"""
+        return self.get_group("quests.json", "quests", "level_requirement", level)
+
+    def get_quests_unlocked_at(self, level: int) -> Tuple[Dict[str, Any], ...]:
+        """
+        Get every quest a player of this level can take (for quest boards).
+
+        Args:
+            level: Player level (clamped to 1..MAX_LEVEL)
+
+        Returns:
+            Quests with level_requirement <= level, in file order
+        """
+        level = min(max(level, 1), MAX_LEVEL)
+        return self.get_group("quests.json", "quests", "unlocked_at", level)
+
+    def get_parables_by_location(self, location: str) -> Tuple[Dict[str, Any], ...]:
+        """Get parables found at one location (e.g., "Galilee - Farm Field")"""
+        return self.get_group("parables.json", "parables", "location", location)
+
+    def get_parables_by_region(self, region: str) -> Tuple[Dict[str, Any], ...]:
+        """Get parables found anywhere in a region (e.g., "Galilee")"""
+        return self.get_group("parables.json", "parables", "region", region)
+
     def get_type_effectiveness(self, attacker_type: str, defender_type: str) -> float:
-        """Get type effectiveness multiplier"""
+        """
+        Get type effectiveness multiplier from fish.json's "type_chart".
+
+        Battles read the compiled copy of constants.TYPE_CHART instead
+        (engine/elements.py); elements.check_data_type_chart() makes sure
+        the two agree.
+        """
         fish_data = self.get_fish_data()
         type_chart = fish_data.get("type_chart", {})
 
@@ -202,6 +602,35 @@ class DataLoader:
     def clear_cache(self):
         """Clear the data cache (useful for reloading during development)"""
         self._cache.clear()
+        self._indexes.clear()
+        self._groups.clear()
+        self._store.snapshot_checked = False  # Re-check freshness on next load
+        self._store.snapshot_loaded = False
+        for hook in self._store.clear_hooks:
+            hook()
+
+    def on_clear_cache(self, hook: Callable[[], None]):
+        """
+        Run hook() whenever clear_cache() (or reload_data()) is called on
+        this data directory - for caches built from the data elsewhere,
+        e.g. the shared EnemyFactory's compiled templates.
+        """
+        self._store.clear_hooks.append(hook)
+
+    def text(self, value: Any) -> Any:
+        """
+        Get display text from a dual-text field.
+
+        Edition loaders already return plain strings; other loaders get
+        the "default" variant.
+
+        Args:
+            value: A field like fish["flavor_text"]
+
+        Returns:
+            The string for this loader's edition
+        """
+        return edition_text(value, self.edition or EDITIONS[0])
 
     def reload_data(self):
         """Reload all data from files"""
@@ -229,9 +658,16 @@ _data_loader = None
 #
 # Instead: ONE DataLoader, ONE cache, shared by all.
 #
+# Engine and UI classes (Battle, GameState, shops, menus, SaveSystem)
+# take an optional data_loader argument and fall back to this singleton,
+# so tests and tools can inject their own data context.
+# Even a stray DataLoader() shares the per-directory cache (_DataStore),
+# so a file is never parsed twice in one process.
+#
 # Usage:
 #   loader = get_data_loader()  # Always returns the same instance
 #   fish = loader.get_fish_by_id("holy_mackerel")
+#   battle = Battle(player, enemies, data_loader=loader)
 #
 # ============================================================================
 
@@ -0,0 +1,181 @@
+"""
+Data snapshot - precompiled bundle of every JSON file in src/data/
+
+Parsing eleven JSON files (~300 KB) is most of the game's cold start.
+A snapshot is all of that data, already parsed, pickled into ONE file.
+DataLoader reads it in a single disk read when it's fresh, and falls
+back to the JSON files when it's stale or missing.
+
+FRESHNESS:
+The snapshot stores a SHA-256 content hash of the source JSON files,
+plus each file's size and modification time.
+1. Same file list + same size/mtime → fresh (no source files read)
+2. Size/mtime changed → hash the sources; same hash → still fresh
+3. Anything else (new file, edited file, old format) → stale
+
+Edit a JSON file and the snapshot is ignored until you rebuild it,
+so modding never serves old data.
+
+BUILD STEP:
+    python src/utils/data_snapshot.py            # builds src/data/data.snapshot
+    python src/utils/data_snapshot.py my/data/   # builds for another folder
+
+Note:
+    The snapshot is a pickle - only load snapshots you built yourself.
+    It's a build artifact and is not committed to git.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import sys
+from typing import Dict, Any, Optional, List, Tuple
+
+SNAPSHOT_FILENAME = "data.snapshot"
+
+# Bump this when the snapshot layout changes - old snapshots become stale
+SNAPSHOT_FORMAT = 1
+
+
+def list_source_files(data_path: str) -> List[str]:
+    """Get the sorted list of JSON files in a data folder"""
+    return sorted(name for name in os.listdir(data_path) if name.endswith(".json"))
+
+
+def _source_manifest(data_path: str, filenames: List[str]) -> Dict[str, Tuple[int, int]]:
+    """Get {filename: (size, mtime_ns)} for the source files"""
+    manifest = {}
+    for name in filenames:
+        stat = os.stat(os.path.join(data_path, name))
+        manifest[name] = (stat.st_size, stat.st_mtime_ns)
+    return manifest
+
+
+def compute_source_hash(data_path: str, filenames: Optional[List[str]] = None) -> str:
+    """
+    Hash the contents of every JSON file in the data folder.
+
+    File names are part of the hash, so renaming a file changes it too.
+
+    Args:
+        data_path: Folder containing the JSON files
+        filenames: Files to hash (default: every .json in the folder)
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    if filenames is None:
+        filenames = list_source_files(data_path)
+
+    digest = hashlib.sha256()
+    for name in filenames:
+        digest.update(name.encode("utf-8") + b"\0")
+        with open(os.path.join(data_path, name), "rb") as f:
+            digest.update(f.read())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def build_snapshot(data_path: str, snapshot_path: Optional[str] = None) -> str:
+    """
+    Compile every JSON file in a data folder into one snapshot file.
+
+    Args:
+        data_path: Folder containing the JSON files
+        snapshot_path: Output file (default: data_path/data.snapshot)
+
+    Returns:
+        Path of the written snapshot
+
+    Raises:
+        json.JSONDecodeError: If a source file has invalid JSON
+            (a snapshot is never built from broken data)
+    """
+    if snapshot_path is None:
+        snapshot_path = os.path.join(data_path, SNAPSHOT_FILENAME)
+
+    filenames = list_source_files(data_path)
+    files = {}
+    for name in filenames:
+        with open(os.path.join(data_path, name), "r", encoding="utf-8") as f:
+            files[name] = json.load(f)
+
+    bundle = {
+        "format": SNAPSHOT_FORMAT,
+        "source_hash": compute_source_hash(data_path, filenames),
+        "manifest": _source_manifest(data_path, filenames),
+        "files": files,
+    }
+
+    # Write to a temp file first so a crash never leaves a half-written snapshot
+    temp_path = snapshot_path + ".tmp"
+    with open(temp_path, "wb") as f:
+        pickle.dump(bundle, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temp_path, snapshot_path)
+
+    return snapshot_path
+
+
+def load_snapshot(data_path: str, snapshot_path: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """
+    Load a snapshot if it's fresh.
+
+    Args:
+        data_path: Folder containing the JSON source files
+        snapshot_path: Snapshot file (default: data_path/data.snapshot)
+
+    Returns:
+        {filename: parsed_json} for every source file, or None if the
+        snapshot is missing, unreadable or stale (caller uses JSON instead)
+    """
+    if snapshot_path is None:
+        snapshot_path = os.path.join(data_path, SNAPSHOT_FILENAME)
+
+    try:
+        with open(snapshot_path, "rb") as f:
+            bundle = pickle.load(f)  # The single read
+    except Exception:
+        # Unpickling can fail almost any way (truncated file, a class or
+        # module that has since moved, ...) - all mean "use the JSON"
+        return None
+
+    if not isinstance(bundle, dict) or bundle.get("format") != SNAPSHOT_FORMAT:
+        return None
+
+    try:
+        filenames = list_source_files(data_path)
+        if filenames != sorted(bundle["files"]):
+            return None  # A JSON file was added or removed
+
+        # Fast path: nothing touched since the build
+        if _source_manifest(data_path, filenames) == bundle["manifest"]:
+            return bundle["files"]
+
+        # Files were touched (e.g. git checkout) - compare actual contents
+        if compute_source_hash(data_path, filenames) == bundle["source_hash"]:
+            return bundle["files"]
+    except (OSError, KeyError):
+        return None
+
+    return None
+
+
+def main(argv: List[str]) -> int:
+    """Build step entry point"""
+    data_path = argv[1] if len(argv) > 1 else os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "..", "data")
+
+    try:
+        path = build_snapshot(data_path)
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"Error: Could not build data snapshot: {e}")
+        return 1
+
+    print(f"Data snapshot written: {os.path.normpath(path)} "
+          f"({len(list_source_files(data_path))} files, {os.path.getsize(path):,} bytes)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,92 @@
+"""
+Editions - collapse dual-text fields to the edition being played
+
+Every piece of user-facing text in the data files is a dual-text pair:
+
+    "flavor_text": {
+        "default": "Irreverent, funny version",
+        "christian_edition": "Reverent, educational version"
+    }
+
+A session only ever shows ONE edition. resolve_edition() copies a loaded
+JSON structure with every pair replaced by the chosen string:
+
+    "flavor_text": "Irreverent, funny version"
+
+so the other variant isn't kept in memory, and game code reads
+record["flavor_text"] directly instead of picking a variant every time.
+
+DataLoader(edition=...) does this once per file and caches the result
+(see data_loader.py), so you rarely need to call this yourself.
+"""
+
+from typing import Any
+
+from .lazy_text import LazyDict, _TextRef, resolve_items
+
+# Edition keys used in the dual-text pairs
+DEFAULT_EDITION = "default"
+CHRISTIAN_EDITION = "christian_edition"
+EDITIONS = (DEFAULT_EDITION, CHRISTIAN_EDITION)
+
+_DUAL_TEXT_KEYS = frozenset(EDITIONS)
+
+
+def is_dual_text(value: Any) -> bool:
+    """True if value is a {"default": ..., "christian_edition": ...} pair"""
+    return isinstance(value, dict) and value.keys() == _DUAL_TEXT_KEYS
+
+
+def resolve_edition(value: Any, edition: str = DEFAULT_EDITION) -> Any:
+    """
+    Copy JSON data with every dual-text pair collapsed to one edition.
+
+    Lazy-text data (see lazy_text.py) stays lazy: the chosen variant is
+    still read from disk on first access, and the other one never is.
+
+    Args:
+        value: Parsed JSON data (dict, list or plain value)
+        edition: "default" or "christian_edition"
+
+    Returns:
+        A new structure; the input is not modified
+
+    Example:
+        resolve_edition({"name": "Carp Diem",
+                         "flavor_text": {"default": "Seize the fish!",
+                                         "christian_edition": "A humble carp."}},
+                        "christian_edition")
+        # {"name": "Carp Diem", "flavor_text": "A humble carp."}
+    """
+    if isinstance(value, dict):
+        if is_dual_text(value):
+            # dict.__getitem__ keeps a lazy variant as a reference
+            return dict.__getitem__(value, edition)
+
+        resolved = {key: resolve_edition(item, edition) for key, item in dict.items(value)}
+        if any(type(item) is _TextRef for item in resolved.values()):
+            return LazyDict(resolved)
+        return resolved
+
+    if isinstance(value, list):
+        return resolve_items([resolve_edition(item, edition) for item in value])
+
+    return value
+
+
+def edition_text(value: Any, edition: str = DEFAULT_EDITION) -> Any:
+    """
+    Get the text for one edition from a field that may or may not be resolved.
+
+    Handy for code that accepts records from any DataLoader.
+
+    Args:
+        value: A dual-text pair, or an already-resolved string
+        edition: Edition to pick from a pair
+
+    Returns:
+        The edition's string (or value unchanged if it isn't a pair)
+    """
+    if is_dual_text(value):
+        return value[edition]
+    return value
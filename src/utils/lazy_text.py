@@ -0,0 +1,196 @@
+"""
+Lazy text - keep long strings on disk until they're actually read
+
+parables.json and quests.json are mostly prose: every parable has a
+full_text, every quest has start/complete dialogue in both editions.
+A session only ever shows a few of them, yet a normal json.load() keeps
+all of it in memory for the whole game.
+
+In lazy-text mode (DataLoader(lazy_text=True)):
+1. The JSON file is parsed once; short strings, numbers, lists and
+   dicts are loaded as usual (the "structural" fields)
+2. Long strings are NOT kept - only their byte offsets in the file
+3. The file stays memory-mapped; reading a field decodes just that
+   slice, then keeps the result (later reads are plain dict lookups)
+
+Records with lazy fields are LazyDict objects. They behave like normal
+dicts for reading (d["full_text"], d.get(), items(), ==, json.dumps),
+so game code doesn't need to know. Long strings inside lists are read
+straight away (see resolve_items()).
+
+Example:
+    loader = DataLoader(lazy_text=True)
+    parable = loader.get_record("parables.json", "parables", "id", "sower")
+    parable["name"]       # Loaded eagerly
+    parable["full_text"]  # Read from the mapped file on first access
+"""
+
+import json
+import json.decoder
+import json.scanner
+import mmap
+from typing import Any, Dict, List, Tuple
+
+# Strings at least this long are left on disk until first access
+LAZY_TEXT_MIN_LENGTH = 80
+
+
+class _TextSource:
+    """A memory-mapped JSON file that lazy strings are read from"""
+
+    def __init__(self, filepath: str):
+        self.filepath = filepath
+        with open(filepath, "rb") as f:
+            # The mapping stays valid after the file object is closed
+            self.mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def read(self, start: int, end: int) -> str:
+        """Decode the JSON string literal at bytes [start, end)"""
+        return json.loads(self.mapped[start:end].decode("utf-8"))
+
+
+class _TextRef:
+    """Where a lazy string lives: byte offsets of its JSON literal (with quotes)"""
+
+    __slots__ = ("source", "start", "end")
+
+    def __init__(self, source: _TextSource, start: int, end: int):
+        self.source = source
+        self.start = start
+        self.end = end
+
+    def resolve(self) -> str:
+        return self.source.read(self.start, self.end)
+
+
+class LazyDict(dict):
+    """
+    A dict whose long string values are read from disk on first access.
+
+    Reading methods resolve lazy values; after the first read, the real
+    string replaces the reference, so it's a normal dict lookup from then on.
+    """
+
+    def __getitem__(self, key):
+        value = dict.__getitem__(self, key)
+        if type(value) is _TextRef:
+            value = value.resolve()
+            dict.__setitem__(self, key, value)
+        return value
+
+    def get(self, key, default=None):
+        if key in self:
+            return self[key]
+        return default
+
+    def __iter__(self):
+        # Overriding __iter__ also stops dict(d) / {**d} from copying the
+        # raw references - CPython then goes through keys() and d[key]
+        return dict.__iter__(self)
+
+    def items(self):
+        return [(key, self[key]) for key in self]
+
+    def values(self):
+        return [self[key] for key in self]
+
+    def copy(self) -> Dict[str, Any]:
+        return dict(self.items())
+
+    def __eq__(self, other):
+        return dict(self.items()) == other
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"LazyDict({dict(self.items())!r})"
+
+
+def resolve_items(items: List[Any]) -> List[Any]:
+    """
+    A list with any lazy strings in it read right away.
+
+    Lists stay plain lists: json.dumps(), str.join(), `in` and slicing
+    go through the C list API, which would see the raw references of a
+    lazy list subclass. (Long strings in lists are rare - the prose
+    lives in dict fields - so reading them eagerly costs little.)
+    """
+    return [item.resolve() if type(item) is _TextRef else item for item in items]
+
+
+def load_lazy_json(filepath: str, min_length: int = LAZY_TEXT_MIN_LENGTH) -> Any:
+    """
+    Parse a JSON file, leaving long strings on disk.
+
+    Uses the pure-Python JSON scanner so each string's position in the
+    file is known. Short strings are decoded normally; long ones become
+    offsets into a memory-mapped copy of the file.
+
+    Args:
+        filepath: JSON file to load
+        min_length: Strings with at least this many characters stay lazy
+
+    Returns:
+        Parsed data; dicts holding lazy strings are LazyDict
+
+    Raises:
+        OSError: If the file can't be read or mapped
+        json.JSONDecodeError: If the file has invalid JSON
+    """
+    # newline="" keeps \r\n intact so character offsets match the file
+    with open(filepath, "r", encoding="utf-8", newline="") as f:
+        text = f.read()
+
+    # (char_start, char_end) for each lazy string, in file order
+    spans: List[Tuple[int, int]] = []
+    placeholders: List[_TextRef] = []
+
+    def parse_string(s, end, strict):
+        value, new_end = json.decoder.scanstring(s, end, strict)
+        if len(value) < min_length:
+            return value, new_end
+        ref = _TextRef(None, 0, 0)
+        spans.append((end - 1, new_end))  # Include both quotes
+        placeholders.append(ref)
+        return ref, new_end
+
+    decoder = json.JSONDecoder()
+    decoder.parse_string = parse_string
+    decoder.scan_once = json.scanner.py_make_scanner(decoder)
+    data = decoder.decode(text)
+
+    if not placeholders:
+        return data
+
+    # Convert character offsets to byte offsets in one forward pass
+    source = _TextSource(filepath)
+    char_pos = byte_pos = 0
+    for ref, (start, end) in zip(placeholders, spans):
+        byte_pos += len(text[char_pos:start].encode("utf-8"))
+        ref.source = source
+        ref.start = byte_pos
+        byte_pos += len(text[start:end].encode("utf-8"))
+        ref.end = byte_pos
+        char_pos = end
+
+    return _wrap_lazy(data)
+
+
+def _wrap_lazy(value: Any) -> Any:
+    """Turn dicts that hold lazy strings into LazyDict (and read lists' ones now)"""
+    if isinstance(value, dict):
+        has_ref = False
+        for key, item in value.items():
+            if type(item) is _TextRef:
+                has_ref = True
+            else:
+                value[key] = _wrap_lazy(item)
+        return LazyDict(value) if has_ref else value
+
+    if isinstance(value, list):
+        return resolve_items([_wrap_lazy(item) for item in value])
+
+    return value
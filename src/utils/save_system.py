@@ -13,13 +13,16 @@ from pathlib import Path
 class SaveSystem:
     """Manages game save and load operations"""
 
-    def __init__(self, save_dir: str = None):
+    def __init__(self, save_dir: str = None, data_loader=None):
         """
         Initialize save system
 
         Args:
             save_dir: Directory for save files (default: ~/.loavesandfishes/saves)
+            data_loader: Shared data context (default: get_data_loader())
         """
+        self.data_loader = data_loader or get_data_loader()
+
         if save_dir is None:
             # Use user's home directory
             home = Path.home()
@@ -256,8 +259,7 @@ class SaveSystem:
         # Use the player's built-in from_dict method if available
         if hasattr(player, 'from_dict'):
             try:
-                loader = get_data_loader()
-                loaded_player = player.__class__.from_dict(data, loader)
+                loaded_player = player.__class__.from_dict(data, self.data_loader)
                 player.__dict__.update(loaded_player.__dict__)
                 return
             except TypeError:
@@ -274,7 +276,7 @@ class SaveSystem:
         player.current_town = data.get("current_town", "Nazareth")
 
         # Load fish (requires Fish class to deserialize)
-        loader = get_data_loader()
+        loader = self.data_loader
         player.active_party = [
             self._deserialize_fish(f_data, loader)
             for f_data in data.get("active_party", [])
@@ -319,7 +321,7 @@ class SaveSystem:
         """
         return {
             "fish_id": fish.fish_id,
-            "nickname": getattr(fish, "nickname", fish.name),
+            "nickname": fish.nickname,  # None = the species name
             "level": fish.level,
             "current_hp": fish.current_hp,
             "max_hp": fish.max_hp,
@@ -328,7 +330,7 @@ class SaveSystem:
             "defense": fish.defense,
             "spd": fish.spd,
             "type": fish.type,
-            "known_moves": getattr(fish, "known_moves", []),
+            "known_moves": [dict(move) for move in getattr(fish, "known_moves", [])],
             "status_effects": getattr(fish, "status_effects", []),
             "held_item": getattr(fish, 'held_item', None)
         }
@@ -468,12 +470,13 @@ class SaveSystem:
 _save_system = None
 
 
-def get_save_system(save_dir: str = None) -> SaveSystem:
+def get_save_system(save_dir: str = None, data_loader=None) -> SaveSystem:
     """
     Get or create the global save system instance
 
     Args:
         save_dir: Optional custom save directory
+        data_loader: Optional data context (default: get_data_loader())
 
     Returns:
         SaveSystem instance
@@ -481,6 +484,6 @@ def get_save_system(save_dir: str = None) -> SaveSystem:
     global _save_system
 
     if _save_system is None:
-        _save_system = SaveSystem(save_dir)
+        _save_system = SaveSystem(save_dir, data_loader)
 
     return _save_system
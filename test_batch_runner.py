@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Batch Runner Test - Checks reproducibility of the process-pool battle runner
+"""
+
+import sys
+import os
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from engine.batch_runner import (BattleSpec, COLUMNS, derive_seed, run_battle,
+                                 run_batch, sweep_specs)
+
+SPECS = [
+    BattleSpec("carp_diem", 5, "wild_bandit", 5),
+    BattleSpec("holy_mackerel", 8, "wild_bandit", 9),
+]
+
+
+def test_same_seed_same_battle():
+    """A battle depends only on its seed"""
+    seed = derive_seed(42, SPECS[0], 3)
+    assert seed == derive_seed(42, SPECS[0], 3)
+    assert seed != derive_seed(42, SPECS[0], 4)
+    assert seed != derive_seed(43, SPECS[0], 3)
+    assert run_battle(SPECS[0], seed) == run_battle(SPECS[0], seed)
+    print("✅ Derived seeds are stable and distinct")
+
+
+def test_worker_count_does_not_change_results():
+    """1 worker and a process pool give bit-for-bit the same columns"""
+    serial = run_batch(SPECS, battles_per_spec=40, seed=7, workers=1, chunk_size=15)
+    pooled = run_batch(SPECS, battles_per_spec=40, seed=7, workers=2, chunk_size=15)
+    assert serial == pooled
+    assert len(serial) == 80
+    assert list(serial.columns) == list(COLUMNS)
+    assert run_batch(SPECS, battles_per_spec=40, seed=8, workers=1) != serial
+    print("✅ Results are identical for any worker count")
+
+
+def test_summary_and_sweep():
+    """Per-spec summary rows and sweep matchups"""
+    results = run_batch(SPECS, battles_per_spec=30, seed=1, workers=1)
+    rows = results.summary()
+    assert [row["fish_id"] for row in rows] == ["carp_diem", "holy_mackerel"]
+    assert all(row["battles"] == 30 for row in rows)
+    assert rows[1]["win_rate"] > rows[0]["win_rate"]
+    assert all(0 <= row["win_rate"] + row["loss_rate"] <= 1 for row in rows)
+
+    specs = sweep_specs([5, 10], fish_ids=["carp_diem"], enemy_ids=["wild_bandit", "skeptical_scholar"])
+    assert len(specs) == 4 and specs[0] == BattleSpec("carp_diem", 5, "wild_bandit", 5)
+    for bad in ({"fish_ids": ["carp_diem", "not_a_fish"]}, {"enemy_ids": ["not_an_enemy"]}):
+        try:
+            sweep_specs([5], **bad)
+            assert False, f"{bad} should be rejected"
+        except ValueError as e:
+            assert "not_a" in str(e)
+    print("✅ Summary and sweep specs")
+
+
+def main():
+    print("=" * 70)
+    print(" BATCH RUNNER TEST ".center(70, "="))
+    print("=" * 70)
+
+    tests = [
+        test_same_seed_same_battle,
+        test_worker_count_does_not_change_results,
+        test_summary_and_sweep,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ {test.__name__} failed: {e}")
+
+    print(f"\nResults: {len(tests) - failed}/{len(tests)} tests passed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Battle Log Test - Checks structured events, lazy text and the ring buffer
+"""
+
+import sys
+import os
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from utils.data_loader import DataLoader, get_data_loader
+from engine.battle_log import (BattleLog, CountingBattleLog, NullBattleLog, LogEvent,
+                               FLAG_CRITICAL, FLAG_SUPER_EFFECTIVE, load_templates)
+from engine.fish import Fish
+from engine.player import Player
+from engine.enemy import create_enemy
+from engine.battle import Battle, BattleAction, BattleResult
+from engine.rng import PythonRNG
+
+
+def play(log=None, seed=3):
+    player = Player("Jesus")
+    player.add_fish_to_party(Fish("carp_diem", get_data_loader().get_fish_by_id("carp_diem"), 5))
+    battle = Battle(player, [create_enemy("wild_bandit", 5)], rng=PythonRNG(seed=seed), log=log)
+    while battle.result == BattleResult.ONGOING and battle.turn_count < 50:
+        battle.execute_turn(BattleAction.ATTACK, 0)
+    return battle
+
+
+def test_every_event_has_a_template():
+    """messages.json has a template (both editions) for every event code"""
+    for edition in (None, "christian_edition"):
+        templates = load_templates(DataLoader(edition=edition))
+        for event in LogEvent:
+            assert event.name.lower() in templates, event
+    print(f"✅ {len(LogEvent)} event templates in both editions")
+
+
+def test_rendering():
+    """Events turn into the same text the log always showed"""
+    log = BattleLog()
+    log.record(LogEvent.ATTACK, "Carp Diem", "Wild Bandit", 12,
+               FLAG_CRITICAL | FLAG_SUPER_EFFECTIVE, "Splash")
+    log.record(LogEvent.STATUS_DAMAGE, "Wild Bandit", amount=3, detail="poison")
+    log.add("Free text")
+    assert log.get_recent(3) == [
+        "Carp Diem used Splash! Critical hit! It's super effective! (12 damage)",
+        "Wild Bandit took 3 poison damage!",
+        "Free text",
+    ]
+    entry = log.entries(1)[0]
+    assert entry.event == LogEvent.TEXT and entry.detail == "Free text"
+
+    battle = play()
+    assert battle.log.get_recent(50)[0] == "Battle started against Wild Bandit!"
+    assert any("used" in line for line in battle.log.events)
+    print("✅ Events render from messages.json templates")
+
+
+def test_ring_buffer_is_bounded():
+    """Only the last `capacity` events are kept"""
+    log = BattleLog(capacity=10)
+    for i in range(1000):
+        log.record(LogEvent.HEALED, "Carp Diem", amount=i)
+    assert len(log) == 10 and log.total == 1000
+    assert log.get_recent(1) == ["Carp Diem restored 999 HP!"]
+    assert log.get_recent(0) == []
+    log.clear()
+    assert len(log) == 0 and log.total == 0
+    print("✅ Ring buffer keeps the last events only")
+
+
+def test_counting_and_null_logs():
+    """Simulation logs count or drop events without changing the battle"""
+    full = play(seed=9)
+    counting = play(CountingBattleLog(), seed=9)
+    null = play(NullBattleLog(), seed=9)
+    assert full.result == counting.result == null.result
+    assert full.turn_count == counting.turn_count == null.turn_count
+
+    assert counting.log.total == full.log.total
+    assert counting.log.counts[LogEvent.BATTLE_START] == 1
+    assert sum(counting.log.counts.values()) == full.log.total
+    assert counting.log.get_recent(5) == [] and null.log.get_recent(5) == []
+    assert len(null.log) == 0
+    print("✅ Counting and null logs")
+
+
+def main():
+    print("=" * 70)
+    print(" BATTLE LOG TEST ".center(70, "="))
+    print("=" * 70)
+
+    tests = [
+        test_every_event_has_a_template,
+        test_rendering,
+        test_ring_buffer_is_bounded,
+        test_counting_and_null_logs,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ {test.__name__} failed: {e}")
+
+    print(f"\nResults: {len(tests) - failed}/{len(tests)} tests passed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
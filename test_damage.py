@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Damage Test - Checks the exact damage odds against real rolled hits
+"""
+
+import sys
+import os
+from collections import Counter
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from conftest import make_battle as make_test_battle, make_enemies
+from engine.battle_log import NullBattleLog
+from engine.damage import (damage_distribution, cached_distribution, apply_defense,
+                           clear_cache)
+
+
+def make_battle(fish_id="holy_mackerel", level=20, enemy_id="wild_bandit", seed=5):
+    return make_test_battle(make_enemies(enemy_id, level=level), fish_ids=(fish_id,),
+                            level=level, seed=seed, log=NullBattleLog())
+
+
+def test_matches_rolled_hits():
+    """Sampled hits only land on listed damages, at the listed rates"""
+    battle = make_battle()
+    fish, enemy = battle.active_fish, battle.active_enemy
+    move = dict(fish.known_moves[0], accuracy=90)
+    odds = damage_distribution(fish.get_effective_stat("atk"), move, enemy, fish.type)
+    assert abs(sum(odds.chances) - 1.0) < 1e-9
+    assert abs(odds.chances[0] - 0.1) < 1e-9 and odds.damages[0] == 0  # Misses
+    assert list(odds.damages) == sorted(odds.damages)
+
+    samples = 40_000
+    counts = Counter()
+    for _ in range(samples):
+        if battle.rng.randint(1, 100) > move["accuracy"]:
+            counts[0] += 1
+            continue
+        damage, _, _ = battle.calculate_damage(fish.get_effective_stat("atk"), move, enemy, fish.type)
+        counts[enemy.damage_after_defense(damage)] += 1
+    assert set(counts) <= set(odds.damages), set(counts) - set(odds.damages)
+    mean = sum(damage * count for damage, count in counts.items()) / samples
+    assert abs(mean - odds.expected) < 0.01 * odds.expected, (mean, odds.expected)
+    for damage, chance in odds.outcomes():
+        assert abs(counts[damage] / samples - chance) < 0.01, (damage, chance)
+    print(f"✅ Exact odds match {samples} rolled hits (EV {odds.expected:.2f})")
+
+
+def test_ko_chance_and_defense():
+    """KO chance counts damage >= HP; defense cases follow take_damage()"""
+    battle = make_battle()
+    fish, enemy = battle.active_fish, battle.active_enemy
+    move = fish.known_moves[0]
+    odds = damage_distribution(fish.get_effective_stat("atk"), move, enemy, fish.type)
+    assert odds.ko_chance(0) == 1.0 and odds.ko_chance(odds.damages[-1] + 1) == 0.0
+    middle = odds.damages[len(odds.damages) // 2]
+    expected = sum(c for d, c in odds.outcomes() if d >= middle)
+    assert abs(odds.ko_chance(middle) - expected) < 1e-9
+
+    for raw in (1, 7, 50, 333):  # The battle and the odds share one formula
+        assert enemy.damage_after_defense(raw) == apply_defense(raw, *enemy.defense_profile())
+        assert fish.damage_after_defense(raw) == apply_defense(raw, *fish.defense_profile())
+
+    fish.apply_status_effect("invincible")
+    attack = enemy.attacks[0]
+    shielded = damage_distribution(enemy.get_effective_stat("atk"), attack, fish, enemy.enemy_type)
+    assert shielded.damages == (0,) and shielded.expected == 0
+    print("✅ KO chance and defense special cases")
+
+
+def test_memoized():
+    """Asking again for the same numbers is a cache hit"""
+    battle = make_battle()
+    fish, enemy = battle.active_fish, battle.active_enemy
+    before = cached_distribution.cache_info().hits
+    first = damage_distribution(fish.get_effective_stat("atk"), fish.known_moves[0], enemy, fish.type)
+    second = damage_distribution(fish.get_effective_stat("atk"), fish.known_moves[0], enemy, fish.type)
+    assert first is second
+    assert cached_distribution.cache_info().hits > before
+
+    enemy.stat_modifiers["def"] = 1.5  # New defense → new entry
+    third = damage_distribution(fish.get_effective_stat("atk"), fish.known_moves[0], enemy, fish.type)
+    assert third.expected < first.expected
+    print("✅ Distributions are memoized per stat tuple")
+
+
+def test_edge_rolls():
+    """Accuracy 0 and over 100, fixed power, immune types and the 1-damage floor"""
+    battle = make_battle()
+    fish, enemy = battle.active_fish, battle.active_enemy
+    atk = fish.get_effective_stat("atk")
+    move = fish.known_moves[0]
+
+    never = damage_distribution(atk, dict(move, accuracy=0), enemy, fish.type)
+    assert never.damages == (0,) and never.hit_chance == 0 and never.ko_chance(1) == 0.0
+    always = damage_distribution(atk, dict(move, accuracy=150), enemy, fish.type)
+    assert always.hit_chance == 1.0 and 0 not in always.damages
+
+    fixed = damage_distribution(atk, dict(move, power=[40, 40], accuracy=100), enemy, fish.type)
+    wide = damage_distribution(atk, dict(move, power=[10, 70], accuracy=100), enemy, fish.type)
+    assert abs(sum(fixed.chances) - 1.0) < 1e-9 and len(fixed.damages) < len(wide.damages)
+    assert abs(fixed.expected - wide.expected) < 0.05 * wide.expected  # Same average power
+
+    # Even a powerless hit on a wall does 1 damage; an immune type too
+    feeble = damage_distribution(1, dict(move, power=[1, 1], accuracy=100), enemy, None,
+                                 effectiveness=0.0)
+    assert feeble.damages == (1,) and feeble.expected == 1.0
+    assert apply_defense(1, 10 ** 6) == 1 and apply_defense(3, 0, halved=True) == 1
+
+    stab = damage_distribution(atk, move, enemy, move.type)
+    plain = damage_distribution(atk, move, enemy, None)
+    assert stab.expected > plain.expected
+
+    clear_cache()
+    assert cached_distribution.cache_info().currsize == 0
+    print("✅ Edge rolls: accuracy bounds, fixed power, immunity, minimum damage")
+
+
+def main():
+    print("=" * 70)
+    print(" DAMAGE TEST ".center(70, "="))
+    print("=" * 70)
+
+    tests = [
+        test_matches_rolled_hits,
+        test_ko_chance_and_defense,
+        test_memoized,
+        test_edge_rolls,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ {test.__name__} failed: {e}")
+
+    print(f"\nResults: {len(tests) - failed}/{len(tests)} tests passed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
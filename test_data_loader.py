@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+Data Loader Test - Checks caching and indexed lookups against the JSON files
+"""
+
+import sys
+import os
+import json
+import shutil
+import tempfile
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from utils.data_loader import (DataLoader, get_data_loader, get_fish, get_apostle,
+                               get_town, get_item)
+from utils.data_snapshot import build_snapshot, load_snapshot
+from utils.lazy_text import load_lazy_json
+from utils.editions import EDITIONS, is_dual_text
+from engine.fish import Fish
+from engine.player import Player
+from engine.enemy import create_enemy
+from engine.battle import Battle, BattleAction, BattleResult
+from engine.game_state import GameState
+
+
+def test_indexed_lookups():
+    """Indexed lookups return the same records as a list scan"""
+    loader = DataLoader()
+
+    for fish in loader.get_all_fish():
+        assert loader.get_fish_by_id(fish["id"]) is fish
+    for apostle in loader.get_all_apostles():
+        assert loader.get_apostle_by_id(apostle["id"]) is apostle
+    for item in loader.get_bread_items():
+        assert loader.get_item_by_id(item["id"]) is item
+    for town in loader.get_all_towns():
+        assert loader.get_town_by_id(town["id"]) is town
+        assert loader.get_town_by_number(town["number"]) is town
+
+    assert loader.get_fish_by_id("no_such_fish") is None
+    assert loader.get_town_by_number(99) is None
+    print("✅ Indexed lookups match list scan")
+
+
+def test_convenience_functions():
+    """Module-level helpers go through the shared loader's indexes"""
+    assert get_fish("holy_mackerel")["name"] == "Holy Mackerel"
+    assert get_apostle("peter") is not None
+    assert get_town("nazareth")["number"] == 1
+    assert get_item("plain_pita") is not None
+    print("✅ Convenience functions resolve records")
+
+
+def test_clear_cache_rebuilds_indexes():
+    """Clearing the cache drops the indexes with it"""
+    loader = DataLoader()
+    first = loader.get_fish_by_id("carp_diem")
+    loader.clear_cache()
+    second = loader.get_fish_by_id("carp_diem")
+    assert first == second and first is not second
+    print("✅ Indexes rebuilt after clear_cache()")
+
+
+def test_loaders_share_one_cache():
+    """Every DataLoader on the same folder parses each file at most once"""
+    first = DataLoader()
+    first.get_fish_data()
+    reads = first.disk_reads
+
+    second = DataLoader()
+    assert second.get_fish_data() is first.get_fish_data()
+    assert second.disk_reads == reads
+    print("✅ Separate DataLoader instances share one cache")
+
+
+def test_battles_do_no_io_after_warmup():
+    """A 1,000-battle simulation reads nothing from disk once warmed up"""
+    loader = get_data_loader()
+    loader.get_fish_data()
+    loader.get_items_data()  # Battle.use_item() looks items up here
+    create_enemy("wild_bandit")  # Compiles the enemy templates
+    reads = loader.disk_reads
+
+    for _ in range(1000):
+        player = Player("Jesus")
+        fish = Fish("carp_diem", loader.get_fish_by_id("carp_diem"), level=5)
+        player.add_fish_to_party(fish)
+        player.add_bread_item("plain_pita", 1)
+
+        battle = Battle(player, [create_enemy("wild_bandit", level=3)],
+                        data_loader=loader)
+        battle.execute_turn(BattleAction.ITEM, "plain_pita")
+        turns = 0
+        while battle.result == BattleResult.ONGOING and turns < 30:
+            battle.execute_turn(BattleAction.ATTACK, 0)
+            turns += 1
+
+    assert loader.disk_reads == reads, f"{loader.disk_reads - reads} unexpected disk reads"
+    print("✅ 1,000 battles did zero file I/O after warm-up")
+
+
+def test_snapshot_fresh_and_stale():
+    """A fresh snapshot loads in one read; an edited JSON file makes it stale"""
+    src_data = os.path.join(os.path.dirname(__file__), 'src', 'data')
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = os.path.join(tmp, "data")
+        shutil.copytree(src_data, data_dir)
+        build_snapshot(data_dir)
+
+        loader = DataLoader(data_dir)
+        fish = loader.get_fish_by_id("holy_mackerel")
+        assert loader.snapshot_loaded and loader.disk_reads == 1
+        loader.preload_all()
+        assert loader.disk_reads == 1
+        assert fish == DataLoader(src_data, use_snapshot=False).get_fish_by_id("holy_mackerel")
+
+        # Edit a source file: the snapshot must be ignored
+        with open(os.path.join(data_dir, "items.json"), "a", encoding="utf-8") as f:
+            f.write("\n")
+        loader.clear_cache()
+        loader.get_fish_by_id("holy_mackerel")
+        assert not loader.snapshot_loaded
+        assert loader.disk_reads == 2
+
+        # A snapshot pickled against a module that's gone: JSON instead
+        with open(os.path.join(data_dir, "data.snapshot"), "wb") as f:
+            f.write(b"cmissing_module_for_snapshot_test\nBundle\n.")
+        assert load_snapshot(data_dir) is None
+    print("✅ Snapshot used when fresh, ignored when stale or unreadable")
+
+
+def test_lazy_text_matches_eager():
+    """Lazy-text records read back exactly like normally loaded ones"""
+    eager = DataLoader(use_snapshot=False)
+    lazy = DataLoader(lazy_text=True)
+    for filename in ("parables.json", "quests.json"):
+        assert lazy.load_json(filename) == eager.load_json(filename)
+        assert json.dumps(lazy.load_json(filename)) == json.dumps(eager.load_json(filename))
+
+    parable = lazy.get_record("parables.json", "parables", "id", "sower")
+    assert parable["full_text"] == eager.get_record("parables.json", "parables", "id", "sower")["full_text"]
+    assert isinstance(dict(parable)["full_text"], str)
+
+    # Long strings in a list come back as a plain list of text
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "lines.json")
+        lines = ["Blessed are the meek, for they shall inherit the earth. " * 2, "Amen."]
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"lines": lines}, f)
+        loaded = load_lazy_json(path)["lines"]
+        assert type(loaded) is list and loaded == lines
+        assert json.dumps(loaded) == json.dumps(lines) and " ".join(loaded) == " ".join(lines)
+    print("✅ Lazy text resolves to the same data as eager loading")
+
+
+def test_edition_views():
+    """Edition loaders collapse every dual-text pair to that edition's string"""
+    both = DataLoader(use_snapshot=False)
+
+    def has_dual_text(value):
+        if isinstance(value, dict):
+            return is_dual_text(value) or any(has_dual_text(v) for v in value.values())
+        if isinstance(value, list):
+            return any(has_dual_text(v) for v in value)
+        return False
+
+    for edition in EDITIONS:
+        loader = DataLoader(edition=edition)
+        assert loader.get_record("fish.json", "fish", "id", "holy_mackerel")["flavor_text"] == \
+            both.get_fish_by_id("holy_mackerel")["flavor_text"][edition]
+        for filename in ("parables.json", "quests.json", "messages.json"):
+            assert not has_dual_text(loader.load_json(filename))
+        assert loader.text(loader.get_item_by_id("plain_pita")["flavor_text"]) == \
+            both.get_item_by_id("plain_pita")["flavor_text"][edition]
+
+    # Lazy text stays lazy through resolution
+    lazy = DataLoader(lazy_text=True, edition="christian_edition")
+    eager = DataLoader(edition="christian_edition")
+    assert lazy.load_json("quests.json") == eager.load_json("quests.json")
+
+    try:
+        DataLoader(edition="pirate_edition")
+        assert False, "unknown edition accepted"
+    except ValueError:
+        pass
+    print("✅ Edition views resolve dual text once per edition")
+
+
+def test_group_queries():
+    """Secondary indexes match a list scan and return the same cached tuple"""
+    loader = DataLoader()
+    enemies = loader.load_json("enemies.json")["enemies"]
+
+    for region in {e["region"] for e in enemies}:
+        group = loader.get_enemies_by_region(region)
+        assert list(group) == [e for e in enemies if e["region"] == region]
+        assert isinstance(group, tuple) and loader.get_enemies_by_region(region) is group
+
+    assert list(loader.get_enemies_for_level(12)) == [
+        e for e in enemies if e["level_range"][0] <= 12 <= e["level_range"][1]]
+    assert all(e["type"] == "Dark" for e in loader.get_enemies_by_type("Dark"))
+    assert [f["id"] for f in loader.get_fish_by_tier(0)] == ["starter_sardine"]
+    assert all(f["type"] == "Water" for f in loader.get_fish_by_type("Water"))
+
+    quests = loader.load_json("quests.json")["quests"]
+    assert list(loader.get_quests_unlocked_at(10)) == [
+        q for q in quests if q["level_requirement"] <= 10]
+    assert len(loader.get_quests_unlocked_at(99)) == len(quests)
+    assert all(p["location"].startswith("Galilee")
+               for p in loader.get_parables_by_region("Galilee"))
+    assert loader.get_enemies_by_region("Atlantis") == ()
+    print("✅ Group queries match list scans")
+
+
+def test_encounters_use_region_index():
+    """Encounter rolls come from the region index"""
+    state = GameState(Player("Jesus"), data_loader=get_data_loader())
+    state.current_town = "Bethsaida"
+    assert state.get_available_encounters() == [
+        e["id"] for e in get_data_loader().get_enemies_by_region("Coastal")]
+    assert state.get_available_encounters()
+    print("✅ Encounters resolved from region index")
+
+
+def main():
+    """Run all tests"""
+    tests = [
+        test_indexed_lookups,
+        test_convenience_functions,
+        test_clear_cache_rebuilds_indexes,
+        test_loaders_share_one_cache,
+        test_battles_do_no_io_after_warmup,
+        test_snapshot_fresh_and_stale,
+        test_lazy_text_matches_eager,
+        test_edition_views,
+        test_group_queries,
+        test_encounters_use_region_index,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ {test.__name__} failed: {e}")
+    print(f"Results: {len(tests) - failed}/{len(tests)} tests passed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
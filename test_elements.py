@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Elements Test - Checks the compiled type table against both type charts
+"""
+
+import sys
+import os
+import copy
+import json
+import tempfile
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from utils.constants import TYPE_CHART
+from utils.data_loader import DataLoader, get_data_loader
+from engine.elements import (TYPE_NAMES, TypeChartMismatch, check_data_type_chart,
+                             check_type_chart, effectiveness_by_id, effectiveness_table, type_effectiveness,
+                             type_id)
+from engine.fish import Fish
+from engine.enemy import create_enemy
+
+
+def test_table_matches_chart():
+    """Every pair in TYPE_CHART reads the same by id, by name and from the flat table"""
+    table, size = effectiveness_table()
+    assert size == len(TYPE_NAMES)
+    for attack, row in TYPE_CHART.items():
+        for defend, multiplier in row.items():
+            attack_id, defend_id = type_id(attack), type_id(defend)
+            assert effectiveness_by_id(attack_id, defend_id) == multiplier
+            assert table[attack_id * size + defend_id] == multiplier
+            assert type_effectiveness(attack, defend) == multiplier
+
+    # Unknown types are neutral, and interning one keeps the old ids
+    holy, dark = type_id("Holy"), type_id("Dark")
+    assert type_effectiveness("Holy", "Ghostly Test Type") == 1.0
+    new = type_id("Ghostly Test Type")
+    assert TYPE_NAMES[new] == "Ghostly Test Type" and type_id("Ghostly Test Type") == new
+    assert effectiveness_by_id(new, dark) == 1.0 and effectiveness_by_id(holy, new) == 1.0
+    assert effectiveness_by_id(holy, dark) == TYPE_CHART["Holy"]["Dark"]
+    print("✅ Compiled type table matches TYPE_CHART")
+
+
+def test_fish_json_agrees():
+    """fish.json's type_chart matches TYPE_CHART, and a drifted copy fails loudly"""
+    loader = get_data_loader()
+    shipped = loader.get_fish_data()["type_chart"]
+    check_type_chart(shipped)  # Raises if the shipped data drifted
+    check_data_type_chart(loader)
+    assert loader.get_type_effectiveness("Water", "Earth") == type_effectiveness("Water", "Earth")
+
+    drifted = copy.deepcopy(shipped)
+    drifted["Holy"]["Dark"] = 1.5
+    drifted["Water"].pop("Earth")  # Missing → neutral, which also differs
+    try:
+        check_type_chart(drifted, "modded fish.json")
+        assert False, "A drifted type chart should raise"
+    except TypeChartMismatch as e:
+        message = str(e)
+        assert "modded fish.json" in message and "2 pairs" in message
+        assert "Holy → Dark" in message and "Water → Earth" in message
+
+    # A data directory with a drifted fish.json is refused
+    data_dir = tempfile.mkdtemp()
+    with open(os.path.join(data_dir, "fish.json"), "w") as f:
+        json.dump({"fish": [], "type_chart": drifted}, f)
+    try:
+        check_data_type_chart(DataLoader(data_path=data_dir, use_snapshot=False))
+        assert False, "A drifted fish.json type chart should raise"
+    except TypeChartMismatch:
+        pass
+    print("✅ fish.json type_chart agrees with TYPE_CHART (drift raises)")
+
+
+def test_fish_and_enemies_carry_ids():
+    """Species and enemy templates compile their type id once"""
+    loader = get_data_loader()
+    fish = Fish("holy_mackerel", loader.get_fish_by_id("holy_mackerel"), 5)
+    enemy = create_enemy("wild_bandit", 5)
+    assert TYPE_NAMES[fish.type_id] == fish.type
+    assert TYPE_NAMES[enemy.type_id] == enemy.enemy_type
+    for move in fish.known_moves:
+        assert (effectiveness_by_id(move.type_id, enemy.type_id)
+                == type_effectiveness(move.type, enemy.enemy_type))
+    print("✅ Fish and enemies carry their type ids")
+
+
+def main():
+    print("=" * 70)
+    print(" ELEMENTS TEST ".center(70, "="))
+    print("=" * 70)
+
+    tests = [
+        test_table_matches_chart,
+        test_fish_json_agrees,
+        test_fish_and_enemies_carry_ids,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ {test.__name__} failed: {e}")
+
+    print(f"\nResults: {len(tests) - failed}/{len(tests)} tests passed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Enemy AI Test - Checks the search-based "expectimax" enemy AI
+"""
+
+import sys
+import os
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from conftest import make_battle as make_test_battle
+from engine.enemy import Enemy, create_boss
+from engine.battle import BattleAction, BattleResult
+from engine.battle_log import NullBattleLog
+from engine.enemy_ai import SEARCH_AI_PATTERN, ExpectimaxAI, hit_outcomes, make_reproducible
+
+
+# A boss whose strongest-looking attack is the wrong choice against Earth fish
+TRICKY_BOSS = {
+    "id": "tricky_boss", "name": "Tricky Boss", "type": "Normal",
+    "base_stats": {"hp": 200, "atk": 20, "def": 10, "spd": 5},
+    "attacks": [
+        {"name": "Heavy Blow", "type": "Normal", "power": [30, 30], "accuracy": 100},
+        {"name": "Wild Swing", "type": "Normal", "power": [50, 50], "accuracy": 30},
+        {"name": "Water Jet", "type": "Water", "power": [20, 20], "accuracy": 100},
+    ],
+    "ai_pattern": "expectimax",
+}
+
+
+def make_battle(enemy, level=25, seed=0):
+    return make_test_battle([enemy], fish_ids=("carp_diem", "holy_mackerel"), level=level,
+                            seed=seed, is_boss=True, log=NullBattleLog())
+
+
+def test_hit_outcomes():
+    """Outcome probabilities add up; misses and crits are included"""
+    battle = make_battle(Enemy(TRICKY_BOSS, 10))
+    fish = battle.active_fish
+    for attack in TRICKY_BOSS["attacks"]:
+        outcomes = hit_outcomes(30, attack, fish, "Normal", 1.0)
+        assert abs(sum(chance for chance, _ in outcomes) - 1.0) < 1e-9
+    swing = dict(hit_outcomes(30, TRICKY_BOSS["attacks"][1], fish, "Normal", 1.0))
+    assert abs(sum(c for c, d in swing.items() if d == 0) - 0.7) < 1e-9  # 30% accuracy
+    print("✅ Damage outcomes cover miss/hit/crit")
+
+
+def test_picks_super_effective_attack():
+    """Against an Earth fish the planner prefers Water Jet (2x) over bigger numbers"""
+    enemy = Enemy(TRICKY_BOSS, 10)
+    make_reproducible([enemy])  # Fixed depth - a busy machine can't cut it short
+    battle = make_battle(enemy)
+    assert battle.active_fish.type == "Earth"
+    attack = enemy.choose_attack(battle.rng, battle)
+    assert attack["name"] == "Water Jet", attack["name"]
+    assert enemy.planner.last_search.depth >= 1
+    assert enemy.planner.table  # Positions were cached
+
+    enemy.ai_pattern = "strongest_first"
+    assert enemy.choose_attack(battle.rng, battle)["name"] == "Wild Swing"
+    print("✅ Search sees type effectiveness and accuracy")
+
+
+def test_time_budget_and_determinism():
+    """A tight budget still answers quickly; a fixed depth is reproducible"""
+    enemy = create_boss("final_trial", 30)
+    enemy.ai_pattern = SEARCH_AI_PATTERN
+    battle = make_battle(enemy, level=60)
+    enemy.planner = ExpectimaxAI(time_budget=0.001, max_depth=10)
+    enemy.choose_attack(battle.rng, battle)
+    assert enemy.planner.last_search.depth < 10
+    assert enemy.planner.last_search.elapsed < 0.05
+
+    # No time at all: one turn ahead (it never looks at the clock), no deeper
+    enemy.planner = ExpectimaxAI(time_budget=1e-9)
+    assert enemy.choose_attack(battle.rng, battle) in enemy.attacks
+    assert enemy.planner.last_search.depth == 1
+
+    def play(seed):
+        boss = create_boss("final_trial", 30)
+        boss.ai_pattern = SEARCH_AI_PATTERN
+        make_reproducible([boss])
+        game = make_battle(boss, level=60, seed=seed)
+        while game.result == BattleResult.ONGOING and game.turn_count < 100:
+            game.execute_turn(BattleAction.ATTACK, 0)
+        return game.result, game.turn_count, boss.current_hp
+
+    assert play(3) == play(3)
+    print("✅ Time budget respected; fixed-depth search is reproducible")
+
+
+def test_table_reuse_and_fallbacks():
+    """The table survives turns with the same stats; fainted fish and no battle still work"""
+    enemy = Enemy(TRICKY_BOSS, 10)
+    make_reproducible([enemy])
+    battle = make_battle(enemy)
+    enemy.choose_attack(battle.rng, battle)
+    planner = enemy.planner
+    enemy.choose_attack(battle.rng, battle)
+    assert planner.last_search.nodes == 0          # Every position already known
+
+    enemy.apply_stat_modifier("atk", 2.0)          # New damage odds: start over
+    enemy.choose_attack(battle.rng, battle)
+    assert planner.last_search.nodes > 0
+
+    planner.max_table_entries = 0                  # Over the limit: cleared first
+    enemy.choose_attack(battle.rng, battle)
+    assert planner.last_search.nodes > 0
+
+    battle.player.active_party[1].current_hp = 0   # A fainted fish can't reply
+    assert enemy.choose_attack(battle.rng, battle)["name"] == "Water Jet"
+    assert enemy.choose_attack(battle.rng, None)["name"] == "Wild Swing"  # No battle: strongest
+
+    plain = Enemy(dict(TRICKY_BOSS, ai_pattern="strongest_first"), 10)
+    make_reproducible([plain])
+    assert plain.planner is None
+    print("✅ Transposition table reuse, limits and fallbacks")
+
+
+def main():
+    print("=" * 70)
+    print(" ENEMY AI TEST ".center(70, "="))
+    print("=" * 70)
+
+    tests = [
+        test_hit_outcomes,
+        test_picks_super_effective_attack,
+        test_time_budget_and_determinism,
+        test_table_reuse_and_fallbacks,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ {test.__name__} failed: {e}")
+
+    print(f"\nResults: {len(tests) - failed}/{len(tests)} tests passed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Enemy Factory Test - Checks enemies and bosses built from the JSON data
+"""
+
+import sys
+import os
+import json
+import shutil
+import tempfile
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from utils.data_loader import DataLoader, get_data_loader
+from engine.enemy import Enemy, Boss, EnemyFactory, create_enemy, create_boss, get_enemy_factory
+
+
+def test_every_record_spawns():
+    """All 40 enemies and 12 bosses in the JSON data can be created"""
+    loader = DataLoader()
+    factory = EnemyFactory(loader)
+
+    for data in loader.load_json("enemies.json")["enemies"]:
+        enemy = factory.create_enemy(data["id"])
+        assert type(enemy) is Enemy and enemy.level == data["level_range"][0]
+        assert enemy.current_hp == enemy.max_hp > 0
+    for data in loader.load_json("bosses.json")["bosses"]:
+        boss = factory.create_boss(data["id"])
+        assert isinstance(boss, Boss) and boss.level == data["level"]
+
+    assert factory.create_enemy("no_such_enemy") is None
+    assert factory.create_boss("wild_bandit") is None
+    print("✅ Every enemy and boss record spawns")
+
+
+def test_factory_matches_direct_construction():
+    """Factory enemies have the same stats as Enemy(record, level)"""
+    loader = DataLoader()
+    record = loader.get_record("enemies.json", "enemies", "id", "wild_bandit")
+    direct = Enemy(record, level=7)
+    spawned = create_enemy("wild_bandit", level=7)
+    for stat in ("max_hp", "atk", "defense", "spd", "xp_reward", "money_reward"):
+        assert getattr(direct, stat) == getattr(spawned, stat), stat
+    print("✅ Factory stats match direct construction")
+
+
+def test_spawns_share_template_not_state():
+    """Spawned enemies share compiled data but not per-battle state"""
+    factory = EnemyFactory(DataLoader())
+    first = factory.create_enemy("wild_bandit", level=5)
+    second = factory.create_enemy("wild_bandit", level=5)
+
+    assert first.template is second.template
+    assert first.attacks is second.attacks
+    template = factory.get_enemy_template("wild_bandit")
+    assert factory.scaled_stats(template, 5) is factory.scaled_stats(template, 5)
+
+    first.take_damage(10)
+    first.apply_status_effect("poison", turns=2)
+    first.apply_stat_modifier("atk", 1.5)
+    assert second.current_hp == second.max_hp
+    assert second.status_effects == [] and second.stat_modifiers["atk"] == 1.0
+    print("✅ Spawns share templates, not battle state")
+
+
+def test_boss_dialogue_uses_edition():
+    """Boss dialogue is resolved to the loader's edition"""
+    default_boss = EnemyFactory(DataLoader()).create_boss("steward_feast")
+    christian_boss = EnemyFactory(DataLoader(edition="christian_edition")).create_boss("steward_feast")
+    assert isinstance(default_boss.intro_dialogue, str)
+    assert default_boss.intro_dialogue != christian_boss.intro_dialogue
+    assert create_boss("steward_feast").intro_dialogue == default_boss.intro_dialogue
+    print("✅ Boss dialogue follows the edition")
+
+
+def test_reload_recompiles_templates():
+    """Edited enemies.json is picked up after clear_cache(), shared factory included"""
+    src_data = os.path.join(os.path.dirname(__file__), 'src', 'data')
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = os.path.join(tmp, "data")
+        shutil.copytree(src_data, data_dir)
+        loader = DataLoader(data_dir, use_snapshot=False)
+        factory = EnemyFactory(loader)
+        before = factory.create_enemy("wild_bandit", level=5)
+
+        path = os.path.join(data_dir, "enemies.json")
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        for record in data["enemies"]:
+            if record["id"] == "wild_bandit":
+                record["base_stats"]["hp"] *= 10
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+
+        assert factory.create_enemy("wild_bandit", level=5).max_hp == before.max_hp
+        loader.clear_cache()
+        after = factory.create_enemy("wild_bandit", level=5)
+        assert after.max_hp > before.max_hp
+        assert after.template is not before.template
+
+    shared = get_enemy_factory()
+    template = shared.get_enemy_template("wild_bandit")
+    shared.scaled_stats(template, 5)
+    get_data_loader().clear_cache()
+    assert shared._stats == {}
+    assert shared.get_enemy_template("wild_bandit") is not template
+    assert create_enemy("wild_bandit", level=5).max_hp == before.max_hp
+    print("✅ Reloaded data recompiles the enemy templates")
+
+
+def main():
+    """Run all tests"""
+    tests = [
+        test_every_record_spawns,
+        test_factory_matches_direct_construction,
+        test_spawns_share_template_not_state,
+        test_boss_dialogue_uses_edition,
+        test_reload_recompiles_templates,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ {test.__name__} failed: {e}")
+    print(f"Results: {len(tests) - failed}/{len(tests)} tests passed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
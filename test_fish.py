@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Fish Test - Checks the shared FishSpecies data and per-fish state
+"""
+
+import sys
+import os
+import tempfile
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from utils.data_loader import DataLoader
+from utils.save_system import SaveSystem
+from engine.fish import Fish, FishSpecies
+from engine.player import Player
+from conftest import make_player
+
+
+def test_species_is_shared():
+    """Fish of one species share a single FishSpecies"""
+    loader = DataLoader()
+    data = loader.get_fish_by_id("carp_diem")
+    first = Fish("carp_diem", data, level=3)
+    second = Fish("carp_diem", data, level=20)
+
+    assert first.species is second.species is FishSpecies.get("carp_diem", data)
+    assert first.name == data["name"] and first.base_atk == data["base_stats"]["atk"]
+    assert first.flavor_text is data["flavor_text"]
+    assert not hasattr(first, "__dict__")
+
+    # A nickname is per fish; the rest of the species data is read-only
+    first.name = "Carp Dies"
+    assert first.name == first.nickname == "Carp Dies" and second.name == data["name"]
+    assert first.clone().name == "Carp Dies"
+    first.name = None
+    assert first.name == data["name"]
+    for field in ("type", "base_atk", "tier"):
+        try:
+            setattr(first, field, None)
+            assert False, f"{field} should be read-only"
+        except AttributeError:
+            pass
+    print("✅ Fish share one species object")
+
+
+def test_battle_state_is_per_fish():
+    """Modifiers and statuses belong to one fish only"""
+    data = DataLoader().get_fish_by_id("holy_mackerel")
+    first = Fish("holy_mackerel", data, level=5)
+    second = Fish("holy_mackerel", data, level=5)
+
+    first.apply_stat_modifier("atk", 1.5, turns=1)
+    first.apply_status_effect("blessed", turns=2)
+    assert first.stat_modifiers["atk"] == 1.5
+    assert second.stat_modifiers["atk"] == 1.0 and second.status_effects == []
+
+    first.tick_temporary_effects()
+    assert first.stat_modifiers["atk"] == 1.0
+    first.apply_stat_modifier("def", 2.0)
+    first.reset_stat_modifiers()
+    assert first.stat_modifiers["def"] == 1.0
+    assert first.timed_stat_modifiers["atk"] == []
+    print("✅ Battle state is per fish")
+
+
+def test_save_round_trip():
+    """to_dict / from_dict keep the same format and state"""
+    data = DataLoader().get_fish_by_id("starter_sardine")
+    fish = Fish("starter_sardine", data, level=12)
+    fish.xp = 40
+    fish.take_damage(30)
+    fish.apply_status_effect("poisoned")
+
+    saved = fish.to_dict()
+    assert set(saved) == {"fish_id", "nickname", "level", "xp", "current_hp", "held_item",
+                          "status_effects"}
+    assert saved["status_effects"] == ["poisoned"] and saved["nickname"] is None
+    restored = Fish.from_dict(saved, data)
+    assert restored.to_dict() == saved
+    assert restored.species is fish.species
+    assert [m["name"] for m in restored.known_moves] == [m["name"] for m in fish.known_moves]
+
+    # Saves from before nicknames load with the species name
+    del saved["nickname"]
+    assert Fish.from_dict(saved, data).name == data["name"]
+    print("✅ Save format unchanged")
+
+
+def test_nickname_survives_save():
+    """A nicknamed fish reads back with its nickname after a save and load"""
+    loader = DataLoader()
+    player = make_player(("holy_mackerel", "carp_diem"))
+    player.active_party[0].name = "Bubbles"
+
+    saves = SaveSystem(tempfile.mkdtemp(), loader)
+    assert saves.save_game(player, 1)
+    loaded = Player("Someone else")
+    assert saves.load_game(loaded, 1)
+    assert [fish.name for fish in loaded.active_party] == ["Bubbles", "Carp Diem"]
+    assert loaded.active_party[1].nickname is None
+
+    fish = player.active_party[0]
+    assert saves._serialize_fish(fish)["nickname"] == "Bubbles"
+    assert saves._deserialize_fish(fish.to_dict(), loader).name == "Bubbles"
+    print("✅ Nicknames survive a save and load")
+
+
+def main():
+    """Run all tests"""
+    tests = [
+        test_species_is_shared,
+        test_battle_state_is_per_fish,
+        test_save_round_trip,
+        test_nickname_survives_save,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ {test.__name__} failed: {e}")
+    print(f"Results: {len(tests) - failed}/{len(tests)} tests passed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Horde Test - Checks horde battles (column storage, batch damage, defeat sweeps)
+"""
+
+import sys
+import os
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from conftest import make_player as make_test_player, make_enemies
+from utils.constants import STATUS_EFFECTS
+from engine.enemy import create_enemy
+from engine.battle import BattleResult
+from engine.battle_log import BattleLog, LogEvent
+from engine.rng import PythonRNG
+from engine import horde as horde_module
+from engine.horde import Horde, HordeBattle
+
+
+def make_player():
+    return make_test_player(level=30)
+
+
+def varied_horde(count=60):
+    """Mixed levels, DEF debuffs, statuses - one of everything the batch code reads"""
+    horde = Horde().spawn("wild_bandit", count // 2, level=4)
+    horde.spawn("lost_sheep", count - count // 2, level=9)
+    for unit in horde.units:
+        if unit.row % 3 == 0:
+            unit.apply_stat_modifier("def", 0.5, 3)
+        if unit.row % 4 == 0:
+            unit.apply_status_effect("poisoned")
+        if unit.row % 5 == 0:
+            unit.apply_status_effect("burned")
+        if unit.row % 7 == 0:
+            unit.apply_status_effect("invincible")
+        unit.current_hp -= unit.row % 9
+    return horde
+
+
+def test_rows_mirror_enemies():
+    """HP, statuses and multipliers read and write the horde's columns"""
+    horde = Horde().spawn("wild_bandit", 3, level=5)
+    unit = horde.units[1]
+    unit.take_damage(10)
+    unit.apply_status_effect("burned")
+    unit.apply_stat_modifier("def", 1.5, 2)
+    assert horde.hp[1] == unit.current_hp < unit.max_hp
+    assert horde.status[1] == unit.status_mask and unit.has_status("burned")
+    assert horde.modifiers["def"][1] == 1.5 and horde.modifiers["def"][0] == 1.0
+
+    # Timed multipliers expire into the column too
+    unit.tick_temporary_effects()
+    unit.tick_temporary_effects()
+    assert horde.modifiers["def"][1] == 1.0
+
+    # Ordinary enemies can be copied in; clones get a row of their own
+    plain = create_enemy("wild_bandit", 5)
+    plain.apply_stat_modifier("atk", 0.5, 2)
+    adopted = horde.adopt(plain)
+    assert adopted.row == 3 and horde.modifiers["atk"][3] == 0.5
+    twin = adopted.clone()
+    twin.take_damage(20)
+    assert twin.horde is not horde and adopted.current_hp == plain.current_hp
+    print("✅ Enemy state lives in the horde's rows")
+
+
+def test_batch_operations_match_enemies():
+    """Area and status damage give the numbers Enemy/Battle give one at a time"""
+    results = []
+    for use_numpy in (True, False):
+        saved_np = horde_module.np
+        if not use_numpy:
+            horde_module.np = None
+        try:
+            horde = varied_horde()
+            expected = [unit.clone() for unit in horde.units]
+            horde.damage_all(45)
+            for enemy in expected:
+                enemy.take_damage(45)
+            assert list(horde.hp) == [enemy.current_hp for enemy in expected]
+
+            hits = horde.status_damage()
+            results.append((list(horde.hp), hits))
+        finally:
+            horde_module.np = saved_np
+
+    (numpy_hp, numpy_hits), (loop_hp, loop_hits) = results
+    assert numpy_hp == loop_hp and numpy_hits == loop_hits
+    poisoned = [(row, damage) for row, damage, handler in loop_hits if handler.name == "poisoned"]
+    unit = varied_horde().units[4]  # Poisoned, not invincible
+    assert (4, max(1, int(unit.max_hp * STATUS_EFFECTS["poisoned"]["damage_per_turn"]))) in poisoned
+    assert all(row % 7 for row, _, _ in loop_hits)  # Invincible rows take none
+    print("✅ Batch damage matches the one-at-a-time rules (with and without NumPy)")
+
+
+def test_horde_battle_sweeps_defeats():
+    """An area attack KOs many enemies; one sweep rewards and removes them all"""
+    player = make_player()
+    horde = Horde().spawn("wild_bandit", 200, level=2).spawn("lost_sheep", 50, level=20)
+    battle = HordeBattle(player, horde, rng=PythonRNG(seed=4), log=BattleLog(capacity=1000))
+    first = battle.active_enemy
+    money = player.money
+
+    saved = battle.snapshot()
+    battle._damage_all_enemies(40)  # KOs the bandits, not the sheep
+    rewards = [e for e in battle.log.entries() if e.event == LogEvent.REWARDS]
+    survivors = [unit for unit in horde.units if unit.current_hp > 0]
+    assert len(survivors) == 50 and len(rewards) == 200 and battle.enemies == survivors
+    assert battle.active_enemy is survivors[0] and battle.active_enemy is not first
+    assert player.money == money + sum(unit.money_reward for unit in horde.units
+                                       if unit not in survivors)
+
+    # Poison on the whole horde: every survivor takes it, at the end of the turn
+    for unit in survivors:
+        unit.apply_status_effect("poisoned")
+    before = [unit.current_hp for unit in survivors]
+    battle._apply_end_of_turn_effects()
+    assert all(unit.current_hp < hp for unit, hp in zip(survivors, before))
+
+    # Restore brings everyone back; a clone has columns of its own
+    battle.restore(saved)
+    assert len(battle.enemies) == 250 and battle.active_enemy is first
+    preview = battle.clone()
+    preview._damage_all_enemies(10_000)
+    assert preview.result == BattleResult.VICTORY and battle.result == BattleResult.ONGOING
+    assert first.current_hp == first.max_hp and len(battle.enemies) == 250
+    print("✅ Horde battles sweep defeats in one pass")
+
+
+def test_dead_rows_and_last_enemies():
+    """Removed rows take nothing; the last sweep is a victory; plain enemies are adopted"""
+    try:
+        Horde().spawn("no_such_enemy", 3)
+        assert False, "An unknown enemy id should raise"
+    except ValueError:
+        pass
+
+    horde = Horde().spawn("wild_bandit", 4, level=3)
+    battle = HordeBattle(make_player(), horde, rng=PythonRNG(seed=4), log=BattleLog())
+    battle.active_enemy.current_hp = 0             # A single-target KO
+    battle._handle_enemy_defeat()
+    assert not horde.alive[0] and battle.active_enemy is horde.units[1]
+    assert len(battle.enemies) == 3
+
+    horde.hp[0] = 7                                # A removed row is left alone...
+    horde.units[0].apply_status_effect("poisoned")
+    battle._damage_all_enemies(5)
+    assert horde.hp[0] == 7
+    assert all(row != 0 for row, _, _ in horde.status_damage())  # ...by status damage too
+
+    for unit in battle.enemies:
+        unit.current_hp = 1
+        unit.apply_status_effect("burned")
+    battle._apply_end_of_turn_effects()
+    assert battle.result == BattleResult.VICTORY and battle.enemies == []
+
+    plain = HordeBattle(make_player(), make_enemies(count=2, level=3), rng=PythonRNG(seed=4))
+    assert len(plain.horde) == 2 and all(unit.horde is plain.horde for unit in plain.enemies)
+    print("✅ Removed rows, the final sweep and adopted enemies")
+
+
+def main():
+    print("=" * 70)
+    print(" HORDE TEST ".center(70, "="))
+    print("=" * 70)
+
+    tests = [
+        test_rows_mirror_enemies,
+        test_batch_operations_match_enemies,
+        test_horde_battle_sweeps_defeats,
+        test_dead_rows_and_last_enemies,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ {test.__name__} failed: {e}")
+
+    print(f"\nResults: {len(tests) - failed}/{len(tests)} tests passed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Modifiers Test - Checks the stat modifier stack (expiry, caching, no drift)
+"""
+
+import sys
+import os
+import copy
+import pickle
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from utils.data_loader import get_data_loader
+from engine.fish import Fish
+from engine.enemy import create_enemy
+from engine.modifiers import ModifierStack
+
+
+def test_no_drift():
+    """Thousands of buffs coming and going land back on exactly 1.0"""
+    stack = ModifierStack({"atk": 1.0, "def": 1.0})
+    for turn in range(3000):
+        multiplier = 1.0 + (turn % 7) / 10 + 0.03
+        stack.apply("atk", multiplier, turns=1 + turn % 4)
+        stack.tick()
+    while stack.timed_entries["atk"]:
+        stack.tick()
+    assert stack["atk"] == 1.0 and stack["def"] == 1.0
+
+    # Permanent and timed modifiers combine; only the timed part expires
+    stack.apply("def", 1.5)
+    stack.apply("def", 2.0, turns=2)
+    assert stack["def"] == 3.0
+    stack.tick()
+    assert stack["def"] == 3.0 and stack.timed_entries["def"] == [{"multiplier": 2.0, "turns": 1}]
+    stack.tick()
+    assert stack["def"] == 1.5
+    print("✅ Modifiers expire without float drift")
+
+
+def test_expiry_order_and_assignment():
+    """Entries expire by turn regardless of the order they were applied in"""
+    enemy = create_enemy("wild_bandit", 5)
+    enemy.apply_stat_modifier("atk", 2.0, 3)
+    enemy.apply_stat_modifier("atk", 0.5, 1)
+    enemy.apply_stat_modifier("spd", 1.25, 2)
+    assert enemy.stat_modifiers["atk"] == 1.0
+    expected = [(2.0, 1.25), (2.0, 1.0), (1.0, 1.0)]
+    for atk, spd in expected:
+        enemy.tick_temporary_effects()
+        assert (enemy.stat_modifiers["atk"], enemy.stat_modifiers["spd"]) == (atk, spd)
+    assert enemy.get_effective_stat("atk") == enemy.atk
+
+    # A direct value becomes permanent and drops that stat's timed entries
+    enemy.apply_stat_modifier("def", 0.5, 2)
+    enemy.stat_modifiers["def"] = 1.5
+    enemy.tick_temporary_effects()
+    enemy.tick_temporary_effects()
+    assert enemy.stat_modifiers["def"] == 1.5 and enemy.timed_stat_modifiers["def"] == []
+    print("✅ Expiry follows turns; assignment is permanent")
+
+
+def test_copies_are_independent():
+    """Snapshots, clones, deepcopy and pickle keep the whole stack"""
+    loader = get_data_loader()
+    fish = Fish("carp_diem", loader.get_fish_by_id("carp_diem"), 20)
+    fish.apply_stat_modifier("atk", 1.5, turns=2)
+    fish.apply_stat_modifier("def", 1.2)
+
+    clone = fish.clone()
+    for other in (clone, copy.deepcopy(fish), pickle.loads(pickle.dumps(fish))):
+        assert other.stat_modifiers == fish.stat_modifiers
+        other.tick_temporary_effects()
+        other.tick_temporary_effects()
+        assert other.stat_modifiers["atk"] == 1.0 and other.stat_modifiers["def"] == 1.2
+    assert fish.stat_modifiers["atk"] == 1.5  # The original didn't tick
+
+    state = fish.snapshot_state()
+    fish.reset_stat_modifiers()
+    fish.restore_state(state)
+    assert fish.timed_stat_modifiers["atk"] == [{"multiplier": 1.5, "turns": 2}]
+    print("✅ Copies keep independent modifier stacks")
+
+
+def main():
+    print("=" * 70)
+    print(" MODIFIERS TEST ".center(70, "="))
+    print("=" * 70)
+
+    tests = [
+        test_no_drift,
+        test_expiry_order_and_assignment,
+        test_copies_are_independent,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ {test.__name__} failed: {e}")
+
+    print(f"\nResults: {len(tests) - failed}/{len(tests)} tests passed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Moves Test - Checks compiled Move objects and that battles still accept move dicts
+"""
+
+import sys
+import os
+import json
+import pickle
+import tempfile
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from utils.data_loader import get_data_loader
+from utils.save_system import SaveSystem
+from engine.fish import Fish
+from engine.player import Player
+from engine.enemy import create_enemy
+from engine.battle import Battle
+from engine.battle_log import NullBattleLog
+from engine.rng import PythonRNG
+from engine.moves import Move, MoveEffect
+from engine.elements import TYPE_NAMES
+
+
+def test_compiled_fields():
+    """Power, defaults and effects are parsed once; the record stays readable"""
+    ranged = Move({"name": "Splash", "type": "Water", "category": "Physical",
+                   "power": [5, 8], "accuracy": 95, "level": 1})
+    assert (ranged.power_min, ranged.power_max, ranged.rolls_power) == (5, 8, True)
+    assert ranged.accuracy == 95 and ranged.priority == 0 and ranged.is_physical
+    assert TYPE_NAMES[ranged.type_id] == "Water"
+    assert ranged.effect is None
+
+    fixed = Move({"name": "Blessing", "type": "Holy", "power": 0, "effect": "def_boost",
+                  "effect_value": 0.2, "duration": 3})
+    assert (fixed.power_min, fixed.power_max, fixed.rolls_power) == (0, 0, False)
+    assert fixed.accuracy == 100 and not fixed.is_physical
+    assert fixed.effect == MoveEffect("def_boost", 0.2, 1.0, 3)
+
+    # Mapping access for older code, dict() for saves
+    assert ranged["name"] == "Splash" and ranged.get("special") is None
+    assert "power" in ranged and dict(ranged)["power"] == [5, 8]
+    try:
+        ranged.accuracy = 100
+        assert False, "Move should be read-only"
+    except AttributeError:
+        pass
+    assert pickle.loads(pickle.dumps(ranged)) == ranged
+    print("✅ Moves compile power, defaults and effects")
+
+
+def test_compiled_once():
+    """Species and enemy templates compile their moves once and share them"""
+    loader = get_data_loader()
+    first = Fish("carp_diem", loader.get_fish_by_id("carp_diem"), 30)
+    second = Fish("carp_diem", loader.get_fish_by_id("carp_diem"), 30)
+    assert all(isinstance(move, Move) for move in first.known_moves)
+    assert all(a is b for a, b in zip(first.known_moves, second.known_moves))
+
+    enemy = create_enemy("wild_bandit", 5)
+    assert all(isinstance(attack, Move) and attack.rolls_power for attack in enemy.attacks)
+    assert create_enemy("wild_bandit", 9).attacks is enemy.attacks
+
+    # Saves still write the moves as plain JSON records
+    data = SaveSystem(tempfile.mkdtemp(), loader)._serialize_fish(first)
+    assert json.loads(json.dumps(data))["known_moves"][0]["name"] == first.known_moves[0].name
+    print("✅ Moves are compiled once per species/template")
+
+
+def test_battle_accepts_dicts():
+    """calculate_damage() rolls the same for a Move and its raw dict"""
+    loader = get_data_loader()
+    player = Player("Jesus")
+    player.add_fish_to_party(Fish("holy_mackerel", loader.get_fish_by_id("holy_mackerel"), 12))
+    battle = Battle(player, [create_enemy("wild_bandit", 12)], log=NullBattleLog())
+    fish, enemy = battle.active_fish, battle.active_enemy
+
+    for move in fish.known_moves:
+        results = []
+        for as_given in (move, dict(move)):
+            battle.rng = PythonRNG(seed=11)
+            results.append(battle.calculate_damage(fish.get_effective_stat("atk"), as_given,
+                                                   enemy, fish.type))
+        assert results[0] == results[1], (move.name, results)
+    print("✅ Raw move dicts still work")
+
+
+def main():
+    print("=" * 70)
+    print(" MOVES TEST ".center(70, "="))
+    print("=" * 70)
+
+    tests = [
+        test_compiled_fields,
+        test_compiled_once,
+        test_battle_accepts_dicts,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ {test.__name__} failed: {e}")
+
+    print(f"\nResults: {len(tests) - failed}/{len(tests)} tests passed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Replay Test - Checks recording, binary round trip, seeking and verification of battle replays
+"""
+
+import sys
+import os
+import json
+import zlib
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from engine.fish import Fish
+from engine.player import Player
+from engine.enemy import create_enemy
+from engine.battle import Battle, BattleAction, BattleResult
+from engine import replay as replay_module
+from engine.replay import ARG_STRING, Replay, ReplayError, ReplayPlayer, state_digest
+from utils.data_loader import get_data_loader
+
+
+def make_battle(seed=11):
+    """Two fish, some bread, two enemies - a battle with switches and items"""
+    loader = get_data_loader()
+    player = Player("Jesus")
+    for fish_id in ("carp_diem", "holy_mackerel"):
+        player.add_fish_to_party(Fish(fish_id, loader.get_fish_by_id(fish_id), 9))
+    player.bread_items = {"plain_pita": 2}
+    enemies = [create_enemy("wild_bandit", 8), create_enemy("skeptical_scholar", 8)]
+    return Battle(player, enemies, record_replay=True, replay_seed=seed)
+
+
+def play(battle):
+    """Fixed script of actions; returns the state seen after each turn"""
+    script = [(BattleAction.ATTACK, 0), (BattleAction.SWITCH, 1), (BattleAction.ITEM, "plain_pita")]
+    states = [None]
+    turn = 0
+    while battle.result == BattleResult.ONGOING and turn < 40:
+        action = script[turn] if turn < len(script) else (BattleAction.ATTACK, turn % 2)
+        battle.execute_turn(*action)
+        states.append(snapshot(battle))
+        turn += 1
+    return states
+
+
+def snapshot(battle):
+    return (battle.turn_count, battle.result,
+            [(f.fish_id, f.current_hp, f.xp) for f in battle.player.active_party],
+            [(e.enemy_id, e.current_hp) for e in battle.enemies])
+
+
+def test_round_trip_and_verify():
+    """Replay survives to_bytes()/from_bytes() and re-simulates to the same end"""
+    battle = make_battle()
+    play(battle)
+    data = battle.get_replay().to_bytes()
+    replay = Replay.from_bytes(data)
+    assert replay.turns == battle.turn_count
+    assert replay.actions == battle.replay.actions
+    assert ReplayPlayer(replay).verify()
+    print(f"✅ {replay.turns} turns in {len(data)} bytes, verified")
+
+
+def test_seek_matches_live_battle():
+    """Seeking forwards and backwards gives the state the live battle had"""
+    battle = make_battle(seed=3)
+    states = play(battle)
+    player = ReplayPlayer(battle.get_replay(), keyframe_interval=2)
+    last = len(states) - 1
+    for turn in [last, 1, last // 2, 2, last, 0]:
+        player.seek(turn)
+        if turn:
+            assert snapshot(player.battle) == states[turn], f"turn {turn}"
+        else:
+            assert player.battle.turn_count == 0
+    player.seek(last)
+    assert state_digest(player.battle, player.enemies) == battle.replay.final_digest
+    print("✅ Seeking matches the recorded battle")
+
+
+def test_tampering_and_bad_data():
+    """Changed actions fail verification; garbage is rejected"""
+    battle = make_battle(seed=5)
+    play(battle)
+    replay = battle.get_replay()
+    data = bytearray(replay.to_bytes())
+    data[-2:] = bytes((list(BattleAction).index(BattleAction.RUN), 0xFF))
+    assert not ReplayPlayer(Replay.from_bytes(bytes(data))).verify()
+
+    good = replay.to_bytes()
+    bad_code, bad_string = bytearray(good), bytearray(good)
+    bad_code[-2] = 0x7E                                   # No such action
+    bad_string[-2:] = bytes((ARG_STRING, 200))            # Past the string table
+    magic, version, seed, turns, digest, header_len = replay_module._HEADER.unpack_from(good)
+    list_header = zlib.compress(b"[1, 2]")                # JSON, but not a dict
+    not_a_dict = (replay_module._HEADER.pack(magic, version, seed, turns, digest, len(list_header))
+                  + list_header + good[replay_module._HEADER.size + header_len:])
+
+    size = replay_module._HEADER.size
+    strings = json.loads(zlib.decompress(good[size:size + header_len]))["strings"]
+
+    def with_header(header):
+        packed = zlib.compress(json.dumps(header).encode())
+        return (replay_module._HEADER.pack(magic, version, seed, turns, digest, len(packed))
+                + packed + good[size + header_len:])
+
+    wrong_shape = with_header({"start": {"foo": 1}, "strings": strings})
+
+    for bad in (b"", b"NOPE" + bytes(40), good[:-1], bytes(bad_code), bytes(bad_string),
+                not_a_dict, wrong_shape):
+        try:
+            Replay.from_bytes(bad)
+            assert False, "bad replay data was accepted"
+        except ReplayError:
+            pass
+
+    # All the keys, but the wrong things in them: caught when it's played
+    start = dict(replay.start, player={"name": "Jesus"}, enemies=[{"id": 3}])
+    odd = Replay.from_bytes(with_header({"start": start, "strings": strings}))
+    try:
+        ReplayPlayer(odd)
+        assert False, "a malformed start state was played"
+    except ReplayError:
+        pass
+    print("✅ Tampered replays fail verification")
+
+
+def main():
+    print("=" * 70)
+    print(" REPLAY TEST ".center(70, "="))
+    print("=" * 70)
+
+    tests = [
+        test_round_trip_and_verify,
+        test_seek_matches_live_battle,
+        test_tampering_and_bad_data,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ {test.__name__} failed: {e}")
+
+    print(f"\nResults: {len(tests) - failed}/{len(tests)} tests passed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
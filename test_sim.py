@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Battle Simulator Test - Checks engine.sim against the scalar battle engine
+"""
+
+import sys
+import os
+import io
+import random
+import contextlib
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from utils.data_loader import get_data_loader
+from engine.fish import Fish
+from engine.player import Player
+from engine.enemy import create_enemy
+from engine.battle import Battle, BattleAction, BattleResult
+from engine.rng import RNG
+from engine.elements import type_id
+
+try:
+    from engine import sim
+except ImportError:  # NumPy not installed
+    sim = None
+
+
+class FixedRandom(RNG):
+    """Battle RNG where every roll sits at the same point u in [0, 1)"""
+
+    def __init__(self, u):
+        self.u = u
+
+    def random(self):
+        return self.u  # randint() and uniform() derive from this
+
+
+class FixedGenerator:
+    """Stand-in for a NumPy Generator with the same fixed roll"""
+
+    def __init__(self, u):
+        self.u = u
+
+    def random(self, n):
+        return sim.np.full(n, self.u)
+
+
+def make_fish(fish_id, level):
+    fish = Fish(fish_id, get_data_loader().get_fish_by_id(fish_id), level)
+    fish.xp_to_next_level = 10 ** 9  # No level-ups mid-battle (not simulated)
+    return fish
+
+
+def test_damage_formula_matches_battle():
+    """Vectorized damage equals Battle.calculate_damage() + take_damage() roll for roll"""
+    if sim is None:
+        print("⚠️  NumPy not installed - skipped")
+        return
+    fish = make_fish("holy_mackerel", 7)
+    enemy = create_enemy("wild_bandit", 6)
+    player = Player("Jesus")
+    player.add_fish_to_party(fish)
+    with contextlib.redirect_stdout(io.StringIO()):
+        battle = Battle(player, [enemy])
+    chart = sim.type_matrix()
+
+    for u in (0.0, 0.01, 0.3, 0.5, 0.77, 0.999):
+        battle.rng = FixedRandom(u)
+        for move in fish.known_moves:
+            atk = fish.get_effective_stat("atk")
+            damage, _, _ = battle.calculate_damage(atk, move, enemy, fish.type)
+            enemy.current_hp = enemy.max_hp
+            expected = enemy.take_damage(damage)
+
+            low, high, _, move_type, _, _ = sim._encode_moves([move])[0]
+            rolled = sim._roll_damage(
+                FixedGenerator(u), sim.np.array([atk]), sim.np.array([low]),
+                sim.np.array([high]),
+                chart[[move_type], [type_id(enemy.enemy_type)]],
+                sim.np.array([move["type"] == fish.type]))
+            actual = sim._after_defense(rolled, sim.np.array([enemy.defense]),
+                                        sim.np.array([enemy.stat_modifiers["def"]]))
+            assert int(actual[0]) == expected, (move["name"], u, actual, expected)
+    print("✅ Damage formula matches the scalar engine")
+
+
+def scalar_battles(fish_id, fish_level, enemy_id, enemy_level, n):
+    """Play n battles through Battle.execute_turn() → (win_rate, mean turns to kill)"""
+    random.seed(3)
+    wins, turns = 0, 0
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(n):
+            player = Player("Jesus")
+            player.add_fish_to_party(make_fish(fish_id, fish_level))
+            battle = Battle(player, [create_enemy(enemy_id, enemy_level)])
+            while battle.result == BattleResult.ONGOING and battle.turn_count < 100:
+                battle.execute_turn(BattleAction.ATTACK, 0)
+            if battle.result == BattleResult.VICTORY:
+                wins += 1
+                turns += battle.turn_count
+    return wins / n, turns / max(1, wins)
+
+
+def test_statistical_parity():
+    """Win rate and turns-to-kill agree with the scalar engine"""
+    if sim is None:
+        print("⚠️  NumPy not installed - skipped")
+        return
+    for fish_id, fish_level, enemy_id, enemy_level in (("carp_diem", 5, "wild_bandit", 5),
+                                                       ("carp_diem", 6, "wild_bandit", 4)):
+        scalar_win, scalar_turns = scalar_battles(fish_id, fish_level, enemy_id, enemy_level, 3000)
+        result = sim.simulate_matchup(make_fish(fish_id, fish_level),
+                                      create_enemy(enemy_id, enemy_level), n=100_000, seed=1)
+        assert abs(result.win_rate - scalar_win) < 0.03, (result.win_rate, scalar_win)
+        assert abs(result.turns_to_kill().mean() - scalar_turns) < 0.1
+        print(f"✅ {fish_id} vs {enemy_id}: sim {result.win_rate:.1%}, scalar {scalar_win:.1%}")
+
+
+def test_batches_and_statuses():
+    """Mixed batches keep rows apart; statuses and seeds behave"""
+    if sim is None:
+        print("⚠️  NumPy not installed - skipped")
+        return
+    strong = make_fish("holy_mackerel", 10)
+    weak = make_fish("carp_diem", 1)
+    batch = sim.BattleBatch.from_matchups([(strong, create_enemy("wild_bandit", 1), 500),
+                                           (weak, create_enemy("wild_bandit", 10), 500)])
+    result = sim.simulate(batch, seed=7)
+    assert len(result) == 1000
+    assert (result.outcome[:500] == sim.OUTCOME_WIN).all()
+    assert (result.outcome[500:] == sim.OUTCOME_LOSS).mean() > 0.9
+
+    # Same seed → same battles
+    again = sim.simulate(batch, seed=7)
+    assert (again.turns == result.turns).all()
+
+    # Frozen fish never attack; invincible fish never take damage → timeout
+    frozen = make_fish("holy_mackerel", 10)
+    frozen.status_effects = ["frozen", "invincible"]
+    stalled = sim.simulate_matchup(frozen, create_enemy("wild_bandit", 1), n=100, max_turns=20)
+    assert (stalled.outcome == sim.OUTCOME_TIMEOUT).all()
+    assert stalled.damage_dealt.sum() == 0 and stalled.damage_taken.sum() == 0
+
+    summary = result.summary()
+    assert summary["battles"] == 1000
+    assert summary["win_rate"] == (result.outcome == sim.OUTCOME_WIN).mean()
+    print("✅ Batches, statuses and seeds behave")
+
+
+def main():
+    print("=" * 70)
+    print(" BATTLE SIMULATOR TEST ".center(70, "="))
+    print("=" * 70)
+
+    tests = [
+        test_damage_formula_matches_battle,
+        test_statistical_parity,
+        test_batches_and_statuses,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ {test.__name__} failed: {e}")
+
+    print(f"\nResults: {len(tests) - failed}/{len(tests)} tests passed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
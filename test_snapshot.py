@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Snapshot Test - Checks Battle.snapshot()/restore()/clone() and RNG stream copies
+"""
+
+import sys
+import os
+import copy
+import random
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from conftest import make_battle as make_test_battle, make_enemies
+from engine.enemy import create_boss
+from engine.battle import BattleAction, BattleResult
+from engine.battle_log import BattleLog
+from engine.rng import PythonRNG, BufferedRNG, np
+from engine.enemy_ai import make_reproducible
+
+
+def make_battle(seed=1, **kwargs):
+    enemies = make_enemies(level=18) + [create_boss("herod_antipas", 18)]
+    make_reproducible(enemies)  # Keeps any search AI timing-independent
+    battle = make_test_battle(enemies, fish_ids=("holy_mackerel", "carp_diem", "sole_survivor"),
+                              level=20, seed=seed, **kwargs)
+    battle.player.bread_items = {"plain_pita": 2}
+    return battle
+
+
+def state(battle):
+    """Everything visible about a battle (copied), for comparisons"""
+    return copy.deepcopy((battle.turn_count, battle.result, battle.player.money, battle.player.bread_items,
+            battle.player.miracle_meter, battle.active_fish.fish_id,
+            [(f.current_hp, f.xp, f.level, f.status_effects, f.status_durations,
+              f.stat_modifiers, f.timed_stat_modifiers) for f in battle.player.active_party],
+            [(e.enemy_id, e.current_hp, e.status_effects, e.stat_modifiers,
+              e.timed_stat_modifiers) for e in battle.enemies]))
+
+
+def play_out(battle):
+    script = [(BattleAction.ITEM, "plain_pita"), (BattleAction.SWITCH, 2)]
+    while battle.result == BattleResult.ONGOING and battle.turn_count < 60:
+        turn = battle.turn_count
+        battle.execute_turn(*(script[turn] if turn < len(script) else (BattleAction.ATTACK, turn % 2)))
+    return state(battle)
+
+
+def test_restore_replays_exactly():
+    """Restoring a snapshot (with RNG) makes the same future happen again"""
+    battle = make_battle()
+    battle.execute_turn(BattleAction.ATTACK, 0)
+    battle.active_fish.apply_stat_modifier("atk", 1.5, turns=3)
+    battle.active_enemy.apply_status_effect("poisoned", turns=2)
+    saved = battle.snapshot(include_rng=True)
+    before = state(battle)
+
+    ending = play_out(battle)
+    assert ending != before
+    for _ in range(2):  # A snapshot can be restored again and again
+        battle.restore(saved)
+        assert state(battle) == before
+        assert play_out(battle) == ending
+    print("✅ restore() rewinds HP, modifiers, statuses, items and RNG")
+
+
+def test_clone_is_independent():
+    """Playing a clone leaves the original untouched and predicts its future"""
+    battle = make_battle(seed=4)
+    battle.execute_turn(BattleAction.ATTACK, 1)
+    before = state(battle)
+
+    clone = battle.clone()
+    assert clone.player is not battle.player
+    assert clone.active_fish.species is battle.active_fish.species  # Static data shared
+    assert clone.active_fish.owner is clone.player
+    predicted = play_out(clone)
+    assert state(battle) == before
+    assert len(battle.log) > 0 and len(clone.log) == 0
+    assert play_out(battle) == predicted  # Cloned RNG continues identically
+    print("✅ Clones are independent and share static data")
+
+
+def test_rng_state_and_clone():
+    """getstate()/setstate()/clone() for every stream type"""
+    streams = [PythonRNG(seed=9), PythonRNG(random)]
+    if np is not None:
+        streams.append(BufferedRNG(seed=9, block_size=16))
+    for rng in streams:
+        rng.random()
+        saved = rng.getstate()
+        twin = rng.clone()
+        values = [rng.random() for _ in range(50)]
+        assert [twin.random() for _ in range(50)] == values
+        rng.setstate(saved)
+        assert [rng.random() for _ in range(50)] == values
+    print("✅ RNG streams can be saved, restored and cloned")
+
+
+def test_restore_after_the_battle_ended():
+    """A snapshot from mid-fight brings back defeated enemies and an ONGOING result"""
+    battle = make_test_battle(make_enemies(level=2, count=2), level=40, seed=2)
+    saved = battle.snapshot(include_rng=True)
+    before = state(battle)
+    while battle.result == BattleResult.ONGOING:
+        battle.execute_turn(BattleAction.ATTACK, 0)
+    assert battle.result == BattleResult.VICTORY and battle.enemies == []
+
+    battle.restore(saved)
+    assert state(battle) == before and len(battle.enemies) == 2
+    assert battle.active_enemy is battle.enemies[0] and not battle.active_enemy.is_defeated()
+    assert play_out(battle)[1] == BattleResult.VICTORY
+    print("✅ restore() undoes a finished battle")
+
+
+def test_restore_without_rng_and_clone_options():
+    """Without include_rng the dice keep rolling on; clone() takes its own rng and log"""
+    battle = make_battle(seed=6)
+    saved = battle.snapshot()
+    first = battle.rng.random()
+    battle.restore(saved)
+    assert battle.rng.random() != first    # The stream wasn't rewound
+
+    log = BattleLog()
+    clone = battle.clone(rng=PythonRNG(seed=6), log=log)
+    assert clone.log is log and clone.replay is None
+    twin = clone.clone()                    # A clone of a clone is as independent
+    twin.execute_turn(BattleAction.ATTACK, 0)
+    assert twin.turn_count == 1 and clone.turn_count == 0 and battle.turn_count == 0
+    assert twin.player is not clone.player and len(log) == 0  # The twin logs nowhere
+    print("✅ RNG-less snapshots and clone() options behave")
+
+
+def main():
+    print("=" * 70)
+    print(" SNAPSHOT TEST ".center(70, "="))
+    print("=" * 70)
+
+    tests = [
+        test_restore_replays_exactly,
+        test_clone_is_independent,
+        test_rng_state_and_clone,
+        test_restore_after_the_battle_ended,
+        test_restore_without_rng_and_clone_options,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ {test.__name__} failed: {e}")
+
+    print(f"\nResults: {len(tests) - failed}/{len(tests)} tests passed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
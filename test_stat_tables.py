@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Stat Table Test - Checks precomputed stats against the growth formula
+"""
+
+import sys
+import os
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from utils.constants import MAX_LEVEL
+from utils.data_loader import DataLoader
+from engine.stat_tables import (FISH_GROWTH_RATE, ENEMY_GROWTH_RATE, STAT_NAMES, np,
+                                get_stat_table, scale_stat, fish_stat_curves,
+                                enemy_stat_curves)
+from engine.fish import Fish
+from engine.enemy import EnemyFactory
+from engine.player import Player
+
+
+def test_tables_match_formula():
+    """Every table entry equals the growth formula, and tables are shared"""
+    loader = DataLoader()
+    for fish in loader.get_all_fish():
+        base = tuple(fish["base_stats"][stat] for stat in STAT_NAMES)
+        table = get_stat_table(base, FISH_GROWTH_RATE)
+        assert table is get_stat_table(base, FISH_GROWTH_RATE)
+        for level in range(1, MAX_LEVEL + 1):
+            assert table.at(level) == tuple(scale_stat(b, level, FISH_GROWTH_RATE) for b in base)
+        # Outside the table: formula fallback
+        assert table.at(MAX_LEVEL + 5)[0] == scale_stat(base[0], MAX_LEVEL + 5, FISH_GROWTH_RATE)
+
+    # Enemy and boss templates grow at the enemy rate
+    factory = EnemyFactory(loader)
+    templates = [factory.get_enemy_template(record["id"])
+                 for record in loader.load_json("enemies.json")["enemies"]]
+    templates += [factory.get_boss_template(record["id"])
+                  for record in loader.load_json("bosses.json")["bosses"]]
+    for template in templates:
+        assert template.stats is get_stat_table(template.base_stats, ENEMY_GROWTH_RATE)
+        for level in range(1, MAX_LEVEL + 1):
+            assert template.stats.at(level) == tuple(
+                scale_stat(b, level, ENEMY_GROWTH_RATE) for b in template.base_stats)
+    print("✅ Stat tables match the growth formula")
+
+
+def test_level_up_and_restore_use_table():
+    """Levelling up and loading a save give the same stats as a fresh fish"""
+    data = DataLoader().get_fish_by_id("holy_mackerel")
+    fish = Fish("holy_mackerel", data, level=1)
+    for _ in range(MAX_LEVEL - 1):
+        fish.xp = fish.xp_to_next_level
+        fish.level_up()
+        fresh = Fish("holy_mackerel", data, level=fish.level)
+        assert (fish.max_hp, fish.atk, fish.defense, fish.spd) == \
+            (fresh.max_hp, fresh.atk, fresh.defense, fresh.spd)
+    assert not fish.level_up()
+
+    player = Player("Jesus")
+    for _ in range(9):
+        player.level_up()
+    restored = Player.from_dict(player.to_dict(), DataLoader())
+    assert restored.level == 10 and restored.max_hp == player.max_hp
+    assert player.max_hp == scale_stat(50, 10, 0.05)
+    print("✅ Level-ups and save restore use the tables")
+
+
+def test_bulk_curves():
+    """All species' curves can be read at once"""
+    loader = DataLoader()
+    ids, curves = fish_stat_curves(loader)
+    fish = Fish("holy_mackerel", loader.get_fish_by_id("holy_mackerel"), level=10)
+    row = curves[ids.index("holy_mackerel")][9]
+    assert list(row) == [fish.max_hp, fish.atk, fish.defense, fish.spd]
+
+    enemy_ids, enemy_curves = enemy_stat_curves(loader)
+    assert len(enemy_ids) == len(enemy_curves) == 52
+    if np is not None:
+        assert curves.shape == (len(ids), MAX_LEVEL, len(STAT_NAMES))
+        assert (enemy_curves[:, 0, 0] > 0).all()
+    print("✅ Bulk stat curves available")
+
+
+def main():
+    """Run all tests"""
+    tests = [
+        test_tables_match_formula,
+        test_level_up_and_restore_use_table,
+        test_bulk_curves,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ {test.__name__} failed: {e}")
+    print(f"Results: {len(tests) - failed}/{len(tests)} tests passed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+State Feed Test - Checks Battle.get_state_changes() (revisions, changed fields, new log events)
+"""
+
+import sys
+import os
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from conftest import make_battle as make_test_battle, make_enemies, make_player as make_test_player
+from engine.battle import STATE_FIELDS, STATE_MARKS_KEPT, BattleAction, BattleResult
+from engine.battle_log import BattleLog, LogEvent
+from engine.rng import PythonRNG
+from engine.horde import Horde, HordeBattle
+
+PARTY = ("holy_mackerel", "carp_diem")
+
+
+def make_player():
+    return make_test_player(PARTY, hp=10 ** 6)
+
+
+def make_battle(**kwargs):
+    kwargs.setdefault("log", BattleLog())
+    return make_test_battle(make_enemies(count=2, hp=10 ** 6), fish_ids=PARTY, hp=10 ** 6,
+                            **kwargs)
+
+
+def test_idle_frames_get_nothing():
+    """The first call sends everything; then only changes, and None while idle"""
+    battle = make_battle()
+    first = battle.get_state_changes()
+    assert set(first["changes"]) == set(STATE_FIELDS)
+    assert [e.event for e in first["log"]] == [LogEvent.BATTLE_START]
+    seen = first["revision"]
+    assert battle.get_state_changes(seen) is None
+    assert battle.get_state_changes(seen) is None
+
+    battle.execute_turn(BattleAction.ATTACK, 0)
+    delta = battle.get_state_changes(seen)
+    assert delta["revision"] == seen + 1
+    assert {"turn", "active_enemy", "all_enemies"} <= set(delta["changes"])
+    assert "can_flee" not in delta["changes"] and "apostle_used" not in delta["changes"]
+    assert delta["changes"]["turn"] == 1
+    new_events = battle.log.entries()[1:]
+    assert delta["log"] == new_events and new_events
+    assert battle.get_state_changes(delta["revision"]) is None
+    print("✅ Idle frames get None; a turn sends only what changed")
+
+
+def test_changes_accumulate_across_revisions():
+    """Asking from an older revision gets everything changed since then"""
+    battle = make_battle()
+    start = battle.get_state_changes()["revision"]
+    battle.execute_turn(BattleAction.ATTACK, 0)
+    middle = battle.get_state_changes(start)["revision"]
+    battle.execute_turn(BattleAction.SWITCH, 1)
+    latest = battle.get_state_changes(middle)
+    assert "active_fish" in latest["changes"]
+    assert latest["changes"]["active_fish"] is battle.player.active_party[1]
+
+    both = battle.get_state_changes(start)
+    assert both["revision"] == latest["revision"]
+    assert set(latest["changes"]) <= set(both["changes"])
+    assert both["log"] == battle.log.entries()[1:]
+
+    # Edits from outside the battle are picked up once marked
+    battle.active_fish.current_hp -= 10
+    assert battle.get_state_changes(latest["revision"]) is None
+    battle.mark_state_changed()
+    assert set(battle.get_state_changes(latest["revision"])["changes"]) == {"active_fish"}
+    print("✅ Changes accumulate from any past revision")
+
+
+def test_restore_clone_and_horde():
+    """Restore counts as a change; clones have a feed of their own; hordes compare columns"""
+    battle = make_battle()
+    saved = battle.snapshot()
+    battle.execute_turn(BattleAction.ATTACK, 0)
+    seen = battle.get_state_changes()["revision"]
+
+    preview = battle.clone()
+    preview.execute_turn(BattleAction.ATTACK, 0)
+    assert preview.get_state_changes()["revision"] == 1
+    assert battle.get_state_changes(seen) is None
+
+    battle.restore(saved)
+    delta = battle.get_state_changes(seen)
+    assert delta["changes"]["turn"] == 0 and delta["log"] == []
+
+    horde = HordeBattle(make_player(), Horde().spawn("wild_bandit", 100, level=3),
+                        rng=PythonRNG(seed=5), log=BattleLog())
+    seen = horde.get_state_changes()["revision"]
+    horde.enemies[50].take_damage(1)
+    horde.mark_state_changed()
+    assert set(horde.get_state_changes(seen)["changes"]) == {"all_enemies"}
+    print("✅ Restores, clones and horde battles keep the feed right")
+
+
+def test_benched_enemies_and_old_revisions():
+    """Changes to enemies other than the active one show up; old revisions resend everything"""
+    battle = make_battle()
+    seen = battle.get_state_changes()["revision"]
+    battle.enemies[1].apply_stat_modifier("atk", 0.5, 1)
+    battle.mark_state_changed()
+    seen = battle.get_state_changes(seen)["revision"]
+
+    # Switching: the active enemy only attacks, but the benched one's debuff runs out
+    battle.execute_turn(BattleAction.SWITCH, 1)
+    delta = battle.get_state_changes(seen)
+    assert "all_enemies" in delta["changes"] and "active_enemy" not in delta["changes"]
+    assert battle.enemies[1].stat_modifiers["atk"] == 1.0
+
+    for meter in range(3 * STATE_MARKS_KEPT):
+        battle.player.miracle_meter = meter % 50
+        battle.mark_state_changed()
+        battle.get_state_changes()
+    assert len(battle._log_marks) <= 2 * STATE_MARKS_KEPT
+    assert set(battle.get_state_changes(seen)["changes"]) == set(STATE_FIELDS)
+    recent = battle.get_state_changes(battle.revision - 1)
+    assert set(recent["changes"]) == {"miracle_meter"} and recent["log"] == []
+    print("✅ Benched enemies are tracked; the feed's history stays bounded")
+
+
+def test_edges_of_the_feed():
+    """No-op restores, odd revisions, a small log and the end of the battle"""
+    battle = make_battle(log=BattleLog(capacity=3))
+    saved = battle.snapshot()
+    seen = battle.get_state_changes()["revision"]
+    battle.restore(saved)                      # Rechecked, but nothing differs
+    assert battle.get_state_changes(seen) is None
+    assert battle.get_state_changes(seen + 5) is None          # From the future: nothing
+    assert set(battle.get_state_changes(-1)["changes"]) == set(STATE_FIELDS)
+
+    for _ in range(3):
+        battle.execute_turn(BattleAction.ATTACK, 0)
+    delta = battle.get_state_changes(seen)
+    assert len(delta["log"]) == 3 and delta["log"] == battle.log.entries()  # What's still kept
+
+    clone = battle.clone()
+    assert clone.get_state_changes()["changes"]["turn"] == 3
+    clone.active_enemy.current_hp = 1
+    clone.mark_state_changed()
+    assert set(clone.get_state_changes(1)["changes"]) == {"active_enemy", "all_enemies"}
+
+    seen = battle.get_state_changes()["revision"]
+    for enemy in list(battle.enemies):
+        enemy.current_hp = 1
+    while battle.result == BattleResult.ONGOING:
+        battle.execute_turn(BattleAction.ATTACK, 0)
+    delta = battle.get_state_changes(seen)
+    assert delta["changes"]["result"] == BattleResult.VICTORY
+    assert delta["changes"]["all_enemies"] == []
+    battle.execute_turn(BattleAction.ATTACK, 0)                # Over: nothing more happens
+    assert battle.get_state_changes(delta["revision"]) is None
+    print("✅ No-op restores, odd revisions, a small log and the battle's end")
+
+
+def main():
+    print("=" * 70)
+    print(" STATE FEED TEST ".center(70, "="))
+    print("=" * 70)
+
+    tests = [
+        test_idle_frames_get_nothing,
+        test_changes_accumulate_across_revisions,
+        test_restore_clone_and_horde,
+        test_benched_enemies_and_old_revisions,
+        test_edges_of_the_feed,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ {test.__name__} failed: {e}")
+
+    print(f"\nResults: {len(tests) - failed}/{len(tests)} tests passed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Statuses Test - Checks status bitmasks, their handlers and save compatibility
+"""
+
+import sys
+import os
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from conftest import make_battle
+from utils.constants import STATUS_EFFECTS
+from utils.data_loader import get_data_loader
+from engine.fish import Fish
+from engine.battle_log import BattleLog, LogEvent
+from engine.statuses import (ACTION_MASK, CANNOT_ACT_MASK, DAMAGE_MASK, STATUS_BITS,
+                             STATUS_HANDLERS, accuracy_multiplier, bit_indexes, status_bit,
+                             status_mask, status_names)
+
+
+def test_handlers_follow_constants():
+    """Every STATUS_EFFECTS entry gets a bit and a handler with its numbers"""
+    for name, settings in STATUS_EFFECTS.items():
+        handler = STATUS_HANDLERS[STATUS_BITS[name].bit_length() - 1]
+        assert handler.name == name and handler.duration == settings["duration"]
+        assert handler.damage_per_turn == settings.get("damage_per_turn", 0.0)
+        assert bool(handler.bit & CANNOT_ACT_MASK) == settings.get("cannot_act", False)
+    assert status_names(DAMAGE_MASK) == ["poisoned", "burned"]
+    assert status_names(ACTION_MASK) == ["frozen", "paralyzed", "asleep", "stunned"]
+
+    # New names get new bits; the behavior masks don't change
+    bit = status_bit("test_only_status")
+    assert bit == status_bit("test_only_status") and not bit & (DAMAGE_MASK | ACTION_MASK)
+    print("✅ Handlers are compiled from STATUS_EFFECTS")
+
+
+def test_saves_stay_compatible():
+    """Old saves (status name lists, unknown names included) load and save back the same"""
+    loader = get_data_loader()
+    data = loader.get_fish_by_id("carp_diem")
+    saved = {"fish_id": "carp_diem", "level": 8, "xp": 12, "current_hp": 20,
+             "held_item": None, "status_effects": ["poisoned", "blessed", "old_save_status"]}
+    fish = Fish.from_dict(saved, data)
+    assert fish.status_mask == STATUS_BITS["poisoned"] | STATUS_BITS["blessed"] | \
+        status_bit("old_save_status")
+    assert sorted(fish.to_dict()["status_effects"]) == sorted(saved["status_effects"])
+
+    # Durations tick down in the parallel turns list
+    fish.clear_status_effects()
+    fish.apply_status_effect("frozen", 2)
+    fish.apply_status_effect("silenced")
+    assert fish.status_durations == {"frozen": 2} and not fish.can_use_move(0)
+    fish.tick_temporary_effects()
+    assert fish.status_durations == {"frozen": 1}
+    fish.tick_temporary_effects()
+    assert fish.status_effects == ["silenced"] and fish.status_durations == {}
+
+    # Immunity blocks new statuses (but not itself)
+    fish.apply_status_effect("immunity", 2)
+    fish.apply_status_effect("burned")
+    assert fish.status_effects == ["immunity", "silenced"]
+    print("✅ Saves and durations work as before")
+
+
+def test_battle_dispatches_set_bits():
+    """End-of-turn damage, lost turns and accuracy come from the handlers"""
+    battle = make_battle(log=BattleLog())
+    fish, enemy = battle.active_fish, battle.active_enemy
+    enemy.apply_status_effect("poisoned")
+    enemy.apply_status_effect("frozen")
+    hp = enemy.current_hp
+    fish_hp = fish.current_hp
+
+    battle.enemy_attack()
+    assert fish.current_hp == fish_hp  # Frozen: lost its turn
+    assert battle.log.entries()[-1].event == LogEvent.STATUS_BLOCKED
+
+    battle._apply_end_of_turn_effects()
+    poison = max(1, int(enemy.max_hp * STATUS_EFFECTS["poisoned"]["damage_per_turn"]))
+    assert enemy.current_hp == hp - poison
+    damage = [e for e in battle.log.entries() if e.event == LogEvent.STATUS_DAMAGE]
+    assert [(e.actor, e.amount, e.detail) for e in damage] == [(enemy.name, poison, "poison")]
+
+    # Blinded: accuracy is cut by the penalty
+    fish.apply_status_effect("blinded")
+    move = fish.known_moves[0]
+    penalty = STATUS_EFFECTS["blinded"]["accuracy_penalty"]
+    assert battle._hit_chance(fish, move) == move.accuracy * (1 - penalty)
+    print("✅ Battle dispatches only the set statuses")
+
+
+def test_stacked_and_shielded_statuses():
+    """Poison and burn both tick; the floor is 0 HP; invincible takes none; rolls and penalties stack"""
+    battle = make_battle(log=BattleLog())
+    enemy = battle.active_enemy
+    enemy.apply_status_effect("burned")
+    enemy.apply_status_effect("poisoned")
+    enemy.current_hp = 1
+    battle._apply_status_damage(enemy)
+    ticks = [e.detail for e in battle.log.entries() if e.event == LogEvent.STATUS_DAMAGE]
+    assert ticks == ["poison", "burn"] and enemy.current_hp == 0  # Bit order, never below 0
+
+    fish = battle.active_fish
+    fish.apply_status_effect("poisoned")
+    fish.apply_status_effect("invincible")
+    hp = fish.current_hp
+    battle._apply_status_damage(fish)
+    assert fish.current_hp == hp
+
+    # Paralyzed loses about half its turns (one roll each); frozen always, without a roll
+    fish.clear_status_effects()
+    fish.apply_status_effect("paralyzed")
+    lost = sum(battle._status_stops_action(fish) for _ in range(2000))
+    assert 850 < lost < 1150, lost
+    fish.apply_status_effect("frozen")
+    state = battle.rng.getstate()
+    assert battle._status_stops_action(fish) and battle.rng.getstate() == state
+
+    # Masks round-trip, including bits past the built-in ones
+    names = ["blinded", "test_only_late_status"]
+    mask = status_mask(names)
+    assert status_names(mask) == names and len(list(bit_indexes(mask))) == 2
+    assert accuracy_multiplier(mask) == 1 - STATUS_EFFECTS["blinded"]["accuracy_penalty"]
+    assert accuracy_multiplier(0) == 1.0
+    print("✅ Stacked, shielded and rolled statuses")
+
+
+def main():
+    print("=" * 70)
+    print(" STATUSES TEST ".center(70, "="))
+    print("=" * 70)
+
+    tests = [
+        test_handlers_follow_constants,
+        test_saves_stay_compatible,
+        test_battle_dispatches_set_bits,
+        test_stacked_and_shielded_statuses,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ {test.__name__} failed: {e}")
+
+    print(f"\nResults: {len(tests) - failed}/{len(tests)} tests passed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
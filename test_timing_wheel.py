@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Timing Wheel Test - Checks that timed effects expire on the battle's wheel
+"""
+
+import sys
+import os
+import pickle
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from conftest import make_battle as make_test_battle, make_enemies
+from engine.apostle_abilities import ApostleManager
+from engine.timing_wheel import WHEEL_SIZE, TimingWheel
+
+
+class Timer:
+    """Records the turns it was woken on"""
+
+    def __init__(self):
+        self.woken = []
+
+    def expire_due(self, wheel):
+        self.woken.append(wheel.now)
+
+
+class Repeater(Timer):
+    """Schedules itself again `every` turns, `times` times"""
+
+    def __init__(self, every, times):
+        super().__init__()
+        self.every, self.times = every, times
+
+    def expire_due(self, wheel):
+        super().expire_due(wheel)
+        if len(self.woken) < self.times:
+            wheel.schedule(wheel.now + self.every, self)
+
+
+def make_battle(enemy_count=3):
+    return make_test_battle(make_enemies(count=enemy_count),
+                            fish_ids=("holy_mackerel", "carp_diem"), seed=3)
+
+
+def test_wheel_wakes_only_due_timers():
+    """Timers wake on their turn, near or past the end of the wheel"""
+    wheel = TimingWheel()
+    near, far, twice = Timer(), Timer(), Timer()
+    wheel.schedule(2, near)
+    wheel.schedule(WHEEL_SIZE * 2 + 3, far)   # Overflow, then back on the wheel
+    wheel.schedule(5, twice)
+    wheel.schedule(5, twice)                  # Same turn again: one wake-up
+    assert [turn for turn, _ in wheel.entries()] == [2, 5, WHEEL_SIZE * 2 + 3]
+
+    copy = pickle.loads(pickle.dumps(wheel))
+    assert [turn for turn, _ in copy.entries()] == [2, 5, WHEEL_SIZE * 2 + 3]
+
+    woken = [wheel.advance() for _ in range(WHEEL_SIZE * 3)]
+    assert sum(woken) == 3
+    assert near.woken == [2] and twice.woken == [5] and far.woken == [WHEEL_SIZE * 2 + 3]
+    assert wheel.entries() == []
+
+    # Only far-off timers: they still come round
+    lone, timer = TimingWheel(), Timer()
+    lone.schedule(WHEEL_SIZE + 4, timer)
+    for _ in range(WHEEL_SIZE + 4):
+        lone.advance()
+    assert timer.woken == [WHEEL_SIZE + 4]
+    print("✅ Wheel wakes timers on their turn only")
+
+
+def test_battle_touches_only_due_units():
+    """End of turn only reaches units with something running out"""
+    battle = make_battle()
+    bystanders = [battle.player.active_party[1], *battle.enemies[1:]]
+    enemy = battle.enemies[0]
+    enemy.apply_stat_modifier("atk", 0.5, 2)
+    enemy.apply_status_effect("frozen", 3)
+    battle.active_fish.apply_status_effect("burned", 1)
+
+    scheduled = {id(timer) for _, timer in battle.wheel.entries()}
+    assert not scheduled & {id(unit) for unit in bystanders}
+
+    expected = [(0.5, {"frozen": 2}, []), (1.0, {"frozen": 1}, []), (1.0, {}, [])]
+    for atk, durations, fish_statuses in expected:
+        battle._tick_temporary_effects()
+        assert enemy.stat_modifiers["atk"] == atk and enemy.status_durations == durations
+        assert battle.active_fish.status_effects == fish_statuses
+    assert battle.wheel.entries() == []
+
+    # Apostle cooldowns are end turns too: ticking is one wheel step
+    apostles = ApostleManager()
+    apostles.recruit_apostle("peter")
+    ability = apostles.use_ability("peter")
+    for turns_left in range(ability.cooldown - 1, -1, -1):
+        apostles.tick_all_cooldowns()
+        assert ability.current_cooldown == turns_left
+    assert ability.is_ready()
+    print("✅ Battle wakes only the units that are due")
+
+
+def test_snapshots_and_clones_keep_end_turns():
+    """Restore and clone put every pending expiry back on a wheel"""
+    battle = make_battle(enemy_count=1)
+    enemy = battle.active_enemy
+    enemy.apply_stat_modifier("def", 2.0, 2)
+    saved = battle.snapshot()
+
+    battle._tick_temporary_effects()
+    battle._tick_temporary_effects()
+    assert enemy.stat_modifiers["def"] == 1.0
+
+    battle.restore(saved)
+    assert enemy.timed_stat_modifiers["def"] == [{"multiplier": 2.0, "turns": 2}]
+    preview = battle.clone()
+    twin = preview.active_enemy
+    preview._tick_temporary_effects()
+    preview._tick_temporary_effects()
+    assert twin.stat_modifiers["def"] == 1.0 and enemy.stat_modifiers["def"] == 2.0
+
+    battle._tick_temporary_effects()
+    battle._tick_temporary_effects()
+    assert enemy.stat_modifiers["def"] == 1.0
+
+    # A unit ticked on its own leaves the battle's wheel alone
+    enemy.apply_status_effect("asleep", 2)
+    enemy.tick_temporary_effects()
+    assert battle.wheel.now == 2 and enemy.status_durations == {"asleep": 1}
+    print("✅ Snapshots and clones keep pending expiries")
+
+
+def test_slot_wrap_and_overflow_edges():
+    """Both sides of the wheel's edge, past turns, wrapped slots and re-scheduling mid-advance"""
+    wheel = TimingWheel(now=WHEEL_SIZE * 5 - 2)        # Slots wrap right away
+    start = wheel.now
+    timers = {delta: Timer() for delta in (-3, 0, 1, 2, WHEEL_SIZE, WHEEL_SIZE + 1, WHEEL_SIZE * 3)}
+    for delta, timer in timers.items():
+        wheel.schedule(start + delta, timer)
+    assert len(wheel._overflow) == 2                   # Only the ones past the edge
+
+    # Every WHEEL_SIZE turns lands in the very slot advance() is emptying
+    every_lap, every_turn = Repeater(WHEEL_SIZE, 3), Repeater(1, 5)
+    wheel.schedule(start + 1, every_lap)
+    wheel.schedule(start + 1, every_turn)
+    for _ in range(WHEEL_SIZE * 4):
+        wheel.advance()
+    for delta, timer in timers.items():
+        assert timer.woken == [start + max(delta, 1)], (delta, timer.woken)
+    assert every_lap.woken == [start + 1 + WHEEL_SIZE * lap for lap in range(3)]
+    assert every_turn.woken == [start + turn for turn in range(1, 6)]
+    assert wheel.entries() == []
+
+    wheel.schedule(wheel.now + WHEEL_SIZE * 2, Timer())
+    wheel.reset(7)                                     # Forgets everything
+    assert wheel.now == 7 and wheel.entries() == [] and wheel.advance() == 0
+
+    # Through a battle: an effect longer than the wheel ends on its turn
+    battle = make_battle(enemy_count=1)
+    enemy = battle.active_enemy
+    enemy.apply_stat_modifier("spd", 0.5, WHEEL_SIZE * 2 + 1)
+    for _ in range(WHEEL_SIZE * 2):
+        battle._tick_temporary_effects()
+    assert enemy.stat_modifiers["spd"] == 0.5
+    battle._tick_temporary_effects()
+    assert enemy.stat_modifiers["spd"] == 1.0
+    print("✅ Slot wrap, overflow edges and re-scheduling")
+
+
+def main():
+    print("=" * 70)
+    print(" TIMING WHEEL TEST ".center(70, "="))
+    print("=" * 70)
+
+    tests = [
+        test_wheel_wakes_only_due_timers,
+        test_battle_touches_only_due_units,
+        test_snapshots_and_clones_keep_end_turns,
+        test_slot_wrap_and_overflow_edges,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ {test.__name__} failed: {e}")
+
+    print(f"\nResults: {len(tests) - failed}/{len(tests)} tests passed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Turn Order Test - Checks the heap turn scheduler and Battle's turn order
+"""
+
+import sys
+import os
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from utils.data_loader import get_data_loader
+from engine.fish import Fish
+from engine.player import Player
+from engine.enemy import create_enemy
+from engine.battle import Battle, BattleAction
+from engine.battle_log import BattleLog, LogEvent
+from engine.rng import PythonRNG
+from engine.turn_order import (ENEMY_SIDE, INTERJECTION_SPEED, PARTY_SIDE,
+                               TurnScheduler)
+
+
+def make_party():
+    loader = get_data_loader()
+    return [Fish(fish_id, loader.get_fish_by_id(fish_id), 10)
+            for fish_id in ("holy_mackerel", "carp_diem", "sole_survivor", "holy_mackerel")]
+
+
+def drain(order):
+    names = []
+    turn = order.pop()
+    while turn is not None:
+        names.append(turn.action)
+        turn = order.pop()
+    return names
+
+
+def test_priority_speed_side_then_order():
+    """Priority beats SPD; SPD ties go to the party, then to who was scheduled first"""
+    party = make_party()
+    enemies = [create_enemy("wild_bandit", 10) for _ in range(3)]
+    for unit, spd in zip((*party, *enemies), (30, 50, 50, 10, 50, 20, 50)):
+        unit.spd = spd
+
+    order = TurnScheduler()
+    order.extend([(fish, f"fish{i}", 0, PARTY_SIDE) for i, fish in enumerate(party)]
+                 + [(enemy, f"enemy{i}", 0, ENEMY_SIDE) for i, enemy in enumerate(enemies)])
+    order.push(enemies[1], "enemy1 quick", 1, ENEMY_SIDE)      # Replaces its turn
+    order.push(object(), "apostle", 0, PARTY_SIDE, speed=INTERJECTION_SPEED)
+    assert len(order) == 8
+    assert drain(order) == ["enemy1 quick", "apostle", "fish1", "fish2", "enemy0",
+                            "enemy2", "fish0", "fish3"]
+    assert len(order) == 0 and order.pop() is None
+    print("✅ Turns come out by priority, SPD, side, then scheduling order")
+
+
+def test_rekey_follows_speed_changes():
+    """A SPD buff mid-round moves only that actor; removed actors never come up"""
+    party = make_party()
+    for fish, spd in zip(party, (40, 30, 20, 10)):
+        fish.spd = spd
+    order = TurnScheduler()
+    order.extend([(fish, i) for i, fish in enumerate(party)])
+    assert order.pop().action == 0
+
+    party[3].apply_stat_modifier("spd", 4.0, 2)      # 10 → 40: now ahead of 30
+    assert order.rekey(party[3]) and not order.rekey(party[0])  # party[0] already acted
+    assert party[3] in order and order.remove(party[2])
+    turn = order.pop()
+    assert turn.action == 3 and turn.speed == 40
+    assert drain(order) == [1]
+    print("✅ Re-keying moves one actor; removed turns are skipped")
+
+
+def test_battle_uses_effective_speed():
+    """A slowed fish now moves after the enemy (SPD modifiers count for turn order)"""
+    loader = get_data_loader()
+    player = Player("Jesus")
+    fish = Fish("holy_mackerel", loader.get_fish_by_id("holy_mackerel"), 10)
+    player.add_fish_to_party(fish)
+    enemy = create_enemy("wild_bandit", 10)
+    fish.max_hp = fish.current_hp = enemy.max_hp = enemy.current_hp = 10 ** 6
+    fish.spd, enemy.spd = 20, 15
+
+    def first_to_act(action=BattleAction.ATTACK, data=0):
+        battle = Battle(player, [enemy], rng=PythonRNG(seed=9), log=BattleLog())
+        battle.execute_turn(action, data)
+        acts = (LogEvent.ATTACK, LogEvent.MISS, LogEvent.APOSTLE_CALLED)
+        return [e for e in battle.log.entries() if e.event in acts][0]
+
+    assert first_to_act().actor == fish.name
+    fish.apply_stat_modifier("spd", 0.5, 5)          # 20 → 10
+    assert first_to_act().actor == enemy.name
+
+    # An apostle has no SPD: the call interjects before the faster enemy
+    player.recruit_apostle("james")
+    assert first_to_act(BattleAction.APOSTLE, "james").event == LogEvent.APOSTLE_CALLED
+    print("✅ Battle orders turns by effective SPD; apostle calls interject")
+
+
+def main():
+    print("=" * 70)
+    print(" TURN ORDER TEST ".center(70, "="))
+    print("=" * 70)
+
+    tests = [
+        test_priority_speed_side_then_order,
+        test_rekey_follows_speed_changes,
+        test_battle_uses_effective_speed,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ {test.__name__} failed: {e}")
+
+    print(f"\nResults: {len(tests) - failed}/{len(tests)} tests passed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)